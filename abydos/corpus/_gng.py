@@ -0,0 +1,98 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.corpus._gng.
+
+The corpus._gng module defines functions for reading Google NGram corpus
+files, which may be compressed, and directories of such files.
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+from typing import IO, List
+
+__all__ = []  # type: List[str]
+
+# the first bytes of each supported compressed format, and its opener
+_COMPRESSED = (
+    (b'\x1f\x8b', gzip.open),
+    (b'BZh', bz2.open),
+    (b'\xfd7zXZ\x00', lzma.open),
+)
+
+
+def _open_gng(corpus_file: str) -> IO[str]:
+    """Open a Google NGram corpus file for reading as text.
+
+    Files compressed with gzip, bzip2, or xz (LZMA) are recognized by their
+    first bytes and decompressed as they are read.
+
+    Parameters
+    ----------
+    corpus_file : str
+        The filename of the Google NGram file
+
+    Returns
+    -------
+    file
+        The file, opened for reading as UTF-8 text
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    with open(corpus_file, 'rb') as raw:
+        magic = raw.read(6)
+    for prefix, opener in _COMPRESSED:
+        if magic.startswith(prefix):
+            return opener(corpus_file, 'rt', encoding='utf-8')
+    return open(corpus_file, 'r', encoding='utf-8')
+
+
+def _gng_files(corpus_file: str) -> List[str]:
+    """Return the Google NGram files at a path.
+
+    Parameters
+    ----------
+    corpus_file : str
+        The filename of a Google NGram file, or of a directory of such files
+
+    Returns
+    -------
+    list of str
+        The filename itself, or the filenames of the files in the directory,
+        excluding hidden files, in sorted order
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if not os.path.isdir(corpus_file):
+        return [corpus_file]
+    return [
+        os.path.join(corpus_file, name)
+        for name in sorted(os.listdir(corpus_file))
+        if not name.startswith('.')
+        and os.path.isfile(os.path.join(corpus_file, name))
+    ]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
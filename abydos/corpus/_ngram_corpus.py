@@ -19,11 +19,21 @@
 The NGram class is a container for an n-gram corpus
 """
 
-from codecs import open as c_open
 from collections import Counter
-from typing import Any, Counter as TCounter, List, Optional, Union, cast
+from typing import (
+    Any,
+    Counter as TCounter,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from ._corpus import Corpus
+from ._gng import _gng_files, _open_gng
+from ..util._many import _map_many
 
 __all__ = ['NGramCorpus']
 
@@ -220,25 +230,66 @@ class NGramCorpus:
         else:
             self._add_to_ngcorpus(corpus[words[0]], words[1:], count)
 
-    def gng_importer(self, corpus_file: str) -> None:
+    def gng_importer(
+        self, corpus_file: str, workers: Optional[int] = 1
+    ) -> None:
         """Fill in self.ngcorpus from a Google NGram corpus file.
 
+        The counts of each file are totalled for each distinct n-gram before
+        they are added to the corpus.
+
         Parameters
         ----------
         corpus_file : str
             The filename of the Google NGram file from which to initialize the
-            n-gram corpus
+            n-gram corpus, or of a directory of such files. Files compressed
+            with gzip, bzip2, or xz are decompressed as they are read.
+        workers : int or None
+            The number of worker processes across which to read the files of a
+            directory (1 by default, which reads all files in the current
+            process). If None, the number of processors on the machine is
+            used. The counts read by the workers are added to the corpus in
+            the order of the files, so the result does not depend on the
+            number of workers.
 
 
         .. versionadded:: 0.3.0
+        .. versionchanged:: 0.6.0
+            Added support for compressed files, directories, and workers
+
+        """
+        for counts in _map_many(
+            NGramCorpus(), '_gng_counts', _gng_files(corpus_file), workers, 1
+        ):
+            for words, count in counts.items():
+                self._add_to_ngcorpus(self.ngcorpus, list(words), count)
+
+    def _gng_counts(self, corpus_file: str) -> Dict[Tuple[str, ...], int]:
+        """Return the counts of the n-grams of a Google NGram corpus file.
+
+        Parameters
+        ----------
+        corpus_file : str
+            The filename of the Google NGram file to read
+
+        Returns
+        -------
+        dict
+            The count of each n-gram, as a tuple of words, in the order of
+            their first appearances
+
+
+        .. versionadded:: 0.6.0
 
         """
-        with c_open(corpus_file, 'r', encoding='utf-8') as gng:
+        counts = {}  # type: Dict[Tuple[str, ...], int]
+        with _open_gng(corpus_file) as gng:
             for line in gng:
                 line_parts = line.rstrip().split('\t')
-                words = line_parts[0].split()
+                words = tuple(line_parts[0].split())
 
-                self._add_to_ngcorpus(self.ngcorpus, words, int(line_parts[2]))
+                counts[words] = counts.get(words, 0) + int(line_parts[2])
+        return counts
 
 
 if __name__ == '__main__':
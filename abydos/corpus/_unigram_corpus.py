@@ -20,20 +20,306 @@ Unigram Corpus
 """
 
 import pickle  # noqa: S403
-from codecs import open as c_open
 from collections import Counter, defaultdict
 from math import log1p
-from typing import Any, Callable, DefaultDict, Optional, Tuple
-
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from ._gng import _gng_files, _open_gng
 from ..tokenizer import _Tokenizer
+from ..util._many import _map_many
 
 __all__ = ['UnigramCorpus']
 
+# the first bytes of a compact corpus file, which identify its format
+_MAGIC = b'ABYUNI01'
+# the header: the magic bytes, then the number of terms, the length of the
+# vocabulary blob, and the greatest distinct documents count
+_HEADER = np.dtype([('magic', 'S8'), ('fields', '<i8', (3,))])
+
 
 def _dd_default(*args: Any) -> Tuple[int, int]:
     return 0, 0
 
 
+def _prefix(term: bytes) -> int:
+    """Return the first 8 bytes of a term, as a number that sorts like it.
+
+    Examples
+    --------
+    >>> _prefix(b'a') < _prefix(b'ab') < _prefix(b'b')
+    True
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return int.from_bytes(term[:8].ljust(8, b'\x00'), 'big')
+
+
+class _CompactCounts(Mapping[str, Tuple[int, int]]):
+    """Read-only mapping of terms to counts, stored in arrays.
+
+    The terms are stored as a single blob of their UTF-8 encodings, in sorted
+    order, with an array of the offset of each term in the blob, and parallel
+    arrays of the terms' counts and distinct documents counts. Terms are
+    found by a binary search of the numeric values of their first 8 bytes,
+    which are also stored, followed by a binary search of the terms sharing
+    those bytes. The arrays may be memory-mapped from a file.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        blob: np.ndarray,
+        offsets: np.ndarray,
+        prefixes: np.ndarray,
+        counts: np.ndarray,
+        doc_counts: np.ndarray,
+    ) -> None:
+        """Initialize _CompactCounts.
+
+        Parameters
+        ----------
+        blob : numpy.ndarray
+            The concatenated UTF-8 encodings of the terms, in sorted order, as
+            an array of bytes
+        offsets : numpy.ndarray
+            The offset of each term in the blob, followed by the length of the
+            blob
+        prefixes : numpy.ndarray
+            The first 8 bytes of each term, as numbers that sort like them
+        counts : numpy.ndarray
+            The number of times each term appeared
+        doc_counts : numpy.ndarray
+            The number of distinct documents in which each term appeared
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.blob = blob
+        self.offsets = offsets
+        self.prefixes = prefixes
+        self.counts = counts
+        self.doc_counts = doc_counts
+        # memoryviews are indexed, and plain arrays searched, more quickly
+        self._bytes = memoryview(blob)
+        self._offsets = memoryview(offsets)
+        self._prefixes = prefixes.view(np.ndarray)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the arrays of the mapping, less their views.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {
+            'blob': self.blob,
+            'offsets': self.offsets,
+            'prefixes': self.prefixes,
+            'counts': self.counts,
+            'doc_counts': self.doc_counts,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the arrays of the mapping, rebuilding their views.
+
+        .. versionadded:: 0.6.0
+
+        """
+        _CompactCounts.__init__(self, **state)
+
+    @classmethod
+    def from_dict(
+        cls, corpus: Mapping[str, Tuple[int, int]]
+    ) -> '_CompactCounts':
+        """Return the compact form of a dict of terms to counts.
+
+        Parameters
+        ----------
+        corpus : dict
+            A mapping of terms to tuples of their counts and distinct
+            documents counts
+
+        Returns
+        -------
+        _CompactCounts
+            The compact mapping
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        items = sorted(
+            (term.encode('utf-8'), counts) for term, counts in corpus.items()
+        )
+        offsets = np.zeros(len(items) + 1, dtype='<i8')
+        np.cumsum([len(term) for term, _ in items], out=offsets[1:])
+        counts = np.array(
+            [counts for _, counts in items], dtype='<i8'
+        ).reshape(len(items), 2)
+        return cls(
+            np.frombuffer(b''.join(term for term, _ in items), dtype=np.uint8),
+            offsets,
+            np.array([_prefix(term) for term, _ in items], dtype='<u8'),
+            np.ascontiguousarray(counts[:, 0]),
+            np.ascontiguousarray(counts[:, 1]),
+        )
+
+    def _term(self, pos: int) -> bytes:
+        """Return the UTF-8 encoding of the term at a position.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return bytes(self._bytes[self._offsets[pos] : self._offsets[pos + 1]])
+
+    def _find(self, term: Any) -> int:
+        """Return the position of a term, or -1 if it is absent.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(term, str):
+            return -1
+        key = term.encode('utf-8')
+        prefix = np.uint64(_prefix(key))
+        low = int(self._prefixes.searchsorted(prefix, 'left'))
+        high = int(self._prefixes.searchsorted(prefix, 'right'))
+        end = high
+        while low < high:
+            mid = (low + high) // 2
+            if self._term(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low < end and self._term(low) == key:
+            return low
+        return -1
+
+    def __getitem__(self, term: str) -> Tuple[int, int]:
+        """Return the counts of a term.
+
+        .. versionadded:: 0.6.0
+
+        """
+        pos = self._find(term)
+        if pos < 0:
+            raise KeyError(term)
+        return int(self.counts[pos]), int(self.doc_counts[pos])
+
+    def __contains__(self, term: Any) -> bool:
+        """Return True if the term is in the mapping.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._find(term) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the terms, in sorted order.
+
+        .. versionadded:: 0.6.0
+
+        """
+        for pos in range(len(self.counts)):
+            yield self._term(pos).decode('utf-8')
+
+    def __len__(self) -> int:
+        """Return the number of terms.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self.counts)
+
+    def save(self, filename: str) -> None:
+        """Save the arrays to a file that can be memory-mapped.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to save the arrays to
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        header = np.zeros(1, dtype=_HEADER)
+        header['magic'] = _MAGIC
+        header['fields'] = (
+            len(self.counts),
+            len(self.blob),
+            int(self.doc_counts.max()) if len(self.counts) else 0,
+        )
+        with open(filename, mode='wb') as out:
+            out.write(header.tobytes())
+            out.write(np.ascontiguousarray(self.offsets, '<i8').tobytes())
+            out.write(np.ascontiguousarray(self.prefixes, '<u8').tobytes())
+            out.write(np.ascontiguousarray(self.counts, '<i8').tobytes())
+            out.write(np.ascontiguousarray(self.doc_counts, '<i8').tobytes())
+            out.write(np.ascontiguousarray(self.blob).tobytes())
+
+    @classmethod
+    def load(cls, filename: str) -> Tuple['_CompactCounts', int]:
+        """Memory-map the arrays saved in a file.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to load the arrays from
+
+        Returns
+        -------
+        tuple
+            The mapping & its greatest distinct documents count
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        header = np.fromfile(filename, dtype=_HEADER, count=1)[0]
+        size, blob_len, max_docs = (int(field) for field in header['fields'])
+        arrays = []
+        offset = _HEADER.itemsize
+        for dtype, length in (
+            ('<i8', size + 1),
+            ('<u8', size),
+            ('<i8', size),
+            ('<i8', size),
+            (np.uint8, blob_len),
+        ):
+            # empty arrays cannot be memory-mapped
+            if length:
+                arrays.append(
+                    np.memmap(
+                        filename,
+                        dtype=dtype,
+                        mode='r',
+                        offset=offset,
+                        shape=(length,),
+                    )
+                )
+            else:
+                arrays.append(np.zeros(0, dtype=dtype))
+            offset += np.dtype(dtype).itemsize * length
+        offsets, prefixes, counts, doc_counts, blob = arrays
+        return cls(blob, offsets, prefixes, counts, doc_counts), max_docs
+
+
 class UnigramCorpus:
     """Unigram corpus class.
 
@@ -43,6 +329,12 @@ class UnigramCorpus:
     of the number of times a term appeared and the number of distinct documents
     in which it appeared.
 
+    A corpus can be converted to a compact, read-only form by
+    :py:meth:`compact`, which stores its terms and counts in NumPy arrays, and
+    saved in that form, to a file that :py:meth:`load_corpus` memory-maps, so
+    that loading it takes almost no time or memory and processes loading the
+    same file share its pages.
+
     .. versionadded:: 0.4.0
     """
 
@@ -83,7 +375,7 @@ class UnigramCorpus:
         """
         self.corpus = defaultdict(
             _dd_default
-        )  # type: DefaultDict[str, Tuple[int, int]]
+        )  # type: Union[DefaultDict[str, Tuple[int, int]], _CompactCounts]
         self.transform = word_transform
         self.tokenizer = word_tokenizer
         self.doc_count = documents
@@ -106,31 +398,60 @@ class UnigramCorpus:
             self._add_word(word, count, 1)
         self.doc_count += 1
 
-    def save_corpus(self, filename: str) -> None:
+    def save_corpus(self, filename: str, compact: bool = False) -> None:
         """Save the corpus to a file.
 
-        This employs pickle to save the corpus (a defaultdict). Other
-        parameters of the corpus, such as its word_tokenizer, will not be
-        affected and should be set during initialization.
+        This employs pickle to save the corpus (a defaultdict), unless it is
+        compact or compact is set to True, in which case the arrays of the
+        compact corpus are saved in a form that :py:meth:`load_corpus` can
+        memory-map. Other parameters of the corpus, such as its
+        word_tokenizer, will not be affected and should be set during
+        initialization.
 
         Parameters
         ----------
         filename : str
             The filename to save the corpus to.
+        compact : bool
+            Save the corpus in compact form, which does not change the form of
+            the corpus in memory
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> corp = UnigramCorpus('the quick brown fox jumped over the dog')
+        >>> path = os.path.join(tempfile.mkdtemp(), 'corpus.dat')
+        >>> corp.save_corpus(path, compact=True)
+        >>> shared = UnigramCorpus()
+        >>> shared.load_corpus(path)
+        >>> shared.corpus['the']
+        (2, 1)
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added compact parameter
 
         """
+        if compact or isinstance(self.corpus, _CompactCounts):
+            if isinstance(self.corpus, _CompactCounts):
+                arrays = self.corpus
+            else:
+                arrays = _CompactCounts.from_dict(self.corpus)
+            arrays.save(filename)
+            return
+
         with open(filename, mode='wb') as pkl:
             pickle.dump(self.corpus, pkl)
 
     def load_corpus(self, filename: str) -> None:
         """Load the corpus from a file.
 
-        This employs pickle to load the corpus (a defaultdict). Other
-        parameters of the corpus, such as its word_tokenizer, will not be
-        affected and should be set during initialization.
+        This employs pickle to load the corpus (a defaultdict), unless the
+        file was saved in compact form, in which case its arrays are
+        memory-mapped, read-only, and the corpus is compact. Other parameters
+        of the corpus, such as its word_tokenizer, will not be affected and
+        should be set during initialization.
 
         Parameters
         ----------
@@ -139,18 +460,53 @@ class UnigramCorpus:
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Loads compact corpora by memory-mapping
 
         """
         with open(filename, mode='rb') as pkl:
-            self.corpus = pickle.load(pkl)  # noqa: S301
-        self._update_doc_count()
+            if pkl.read(len(_MAGIC)) != _MAGIC:
+                pkl.seek(0)
+                self.corpus = pickle.load(pkl)  # noqa: S301
+                self._update_doc_count()
+                return
+
+        self.corpus, max_docs = _CompactCounts.load(filename)
+        self.doc_count = max(max_docs, self.doc_count)
+
+    def compact(self) -> None:
+        """Convert the corpus to compact form.
+
+        The terms of a compact corpus are stored, in sorted order, as a single
+        blob of their UTF-8 encodings, with an array of their offsets and
+        parallel arrays of their counts, and are found by binary search. Adding
+        a document to a compact corpus converts it back to a defaultdict.
+
+        Examples
+        --------
+        >>> corp = UnigramCorpus('the quick brown fox jumped over the dog')
+        >>> corp.compact()
+        >>> list(corp.corpus)
+        ['brown', 'dog', 'fox', 'jumped', 'over', 'quick', 'the']
+        >>> round(corp.idf('the'), 10)
+        0.6931471806
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(self.corpus, _CompactCounts):
+            self.corpus = _CompactCounts.from_dict(self.corpus)
 
     def _update_doc_count(self) -> None:
         """Update document count, if necessary.
 
         .. versionadded:: 0.4.0
         """
-        max_docs = max(self.corpus.values(), key=lambda _: _[1])[1]
+        if isinstance(self.corpus, _CompactCounts):
+            max_docs = int(self.corpus.doc_counts.max())
+        else:
+            max_docs = max(self.corpus.values(), key=lambda _: _[1])[1]
         self.doc_count = max(max_docs, self.doc_count)
 
     def _add_word(self, word: str, count: int, doc_count: int) -> None:
@@ -169,6 +525,9 @@ class UnigramCorpus:
         .. versionadded:: 0.4.0
 
         """
+        if isinstance(self.corpus, _CompactCounts):
+            self.corpus = defaultdict(_dd_default, self.corpus.items())
+
         if self.transform is not None:
             word = self.transform(word)
 
@@ -189,26 +548,91 @@ class UnigramCorpus:
                 prior_doc_count + doc_count,
             )
 
-    def gng_importer(self, corpus_file: str) -> None:
+    def gng_importer(
+        self, corpus_file: str, workers: Optional[int] = 1
+    ) -> None:
         """Fill in self.corpus from a Google NGram corpus file.
 
+        The counts of each file are totalled for each distinct word before
+        they are added to the corpus, so that each distinct word of a file is
+        transformed and tokenized once.
+
         Parameters
         ----------
-        corpus_file : file
-            The Google NGram file from which to initialize the n-gram corpus
+        corpus_file : str
+            The Google NGram file from which to initialize the n-gram corpus,
+            or a directory of such files. Files compressed with gzip, bzip2,
+            or xz are decompressed as they are read.
+        workers : int or None
+            The number of worker processes across which to read the files of a
+            directory (1 by default, which reads all files in the current
+            process). If None, the number of processors on the machine is
+            used. The counts read by the workers are added to the corpus in
+            the order of the files, so the result does not depend on the
+            number of workers. With multiple workers, the corpus's
+            word_transform and word_tokenizer must be picklable.
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added support for compressed files, directories, and workers
+
+        """
+        # an empty corpus reads each file, so that the (possibly large)
+        # corpus itself is not sent to worker processes
+        reader = UnigramCorpus(
+            word_transform=self.transform, word_tokenizer=self.tokenizer
+        )
+        for counts in _map_many(
+            reader, '_gng_counts', _gng_files(corpus_file), workers, 1
+        ):
+            if isinstance(self.corpus, _CompactCounts):
+                self.corpus = defaultdict(_dd_default, self.corpus.items())
+            for term, (count, doc_count) in counts.items():
+                prior_count, prior_doc_count = self.corpus[term]
+                self.corpus[term] = (
+                    prior_count + count,
+                    prior_doc_count + doc_count,
+                )
+        self._update_doc_count()
+
+    def _gng_counts(self, corpus_file: str) -> Dict[str, Tuple[int, int]]:
+        """Return the counts of the terms of a Google NGram corpus file.
+
+        Parameters
+        ----------
+        corpus_file : str
+            The Google NGram file to read
+
+        Returns
+        -------
+        dict
+            The counts of each term, after transformation and tokenization,
+            in the order of their first appearances
+
+
+        .. versionadded:: 0.6.0
 
         """
-        with c_open(corpus_file, 'r', encoding='utf-8') as gng:
+        words = {}  # type: Dict[str, Tuple[int, int]]
+        with _open_gng(corpus_file) as gng:
             for line in gng:
                 word, _, count, doc_count = line.rstrip().split('\t')
                 if '_' in word:
                     word = word[: word.find('_')]
 
-                self._add_word(word, int(count), int(doc_count))
-            self._update_doc_count()
+                prior_count, prior_doc_count = words.get(word, (0, 0))
+                words[word] = (
+                    prior_count + int(count),
+                    prior_doc_count + int(doc_count),
+                )
+
+        partial = UnigramCorpus(
+            word_transform=self.transform, word_tokenizer=self.tokenizer
+        )
+        for term, (total, docs) in words.items():
+            partial._add_word(term, total, docs)  # noqa: SF01
+        return dict(partial.corpus)
 
     def idf(self, term: str) -> float:
         r"""Calculate the Inverse Document Frequency of a term in the corpus.
@@ -237,9 +661,9 @@ class UnigramCorpus:
         .. versionadded:: 0.4.0
 
         """
-        if term in self.corpus:
-            count, term_doc_count = self.corpus[term]
-            return log1p(self.doc_count / term_doc_count)
+        counts = self.corpus.get(term)
+        if counts is not None:
+            return log1p(self.doc_count / counts[1])
         else:
             return float('inf')
 
@@ -324,6 +324,15 @@ undergone each transform, is provided in:
 
     - Phonetic distance (:py:class:`.PhoneticDistance`)
 
+A BK-tree index (:py:class:`.BKTree`), which supports fast retrieval of the
+terms within a given distance of, or nearest to, a query term under any
+metric with integer distances, is also provided, as is a similarity join
+index (:py:class:`.SimilarityJoin`), which finds all pairs of strings whose
+Jaccard, Dice, cosine, or overlap similarity meets a threshold.
+
+Strings to be compared many times by token-based measures may be tokenized
+once, into token profiles, by the measures' prepare methods.
+
 The remaining distance measures & metrics include:
 
     - Western Airlines' Match Rating Algorithm comparison
@@ -402,6 +411,7 @@ from ._benini_ii import BeniniII
 from ._bennet import Bennet
 from ._bhattacharyya import Bhattacharyya
 from ._bisim import BISIM
+from ._bk_tree import BKTree
 from ._bleu import BLEU
 from ._block_levenshtein import BlockLevenshtein
 from ._brainerd_robinson import BrainerdRobinson
@@ -585,6 +595,7 @@ from ._shapira_storer_i import ShapiraStorerI
 from ._sift4 import Sift4
 from ._sift4_extended import Sift4Extended
 from ._sift4_simplest import Sift4Simplest
+from ._similarity_join import SimilarityJoin
 from ._single_linkage import SingleLinkage
 from ._size import Size
 from ._smith_waterman import SmithWaterman
@@ -905,6 +916,8 @@ __all__ = [
     'FuzzyWuzzyTokenSort',
     'FuzzyWuzzyTokenSet',
     'PhoneticDistance',
+    'BKTree',
+    'SimilarityJoin',
     'MRA',
     'Editex',
     'Baystat',
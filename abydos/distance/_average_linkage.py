@@ -110,17 +110,17 @@ class AverageLinkage(_TokenDistance):
         if not src and not tar:
             return 0.0
 
-        src = self.params['tokenizer'].tokenize(src).get_list()
-        tar = self.params['tokenizer'].tokenize(tar).get_list()
+        src_list = self._thread_tokenizer().tokenize(src).get_list()
+        tar_list = self._thread_tokenizer().tokenize(tar).get_list()
 
-        if not src or not tar:
+        if not src_list or not tar_list:
             return 1.0
 
         num = 0.0
-        den = len(src) * len(tar)
+        den = len(src_list) * len(tar_list)
 
-        for term_src in src:
-            for term_tar in tar:
+        for term_src in src_list:
+            for term_tar in tar_list:
                 num += self._metric.dist(term_src, term_tar)
 
         return num / den
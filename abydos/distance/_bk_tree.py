@@ -0,0 +1,267 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._bk_tree.
+
+BK-tree nearest-neighbor index
+"""
+
+from heapq import heappop, heappush, heappushpop
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ._distance import _Distance
+from ._levenshtein import Levenshtein
+
+__all__ = ['BKTree']
+
+
+class BKTree:
+    """BK-tree.
+
+    A BK-tree :cite:`Burkhard:1973` indexes a collection of terms under a
+    metric with discrete (integer) distances, such as :py:class:`.Levenshtein`,
+    :py:class:`.DamerauLevenshtein`, :py:class:`.Hamming`, or
+    :py:class:`.Indel` distance. Each child of a node is labeled by its
+    distance from that node, so the triangle inequality allows a query to
+    skip every subtree whose label differs from the query's distance to the
+    node by more than the search radius.
+
+    The nodes are stored in flat lists, rather than as nested objects, so
+    that trees may be pickled and unpickled quickly, regardless of depth.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        metric: Optional[_Distance] = None,
+        terms: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Initialize BKTree instance.
+
+        Parameters
+        ----------
+        metric : _Distance
+            A distance metric instance whose dist_abs method returns integer
+            distances and satisfies the triangle inequality (Levenshtein by
+            default)
+        terms : iterable of str
+            Terms with which to populate the tree
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._metric = Levenshtein() if metric is None else metric
+        self._terms = []  # type: List[str]
+        self._children = []  # type: List[Dict[float, int]]
+        if terms is not None:
+            self.update(terms)
+
+    def __len__(self) -> int:
+        """Return the number of terms in the tree.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._terms)
+
+    def __iter__(self) -> Iterator[str]:
+        """Return an iterator over the terms in the tree.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return iter(self._terms)
+
+    def __contains__(self, term: object) -> bool:
+        """Return True if term is in the tree.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return isinstance(term, str) and bool(self.query(term, 0))
+
+    def add(self, term: str) -> bool:
+        """Add a term to the tree.
+
+        Parameters
+        ----------
+        term : str
+            The term to add
+
+        Returns
+        -------
+        bool
+            True if the term was added, False if it was already present
+
+        Examples
+        --------
+        >>> tree = BKTree()
+        >>> tree.add('Niall')
+        True
+        >>> tree.add('Niall')
+        False
+        >>> len(tree)
+        1
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._terms:
+            self._terms.append(term)
+            self._children.append({})
+            return True
+
+        node = 0
+        while True:
+            dist = self._metric.dist_abs(term, self._terms[node])
+            if dist == 0:
+                return False
+            children = self._children[node]
+            if dist in children:
+                node = children[dist]
+            else:
+                children[dist] = len(self._terms)
+                self._terms.append(term)
+                self._children.append({})
+                return True
+
+    def update(self, terms: Iterable[str]) -> None:
+        """Add each of a collection of terms to the tree.
+
+        Parameters
+        ----------
+        terms : iterable of str
+            The terms to add
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for term in terms:
+            self.add(term)
+
+    def query(self, term: str, max_dist: float) -> List[Tuple[str, float]]:
+        """Return the terms within a given distance of a term.
+
+        Parameters
+        ----------
+        term : str
+            The term to search for
+        max_dist : int
+            The maximum distance of returned terms
+
+        Returns
+        -------
+        list of tuples
+            The terms within max_dist of the search term, paired with their
+            distances, in order of increasing distance
+
+        Examples
+        --------
+        >>> tree = BKTree(terms=['Niall', 'Neal', 'Neil', 'Njall', 'Nigel'])
+        >>> tree.query('Neall', 1)
+        [('Neal', 1), ('Niall', 1), ('Njall', 1)]
+        >>> tree.query('Neall', 2)
+        [('Neal', 1), ('Niall', 1), ('Njall', 1), ('Neil', 2)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        matches = []  # type: List[Tuple[float, str]]
+        if not self._terms:
+            return []
+
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            dist = self._metric.dist_abs(term, self._terms[node])
+            if dist <= max_dist:
+                matches.append((dist, self._terms[node]))
+            for edge, child in self._children[node].items():
+                if dist - max_dist <= edge <= dist + max_dist:
+                    stack.append(child)
+
+        return [(match, dist) for dist, match in sorted(matches)]
+
+    def nearest(self, term: str, k: int = 1) -> List[Tuple[str, float]]:
+        """Return the k terms nearest to a term.
+
+        The tree is searched best-first, in order of the lower bound on each
+        subtree's distance from the search term, and the search ends once
+        that bound exceeds the distance of the k-th nearest term found.
+
+        Parameters
+        ----------
+        term : str
+            The term to search for
+        k : int
+            The number of terms to return
+
+        Returns
+        -------
+        list of tuples
+            The k terms nearest the search term, paired with their distances,
+            in order of increasing distance (ties are broken arbitrarily)
+
+        Examples
+        --------
+        >>> tree = BKTree(terms=['Niall', 'Neal', 'Neil', 'Njall', 'Nigel'])
+        >>> tree.nearest('Nigl')
+        [('Nigel', 1)]
+        >>> tree.nearest('Nial', 2)
+        [('Neal', 1), ('Niall', 1)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._terms or k < 1:
+            return []
+
+        # best holds the negated distances of the k nearest terms found, so
+        # that best[0] is the distance of the farthest of them
+        best = []  # type: List[Tuple[float, str]]
+        frontier = [(0.0, 0)]  # type: List[Tuple[float, int]]
+        while frontier:
+            bound, node = heappop(frontier)
+            if len(best) == k and bound > -best[0][0]:
+                break
+            dist = self._metric.dist_abs(term, self._terms[node])
+            if len(best) < k:
+                heappush(best, (-dist, self._terms[node]))
+            elif dist < -best[0][0]:
+                heappushpop(best, (-dist, self._terms[node]))
+            for edge, child in self._children[node].items():
+                bound = abs(dist - edge)
+                if len(best) < k or bound <= -best[0][0]:
+                    heappush(frontier, (bound, child))
+
+        return [
+            (match, dist)
+            for dist, match in sorted(
+                (-neg_dist, match) for neg_dist, match in best
+            )
+        ]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
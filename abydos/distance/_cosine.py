@@ -20,9 +20,11 @@ Cosine similarity & distance
 """
 
 from math import sqrt
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
-from ._token_distance import _TokenDistance
+import numpy as np
+
+from ._token_distance import _TokenDistance, _identical
 from ..tokenizer import _Tokenizer
 
 __all__ = ['Cosine']
@@ -143,6 +145,35 @@ class Cosine(_TokenDistance):
             return num / sqrt(self._src_card() * self._tar_card())
         return 0.0
 
+    def _sim_block(
+        self,
+        srcs: Sequence[str],
+        tars: Sequence[str],
+        intersections: np.ndarray,
+        src_cards: np.ndarray,
+        tar_cards: np.ndarray,
+    ) -> Optional[np.ndarray]:
+        """Return the cosine similarities of a block from its cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        identical = _identical(srcs, tars)
+        compared = (
+            ~identical
+            & (intersections > 0)
+            & np.outer(
+                [bool(src) for src in srcs], [bool(tar) for tar in tars]
+            )
+        )
+
+        sims = np.zeros(intersections.shape, dtype=np.float_)
+        sims[compared] = intersections[compared] / np.sqrt(
+            np.outer(src_cards, tar_cards)[compared]
+        )
+        sims[identical] = 1.0
+        return sims
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,9 +19,12 @@
 Damerau-Levenshtein distance
 """
 
+from bisect import bisect_left
+from collections import defaultdict
 from sys import maxsize
-from typing import Any, Callable, List, Tuple, cast
+from typing import Any, Callable, DefaultDict, List, Optional, Tuple, cast
 
+from numpy import full as np_full
 from numpy import int_ as np_int
 from numpy import zeros as np_zeros
 
@@ -39,12 +42,16 @@ class DamerauLevenshtein(_Distance):
     Damerau-Levenshtein code is based on Java code by Kevin L. Stern
     :cite:`Stern:2014`, under the MIT license:
     https://github.com/KevinStern/software-and-algorithms/blob/master/src/main/java/blogspot/software_and_algorithms/stern_library/string/DamerauLevenshteinAlgorithm.java
+
+    .. versionchanged:: 0.6.0
+        Added max_distance option
     """
 
     def __init__(
         self,
         cost: Tuple[float, float, float, float] = (1, 1, 1, 1),
         normalizer: Callable[[List[float]], float] = max,
+        max_distance: Optional[float] = None,
         **kwargs: Any
     ):
         """Initialize Levenshtein instance.
@@ -59,16 +66,25 @@ class DamerauLevenshtein(_Distance):
             A function that takes an list and computes a normalization term
             by which the edit distance is divided (max by default). Another
             good option is the sum function.
+        max_distance : float or None
+            If set, the distance computation is limited to the diagonal band
+            of the alignment matrix in which distances of at most max_distance
+            can occur and stops as soon as the distance is certain to exceed
+            max_distance. In that case, dist_abs returns max_distance + 1 and
+            dist returns 1.0.
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_distance option
 
         """
         super(DamerauLevenshtein, self).__init__(**kwargs)
         self._cost = cost
         self._normalizer = normalizer
+        self._max_distance = max_distance
 
     def dist_abs(self, src: str, tar: str) -> float:
         """Return the Damerau-Levenshtein distance between two strings.
@@ -110,13 +126,21 @@ class DamerauLevenshtein(_Distance):
 
         """
         ins_cost, del_cost, sub_cost, trans_cost = self._cost
+        max_distance = self._max_distance
 
         if src == tar:
             return 0
-        if not src:
-            return len(tar) * ins_cost
-        if not tar:
-            return len(src) * del_cost
+        if (
+            max_distance is not None
+            and abs(len(src) - len(tar)) * min(ins_cost, del_cost)
+            > max_distance
+        ):
+            return max_distance + 1
+        if not src or not tar:
+            distance = len(tar) * ins_cost + len(src) * del_cost
+            if max_distance is not None and distance > max_distance:
+                return max_distance + 1
+            return distance
 
         if 2 * trans_cost < ins_cost + del_cost:
             raise ValueError(
@@ -124,7 +148,23 @@ class DamerauLevenshtein(_Distance):
                 + 'must not be less than the cost of an insert plus a delete.'
             )
 
-        d_mat = np_zeros((len(src), len(tar)), dtype=np_int)
+        # When max_distance is set, only cells within band of the diagonal
+        # are computed; cells outside it cannot lie on an alignment costing
+        # at most max_distance (plus the slack needed by the early exit test
+        # below), so they are left at a value exceeding any such cost.
+        if max_distance is not None:
+            slack = max(0, del_cost - trans_cost)
+            min_indel = min(ins_cost, del_cost)
+            band = (
+                int((max_distance + slack) // min_indel)
+                if min_indel > 0
+                else max(len(src), len(tar))
+            )
+            d_mat = np_full((len(src), len(tar)), maxsize // 4, dtype=np_int)
+            d_mat[0, 0] = 0
+        else:
+            band = max(len(src), len(tar))
+            d_mat = np_zeros((len(src), len(tar)), dtype=np_int)
 
         if src[0] != tar[0]:
             d_mat[0, 0] = min(sub_cost, ins_cost + del_cost)
@@ -146,9 +186,23 @@ class DamerauLevenshtein(_Distance):
             )
             d_mat[0, j] = min(del_distance, ins_distance, match_distance)
 
+        tar_index_by_character = defaultdict(
+            list
+        )  # type: DefaultDict[str, List[int]]
+        for j, char in enumerate(tar):
+            tar_index_by_character[char].append(j)
+
         for i in range(1, len(src)):
-            max_src_letter_match_index = 0 if src[i] == tar[0] else -1
-            for j in range(1, len(tar)):
+            start = max(1, i - band)
+            # the last index before start at which tar matches src[i], or -1
+            max_src_letter_match_index = (
+                bisect_left(tar_index_by_character[src[i]], start) - 1
+            )
+            if max_src_letter_match_index != -1:
+                max_src_letter_match_index = tar_index_by_character[src[i]][
+                    max_src_letter_match_index
+                ]
+            for j in range(start, min(len(tar), i + band + 1)):
                 candidate_swap_index = (
                     -1
                     if tar[j] not in src_index_by_character
@@ -186,7 +240,24 @@ class DamerauLevenshtein(_Distance):
                 )
             src_index_by_character[src[i]] = i
 
-        return cast(float, d_mat[len(src) - 1, len(tar) - 1])
+            # Every alignment either passes through row i (possibly before
+            # reaching the first character of tar, at a cost of
+            # (i + 1) * del_cost) or skips it with a swap costing no less than
+            # the row's minimum less the slack.
+            if (
+                max_distance is not None
+                and min(
+                    d_mat[i, max(0, i - band) : i + band + 1].min(),
+                    (i + 1) * del_cost,
+                )
+                > max_distance + slack
+            ):
+                return max_distance + 1
+
+        distance = cast(float, d_mat[len(src) - 1, len(tar) - 1])
+        if max_distance is not None and distance > max_distance:
+            return max_distance + 1
+        return distance
 
     def dist(self, src: str, tar: str) -> float:
         """Return the Damerau-Levenshtein similarity of two strings.
@@ -233,7 +304,10 @@ class DamerauLevenshtein(_Distance):
         if src == tar:
             return 0.0
         ins_cost, del_cost = self._cost[:2]
-        return self.dist_abs(src, tar) / (
+        distance = self.dist_abs(src, tar)
+        if self._max_distance is not None and distance > self._max_distance:
+            return 1.0
+        return distance / (
             self._normalizer([len(src) * del_cost, len(tar) * ins_cost])
         )
 
@@ -18,11 +18,43 @@
 
 The distance._distance module implements abstract class _Distance.
 """
-from typing import Any, Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+import numpy as np
 
 __all__ = ['_Distance']
 
 
+def _pairwise_rows(
+    task: Tuple['_Distance', str, Sequence[str], Sequence[str], int]
+) -> List[List[float]]:
+    """Compute a block of rows of a pairwise matrix.
+
+    This is a module-level function so that it can be dispatched to a
+    process pool.
+
+    Parameters
+    ----------
+    task : tuple
+        A tuple of the measure, the name of the method to call, the source
+        strings of the block, the target strings, and the offset into the
+        target strings at which each row begins (0 for a full matrix and
+        1 for the upper triangle used by pdist)
+
+    Returns
+    -------
+    list of lists of floats
+        The computed rows
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    measure, method, srcs, tars, start = task
+    return measure._rows(method, srcs, tars, start)  # noqa: SF01
+
+
 class _Distance:
     """Abstract Distance class.
 
@@ -122,6 +154,319 @@ class _Distance:
         """
         return self.dist(src, tar)
 
+    def _batch(
+        self, method: str, srcs: Sequence[str], tars: Sequence[str]
+    ) -> Optional[np.ndarray]:
+        """Return a vectorized matrix of pairwise values, if supported.
+
+        Measures that can compute many comparisons at once should override
+        this method, returning a matrix of shape (len(srcs), len(tars)) for
+        each supported method name. Returning None causes the generic
+        (chunked, optionally parallel) implementation to be used instead.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method to vectorize (``sim``, ``dist``, or
+            ``dist_abs``)
+        srcs : list of str
+            Source strings for comparison
+        tars : list of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray or None
+            The pairwise values or None
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return None
+
+    def _rows(
+        self, method: str, srcs: Sequence[str], tars: Sequence[str], start: int
+    ) -> List[List[float]]:
+        """Return a block of rows of a pairwise matrix.
+
+        Measures that can share work among the comparisons of a block may
+        override this method.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method to call
+        srcs : list of str
+            Source strings of the block
+        tars : list of str
+            Target strings for comparison
+        start : int
+            The offset into the target strings at which each row begins (0 for
+            a full matrix and 1 for the upper triangle used by pdist)
+
+        Returns
+        -------
+        list of lists of floats
+            The computed rows
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        func = getattr(self, method)
+        if start:
+            return [
+                [func(src, tar) for tar in tars[row + start :]]
+                for row, src in enumerate(srcs)
+            ]
+        return [[func(src, tar) for tar in tars] for src in srcs]
+
+    def _pairwise(
+        self,
+        method: str,
+        srcs: Sequence[str],
+        tars: Sequence[str],
+        triangle: bool = False,
+        workers: Optional[int] = 1,
+        chunksize: Optional[int] = None,
+    ) -> List[List[float]]:
+        """Return pairwise values by calling method on each pair.
+
+        Rows are computed in chunks of chunksize source strings, which are
+        distributed across a process pool when workers is not 1.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method to call
+        srcs : list of str
+            Source strings for comparison
+        tars : list of str
+            Target strings for comparison
+        triangle : bool
+            If True, srcs and tars are the same collection and only the values
+            above the diagonal are computed
+        workers : int or None
+            The number of worker processes to use (1 by default, which
+            computes all values in the current process). If None, the number
+            of processors on the machine is used.
+        chunksize : int or None
+            The number of source strings per task submitted to the workers
+
+        Returns
+        -------
+        list of lists of floats
+            The computed rows
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if chunksize is None:
+            chunksize = max(1, len(srcs) // (4 * (workers or 8)))
+        offset = 1 if triangle else 0
+        tasks = [
+            (
+                self,
+                method,
+                srcs[i : i + chunksize],
+                tars[i:] if triangle else tars,
+                offset,
+            )
+            for i in range(0, len(srcs), chunksize)
+        ]
+
+        rows = []  # type: List[List[float]]
+        if workers == 1 or len(tasks) < 2:
+            for task in tasks:
+                rows.extend(_pairwise_rows(task))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for block in executor.map(_pairwise_rows, tasks):
+                    rows.extend(block)
+        return rows
+
+    def _matrix(
+        self,
+        method: str,
+        srcs: Sequence[str],
+        tars: Optional[Sequence[str]],
+        workers: Optional[int],
+        chunksize: Optional[int],
+    ) -> np.ndarray:
+        """Return the matrix of method values for all pairs.
+
+        .. versionadded:: 0.6.0
+
+        """
+        srcs = list(srcs)
+        tars = srcs if tars is None else list(tars)
+
+        batch = self._batch(method, srcs, tars)
+        if batch is not None:
+            return batch
+
+        mat = np.zeros((len(srcs), len(tars)), dtype=np.float_)
+        for i, row in enumerate(
+            self._pairwise(
+                method, srcs, tars, workers=workers, chunksize=chunksize
+            )
+        ):
+            mat[i, :] = row
+        return mat
+
+    def sim_array(
+        self,
+        srcs: Sequence[str],
+        tars: Optional[Sequence[str]] = None,
+        workers: Optional[int] = 1,
+        chunksize: Optional[int] = None,
+    ) -> np.ndarray:
+        """Return the similarities of all pairs of strings.
+
+        Parameters
+        ----------
+        srcs : list of str
+            Source strings for comparison
+        tars : list of str or None
+            Target strings for comparison. If None, srcs is compared against
+            itself.
+        workers : int or None
+            The number of worker processes to use (1 by default, which
+            computes all values in the current process). If None, the number
+            of processors on the machine is used. This is ignored by measures
+            that support vectorized computation.
+        chunksize : int or None
+            The number of source strings per task submitted to the workers
+
+        Returns
+        -------
+        numpy.ndarray
+            A matrix of shape (len(srcs), len(tars)), in which the value at
+            [i, j] is the similarity of srcs[i] and tars[j]
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.sim_array(['cat', 'Niall'], ['hat', 'Neil', 'cat'])
+        array([[0.66666667, 0.        , 1.        ],
+               [0.2       , 0.4       , 0.2       ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._matrix('sim', srcs, tars, workers, chunksize)
+
+    def dist_array(
+        self,
+        srcs: Sequence[str],
+        tars: Optional[Sequence[str]] = None,
+        workers: Optional[int] = 1,
+        chunksize: Optional[int] = None,
+    ) -> np.ndarray:
+        """Return the distances of all pairs of strings.
+
+        Parameters
+        ----------
+        srcs : list of str
+            Source strings for comparison
+        tars : list of str or None
+            Target strings for comparison. If None, srcs is compared against
+            itself.
+        workers : int or None
+            The number of worker processes to use (1 by default, which
+            computes all values in the current process). If None, the number
+            of processors on the machine is used. This is ignored by measures
+            that support vectorized computation.
+        chunksize : int or None
+            The number of source strings per task submitted to the workers
+
+        Returns
+        -------
+        numpy.ndarray
+            A matrix of shape (len(srcs), len(tars)), in which the value at
+            [i, j] is the distance between srcs[i] and tars[j]
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.dist_array(['cat', 'Niall'], ['hat', 'Neil', 'cat'])
+        array([[0.33333333, 1.        , 0.        ],
+               [0.8       , 0.6       , 0.8       ]])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._matrix('dist', srcs, tars, workers, chunksize)
+
+    def pdist(
+        self,
+        collection: Sequence[str],
+        workers: Optional[int] = 1,
+        chunksize: Optional[int] = None,
+    ) -> np.ndarray:
+        r"""Return the condensed pairwise distances within a collection.
+
+        As with :py:func:`scipy.spatial.distance.pdist`, the distance between
+        collection[i] and collection[j], for i < j, is stored at index
+        :math:`n \cdot i + j - \frac{(i+1)(i+2)}{2}`, where n is the size
+        of the collection. Only the values above the diagonal are computed.
+
+        Parameters
+        ----------
+        collection : list of str
+            The strings to compare
+        workers : int or None
+            The number of worker processes to use (1 by default, which
+            computes all values in the current process). If None, the number
+            of processors on the machine is used. This is ignored by measures
+            that support vectorized computation.
+        chunksize : int or None
+            The number of strings per task submitted to the workers
+
+        Returns
+        -------
+        numpy.ndarray
+            A vector of length :math:`\frac{n(n-1)}{2}`
+
+        Examples
+        --------
+        >>> from abydos.distance import Levenshtein
+        >>> cmp = Levenshtein()
+        >>> cmp.pdist(['cat', 'hat', 'Niall', 'Neil'])
+        array([0.33333333, 0.8       , 1.        , 0.8       , 1.        ,
+               0.6       ])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        collection = list(collection)
+        size = len(collection)
+
+        batch = self._batch('dist', collection, collection)
+        if batch is not None:
+            return cast(np.ndarray, batch[np.triu_indices(size, 1)])
+
+        condensed = np.zeros(size * (size - 1) // 2, dtype=np.float_)
+        pos = 0
+        for row in self._pairwise(
+            'dist',
+            collection,
+            collection,
+            triangle=True,
+            workers=workers,
+            chunksize=chunksize,
+        ):
+            condensed[pos : pos + len(row)] = row
+            pos += len(row)
+        return condensed
+
 
 if __name__ == '__main__':
     import doctest
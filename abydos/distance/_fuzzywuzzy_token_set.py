@@ -99,20 +99,20 @@ class FuzzyWuzzyTokenSet(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        src_tok = self.params['tokenizer'].tokenize(src).get_set()
-        tar_tok = self.params['tokenizer'].tokenize(tar).get_set()
+        src_tok = self._thread_tokenizer().tokenize(src).get_set()
+        tar_tok = self._thread_tokenizer().tokenize(tar).get_set()
 
         intersection = src_tok & tar_tok
         src_tok -= intersection
         tar_tok -= intersection
 
-        intersection = ' '.join(sorted(intersection)) + ' '
-        src = intersection + ' '.join(sorted(src_tok))
-        tar = intersection + ' '.join(sorted(tar_tok))
+        common = ' '.join(sorted(intersection)) + ' '
+        src = common + ' '.join(sorted(src_tok))
+        tar = common + ' '.join(sorted(tar_tok))
 
         return max(
-            SequenceMatcher(None, src, intersection).ratio(),
-            SequenceMatcher(None, intersection, tar).ratio(),
+            SequenceMatcher(None, src, common).ratio(),
+            SequenceMatcher(None, common, tar).ratio(),
             SequenceMatcher(None, src, tar).ratio(),
         )
 
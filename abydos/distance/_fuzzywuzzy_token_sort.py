@@ -102,10 +102,10 @@ class FuzzyWuzzyTokenSort(_TokenDistance):
 
         """
         src = ' '.join(
-            sorted(self.params['tokenizer'].tokenize(src).get_list())
+            sorted(self._thread_tokenizer().tokenize(src).get_list())
         )
         tar = ' '.join(
-            sorted(self.params['tokenizer'].tokenize(tar).get_list())
+            sorted(self._thread_tokenizer().tokenize(tar).get_list())
         )
 
         return SequenceMatcher(None, src, tar).ratio()
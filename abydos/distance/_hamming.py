@@ -19,7 +19,9 @@
 Hamming distance
 """
 
-from typing import Any
+from typing import Any, Optional, Sequence, cast
+
+import numpy as np
 
 from ._distance import _Distance
 
@@ -158,6 +160,83 @@ class Hamming(_Distance):
             return 0.0
         return self.dist_abs(src, tar) / max(len(src), len(tar))
 
+    def _batch(
+        self, method: str, srcs: Sequence[str], tars: Sequence[str]
+    ) -> Optional[np.ndarray]:
+        """Return a vectorized matrix of Hamming distances.
+
+        The strings are packed into zero-padded arrays of code points, so that
+        each row of the matrix is computed as a single array comparison.
+        Strings containing NUL characters are compared with the generic
+        implementation, since these cannot be distinguished from padding.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method to vectorize
+        srcs : list of str
+            Source strings for comparison
+        tars : list of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray or None
+            The pairwise values
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if any('\x00' in term for term in srcs) or any(
+            '\x00' in term for term in tars
+        ):
+            return None
+
+        src_lens = np.array([len(src) for src in srcs], dtype=np.int_)
+        tar_lens = np.array([len(tar) for tar in tars], dtype=np.int_)
+        if (
+            not self._diff_lens
+            and len(set(src_lens.tolist()) | set(tar_lens.tolist())) > 1
+        ):
+            raise ValueError(
+                'Undefined for sequences of unequal length; set diff_lens '
+                + 'to True for Hamming distance between strings of unequal '
+                + 'lengths.'
+            )
+
+        width = max(
+            1, int(src_lens.max(initial=0)), int(tar_lens.max(initial=0))
+        )
+        src_codes = (
+            np.array(srcs, dtype='<U{}'.format(width))
+            .view(np.uint32)
+            .reshape(len(srcs), width)
+        )
+        tar_codes = (
+            np.array(tars, dtype='<U{}'.format(width))
+            .view(np.uint32)
+            .reshape(len(tars), width)
+        )
+
+        # Padding positions differ from every character, so the count of
+        # differing positions includes the difference in lengths.
+        dist_abs = np.empty((len(srcs), len(tars)), dtype=np.float_)
+        for i in range(len(srcs)):
+            dist_abs[i, :] = np.count_nonzero(
+                tar_codes != src_codes[i], axis=1
+            )
+
+        if method == 'dist_abs':
+            return cast(np.ndarray, dist_abs)
+        longer = np.maximum.outer(src_lens, tar_lens)
+        dist = np.divide(
+            dist_abs, longer, out=np.zeros_like(dist_abs), where=longer > 0,
+        )
+        if method == 'dist':
+            return cast(np.ndarray, dist)
+        return cast(np.ndarray, 1.0 - dist)
+
 
 if __name__ == '__main__':
     import doctest
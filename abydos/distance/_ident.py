@@ -19,6 +19,10 @@
 Identity similarity & distance
 """
 
+from typing import Optional, Sequence, cast
+
+import numpy as np
+
 from ._distance import _Distance
 
 __all__ = ['Ident']
@@ -64,6 +68,36 @@ class Ident(_Distance):
         """
         return 1.0 if src == tar else 0.0
 
+    def _batch(
+        self, method: str, srcs: Sequence[str], tars: Sequence[str]
+    ) -> Optional[np.ndarray]:
+        """Return a vectorized matrix of identity values.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method to vectorize
+        srcs : list of str
+            Source strings for comparison
+        tars : list of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The pairwise values
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        sim = np.equal.outer(
+            np.array(srcs, dtype=object), np.array(tars, dtype=object)
+        ).astype(np.float_)
+        if method == 'sim':
+            return cast(np.ndarray, sim)
+        return cast(np.ndarray, 1.0 - sim)
+
 
 if __name__ == '__main__':
     import doctest
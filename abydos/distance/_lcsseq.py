@@ -19,7 +19,7 @@
 Longest common subsequence
 """
 
-from typing import Any, Callable, List
+from typing import Any, Callable, List, Optional
 
 from numpy import int_ as np_int
 from numpy import zeros as np_zeros
@@ -36,10 +36,15 @@ class LCSseq(_Distance):
     characters that two strings have in common.
 
     .. versionadded:: 0.3.6
+    .. versionchanged:: 0.6.0
+        Added min_similarity option
     """
 
     def __init__(
-        self, normalizer: Callable[[List[float]], float] = max, **kwargs: Any
+        self,
+        normalizer: Callable[[List[float]], float] = max,
+        min_similarity: Optional[float] = None,
+        **kwargs: Any
     ) -> None:
         r"""Initialize LCSseq.
 
@@ -51,15 +56,24 @@ class LCSseq(_Distance):
             lambda x: sum(x)/2.0 is supplied, the normalization proposed in
             :cite:`Radev:2001` is used, i.e.
             :math:`\frac{2 \dot |LCS(src, tar)|}{|src| + |tar|}`.
+        min_similarity : float or None
+            If set, the similarity computation is limited to the diagonal band
+            of the length matrix in which similarities of at least
+            min_similarity can occur and stops as soon as the similarity is
+            certain to fall below min_similarity. In that case, sim returns
+            0.0.
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added min_similarity option
 
         """
         super(LCSseq, self).__init__(**kwargs)
         self._normalizer = normalizer
+        self._min_similarity = min_similarity
 
     def lcsseq(self, src: str, tar: str) -> str:
         """Return the longest common subsequence of two strings.
@@ -127,6 +141,64 @@ class LCSseq(_Distance):
                 j -= 1
         return result
 
+    def _banded_length(self, src: str, tar: str, min_length: float) -> int:
+        """Return the length of the LCS, computed within a diagonal band.
+
+        A common subsequence of length L leaves |src| + |tar| - 2L characters
+        unmatched, so only cells of the length matrix within that many
+        positions of the diagonal are computed. The computation stops once
+        no cell of the current row can be extended to a common subsequence
+        of min_length characters.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        min_length : float
+            The minimum length of interest
+
+        Returns
+        -------
+        int
+            The length of the longest common subsequence, or -1 if that is
+            less than min_length
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_len = len(src)
+        tar_len = len(tar)
+        band = int(src_len + tar_len - 2 * min_length) + 1
+
+        cur_row = [0] * (tar_len + 1)
+        for i, src_char in enumerate(src):
+            prev_row = cur_row
+            cur_row = [0] * (tar_len + 1)
+            start = max(0, i - band)
+            stop = min(tar_len, i + band + 1)
+            for j in range(start, stop):
+                if src_char == tar[j]:
+                    cur_row[j + 1] = prev_row[j] + 1
+                else:
+                    cur_row[j + 1] = max(cur_row[j], prev_row[j + 1])
+
+            remaining = src_len - i - 1
+            if (
+                max(
+                    cur_row[j] + min(remaining, tar_len - j)
+                    for j in range(start, stop + 1)
+                )
+                < min_length
+            ):
+                return -1
+
+        if cur_row[tar_len] < min_length:
+            return -1
+        return cur_row[tar_len]
+
     def sim(self, src: str, tar: str) -> float:
         r"""Return the longest common subsequence similarity of two strings.
 
@@ -159,6 +231,12 @@ class LCSseq(_Distance):
         >>> sseq.sim('ATCG', 'TAGC')
         0.5
 
+        >>> sseq = LCSseq(min_similarity=0.5)
+        >>> sseq.sim('Niall', 'Neil')
+        0.6
+        >>> sseq.sim('aluminum', 'Catalan')
+        0.0
+
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
@@ -170,6 +248,18 @@ class LCSseq(_Distance):
             return 1.0
         elif not src or not tar:
             return 0.0
+
+        if self._min_similarity is not None:
+            normalize_term = self._normalizer([len(src), len(tar)])
+            if min(len(src), len(tar)) / normalize_term < self._min_similarity:
+                return 0.0
+            length = self._banded_length(
+                src, tar, self._min_similarity * normalize_term
+            )
+            if length / normalize_term < self._min_similarity:
+                return 0.0
+            return length / normalize_term
+
         return len(self.lcsseq(src, tar)) / self._normalizer(
             [len(src), len(tar)]
         )
@@ -19,6 +19,10 @@
 Length similarity & distance
 """
 
+from typing import Optional, Sequence, cast
+
+import numpy as np
+
 from ._distance import _Distance
 
 __all__ = ['Length']
@@ -74,6 +78,46 @@ class Length(_Distance):
             len(src) / len(tar) if len(src) < len(tar) else len(tar) / len(src)
         )
 
+    def _batch(
+        self, method: str, srcs: Sequence[str], tars: Sequence[str]
+    ) -> Optional[np.ndarray]:
+        """Return a vectorized matrix of length similarities or distances.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method to vectorize
+        srcs : list of str
+            Source strings for comparison
+        tars : list of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The pairwise values
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src_lens = np.array([len(src) for src in srcs], dtype=np.float_)
+        tar_lens = np.array([len(tar) for tar in tars], dtype=np.float_)
+        shorter = np.minimum.outer(src_lens, tar_lens)
+        longer = np.maximum.outer(src_lens, tar_lens)
+
+        sim = np.divide(
+            shorter, longer, out=np.zeros_like(shorter), where=longer > 0
+        )
+        sim[
+            np.equal.outer(
+                np.array(srcs, dtype=object), np.array(tars, dtype=object)
+            )
+        ] = 1.0
+        if method == 'sim':
+            return cast(np.ndarray, sim)
+        return cast(np.ndarray, 1.0 - sim)
+
 
 if __name__ == '__main__':
     import doctest
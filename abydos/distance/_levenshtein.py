@@ -24,7 +24,7 @@ based on Levenshtein distance, including:
 """
 
 from sys import float_info
-from typing import Any, Callable, List, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 import numpy as np
 
@@ -47,11 +47,17 @@ class Levenshtein(_Distance):
     :cite:`Wagner:1974`.
 
     Levenshtein edit distance ordinarily has unit insertion, deletion, and
-    substitution costs.
+    substitution costs. When unit costs are used and tapering is disabled,
+    the distance is computed by the bit-parallel algorithm of Myers
+    :cite:`Myers:1999`, as formulated by Hyyrö :cite:`Hyyro:2001`, including
+    Hyyrö's extension for Optimal String Alignment distance
+    :cite:`Hyyro:2003`.
 
     .. versionadded:: 0.3.6
     .. versionchanged:: 0.4.0
         Added taper option
+    .. versionchanged:: 0.6.0
+        Added bit-parallel computation for unit costs & max_distance option
     """
 
     def __init__(
@@ -60,6 +66,7 @@ class Levenshtein(_Distance):
         cost: Tuple[float, float, float, float] = (1, 1, 1, 1),
         normalizer: Callable[[List[float]], float] = max,
         taper: bool = False,
+        max_distance: Optional[float] = None,
         **kwargs: Any
     ) -> None:
         """Initialize Levenshtein instance.
@@ -89,11 +96,19 @@ class Levenshtein(_Distance):
             edits at the start of the string to "just [exceed] twice the
             minimum penalty for replacement or deletion at the end of the
             string".
+        max_distance : float or None
+            If set, the distance computation is limited to the diagonal band
+            of the alignment matrix in which distances of at most max_distance
+            can occur and stops as soon as the distance is certain to exceed
+            max_distance. In that case, dist_abs returns max_distance + 1 and
+            dist returns 1.0.
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_distance option
 
         """
         super(Levenshtein, self).__init__(**kwargs)
@@ -101,6 +116,7 @@ class Levenshtein(_Distance):
         self._cost = cost
         self._normalizer = normalizer
         self._taper_enabled = taper
+        self._max_distance = max_distance
 
     def _taper(self, pos: int, length: int) -> float:
         return (
@@ -109,6 +125,161 @@ class Levenshtein(_Distance):
             else 1
         )
 
+    def _bit_parallel(
+        self, src: str, tar: str, max_distance: Optional[float] = None
+    ) -> float:
+        """Return the unit-cost distance, computed bit-parallel.
+
+        Each column of the dynamic programming matrix is represented by bit
+        vectors of vertical positive and negative deltas, so a single pass
+        of bitwise operations per character of tar replaces the inner loop
+        over src. Python's integers have arbitrary precision, so strings of
+        any length are processed as a single block rather than as a series
+        of machine words.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        max_distance : float or None
+            If set, computation stops once the distance must exceed this value
+
+        Returns
+        -------
+        int
+            The Levenshtein (or OSA) distance between src & tar, or
+            max_distance + 1 if that is exceeded
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # The shorter string is the pattern, to keep the vectors short.
+        if len(src) > len(tar):
+            src, tar = tar, src
+
+        peq = {}  # type: Dict[str, int]
+        bit = 1
+        for char in src:
+            peq[char] = peq.get(char, 0) | bit
+            bit <<= 1
+
+        full = (1 << len(src)) - 1
+        last = 1 << (len(src) - 1)
+        osa = self._mode == 'osa'
+
+        dist = len(src)
+        vp = full
+        vn = 0
+        d0 = 0
+        pm_prev = 0
+        remaining = len(tar)
+        for char in tar:
+            pm = peq.get(char, 0)
+            if osa:
+                trans = (((~d0 & pm) << 1) & pm_prev) & full
+                pm_prev = pm
+            else:
+                trans = 0
+            d0 = (((((pm & vp) + vp) & full) ^ vp) | pm | vn | trans) & full
+            hp = (vn | ~(d0 | vp)) & full
+            hn = d0 & vp
+            if hp & last:
+                dist += 1
+            elif hn & last:
+                dist -= 1
+            hp = ((hp << 1) | 1) & full
+            hn = (hn << 1) & full
+            vp = (hn | ~(d0 | hp)) & full
+            vn = hp & d0
+
+            # The distance decreases by at most 1 per remaining character.
+            remaining -= 1
+            if max_distance is not None and dist - remaining > max_distance:
+                return max_distance + 1
+
+        return dist
+
+    def _banded(self, src: str, tar: str, max_distance: float) -> float:
+        """Return the distance, computed within a diagonal band.
+
+        Only the cells of the alignment matrix within
+        max_distance / min(insert cost, delete cost) of the diagonal can lie
+        on an alignment costing at most max_distance, so all other cells are
+        skipped. Since every alignment passes through each row (or, in OSA
+        mode, through at least one of each pair of adjacent rows), the
+        computation stops once these rows' minima exceed max_distance.
+
+        Parameters
+        ----------
+        src : str
+            Source string for comparison
+        tar : str
+            Target string for comparison
+        max_distance : float
+            The maximum distance of interest
+
+        Returns
+        -------
+        float
+            The Levenshtein distance between src & tar, or max_distance + 1
+            if that is exceeded
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        ins_cost, del_cost, sub_cost, trans_cost = self._cost
+
+        src_len = len(src)
+        tar_len = len(tar)
+        max_len = max(src_len, tar_len)
+        osa = self._mode == 'osa'
+        inf = float('inf')
+
+        min_indel = min(ins_cost, del_cost)
+        band = int(max_distance // min_indel) if min_indel > 0 else max_len
+
+        prev_row = [inf] * (tar_len + 1)
+        cur_row = [
+            j * self._taper(j, max_len) * ins_cost if j <= band else inf
+            for j in range(tar_len + 1)
+        ]
+        prev_min = min(cur_row)
+        for i in range(src_len):
+            prev_prev_row, prev_row = prev_row, cur_row
+            cur_row = [inf] * (tar_len + 1)
+            if i < band:
+                cur_row[0] = (i + 1) * self._taper(i + 1, max_len) * del_cost
+            for j in range(max(0, i - band), min(tar_len, i + band + 1)):
+                taper = self._taper(1 + max(i, j), max_len)
+                cost = min(
+                    cur_row[j] + ins_cost * taper,
+                    prev_row[j + 1] + del_cost * taper,
+                    prev_row[j]
+                    + (sub_cost * taper if src[i] != tar[j] else 0),
+                )
+                if (
+                    osa
+                    and i
+                    and j
+                    and src[i] == tar[j - 1]
+                    and src[i - 1] == tar[j]
+                ):
+                    cost = min(cost, prev_prev_row[j - 1] + trans_cost * taper)
+                cur_row[j + 1] = cost
+
+            cur_min = min(cur_row)
+            if cur_min > max_distance and (not osa or prev_min > max_distance):
+                return max_distance + 1
+            prev_min = cur_min
+
+        if cur_row[tar_len] > max_distance:
+            return max_distance + 1
+        return cur_row[tar_len]
+
     def _alignment_matrix(
         self, src: str, tar: str, backtrace: bool = True
     ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
@@ -298,6 +469,12 @@ class Levenshtein(_Distance):
         >>> cmp.dist_abs('ACTG', 'TAGC')
         4
 
+        >>> cmp = Levenshtein(max_distance=2)
+        >>> cmp.dist_abs('cat', 'hat')
+        1
+        >>> cmp.dist_abs('aluminum', 'Catalan')
+        3
+
 
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
@@ -312,23 +489,48 @@ class Levenshtein(_Distance):
 
         if src == tar:
             return 0
-        if not src:
-            return sum(
-                ins_cost * self._taper(pos, max_len) for pos in range(tar_len)
-            )
-        if not tar:
-            return sum(
-                del_cost * self._taper(pos, max_len) for pos in range(src_len)
-            )
 
-        d_mat = cast(
-            np.ndarray, self._alignment_matrix(src, tar, backtrace=False)
-        )
+        max_distance = self._max_distance
+        if max_distance is not None and (
+            (src_len - tar_len) * del_cost > max_distance
+            or (tar_len - src_len) * ins_cost > max_distance
+        ):
+            return max_distance + 1
+
+        if not src or not tar:
+            if not src:
+                distance = sum(
+                    ins_cost * self._taper(pos, max_len)
+                    for pos in range(tar_len)
+                )
+            else:
+                distance = sum(
+                    del_cost * self._taper(pos, max_len)
+                    for pos in range(src_len)
+                )
+            if max_distance is not None and distance > max_distance:
+                return max_distance + 1
+            return distance
+
+        if (
+            not self._taper_enabled
+            and ins_cost == del_cost == sub_cost == 1
+            and (self._mode != 'osa' or trans_cost == 1)
+        ):
+            return self._bit_parallel(src, tar, max_distance)
+
+        if max_distance is not None:
+            distance = self._banded(src, tar, max_distance)
+        else:
+            d_mat = cast(
+                np.ndarray, self._alignment_matrix(src, tar, backtrace=False)
+            )
+            distance = d_mat[src_len, tar_len]
 
-        if int(d_mat[src_len, tar_len]) == d_mat[src_len, tar_len]:
-            return int(d_mat[src_len, tar_len])
+        if int(distance) == distance:
+            return int(distance)
         else:
-            return cast(float, d_mat[src_len, tar_len])
+            return cast(float, distance)
 
     def dist(self, src: str, tar: str) -> float:
         """Return the normalized Levenshtein distance between two strings.
@@ -395,7 +597,10 @@ class Levenshtein(_Distance):
                 [src_len * del_cost, tar_len * ins_cost]
             )
 
-        return self.dist_abs(src, tar) / normalize_term
+        distance = self.dist_abs(src, tar)
+        if self._max_distance is not None and distance > self._max_distance:
+            return 1.0
+        return distance / normalize_term
 
 
 if __name__ == '__main__':
@@ -19,9 +19,11 @@
 Overlap similarity & distance
 """
 
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
-from ._token_distance import _TokenDistance
+import numpy as np
+
+from ._token_distance import _TokenDistance, _identical
 from ..tokenizer import _Tokenizer
 
 __all__ = ['Overlap']
@@ -134,6 +136,28 @@ class Overlap(_TokenDistance):
             self._src_card(), self._tar_card()
         )
 
+    def _sim_block(
+        self,
+        srcs: Sequence[str],
+        tars: Sequence[str],
+        intersections: np.ndarray,
+        src_cards: np.ndarray,
+        tar_cards: np.ndarray,
+    ) -> Optional[np.ndarray]:
+        """Return the overlap coefficients of a block from its cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        identical = _identical(srcs, tars)
+        smaller = np.minimum.outer(src_cards, tar_cards)
+        compared = ~identical & (smaller > 0)
+
+        sims = np.zeros(intersections.shape, dtype=np.float_)
+        sims[compared] = intersections[compared] / smaller[compared]
+        sims[identical] = 1.0
+        return sims
+
 
 if __name__ == '__main__':
     import doctest
@@ -0,0 +1,469 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._similarity_join.
+
+Token-based similarity join index
+"""
+
+from collections import Counter
+from math import ceil, floor, sqrt
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from ._cosine import Cosine
+from ._dice import Dice
+from ._jaccard import Jaccard
+from ._overlap import Overlap
+from ._token_distance import _TokenDistance
+
+__all__ = ['SimilarityJoin']
+
+# slack applied to the filter bounds, so that floating point rounding can
+# only ever admit extra candidates, which verification then rejects
+_EPS = 1e-9
+
+
+class SimilarityJoin:
+    """Similarity join index.
+
+    This index finds all pairs of strings whose :py:class:`.Jaccard`,
+    :py:class:`.Dice`, :py:class:`.Cosine`, or :py:class:`.Overlap`
+    similarity meets a threshold without comparing every pair. Each string is
+    tokenized by its measure's tokenizer (by default, :py:class:`.QGrams`)
+    and its tokens are sorted by increasing document frequency. Candidates
+    are then drawn from an inverted index over only the prefix of each
+    token list that any match must share :cite:`Chaudhuri:2006`, skipping
+    strings whose token counts are out of range :cite:`Bayardo:2007`, and
+    discarding candidates once their token positions show that the
+    threshold can no longer be met :cite:`Xiao:2008`. Similarities of the
+    surviving candidates are computed exactly, from the sorted token lists.
+
+    Token multisets are supported by treating the k-th occurrence of a token
+    as a distinct element, so similarities are identical to those returned
+    by the measure's own sim method, when using crisp intersections.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        measure: Optional[_TokenDistance] = None,
+        threshold: float = 0.8,
+        terms: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Initialize SimilarityJoin instance.
+
+        Parameters
+        ----------
+        measure : _TokenDistance
+            A Jaccard, Dice, Cosine, or Overlap instance (Jaccard with bigram
+            tokenization by default)
+        threshold : float
+            The minimum similarity of returned pairs, in the range (0, 1]
+        terms : iterable of str
+            Terms with which to populate the index. Token frequencies are
+            taken from these terms, so building an index from a collection is
+            preferable to adding its terms one at a time.
+
+        Raises
+        ------
+        ValueError
+            Unsupported measure or threshold
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._measure = Jaccard() if measure is None else measure
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError('threshold must be in the range (0, 1].')
+        self._threshold = threshold
+
+        if isinstance(self._measure, (Jaccard, Dice)):
+            self._kind = 'tversky'
+            # alpha & beta are equal for both, so the measure is symmetric
+            self._weight = float(self._measure.params['alpha'])
+        elif isinstance(self._measure, Cosine):
+            self._kind = 'cosine'
+        elif isinstance(self._measure, Overlap):
+            self._kind = 'overlap'
+        else:
+            raise ValueError(
+                'Only Jaccard, Dice, Cosine, & Overlap are supported.'
+            )
+        if self._measure.params['intersection_type'] != 'crisp':
+            raise ValueError('Only crisp intersections are supported.')
+
+        self._terms = []  # type: List[str]
+        self._elements = []  # type: List[List[float]]
+        self._sets = []  # type: List[FrozenSet[float]]
+        self._rank = {}  # type: Dict[Tuple[str, int], float]
+        self._index = {}  # type: Dict[float, List[Tuple[int, int]]]
+        self._empty = {}  # type: Dict[str, List[int]]
+
+        if terms is not None:
+            terms = list(terms)
+            tokenized = [self._tokenize(term) for term in terms]
+            freqs = Counter(
+                element for elements in tokenized for element in elements
+            )
+            for rank, element in enumerate(
+                sorted(freqs, key=lambda elt: (freqs[elt], elt))
+            ):
+                self._rank[element] = rank
+            for term, elements in zip(terms, tokenized):
+                self._add(term, elements)
+
+    def __len__(self) -> int:
+        """Return the number of terms in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._terms)
+
+    def _tokenize(self, term: str) -> List[Tuple[str, int]]:
+        """Return the elements of a term's token multiset.
+
+        Parameters
+        ----------
+        term : str
+            The term to tokenize
+
+        Returns
+        -------
+        list of tuples
+            Each token paired with each of its occurrence numbers
+
+        Raises
+        ------
+        ValueError
+            The tokenizer returned non-integral token counts
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not term:
+            return []
+        elements = []  # type: List[Tuple[str, int]]
+        tokens = self._measure.params['tokenizer'].tokenize(term).get_counter()
+        for token, count in tokens.items():
+            if count != int(count):
+                raise ValueError(
+                    'Tokenizers with scaled counts are not supported.'
+                )
+            elements.extend((token, occ) for occ in range(int(count)))
+        return elements
+
+    def _add(self, term: str, elements: List[Tuple[str, int]]) -> None:
+        """Add a tokenized term to the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        rid = len(self._terms)
+        self._terms.append(term)
+
+        for element in elements:
+            if element not in self._rank:
+                # tokens first seen after the index was built are taken to
+                # be rarer than all others
+                self._rank[element] = -1 - len(self._rank)
+        ranks = sorted(self._rank[element] for element in elements)
+        self._elements.append(ranks)
+        self._sets.append(frozenset(ranks))
+
+        if not ranks:
+            self._empty.setdefault(term, []).append(rid)
+            return
+        size = len(ranks)
+        for pos in range(size - self._min_overlap(size) + 1):
+            self._index.setdefault(ranks[pos], []).append((rid, pos))
+
+    def add(self, term: str) -> None:
+        """Add a term to the index.
+
+        Parameters
+        ----------
+        term : str
+            The term to add
+
+        Examples
+        --------
+        >>> join = SimilarityJoin(threshold=0.5)
+        >>> join.add('Niall')
+        >>> join.add('Niall')
+        >>> len(join)
+        2
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._add(term, self._tokenize(term))
+
+    def update(self, terms: Iterable[str]) -> None:
+        """Add each of a collection of terms to the index.
+
+        Parameters
+        ----------
+        terms : iterable of str
+            The terms to add
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for term in terms:
+            self.add(term)
+
+    def _size_bounds(self, size: int) -> Tuple[int, float]:
+        """Return the range of token counts that could match a size.
+
+        .. versionadded:: 0.6.0
+
+        """
+        thresh = self._threshold
+        if self._kind == 'tversky':
+            ratio = (
+                thresh * self._weight / (1 - thresh + thresh * self._weight)
+            )
+            return (
+                max(1, ceil(size * ratio - _EPS)),
+                floor(size / ratio + _EPS),
+            )
+        if self._kind == 'cosine':
+            return (
+                max(1, ceil(size * thresh * thresh - _EPS)),
+                floor(size / (thresh * thresh) + _EPS),
+            )
+        return 1, float('inf')
+
+    def _required(self, size1: int, size2: int) -> int:
+        """Return the minimum overlap of a match between two sizes.
+
+        .. versionadded:: 0.6.0
+
+        """
+        thresh = self._threshold
+        if self._kind == 'tversky':
+            # o >= t * (o + w * (x - o) + w * (y - o))
+            return max(
+                1,
+                ceil(
+                    thresh
+                    * self._weight
+                    * (size1 + size2)
+                    / (1 - thresh + 2 * thresh * self._weight)
+                    - _EPS
+                ),
+            )
+        if self._kind == 'cosine':
+            return max(1, ceil(thresh * sqrt(size1 * size2) - _EPS))
+        return max(1, ceil(thresh * min(size1, size2) - _EPS))
+
+    def _min_overlap(self, size: int) -> int:
+        """Return the minimum overlap of a match with any other size.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return min(size, self._required(size, self._size_bounds(size)[0]))
+
+    def _sim(self, overlap: int, size1: int, size2: int) -> float:
+        """Return the similarity, computed as the measure would.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not overlap:
+            return 0.0
+        if self._kind == 'tversky':
+            return overlap / (
+                overlap
+                + self._weight * (size1 - overlap)
+                + self._weight * (size2 - overlap)
+            )
+        if self._kind == 'cosine':
+            return overlap / sqrt(size1 * size2)
+        return overlap / min(size1, size2)
+
+    def _candidates(
+        self,
+        ranks: List[float],
+        prefix: int,
+        index: Dict[float, List[Tuple[int, int]]],
+    ) -> Dict[int, int]:
+        """Return candidates sharing a prefix element, with prefix overlaps.
+
+        .. versionadded:: 0.6.0
+
+        """
+        size = len(ranks)
+        min_size, max_size = self._size_bounds(size)
+        required = {}  # type: Dict[int, int]
+        overlaps = {}  # type: Dict[int, int]
+        for pos in range(prefix):
+            for rid, rid_pos in index.get(ranks[pos], ()):
+                seen = overlaps.get(rid, 0)
+                if seen < 0:
+                    continue
+                rid_size = len(self._elements[rid])
+                if not min_size <= rid_size <= max_size:
+                    continue
+                if rid_size not in required:
+                    required[rid_size] = self._required(size, rid_size)
+                # positional filter: the overlap cannot exceed what is shared
+                # so far plus the shorter of the two unseen suffixes
+                if (
+                    seen + 1 + min(size - pos - 1, rid_size - rid_pos - 1)
+                    < required[rid_size]
+                ):
+                    overlaps[rid] = -1
+                else:
+                    overlaps[rid] = seen + 1
+        return overlaps
+
+    def _verify(
+        self, ranks: FrozenSet[float], size: int, candidates: Dict[int, int]
+    ) -> List[Tuple[int, float]]:
+        """Return the candidates whose similarity meets the threshold.
+
+        .. versionadded:: 0.6.0
+
+        """
+        verified = []
+        for rid, seen in candidates.items():
+            if seen < 0:
+                continue
+            rid_ranks = self._sets[rid]
+            sim = self._sim(len(ranks & rid_ranks), size, len(rid_ranks))
+            if sim >= self._threshold:
+                verified.append((rid, sim))
+        return verified
+
+    def query(self, term: str) -> List[Tuple[str, float]]:
+        """Return the indexed terms similar to a term.
+
+        Parameters
+        ----------
+        term : str
+            The term to search for
+
+        Returns
+        -------
+        list of tuples
+            The indexed terms whose similarity to the search term meets the
+            threshold, paired with their similarities, in order of
+            decreasing similarity
+
+        Examples
+        --------
+        >>> join = SimilarityJoin(threshold=0.4,
+        ... terms=['Niall', 'Neal', 'Neil', 'Njall', 'Nigel'])
+        >>> join.query('Nial')
+        [('Niall', 0.8333333333333334), ('Neal', 0.42857142857142855)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        elements = self._tokenize(term)
+        if not elements:
+            return [(term, 1.0) for _ in self._empty.get(term, ())]
+
+        # elements absent from the index are ranked first & can never match
+        ranks = sorted(
+            self._rank.get(element, float('-inf')) for element in elements
+        )
+        size = len(ranks)
+        matches = []  # type: List[Tuple[float, str]]
+        for rid, sim in self._verify(
+            frozenset(ranks),
+            size,
+            self._candidates(
+                ranks, size - self._min_overlap(size) + 1, self._index
+            ),
+        ):
+            matches.append((-sim, self._terms[rid]))
+
+        return [(match, -neg_sim) for neg_sim, match in sorted(matches)]
+
+    def self_join(self) -> List[Tuple[str, str, float]]:
+        """Return all pairs of indexed terms that are similar.
+
+        Terms are joined in order of increasing token count, so that each
+        need only be indexed by the shorter prefix that any match of equal
+        or greater token count must share.
+
+        Returns
+        -------
+        list of tuples
+            Each pair of indexed terms whose similarity meets the threshold,
+            followed by their similarity. Pairs are ordered by the positions
+            at which their terms were added to the index, with the term added
+            first listed first.
+
+        Examples
+        --------
+        >>> join = SimilarityJoin(threshold=0.4,
+        ... terms=['Niall', 'Neal', 'Neil', 'Njall', 'Nigel'])
+        >>> join.self_join()
+        [('Niall', 'Njall', 0.5), ('Neal', 'Neil', 0.42857142857142855)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        pairs = []  # type: List[Tuple[int, int, float]]
+        index = {}  # type: Dict[float, List[Tuple[int, int]]]
+        for rid in sorted(
+            range(len(self._terms)), key=lambda rid: len(self._elements[rid])
+        ):
+            ranks = self._elements[rid]
+            size = len(ranks)
+            if not size:
+                continue
+
+            # every term already indexed is no larger than this one
+            for cand, sim in self._verify(
+                self._sets[rid],
+                size,
+                self._candidates(
+                    ranks, size - self._min_overlap(size) + 1, index
+                ),
+            ):
+                pairs.append((min(rid, cand), max(rid, cand), sim))
+
+            for pos in range(size - self._required(size, size) + 1):
+                index.setdefault(ranks[pos], []).append((rid, pos))
+
+        for rids in self._empty.values():
+            for pos, rid in enumerate(rids):
+                for other in rids[pos + 1 :]:
+                    pairs.append((rid, other, 1.0))
+
+        return [
+            (self._terms[rid1], self._terms[rid2], sim)
+            for rid1, rid2, sim in sorted(pairs)
+        ]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -43,6 +43,9 @@ class SingleLinkage(_TokenDistance):
     .. versionadded:: 0.4.0
     """
 
+    # compares the token strings themselves
+    _token_codes = False
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
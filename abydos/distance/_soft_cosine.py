@@ -57,6 +57,9 @@ class SoftCosine(_TokenDistance):
 
     """
 
+    # compares the token strings themselves
+    _token_codes = False
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
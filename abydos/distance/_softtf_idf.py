@@ -64,6 +64,9 @@ class SoftTFIDF(_TokenDistance):
 
     """
 
+    # compares the token strings themselves
+    _token_codes = False
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -142,7 +145,7 @@ class SoftTFIDF(_TokenDistance):
         src_tok, tar_tok = self._get_tokens()
 
         if self._corpus is None:
-            corpus = UnigramCorpus(word_tokenizer=self.params['tokenizer'])
+            corpus = UnigramCorpus(word_tokenizer=self._thread_tokenizer())
             corpus.add_document(src)
             corpus.add_document(tar)
         else:
@@ -19,19 +19,179 @@
 String subsequence kernel (SSK) similarity
 """
 
-from typing import Any, Optional
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+import numpy as np
 
 from ._token_distance import _TokenDistance
 from ..tokenizer import QSkipgrams, _Tokenizer
 
 __all__ = ['SSK']
 
+# the greatest number of matrix cells compared at once by the kernel engine
+_BLOCK_CELLS = 1 << 22
+
+
+def _code_points(strings: Sequence[str], pad: int) -> np.ndarray:
+    """Return the code points of strings, one row per string.
+
+    Parameters
+    ----------
+    strings : list of str
+        The strings
+    pad : int
+        The value following each string's code points in its row
+
+    Returns
+    -------
+    numpy.ndarray
+        A 2-dimensional array of code points
+
+    Examples
+    --------
+    >>> _code_points(['ab', 'c'], -1).tolist()
+    [[97, 98], [99, -1]]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    width = max([len(string) for string in strings] + [1])
+    codes = np.full((len(strings), width), pad, dtype=np.int64)
+    for row, string in enumerate(strings):
+        codes[row, : len(string)] = np.frombuffer(
+            string.encode('utf-32-le'), dtype=np.uint32
+        )
+    return cast(np.ndarray, codes)
+
+
+def _decayed_cumsum(
+    values: np.ndarray, ssk_lambda: float, axis: int
+) -> np.ndarray:
+    """Return cumulative sums along an axis, decayed by lambda at each step.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The values to sum
+    ssk_lambda : float
+        The decay factor
+    axis : int
+        The axis along which to sum
+
+    Returns
+    -------
+    numpy.ndarray
+        The sums, each of the values at its own & preceding positions along
+        the axis, with each value multiplied by lambda raised to its distance
+        from the sum's position
+
+    Examples
+    --------
+    >>> _decayed_cumsum(np.array([1.0, 1.0, 1.0]), 0.5, 0).tolist()
+    [1.0, 1.5, 1.75]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    sums = np.moveaxis(values, axis, 0).copy()
+    for pos in range(1, len(sums)):
+        sums[pos] += ssk_lambda * sums[pos - 1]
+    return cast(np.ndarray, np.moveaxis(sums, 0, axis))
+
+
+def _subsequence_kernels(
+    srcs: np.ndarray,
+    tars: np.ndarray,
+    qval: int,
+    ssk_lambdas: Sequence[float],
+) -> np.ndarray:
+    """Return the string subsequence kernels of pairs of strings.
+
+    This is the dynamic programming formulation of the kernel of
+    :cite:`Lodhi:2002`: the decayed counts of the common subsequences of each
+    length, which end at each pair of positions, are found from those of the
+    next shorter length by running sums over the preceding positions, decayed
+    by lambda at each step, taken over the source positions and then over the
+    target positions. Each length thus takes a pass over the rows & a pass
+    over the columns of the matrix of pairs of positions, so the kernel of
+    strings of lengths n & m takes O(q*n*m) time for each pair of lambdas.
+    Each occurrence of a subsequence is weighted by lambda raised to
+    its span plus q-2, as in the weights of :py:class:`.QSkipgrams`, and the
+    weights of multiple lambdas are summed.
+
+    Parameters
+    ----------
+    srcs : numpy.ndarray
+        The code points of the source strings, one row per string, padded
+        with a value that does not occur in tars
+    tars : numpy.ndarray
+        The code points of the target strings, one row per string, padded
+        with a value that does not occur in srcs
+    qval : int
+        The length of the subsequences
+    ssk_lambdas : list of floats
+        The decay factors
+
+    Returns
+    -------
+    numpy.ndarray
+        The kernel of each pair of source & target strings
+
+    Examples
+    --------
+    >>> _subsequence_kernels(
+    ...     _code_points(['cat'], -1), _code_points(['car'], -2), 2, [0.9]
+    ... ).tolist()
+    [0.6561000000000001]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    matches = (srcs[:, :, None] == tars[:, None, :]).astype(np.float_)
+    kernels = np.zeros(len(srcs), dtype=np.float_)
+    for src_lambda in ssk_lambdas:
+        for tar_lambda in ssk_lambdas:
+            decay = src_lambda * tar_lambda
+            subseqs = matches
+            for _ in range(qval - 1):
+                sums = _decayed_cumsum(
+                    _decayed_cumsum(subseqs, src_lambda, 1), tar_lambda, 2
+                )
+                subseqs = np.zeros_like(matches)
+                subseqs[:, 1:, 1:] = (
+                    matches[:, 1:, 1:] * sums[:, :-1, :-1] * decay
+                )
+            kernels += decay ** (qval - 1) * subseqs.sum(axis=(1, 2))
+    return kernels
+
 
 class SSK(_TokenDistance):
     r"""String subsequence kernel (SSK) similarity.
 
     This is based on :cite:`Lodhi:2002`.
 
+    By default, the kernel is the dot product of the strings' q-skipgram
+    weights, from the :py:class:`.QSkipgrams` tokenizer. The 'kernel' engine
+    instead computes it by dynamic programming over pairs of positions, as
+    described in :cite:`Lodhi:2002`, without enumerating any q-skipgrams. The
+    results are the same, up to floating point rounding, but the time taken
+    grows with the product of the strings' lengths, rather than with the
+    number of their q-skipgrams, so the engine suits long strings and large
+    values of q. The engine also computes the rows of :py:meth:`sim_array`,
+    :py:meth:`dist_array`, and :py:meth:`pdist` for many target strings at
+    once.
+
 
     .. versionadded:: 0.4.1
     """
@@ -40,6 +200,7 @@ class SSK(_TokenDistance):
         self,
         tokenizer: Optional[_Tokenizer] = None,
         ssk_lambda: float = 0.9,
+        engine: str = 'tokens',
         **kwargs: Any
     ) -> None:
         """Initialize SSK instance.
@@ -53,6 +214,17 @@ class SSK(_TokenDistance):
             characters according to the method described in :cite:`Lodhi:2002`.
             To supply multiple values of lambda, provide an Iterable of numeric
             values, such as (0.5, 0.05) or np.arange(0.05, 0.5, 0.05)
+        engine : str
+            The method used to compute the kernel of two strings:
+
+                - ``tokens`` (default) sums the products of their q-skipgram
+                  weights
+                - ``kernel`` uses dynamic programming over their positions,
+                  which requires a :py:class:`.QSkipgrams` tokenizer with the
+                  SSK scaler
+
+            .. versionadded:: 0.6.0
+
         **kwargs
             Arbitrary keyword arguments
 
@@ -63,8 +235,16 @@ class SSK(_TokenDistance):
             tokenizer=None will cause the instance to use the QGramskipgrams
             tokenizer with this q value.
 
+        Raises
+        ------
+        ValueError
+            Unknown engine, or the kernel engine was requested with an
+            unsupported tokenizer
+
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added engine parameter
 
         """
         super(SSK, self).__init__(
@@ -80,6 +260,149 @@ class SSK(_TokenDistance):
             )
         )
 
+        if engine not in {'tokens', 'kernel'}:
+            raise ValueError('Unknown engine: {}'.format(engine))
+        self._engine = engine
+        if engine == 'kernel':
+            tokenizer = self.params['tokenizer']
+            if (
+                not isinstance(tokenizer, QSkipgrams)
+                or tokenizer._scaler != 'SSK'  # noqa: SF01
+            ):
+                raise ValueError(
+                    'The kernel engine requires a QSkipgrams tokenizer with '
+                    'the SSK scaler.'
+                )
+            qvals = tokenizer.qval
+            if not isinstance(qvals, Iterable):
+                qvals = (qvals,)
+            self._qvals = [
+                qval_i for qval_i in qvals if qval_i >= 1
+            ]  # type: List[int]
+            self._start_stop = tokenizer.start_stop
+            self._lambdas = tuple(
+                tokenizer._lambda  # noqa: SF01
+            )  # type: Tuple[float, ...]
+
+    def _kernels(self, srcs: Sequence[str], tars: Sequence[str]) -> np.ndarray:
+        """Return the string subsequence kernels of pairs of strings.
+
+        The pairs are compared in blocks, in order of their lengths, so that
+        little of each block is padding.
+
+        Parameters
+        ----------
+        srcs : list of str
+            Source strings for comparison
+        tars : list of str
+            Target strings for comparison, as many as the source strings
+
+        Returns
+        -------
+        numpy.ndarray
+            The kernel of each source string & the corresponding target string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        kernels = np.zeros(len(tars), dtype=np.float_)
+        order = sorted(
+            range(len(tars)), key=lambda i: (len(tars[i]), len(srcs[i]))
+        )
+        for qval in self._qvals:
+            src_padded = [self._pad(srcs[i], qval) for i in order]
+            tar_padded = [self._pad(tars[i], qval) for i in order]
+            start = 0
+            while start < len(order):
+                stop = start + 1
+                src_width = len(src_padded[start])
+                tar_width = len(tar_padded[start])
+                while stop < len(order):
+                    src_width = max(src_width, len(src_padded[stop]))
+                    tar_width = max(tar_width, len(tar_padded[stop]))
+                    if (
+                        stop - start + 1
+                    ) * src_width * tar_width > _BLOCK_CELLS:
+                        break
+                    stop += 1
+                kernels[order[start:stop]] += _subsequence_kernels(
+                    _code_points(src_padded[start:stop], -1),
+                    _code_points(tar_padded[start:stop], -2),
+                    qval,
+                    self._lambdas,
+                )
+                start = stop
+        return kernels
+
+    def _pad(self, string: str, qval: int) -> str:
+        """Return a string with the tokenizer's start & stop symbols added.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._start_stop and string:
+            return (
+                self._start_stop[0] * (qval - 1)
+                + string
+                + self._start_stop[-1] * (qval - 1)
+            )
+        return string
+
+    def _batch(
+        self, method: str, srcs: Sequence[str], tars: Sequence[str]
+    ) -> Optional[np.ndarray]:
+        """Return a matrix of SSK similarities or distances from the kernels.
+
+        Each string's kernel with itself, by which the kernels are
+        normalized, is computed once.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method to vectorize
+        srcs : list of str
+            Source strings for comparison
+        tars : list of str
+            Target strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray or None
+            The pairwise values, or None for the tokens engine
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._engine != 'kernel' or method not in {'sim', 'dist'}:
+            return None
+
+        src_norms = self._kernels(srcs, srcs)
+        tar_norms = self._kernels(tars, tars)
+        mat = np.zeros((len(srcs), len(tars)), dtype=np.float_)
+        for i, src in enumerate(srcs):
+            scores = self._kernels([src] * len(tars), tars)
+            nonzero = scores != 0
+            mat[i, nonzero] = scores[nonzero] / np.sqrt(
+                src_norms[i] * tar_norms[nonzero]
+            )
+            mat[i, [src == tar for tar in tars]] = 1.0
+        if method == 'dist':
+            return cast(np.ndarray, 1.0 - mat)
+        return mat
+
+    def _scores(self, src: str, tar: str) -> Tuple[float, float]:
+        """Return the kernel & its normalization by the kernel engine.
+
+        .. versionadded:: 0.6.0
+
+        """
+        score, src_norm, tar_norm = self._kernels(
+            [src, src, tar], [tar, src, tar]
+        )
+        return score, (src_norm * tar_norm) ** 0.5
+
     def sim_score(self, src: str, tar: str) -> float:
         """Return the SSK similarity of two strings.
 
@@ -101,7 +424,7 @@ class SSK(_TokenDistance):
         >>> cmp.dist_abs('cat', 'hat')
         0.6441281138790036
         >>> cmp.dist_abs('Niall', 'Neil')
-        0.5290992177869402
+        0.5290992177869401
         >>> cmp.dist_abs('aluminum', 'Catalan')
         0.862398428061774
         >>> cmp.dist_abs('ATCG', 'TAGC')
@@ -111,6 +434,13 @@ class SSK(_TokenDistance):
         .. versionadded:: 0.4.1
 
         """
+        if (
+            self._engine == 'kernel'
+            and isinstance(src, str)
+            and isinstance(tar, str)
+        ):
+            return float(self._kernels([src], [tar])[0])
+
         self._tokenize(src, tar)
 
         src_wts = self._src_tokens
@@ -143,7 +473,7 @@ class SSK(_TokenDistance):
         >>> cmp.sim('cat', 'hat')
         0.3558718861209964
         >>> cmp.sim('Niall', 'Neil')
-        0.4709007822130597
+        0.47090078221305987
         >>> cmp.sim('aluminum', 'Catalan')
         0.13760157193822603
         >>> cmp.sim('ATCG', 'TAGC')
@@ -156,6 +486,16 @@ class SSK(_TokenDistance):
         if src == tar:
             return 1.0
 
+        if (
+            self._engine == 'kernel'
+            and isinstance(src, str)
+            and isinstance(tar, str)
+        ):
+            score, norm = self._scores(src, tar)
+            if not score:
+                return 0.0
+            return float(score / norm)
+
         self._tokenize(src, tar)
 
         src_wts = self._src_tokens
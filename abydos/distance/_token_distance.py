@@ -21,16 +21,24 @@ _TokenDistance.
 """
 
 from collections import Counter, OrderedDict
+from copy import copy
 from itertools import product
 from math import exp, log1p
+from threading import local
 from typing import (
     Any,
     Callable,
     Counter as TCounter,
+    Dict,
+    Generic,
+    List,
     Optional,
+    Sequence,
     Tuple,
+    TypeVar,
     Union,
     cast,
+    overload,
 )
 
 import numpy as np
@@ -39,11 +47,323 @@ from ._damerau_levenshtein import DamerauLevenshtein
 from ._distance import _Distance
 from ._lcprefix import LCPrefix
 from ._levenshtein import Levenshtein
+from ._token_profile import TokenProfile
 from ..stats import ConfusionTable
 from ..tokenizer import QGrams, QSkipgrams, WhitespaceTokenizer, _Tokenizer
 
 __all__ = ['_TokenDistance']
 
+T = TypeVar('T')
+
+
+def _profile_tokens(profile: Optional[TokenProfile]) -> TCounter[str]:
+    """Return the tokens of a profile, or no tokens if there is none.
+
+    The tokens of a profile with token codes are keyed by the codes, which
+    the measures use only as opaque keys, in place of the token strings.
+
+    .. versionadded:: 0.6.0
+
+    """
+    if profile is None:
+        return Counter()
+    return cast(TCounter[str], profile.tokens)
+
+
+class _Comparison:
+    """Per-call state of a token distance comparison.
+
+    A new instance is created for each pair of strings compared, so that the
+    tokens & intermediate values of one comparison are never visible to
+    another.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, normalizer: Callable[[float, int, float], float]):
+        """Initialize _Comparison instance.
+
+        Parameters
+        ----------
+        normalizer : function
+            The normalizer applied to contingency table values
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.src_orig = ''  # type: Union[str, TCounter[str]]
+        self.tar_orig = ''  # type: Union[str, TCounter[str]]
+        # tokens that are None are taken from the profile when first needed
+        self._src_tokens = None  # type: Optional[TCounter[str]]
+        self._tar_tokens = None  # type: Optional[TCounter[str]]
+        # profiles whose tokens are created only if needed
+        self.src_profile = None  # type: Optional[TokenProfile]
+        self.tar_profile = None  # type: Optional[TokenProfile]
+        self.src_card_value = None  # type: Optional[float]
+        self.tar_card_value = None  # type: Optional[float]
+        self.crisp_intersection_value = None  # type: Optional[TCounter[str]]
+        # the precomputed crisp intersection & complement cardinalities
+        self.cells = None  # type: Optional[Tuple[int, int]]
+        self.population_card_value = 0  # type: float
+        self.normalizer = normalizer
+        self.soft_intersection_precalc = Counter()  # type: TCounter[str]
+        self.soft_src_only = Counter()  # type: TCounter[str]
+        self.soft_tar_only = Counter()  # type: TCounter[str]
+
+    @property
+    def src_tokens(self) -> TCounter[str]:
+        """Return the source tokens, taking them from its profile if needed.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._src_tokens is None:
+            self._src_tokens = _profile_tokens(self.src_profile)
+        return self._src_tokens
+
+    @src_tokens.setter
+    def src_tokens(self, tokens: TCounter[str]) -> None:
+        self._src_tokens = tokens
+
+    @property
+    def tar_tokens(self) -> TCounter[str]:
+        """Return the target tokens, taking them from its profile if needed.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._tar_tokens is None:
+            self._tar_tokens = _profile_tokens(self.tar_profile)
+        return self._tar_tokens
+
+    @tar_tokens.setter
+    def tar_tokens(self, tokens: TCounter[str]) -> None:
+        self._tar_tokens = tokens
+
+
+class _ComparisonAttribute(Generic[T]):
+    """Descriptor delegating to an attribute of the current comparison.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, name: str, reset: Tuple[str, ...] = ()) -> None:
+        """Initialize _ComparisonAttribute instance.
+
+        Parameters
+        ----------
+        name : str
+            The name of the comparison's attribute
+        reset : tuple of str
+            The names of other attributes, derived from this one, to reset to
+            None when this one is set
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.name = name
+        self.reset = reset
+
+    @overload
+    def __get__(
+        self, instance: None, owner: type
+    ) -> '_ComparisonAttribute[T]':
+        pass  # pragma: no cover
+
+    @overload
+    def __get__(self, instance: '_TokenDistance', owner: type) -> T:
+        pass  # pragma: no cover
+
+    def __get__(
+        self, instance: Optional['_TokenDistance'], owner: type
+    ) -> Union['_ComparisonAttribute[T]', T]:
+        if instance is None:
+            return self
+        return cast(T, getattr(instance._comparison, self.name))
+
+    def __set__(self, instance: '_TokenDistance', value: T) -> None:
+        setattr(instance._comparison, self.name, value)
+        for derived in self.reset:
+            setattr(instance._comparison, derived, None)
+
+
+def _encode(
+    profiles: Sequence[TokenProfile],
+    features: Dict[Tuple[Union[str, int], int], int],
+) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Encode token profiles as sparse binary feature matrices.
+
+    Parameters
+    ----------
+    profiles : list of TokenProfile
+        The profiles to encode
+    features : dict
+        A mapping of features, each token paired with an occurrence number, to
+        column numbers, which is extended with any new features encountered
+
+    Returns
+    -------
+    tuple of numpy.ndarrays or None
+        A 2-row array of the row & column numbers of the nonzero entries for
+        all features, the number of distinct tokens in each profile, and a
+        2-row array of the nonzero entries for only the first occurrences of
+        each token; or None if any token count is not a positive integer
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    entries = []
+    firsts = []
+    distinct = []
+    for row, profile in enumerate(profiles):
+        for token, count in profile.tokens.items():
+            if not isinstance(count, int) or count < 1:
+                return None
+            for occurrence in range(count):
+                feature = features.setdefault(
+                    (token, occurrence), len(features)
+                )
+                entries.append((row, feature))
+            firsts.append((row, features[token, 0]))
+        distinct.append(len(profile.tokens))
+    return (
+        np.array(entries, dtype=np.int64).reshape(-1, 2).T,
+        np.array(distinct, dtype=np.int64),
+        np.array(firsts, dtype=np.int64).reshape(-1, 2).T,
+    )
+
+
+def _identical(srcs: Sequence[str], tars: Sequence[str]) -> np.ndarray:
+    """Return which pairs of strings are identical.
+
+    Parameters
+    ----------
+    srcs : list of str
+        Source strings for comparison
+    tars : list of str
+        Target strings for comparison
+
+    Returns
+    -------
+    numpy.ndarray
+        A boolean matrix of shape (len(srcs), len(tars))
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return cast(
+        np.ndarray,
+        np.equal.outer(
+            np.array(srcs, dtype=object), np.array(tars, dtype=object)
+        ).astype(np.bool_),
+    )
+
+
+def _merge_cells(
+    src_codes: Tuple[np.ndarray, np.ndarray],
+    tar_codes: Tuple[np.ndarray, np.ndarray],
+    alphabet: Optional[int],
+) -> Tuple[int, int]:
+    """Return the intersection & complement cardinalities of token codes.
+
+    Parameters
+    ----------
+    src_codes : tuple of numpy.ndarrays
+        The sorted distinct source token codes and their counts
+    tar_codes : tuple of numpy.ndarrays
+        The sorted distinct target token codes and their counts
+    alphabet : int or None
+        The cardinality of the alphabet of tokens
+
+    Returns
+    -------
+    tuple of ints
+        The crisp intersection cardinality, the sum of the minima of the
+        counts of the shared codes, and the cardinality of the complement of
+        the total
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    src_keys, src_counts = src_codes
+    tar_keys, tar_counts = tar_codes
+    if len(tar_keys):
+        pos = np.minimum(
+            np.searchsorted(tar_keys, src_keys), len(tar_keys) - 1
+        )
+        shared = tar_keys[pos] == src_keys
+        intersection = int(
+            np.minimum(src_counts[shared], tar_counts[pos[shared]]).sum()
+        )
+        num_shared = int(np.count_nonzero(shared))
+    else:
+        intersection = num_shared = 0
+    if alphabet is None:
+        return intersection, 0
+    return (
+        intersection,
+        max(0, alphabet - (len(src_keys) + len(tar_keys) - num_shared)),
+    )
+
+
+def _overlaps(
+    src_entries: np.ndarray,
+    tar_entries: np.ndarray,
+    shape: Tuple[int, int],
+    num_features: int,
+) -> np.ndarray:
+    """Return the product of two sparse binary matrices, transposing one.
+
+    Each source entry is paired with every target entry of the same feature,
+    by way of an index of the target rows sorted by feature, and the pairs
+    are counted.
+
+    Parameters
+    ----------
+    src_entries : numpy.ndarray
+        A 2-row array of the row & feature numbers of the source entries
+    tar_entries : numpy.ndarray
+        A 2-row array of the row & feature numbers of the target entries
+    shape : tuple of ints
+        The numbers of source & target rows
+    num_features : int
+        The number of features
+
+    Returns
+    -------
+    numpy.ndarray
+        The number of features shared by each pair of source & target rows
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    src_rows, src_feats = src_entries
+    tar_rows, tar_feats = tar_entries
+    num_srcs, num_tars = shape
+
+    tar_rows = tar_rows[np.argsort(tar_feats, kind='stable')]
+    counts = np.bincount(tar_feats, minlength=num_features)
+    starts = np.cumsum(counts) - counts
+
+    reps = counts[src_feats]
+    offsets = np.arange(reps.sum()) - np.repeat(np.cumsum(reps) - reps, reps)
+    pairs = (
+        np.repeat(src_rows, reps) * num_tars
+        + tar_rows[np.repeat(starts[src_feats], reps) + offsets]
+    )
+    return cast(
+        np.ndarray,
+        np.bincount(pairs, minlength=num_srcs * num_tars).reshape(
+            num_srcs, num_tars
+        ),
+    )
+
 
 class _TokenDistance(_Distance):
     r"""Abstract Token Distance class.
@@ -73,9 +393,48 @@ class _TokenDistance(_Distance):
     .. |c+d| replace:: :math:`q_1 = c+d = |N\setminus X|`
     .. |b+d| replace:: :math:`q_2 = b+d = |N\setminus Y|`
 
+    The tokens & contingency table values of each comparison are held in a
+    per-call object, local to the calling thread, and each thread tokenizes
+    with its own copy of the tokenizer, so a single instance may safely be
+    shared by multiple threads.
+
     .. versionadded:: 0.3.6
+    .. versionchanged:: 0.6.0
+        Made comparisons thread-safe
     """
 
+    # whether the measure may compare the token codes of TokenProfiles,
+    # rather than the token strings
+    _token_codes = True
+
+    _src_orig = _ComparisonAttribute(
+        'src_orig'
+    )  # type: _ComparisonAttribute[Union[str, TCounter[str]]]
+    _tar_orig = _ComparisonAttribute(
+        'tar_orig'
+    )  # type: _ComparisonAttribute[Union[str, TCounter[str]]]
+    _src_tokens = _ComparisonAttribute(
+        'src_tokens', ('src_card_value', 'crisp_intersection_value', 'cells')
+    )  # type: _ComparisonAttribute[TCounter[str]]
+    _tar_tokens = _ComparisonAttribute(
+        'tar_tokens', ('tar_card_value', 'crisp_intersection_value', 'cells')
+    )  # type: _ComparisonAttribute[TCounter[str]]
+    _population_card_value = _ComparisonAttribute(
+        'population_card_value'
+    )  # type: _ComparisonAttribute[float]
+    normalizer = _ComparisonAttribute(
+        'normalizer'
+    )  # type: _ComparisonAttribute[Callable[[float, int, float], float]]
+    _soft_intersection_precalc = _ComparisonAttribute(
+        'soft_intersection_precalc'
+    )  # type: _ComparisonAttribute[TCounter[str]]
+    _soft_src_only = _ComparisonAttribute(
+        'soft_src_only'
+    )  # type: _ComparisonAttribute[TCounter[str]]
+    _soft_tar_only = _ComparisonAttribute(
+        'soft_tar_only'
+    )  # type: _ComparisonAttribute[TCounter[str]]
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -166,6 +525,7 @@ class _TokenDistance(_Distance):
         .. versionadded:: 0.4.0
 
         """
+        self._local = local()
         super(_TokenDistance, self).__init__(
             intersection_type=intersection_type, **kwargs
         )
@@ -235,15 +595,6 @@ class _TokenDistance(_Distance):
         else:
             self._intersection = self._crisp_intersection  # type: ignore
 
-        self._src_tokens = Counter()  # type: TCounter[str]
-        self._tar_tokens = Counter()  # type: TCounter[str]
-        self._population_card_value = 0  # type: float
-
-        # initialize normalizer
-        self.normalizer = (
-            self._norm_none
-        )  # type: Callable[[float, int, float], float]  # noqa: E501
-
         self._norm_dict = {
             'proportional': self._norm_proportional,
             'log': self._norm_log,
@@ -253,10 +604,52 @@ class _TokenDistance(_Distance):
             'complement': self._norm_complement,
         }
 
-        # initialize values for soft intersection
-        self._soft_intersection_precalc = Counter()  # type: TCounter[str]
-        self._soft_src_only = Counter()  # type: TCounter[str]
-        self._soft_tar_only = Counter()  # type: TCounter[str]
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the instance's state, omitting thread-local values.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the instance's state.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._local = local()
+
+    @property
+    def _comparison(self) -> _Comparison:
+        """Return the calling thread's current comparison.
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            return cast(_Comparison, self._local.comparison)
+        except AttributeError:
+            self._local.comparison = _Comparison(self._norm_none)
+            return cast(_Comparison, self._local.comparison)
+
+    def _thread_tokenizer(self) -> _Tokenizer:
+        """Return the calling thread's copy of the tokenizer.
+
+        Tokenizers retain the tokens of the last string tokenized, so each
+        thread needs a copy of its own.
+
+        .. versionadded:: 0.6.0
+
+        """
+        tokenizer = self.params['tokenizer']
+        if getattr(self._local, 'tokenizer_orig', None) is not tokenizer:
+            self._local.tokenizer_orig = tokenizer
+            self._local.tokenizer = copy(tokenizer)
+        return cast(_Tokenizer, self._local.tokenizer)
 
     @staticmethod
     def _norm_none(x: float, _squares: int, _pop: float) -> float:
@@ -294,9 +687,9 @@ class _TokenDistance(_Distance):
         Parameters
         ----------
         src : str
-            Source string (or QGrams/Counter objects) for comparison
+            Source string (or TokenProfile/Counter objects) for comparison
         tar : str
-            Target string (or QGrams/Counter objects) for comparison
+            Target string (or TokenProfile/Counter objects) for comparison
 
         Returns
         -------
@@ -314,26 +707,11 @@ class _TokenDistance(_Distance):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Stores tokens in a new per-call, thread-local comparison object &
+            accepts TokenProfile objects
 
         """
-        self._src_orig = src
-        self._tar_orig = tar
-
-        if isinstance(src, Counter):
-            self._src_tokens = src
-        else:
-            self._src_tokens = (
-                self.params['tokenizer'].tokenize(src).get_counter()
-            )
-        if isinstance(tar, Counter):
-            self._tar_tokens = tar
-        else:
-            self._tar_tokens = (
-                self.params['tokenizer'].tokenize(tar).get_counter()
-            )
-
-        self._population_card_value = self._calc_population_card()
-
         # Set up the normalizer, a function of two variables:
         # x is the value in the contingency table square(s)
         # n is the number of squares that x represents
@@ -341,15 +719,315 @@ class _TokenDistance(_Distance):
             'normalizer' in self.params
             and self.params['normalizer'] in self._norm_dict
         ):
-            self.normalizer = self._norm_dict[self.params['normalizer']]
+            comparison = _Comparison(
+                self._norm_dict[self.params['normalizer']]
+            )
+        else:
+            comparison = _Comparison(self._norm_none)
+
+        comparison.src_orig = src
+        comparison.tar_orig = tar
+
+        tokenizer = self.params['tokenizer']
+        # profiles with token codes are compared by their codes, so the other
+        # string must have codes too; only measures with crisp intersections
+        # that do not compare the token strings themselves, nor count them in
+        # an alphabet Counter, can use codes
+        coded = [
+            isinstance(string, TokenProfile)
+            and string.tokenizer is tokenizer
+            and string.codes is not None
+            for string in (src, tar)
+        ]
+        if any(coded):
+            if (
+                self._token_codes
+                and self.params['intersection_type'] == 'crisp'
+                and not isinstance(self.params['alphabet'], Counter)
+                and not isinstance(src, Counter)
+                and not isinstance(tar, Counter)
+            ):
+                src = self.prepare(src, codes=True)
+                tar = self.prepare(tar, codes=True)
+            else:
+                if coded[0]:
+                    src = str(src)
+                if coded[1]:
+                    tar = str(tar)
+
+        if isinstance(src, TokenProfile) and src.tokenizer is tokenizer:
+            if src.codes is None:
+                comparison.src_tokens = _profile_tokens(src)
+            else:
+                comparison.src_profile = src
+            comparison.src_card_value = src.card
+        elif isinstance(src, Counter):
+            comparison.src_tokens = src
+        else:
+            comparison.src_tokens = (
+                self._thread_tokenizer().tokenize(src).get_counter()
+            )
+        if isinstance(tar, TokenProfile) and tar.tokenizer is tokenizer:
+            if tar.codes is None:
+                comparison.tar_tokens = _profile_tokens(tar)
+            else:
+                comparison.tar_profile = tar
+            comparison.tar_card_value = tar.card
+        elif isinstance(tar, Counter):
+            comparison.tar_tokens = tar
+        else:
+            comparison.tar_tokens = (
+                self._thread_tokenizer().tokenize(tar).get_counter()
+            )
 
-        # clear values for soft intersection
-        self._soft_intersection_precalc = Counter()
-        self._soft_src_only = Counter()
-        self._soft_tar_only = Counter()
+        # a block of comparisons being computed by _rows may supply the
+        # intersection & complement cardinalities of this pair, and those of
+        # profiles with token codes are computed from the codes
+        pending = getattr(self._local, 'pending', None)
+        if pending is not None and pending[0] is src and pending[1] is tar:
+            comparison.cells = pending[2]
+        elif comparison.src_profile is not None:
+            comparison.cells = _merge_cells(
+                src.codes,  # type: ignore
+                tar.codes,  # type: ignore
+                self.params['alphabet'],
+            )
+        if comparison.cells is not None:
+            comparison.population_card_value = (
+                cast(float, comparison.src_card_value)
+                + cast(float, comparison.tar_card_value)
+                + comparison.cells[1]
+            )
+        else:
+            comparison.population_card_value = self._calc_population_card(
+                comparison.src_tokens + comparison.tar_tokens
+            )
 
+        self._local.comparison = comparison
         return self
 
+    def prepare(self, src: str, codes: bool = False) -> TokenProfile:
+        """Return a string's token profile.
+
+        The profile may be passed to this measure, or to any other measure
+        sharing its tokenizer, in place of the string, and its tokens will be
+        used directly, rather than tokenizing the string again.
+
+        Parameters
+        ----------
+        src : str
+            The string to tokenize
+        codes : bool
+            If True, the profile holds the tokens as packed integer codes,
+            which measures with a crisp intersection compare by merging
+            sorted arrays; this requires a QGrams tokenizer, with no scaler or
+            the 'set' scaler
+
+        Returns
+        -------
+        TokenProfile
+            The string's token profile
+
+        Raises
+        ------
+        TypeError
+            Token codes require a QGrams tokenizer.
+
+        Examples
+        --------
+        >>> from abydos.distance import Jaccard
+        >>> cmp = Jaccard()
+        >>> query = cmp.prepare('Niall')
+        >>> [cmp.sim(query, cmp.prepare(name))
+        ... for name in ('Neal', 'Njall', 'Niall')]
+        [0.375, 0.5, 1.0]
+
+        >>> query = cmp.prepare('Niall', codes=True)
+        >>> [cmp.sim(query, cmp.prepare(name, codes=True))
+        ... for name in ('Neal', 'Njall', 'Niall')]
+        [0.375, 0.5, 1.0]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        tokenizer = self.params['tokenizer']
+        if (
+            isinstance(src, TokenProfile)
+            and src.tokenizer is tokenizer
+            and (src.codes is not None or not codes)
+        ):
+            return src
+        if codes:
+            if not isinstance(tokenizer, QGrams):
+                raise TypeError('Token codes require a QGrams tokenizer.')
+            return TokenProfile(
+                src, tokenizer=tokenizer, codes=tokenizer.tokenize_codes(src),
+            )
+        return TokenProfile(
+            src,
+            self._thread_tokenizer().tokenize(src).get_counter(),
+            tokenizer,
+        )
+
+    def _pairwise(
+        self,
+        method: str,
+        srcs: Sequence[str],
+        tars: Sequence[str],
+        triangle: bool = False,
+        workers: Optional[int] = 1,
+        chunksize: Optional[int] = None,
+    ) -> List[List[float]]:
+        """Return pairwise values by calling method on each pair.
+
+        Each string is tokenized once, before any comparisons are made.
+
+        .. versionadded:: 0.6.0
+
+        """
+        prepared = [self.prepare(src) for src in srcs]
+        return super(_TokenDistance, self)._pairwise(
+            method,
+            prepared,
+            prepared if tars is srcs else [self.prepare(tar) for tar in tars],
+            triangle,
+            workers,
+            chunksize,
+        )
+
+    def _sim_block(
+        self,
+        srcs: Sequence[str],
+        tars: Sequence[str],
+        intersections: np.ndarray,
+        src_cards: np.ndarray,
+        tar_cards: np.ndarray,
+    ) -> Optional[np.ndarray]:
+        """Return the similarities of a block from its cardinalities.
+
+        Measures whose similarity is a simple function of the crisp
+        intersection & set cardinalities may override this method, returning
+        the similarities of all pairs of the block as a single array
+        expression. It is called only when the tokens are not normalized.
+        Returning None causes each pair to be compared in turn instead.
+
+        Parameters
+        ----------
+        srcs : list of str
+            Source strings of the block
+        tars : list of str
+            Target strings for comparison
+        intersections : numpy.ndarray
+            The crisp intersection cardinality of each pair
+        src_cards : numpy.ndarray
+            The token cardinality of each source string
+        tar_cards : numpy.ndarray
+            The token cardinality of each target string
+
+        Returns
+        -------
+        numpy.ndarray or None
+            The similarities or None
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return None
+
+    def _rows(
+        self, method: str, srcs: Sequence[str], tars: Sequence[str], start: int
+    ) -> List[List[float]]:
+        """Return a block of rows of a pairwise matrix.
+
+        When the intersection is crisp and all token counts are positive
+        integers, the strings of the block are encoded as a sparse matrix, in
+        which each occurrence of each token is a separate binary feature, so
+        that the crisp intersection cardinality of every pair, the sum of the
+        minima of their token counts, is a single sparse matrix product. The
+        numbers of distinct tokens each pair shares, from which the complement
+        cardinalities are derived, are likewise a product over the first
+        occurrences alone.
+
+        Measures that support it compute the similarities & distances of the
+        whole block from these arrays at once (see :py:meth:`_sim_block`).
+        For all others, each comparison takes its contingency table values
+        from these, rather than from operations on its tokens.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.params['intersection_type'] != 'crisp' or isinstance(
+            self.params['alphabet'], Counter
+        ):
+            return super(_TokenDistance, self)._rows(method, srcs, tars, start)
+
+        src_profiles = [self.prepare(src) for src in srcs]
+        tar_profiles = [self.prepare(tar) for tar in tars]
+        features = {}  # type: Dict[Tuple[Union[str, int], int], int]
+        src_enc = _encode(src_profiles, features)
+        tar_enc = _encode(tar_profiles, features)
+        if src_enc is None or tar_enc is None:
+            return super(_TokenDistance, self)._rows(
+                method, src_profiles, tar_profiles, start
+            )
+
+        shape = (len(src_profiles), len(tar_profiles))
+        intersections = _overlaps(src_enc[0], tar_enc[0], shape, len(features))
+
+        if (
+            method in {'sim', 'dist'}
+            and self.params.get('normalizer') not in self._norm_dict
+        ):
+            sims = self._sim_block(
+                src_profiles,
+                tar_profiles,
+                intersections,
+                np.array([src.card for src in src_profiles]),
+                np.array([tar.card for tar in tar_profiles]),
+            )
+            if sims is not None:
+                values = sims if method == 'sim' else 1.0 - sims
+                return [
+                    row[row_num + start if start else 0 :]
+                    for row_num, row in enumerate(values.tolist())
+                ]
+
+        if self.params['alphabet'] is None:
+            complements = np.zeros_like(intersections)
+        else:
+            complements = np.maximum(
+                0,
+                self.params['alphabet']
+                - (
+                    src_enc[1][:, None]
+                    + tar_enc[1][None, :]
+                    - _overlaps(src_enc[2], tar_enc[2], shape, len(features))
+                ),
+            )
+
+        func = getattr(self, method)
+        rows = []
+        try:
+            for row, (src, src_inters, src_comps) in enumerate(
+                zip(src_profiles, intersections.tolist(), complements.tolist())
+            ):
+                begin = row + start if start else 0
+                row_values = []
+                for col in range(begin, len(tar_profiles)):
+                    tar = tar_profiles[col]
+                    self._local.pending = (
+                        src,
+                        tar,
+                        (src_inters[col], src_comps[col]),
+                    )
+                    row_values.append(func(src, tar))
+                rows.append(row_values)
+        finally:
+            self._local.pending = None
+        return rows
+
     def _get_tokens(self) -> Tuple[TCounter[str], TCounter[str]]:
         """Return the src and tar tokens as a tuple."""
         return self._src_tokens, self._tar_tokens
@@ -369,10 +1047,13 @@ class _TokenDistance(_Distance):
                 2,
                 self._population_card_value,
             )
+        comparison = self._comparison
+        if comparison.src_card_value is None:
+            comparison.src_card_value = sum(
+                abs(val) for val in comparison.src_tokens.values()
+            )
         return self.normalizer(
-            sum(abs(val) for val in self._src_tokens.values()),
-            2,
-            self._population_card_value,
+            comparison.src_card_value, 2, comparison.population_card_value
         )
 
     def _src_only(self) -> TCounter[str]:
@@ -391,6 +1072,13 @@ class _TokenDistance(_Distance):
 
     def _src_only_card(self) -> float:
         """Return the cardinality of the tokens only in the source set."""
+        comparison = self._comparison
+        if comparison.cells is not None:
+            return self.normalizer(
+                cast(float, comparison.src_card_value) - comparison.cells[0],
+                1,
+                comparison.population_card_value,
+            )
         return self.normalizer(
             sum(abs(val) for val in self._src_only().values()),
             1,
@@ -412,10 +1100,13 @@ class _TokenDistance(_Distance):
                 2,
                 self._population_card_value,
             )
+        comparison = self._comparison
+        if comparison.tar_card_value is None:
+            comparison.tar_card_value = sum(
+                abs(val) for val in comparison.tar_tokens.values()
+            )
         return self.normalizer(
-            sum(abs(val) for val in self._tar_tokens.values()),
-            2,
-            self._population_card_value,
+            comparison.tar_card_value, 2, comparison.population_card_value
         )
 
     def _tar_only(self) -> TCounter[str]:
@@ -434,6 +1125,13 @@ class _TokenDistance(_Distance):
 
     def _tar_only_card(self) -> float:
         """Return the cardinality of the tokens only in the target set."""
+        comparison = self._comparison
+        if comparison.cells is not None:
+            return self.normalizer(
+                cast(float, comparison.tar_card_value) - comparison.cells[0],
+                1,
+                comparison.population_card_value,
+            )
         return self.normalizer(
             sum(abs(val) for val in self._tar_only().values()),
             1,
@@ -449,6 +1147,15 @@ class _TokenDistance(_Distance):
 
     def _symmetric_difference_card(self) -> float:
         """Return the cardinality of the symmetric difference."""
+        comparison = self._comparison
+        if comparison.cells is not None:
+            return self.normalizer(
+                cast(float, comparison.src_card_value)
+                + cast(float, comparison.tar_card_value)
+                - 2 * comparison.cells[0],
+                2,
+                comparison.population_card_value,
+            )
         return self.normalizer(
             sum(abs(val) for val in self._symmetric_difference().values()),
             2,
@@ -476,46 +1183,64 @@ class _TokenDistance(_Distance):
 
     def _total_card(self) -> float:
         """Return the cardinality of the complement of the total."""
+        comparison = self._comparison
+        if comparison.cells is not None:
+            return self.normalizer(
+                cast(float, comparison.src_card_value)
+                + cast(float, comparison.tar_card_value),
+                3,
+                comparison.population_card_value,
+            )
         return self.normalizer(
             sum(abs(val) for val in self._total().values()),
             3,
             self._population_card_value,
         )
 
-    def _total_complement_card(self) -> float:
-        """Return the cardinality of the complement of the total."""
+    def _complement_card(self, total: TCounter[str]) -> float:
+        """Return the unnormalized cardinality of a total's complement."""
         if self.params['alphabet'] is None:
-            return self.normalizer(0, 1, self._population_card_value)
+            return 0
         elif isinstance(self.params['alphabet'], Counter):
-            return self.normalizer(
-                max(
-                    0,
-                    sum(
-                        abs(val)
-                        for val in (
-                            self.params['alphabet'] - self._total()
-                        ).values()
-                    ),
+            return max(
+                0,
+                sum(
+                    abs(val)
+                    for val in (self.params['alphabet'] - total).values()
                 ),
-                1,
-                self._population_card_value,
+            )
+        return max(0, cast(int, self.params['alphabet']) - len(total.values()))
+
+    def _total_complement_card(self) -> float:
+        """Return the cardinality of the complement of the total."""
+        comparison = self._comparison
+        if comparison.cells is not None:
+            return self.normalizer(
+                comparison.cells[1], 1, comparison.population_card_value
             )
         return self.normalizer(
-            max(0, self.params['alphabet'] - len(self._total().values())),
+            self._complement_card(self._total()),
             1,
             self._population_card_value,
         )
 
-    def _calc_population_card(self) -> float:
-        """Return the cardinality of the population."""
-        save_normalizer = self.normalizer
-        self.normalizer = self._norm_none
-        save_intersection = self.params['intersection_type']
-        self.params['intersection_type'] = 'crisp'
-        pop = self._total_card() + self._total_complement_card()
-        self.normalizer = save_normalizer
-        self.params['intersection_type'] = save_intersection
-        return pop
+    def _calc_population_card(self, total: TCounter[str]) -> float:
+        """Return the cardinality of the population.
+
+        Parameters
+        ----------
+        total : Counter
+            The crisp total of the src & tar tokens
+
+
+        .. versionchanged:: 0.6.0
+            Takes the total as an argument, rather than altering the
+            normalizer & intersection type to compute it
+
+        """
+        return sum(abs(val) for val in total.values()) + self._complement_card(
+            total
+        )
 
     def _population_card(self) -> float:
         """Return the cardinality of the population."""
@@ -551,6 +1276,15 @@ class _TokenDistance(_Distance):
 
     def _union_card(self) -> float:
         """Return the cardinality of the union."""
+        comparison = self._comparison
+        if comparison.cells is not None:
+            return self.normalizer(
+                cast(float, comparison.src_card_value)
+                + cast(float, comparison.tar_card_value)
+                - comparison.cells[0],
+                3,
+                comparison.population_card_value,
+            )
         return self.normalizer(
             sum(abs(val) for val in self._union().values()),
             3,
@@ -573,8 +1307,16 @@ class _TokenDistance(_Distance):
         r"""Return the intersection of tokens from src and tar.
 
         For (multi-)sets S and T, this is :math:`S \cap T`.
+
+        The intersection is computed once per comparison, so it must not be
+        modified.
         """
-        return self._src_tokens & self._tar_tokens
+        comparison = self._comparison
+        if comparison.crisp_intersection_value is None:
+            comparison.crisp_intersection_value = (
+                comparison.src_tokens & comparison.tar_tokens
+            )
+        return comparison.crisp_intersection_value
 
     def _soft_intersection(self) -> TCounter[str]:
         """Return the soft source, target, & intersection tokens & weights.
@@ -588,7 +1330,7 @@ class _TokenDistance(_Distance):
 member function, such as Levenshtein."
             )
 
-        intersection = self._crisp_intersection()
+        intersection = Counter(self._crisp_intersection())
         src_only = self._src_tokens - self._tar_tokens
         tar_only = self._tar_tokens - self._src_tokens
 
@@ -686,7 +1428,7 @@ member function, such as Levenshtein."
         src_only += src_new
         tar_only += tar_new
 
-        # Save src_only/tar_only to the instance for retrieval later.
+        # Save src_only/tar_only to the comparison for retrieval later.
         self._soft_src_only = src_only
         self._soft_tar_only = tar_only
         self._soft_intersection_precalc = intersection
@@ -712,7 +1454,7 @@ member function, such as Levenshtein."
         .. versionadded:: 0.4.0
 
         """
-        intersection = self._crisp_intersection()
+        intersection = Counter(self._crisp_intersection())
         src_only = self._src_tokens - self._tar_tokens
         tar_only = self._tar_tokens - self._src_tokens
 
@@ -783,7 +1525,7 @@ member function, such as Levenshtein."
             version is no longer needed.
 
         """
-        intersection = self._crisp_intersection()
+        intersection = Counter(self._crisp_intersection())
         src_only_tok = sorted(self._src_tokens - self._tar_tokens)
         tar_only_tok = sorted(self._tar_tokens - self._src_tokens)
         src_only = self._src_tokens - self._tar_tokens
@@ -966,6 +1708,11 @@ member function, such as Levenshtein."
 
     def _intersection_card(self) -> float:
         """Return the cardinality of the intersection."""
+        comparison = self._comparison
+        if comparison.cells is not None:
+            return self.normalizer(
+                comparison.cells[0], 1, comparison.population_card_value
+            )
         return self.normalizer(
             sum(abs(val) for val in self._intersection().values()),
             1,
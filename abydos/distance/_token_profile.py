@@ -0,0 +1,140 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._token_profile.
+
+Pre-tokenized strings for token distance measures
+"""
+
+from collections import Counter
+from typing import Counter as TCounter, Optional, Tuple, Union, cast
+
+import numpy as np
+
+from ..tokenizer import _Tokenizer
+
+__all__ = ['TokenProfile']
+
+
+class TokenProfile(str):
+    """Token profile.
+
+    A token profile is a string together with the tokens produced from it by
+    a tokenizer and their total cardinality. Since it is a str, a profile may
+    be passed in place of a string to any method of any distance measure.
+    Token distance measures whose tokenizer produced a profile use its
+    tokens directly, rather than tokenizing the string again, so that a
+    string compared many times need only be tokenized once. Profiles are
+    most easily created by the prepare method of a token distance measure.
+
+    A profile may instead hold its tokens as packed integer codes, in a
+    sorted array of the distinct codes and an array of their counts, such as
+    those produced by :py:meth:`.QGrams.tokenize_codes`. Measures with a crisp
+    intersection compute the cardinalities of their contingency tables from
+    two such profiles by merging their sorted codes, without creating any
+    token objects. For measures that operate on the tokens themselves, the
+    tokens are a Counter of the codes, created when first needed.
+
+    The tokens of a profile must not be modified.
+
+    .. versionadded:: 0.6.0
+    """
+
+    _tokens = None  # type: Optional[TCounter[Union[str, int]]]
+    tokenizer = None  # type: Optional[_Tokenizer]
+    card = 0.0  # type: float
+    codes = None  # type: Optional[Tuple[np.ndarray, np.ndarray]]
+
+    def __new__(
+        cls,
+        string: str,
+        tokens: Optional[TCounter[str]] = None,
+        tokenizer: Optional[_Tokenizer] = None,
+        codes: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> 'TokenProfile':
+        """Create TokenProfile instance.
+
+        Parameters
+        ----------
+        string : str
+            The string from which the tokens were produced
+        tokens : Counter
+            The tokens of the string
+        tokenizer : _Tokenizer
+            The tokenizer that produced the tokens
+        codes : tuple of numpy.ndarrays
+            The tokens of the string as packed integer codes: a sorted array
+            of the distinct codes and an array of their counts; used if
+            tokens is None
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import QGrams
+        >>> tokenizer = QGrams()
+        >>> profile = TokenProfile(
+        ... 'Niall', tokenizer.tokenize('Niall').get_counter(), tokenizer)
+        >>> profile
+        'Niall'
+        >>> profile.card
+        6
+
+        >>> profile = TokenProfile(
+        ... 'Niall', tokenizer=tokenizer,
+        ... codes=tokenizer.tokenize_codes('Niall'))
+        >>> profile.card
+        6
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        profile = super(TokenProfile, cls).__new__(cls, string)
+        if tokens is not None:
+            profile._tokens = cast(TCounter[Union[str, int]], tokens)
+            profile.card = sum(abs(val) for val in tokens.values())
+        elif codes is not None:
+            profile.codes = codes
+            profile.card = int(codes[1].sum())
+        profile.tokenizer = tokenizer
+        return profile
+
+    @property
+    def tokens(self) -> TCounter[Union[str, int]]:
+        """Return the tokens of the profile.
+
+        Returns
+        -------
+        Counter
+            The tokens of the string, or its token codes, if it has codes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._tokens is None:
+            if self.codes is None:
+                self._tokens = Counter()
+            else:
+                self._tokens = Counter(
+                    dict(zip(self.codes[0].tolist(), self.codes[1].tolist()))
+                )
+        return self._tokens
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
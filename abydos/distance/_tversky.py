@@ -19,9 +19,11 @@
 Tversky index
 """
 
-from typing import Any, Optional, cast
+from typing import Any, Optional, Sequence, cast
 
-from ._token_distance import _TokenDistance
+import numpy as np
+
+from ._token_distance import _TokenDistance, _identical
 from ..tokenizer import _Tokenizer
 
 __all__ = ['Tversky']
@@ -200,6 +202,44 @@ class Tversky(_TokenDistance):
             ),
         )
 
+    def _sim_block(
+        self,
+        srcs: Sequence[str],
+        tars: Sequence[str],
+        intersections: np.ndarray,
+        src_cards: np.ndarray,
+        tar_cards: np.ndarray,
+    ) -> Optional[np.ndarray]:
+        """Return the Tversky indices of a block from its cardinalities.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if (
+            self.params['bias'] is not None
+            or self.params['alpha'] < 0
+            or self.params['beta'] < 0
+        ):
+            return None
+
+        denoms = (
+            intersections
+            + self.params['alpha'] * (src_cards[:, None] - intersections)
+            + self.params['beta'] * (tar_cards[None, :] - intersections)
+        )
+        identical = _identical(srcs, tars)
+        compared = ~identical & np.outer(
+            [bool(src) and card > 0 for src, card in zip(srcs, src_cards)],
+            [bool(tar) and card > 0 for tar, card in zip(tars, tar_cards)],
+        )
+        if np.any(denoms[compared] == 0):
+            return None
+
+        sims = np.zeros(intersections.shape, dtype=np.float_)
+        sims[compared] = intersections[compared] / denoms[compared]
+        sims[identical] = 1.0
+        return sims
+
 
 if __name__ == '__main__':
     import doctest
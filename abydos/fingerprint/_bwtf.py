@@ -19,6 +19,8 @@
 Burrows-Wheeler transform fingerprint
 """
 
+from typing import Optional
+
 from ._fingerprint import _Fingerprint
 from ..compression import BWT as _BWT
 
@@ -34,19 +36,27 @@ class BWTF(_Fingerprint):
     .. versionadded:: 0.4.1
     """
 
-    def __init__(self, terminator: str = '\0') -> None:
+    def __init__(
+        self, terminator: str = '\0', cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize BWTF instance.
 
         Parameters
         ----------
         terminator : str
             A character added to signal the end of the string
+        cache_size : int or None
+            The number of most recently used fingerprints to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
-        super(BWTF, self).__init__()
+        super(BWTF, self).__init__(cache_size)
         self._bwt = _BWT(terminator)
 
     def fingerprint(self, word: str) -> str:
@@ -41,6 +41,7 @@ class Consonant(_Fingerprint):
         variant: int = 1,
         doubles: bool = True,
         vowels: Optional[Union[Iterable[str], str]] = None,
+        cache_size: Optional[int] = 0,
     ) -> None:
         """Initialize Consonant instance.
 
@@ -60,12 +61,18 @@ class Consonant(_Fingerprint):
         vowels : list, set, or str
             Setting vowels to a non-None value overrides the variant setting
             and defines the set of letters to be removed from the input.
+        cache_size : int or None
+            The number of most recently used fingerprints to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
-        super(Consonant, self).__init__()
+        super(Consonant, self).__init__(cache_size)
         self._doubles = doubles
 
         if vowels is None:
@@ -20,7 +20,7 @@ Cisłak & Grabowski's count fingerprint
 """
 
 from collections import Counter
-from typing import Tuple
+from typing import Optional, Tuple
 
 from ._fingerprint import MOST_COMMON_LETTERS_CG, _Fingerprint
 
@@ -39,6 +39,7 @@ class Count(_Fingerprint):
         self,
         n_bits: int = 16,
         most_common: Tuple[str, ...] = MOST_COMMON_LETTERS_CG,
+        cache_size: Optional[int] = 0,
     ) -> None:
         """Initialize Count instance.
 
@@ -48,12 +49,18 @@ class Count(_Fingerprint):
             Number of bits in the fingerprint returned
         most_common : list
             The most common tokens in the target language, ordered by frequency
+        cache_size : int or None
+            The number of most recently used fingerprints to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
-        super(Count, self).__init__()
+        super(Count, self).__init__(cache_size)
         self._n_bits = n_bits
         self._most_common = most_common
 
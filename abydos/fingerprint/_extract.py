@@ -19,7 +19,7 @@
 Taft's extract letter list coding
 """
 
-from typing import Iterable, Union, cast
+from typing import cast, Iterable, Optional, Union
 
 from ._fingerprint import _Fingerprint
 
@@ -35,7 +35,11 @@ class Extract(_Fingerprint):
     .. versionadded:: 0.4.1
     """
 
-    def __init__(self, letter_list: Union[int, Iterable[str]] = 1) -> None:
+    def __init__(
+        self,
+        letter_list: Union[int, Iterable[str]] = 1,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize Extract instance.
 
         Parameters
@@ -44,9 +48,15 @@ class Extract(_Fingerprint):
             If an integer (1-4) is supplied, Taft's specified letter lists are
             used. If an iterable is supplied, its values will be used as the
             list of letters to remove (in order).
+        cache_size : int or None
+            The number of most recently used fingerprints to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
         letter_lists = [
@@ -56,7 +66,7 @@ class Extract(_Fingerprint):
             'EARNLOISTHDMCBGUWYJKPFVZXQ',
         ]
 
-        super(Extract, self).__init__()
+        super(Extract, self).__init__(cache_size)
         if isinstance(letter_list, int) and 1 <= letter_list <= 4:
             self._letter_list = list(letter_lists[letter_list - 1])
         elif hasattr(letter_list, '__iter__'):
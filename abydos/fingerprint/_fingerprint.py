@@ -20,6 +20,11 @@ The fingerprint._Fingerprint module implements abstract class Fingerprint
 and defines contants for most common letters.
 """
 
+from typing import Iterable, Iterator, Optional
+
+from ..util._cache import _Cached
+from ..util._many import _map_many
+
 # fmt: off
 # most common letters, as defined in Cisłak & Grabowski
 MOST_COMMON_LETTERS_CG = ('e', 't', 'a', 'o', 'i', 'n', 's', 'h', 'r', 'd',
@@ -61,12 +66,14 @@ MOST_COMMON_LETTERS_DE_LC = ('e', 'n', 'i', 'r', 's', 't', 'a', 'd', 'h', 'u',
 # fmt: on
 
 
-class _Fingerprint:
+class _Fingerprint(_Cached):
     """Abstract _Fingerprint class.
 
     .. versionadded:: 0.3.6
     """
 
+    _cached_method = 'fingerprint'
+
     def fingerprint(self, word: str) -> str:
         """Fingerprint string.
 
@@ -81,6 +88,47 @@ class _Fingerprint:
         """
         return word
 
+    def fingerprint_many(
+        self,
+        phrases: Iterable[str],
+        workers: Optional[int] = 1,
+        chunksize: int = 1000,
+    ) -> Iterator[str]:
+        """Yield the fingerprints of a stream of phrases.
+
+        The phrases are read in chunks, each distinct phrase of a chunk is
+        processed once, and the fingerprints are yielded in the order of the
+        phrases. With multiple workers, the chunks are processed by a pool of
+        processes, to each of which this instance is pickled once.
+
+        Parameters
+        ----------
+        phrases : iterable of str
+            The phrases to process
+        workers : int or None
+            The number of worker processes to use (1 by default, which
+            processes all phrases in the current process). If None, the number
+            of processors on the machine is used.
+        chunksize : int
+            The number of phrases per chunk
+
+        Yields
+        ------
+        str
+            The fingerprint of each phrase
+
+        Examples
+        --------
+        >>> from abydos.fingerprint import String
+        >>> list(String().fingerprint_many(['b a', 'a b c', 'b a']))
+        ['a b', 'a b c', 'a b']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _map_many(self, 'fingerprint', phrases, workers, chunksize)
+
 
 __all__ = [
     '_Fingerprint',
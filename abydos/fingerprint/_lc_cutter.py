@@ -19,6 +19,8 @@
 Library of Congress Cutter table encoding
 """
 
+from typing import Optional
+
 from ._fingerprint import _Fingerprint
 
 __all__ = ['LCCutter']
@@ -42,19 +44,27 @@ class LCCutter(_Fingerprint):
 
     _expansions = ['D', 'H', 'L', 'O', 'S', 'V']
 
-    def __init__(self, max_length: int = 64) -> None:
+    def __init__(
+        self, max_length: int = 64, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize LCCutter instance.
 
         Parameters
         ----------
         max_length : int
             The length of the code returned (defaults to 64)
+        cache_size : int or None
+            The number of most recently used fingerprints to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
-        super(LCCutter, self).__init__()
+        super(LCCutter, self).__init__(cache_size)
         # Require a max_length of at least 2 and not more than 64
         if max_length != -1:
             self._max_length = min(max(2, max_length), 64)
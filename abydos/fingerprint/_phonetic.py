@@ -47,6 +47,7 @@ class Phonetic(String):
             Union[Callable[[str], str], _Phonetic]
         ] = None,
         joiner: str = ' ',
+        cache_size: Optional[int] = 0,
     ) -> None:
         """Initialize Phonetic instance.
 
@@ -56,12 +57,18 @@ class Phonetic(String):
             default, this function uses :py:func:`.double_metaphone`.
         joiner : str
             The string that will be placed between each word
+        cache_size : int or None
+            The number of most recently used fingerprints to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
-        super(Phonetic, self).__init__()
+        super(Phonetic, self).__init__(cache_size=cache_size)
         if isinstance(phonetic_algorithm, _Phonetic):
             phonetic_algorithm = phonetic_algorithm.encode
         self._phonetic_algorithm = (
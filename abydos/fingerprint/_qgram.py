@@ -19,6 +19,7 @@
 q-gram fingerprint
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._fingerprint import _Fingerprint
@@ -43,6 +44,7 @@ class QGram(_Fingerprint):
         start_stop: str = '',
         joiner: str = '',
         skip: int = 0,
+        cache_size: Optional[int] = 0,
     ) -> None:
         """Initialize Q-Gram fingerprinter.
 
@@ -56,12 +58,18 @@ class QGram(_Fingerprint):
         skip : int or Iterable
             The number of characters to skip, can be an integer, range object,
             or list
+        cache_size : int or None
+            The number of most recently used fingerprints to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
-        super(QGram, self).__init__()
+        super(QGram, self).__init__(cache_size)
         self._tokenizer = QGrams(qval, start_stop, skip)
         self._joiner = joiner
 
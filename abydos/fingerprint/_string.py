@@ -19,6 +19,7 @@
 string fingerprint
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._fingerprint import _Fingerprint
@@ -36,19 +37,27 @@ class String(_Fingerprint):
     .. versionadded:: 0.3.6
     """
 
-    def __init__(self, joiner: str = ' ') -> None:
+    def __init__(
+        self, joiner: str = ' ', cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize String instance.
 
         Parameters
         ----------
         joiner : str
             The string that will be placed between each word
+        cache_size : int or None
+            The number of most recently used fingerprints to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
-        super(String, self).__init__()
+        super(String, self).__init__(cache_size)
         self._joiner = joiner
 
     def fingerprint(self, phrase: str) -> str:
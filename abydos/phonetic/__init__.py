@@ -85,6 +85,10 @@ phonetic algorithms:
     - Oxford Name Compression Algorithm (ONCA) (:py:class:`.ONCA`)
     - MetaSoundex (:py:class:`.MetaSoundex`)
 
+A phonetic key blocking index (:py:class:`.PhoneticIndex`), which groups
+terms by the codes that one or more phonetic algorithms assign them, and so
+finds candidate matches for record linkage, is also provided.
+
 
 Each class has an ``encode`` method to return the phonetically encoded string.
 Classes for which ``encode`` returns a numeric value generally have an
@@ -127,6 +131,7 @@ from ._parmar_kumbharana import ParmarKumbharana
 from ._phonem import Phonem
 from ._phonet import Phonet
 from ._phonetic import _Phonetic
+from ._phonetic_index import PhoneticIndex
 from ._phonetic_spanish import PhoneticSpanish
 from ._phonex import Phonex
 from ._phonic import PHONIC
@@ -191,6 +196,7 @@ __all__ = [
     'Waahlin',
     'Norphone',
     'Ainsworth',
+    'PhoneticIndex',
 ]
 
 
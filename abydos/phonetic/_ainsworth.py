@@ -22,6 +22,7 @@ Ainsworth's grapheme to phoneme converter
 import re
 
 from ._phonetic import _Phonetic
+from ._rewrite_rules import _RewriteRules
 
 __all__ = ['Ainsworth']
 
@@ -237,6 +238,10 @@ class Ainsworth(_Phonetic):
         (re.compile('z'), 'z', 1),
     ]
 
+    # the rules above, compiled into a rewrite table; each rule advances by
+    # the number of characters it matches
+    _rewrite = _RewriteRules([(rule, repl) for rule, repl, _ in _rules])
+
     def encode(self, word: str) -> str:
         """Return the phonemic representation of a word.
 
@@ -268,20 +273,9 @@ class Ainsworth(_Phonetic):
         """
         # lowercase
         word = word.lower()
-        pron = []
-
-        pos = 0
-        while pos < len(word):
-            for rule, repl, matchlen in self._rules:
-                if rule.match(word, pos):
-                    pron.append(repl)
-                    pos += matchlen
-                    break
-            else:
-                # failed to match, but advance anyway
-                pos += 1
 
-        return ''.join(pron)
+        # characters that fail to match are skipped
+        return self._rewrite.rewrite(word)
 
 
 if __name__ == '__main__':
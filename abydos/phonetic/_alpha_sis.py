@@ -19,7 +19,7 @@
 IBM's Alpha Search Inquiry System coding
 """
 
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -150,18 +150,27 @@ class AlphaSIS(_Phonetic):
         zip((ord(_) for _ in '0123456789'), 'STNMRLJKFP')
     )
 
-    def __init__(self, max_length: int = 14) -> None:
+    def __init__(
+        self, max_length: int = 14, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize AlphaSIS instance.
 
         Parameters
         ----------
         max_length : int
             The length of the code returned (defaults to 14)
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(AlphaSIS, self).__init__(cache_size)
         # Clamp max_length to [4, 64]
         if max_length != -1:
             self._max_length = min(max(4, max_length), 64)
@@ -23,8 +23,18 @@
 Beider-Morse Phonetic Matching (BMPM) algorithm
 """
 
-from re import search
-from typing import Any, Optional, Tuple, Union
+from re import compile as re_compile
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from unicodedata import normalize
 
 from ._beider_morse_data import (
@@ -52,6 +62,7 @@ from ._beider_morse_data import (
     L_TURKISH,
 )
 from ._phonetic import _Phonetic
+from ..util._many import _map_many
 
 __all__ = ['BeiderMorse']
 
@@ -121,6 +132,86 @@ _LCONTEXT_POS = 1
 _RCONTEXT_POS = 2
 _PHONETIC_POS = 3
 
+# indexes of rule tables, keyed by the id of the table
+_RULE_INDEXES = {}  # type: Dict[int, Tuple[Tuple[Any, ...], Any]]
+_LANGUAGE_RULE_INDEXES = {}  # type: Dict[int, Tuple[Tuple[Any, ...], Any]]
+
+
+def _rule_index(rules: Tuple[Any, ...]) -> Dict[str, Tuple[Any, ...]]:
+    """Return a rule table indexed by the first character of each pattern.
+
+    Each entry of the index holds the rules whose patterns begin with a
+    character, in their original order, as tuples of the pattern, its length,
+    the search methods of the compiled left & right context regexps (or None
+    for empty contexts), and the phonetic value. Indexes are built on first
+    use and retained for the life of the rule table.
+
+    Parameters
+    ----------
+    rules : tuple
+        A table of phonetic transform rules
+
+    Returns
+    -------
+    dict
+        The index of the rules
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    entry = _RULE_INDEXES.get(id(rules))
+    if entry is None or entry[0] is not rules:
+        index = {}  # type: Dict[str, List[Any]]
+        for rule in rules:
+            pattern = rule[_PATTERN_POS]
+            lcontext = rule[_LCONTEXT_POS]
+            rcontext = rule[_RCONTEXT_POS]
+            index.setdefault(pattern[:1], []).append(
+                (
+                    pattern,
+                    len(pattern),
+                    re_compile(lcontext + '$').search if lcontext else None,
+                    re_compile('^' + rcontext).search if rcontext else None,
+                    rule[_PHONETIC_POS],
+                )
+            )
+        entry = (rules, {key: tuple(val) for key, val in index.items()})
+        _RULE_INDEXES[id(rules)] = entry
+    return entry[1]
+
+
+def _language_rule_index(
+    rules: Tuple[Any, ...]
+) -> Tuple[Tuple[Callable[..., Any], int, bool], ...]:
+    """Return a language rule table with its regexps compiled.
+
+    Parameters
+    ----------
+    rules : tuple
+        A table of language detection rules
+
+    Returns
+    -------
+    tuple
+        The rules, each with the search method of its compiled regexp
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    entry = _LANGUAGE_RULE_INDEXES.get(id(rules))
+    if entry is None or entry[0] is not rules:
+        entry = (
+            rules,
+            tuple(
+                (re_compile(letters).search, languages, accept)
+                for letters, languages, accept in rules
+            ),
+        )
+        _LANGUAGE_RULE_INDEXES[id(rules)] = entry
+    return entry[1]
+
 
 class BeiderMorse(_Phonetic):
     """Beider-Morse Phonetic Matching.
@@ -132,6 +223,9 @@ class BeiderMorse(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
+    # the number of terms whose languages are memoized by each instance
+    _languages_size = 65536
+
     def _language(self, name: str, name_mode: str) -> int:
         """Return the best guess language ID for the word and language choices.
 
@@ -152,23 +246,32 @@ class BeiderMorse(_Phonetic):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Memoized the language of each term
 
         """
         name = name.strip().lower()
-        rules = BMDATA[name_mode]['language_rules']
+        choices_remaining = self._languages.get((name_mode, name))
+        if choices_remaining is not None:
+            return choices_remaining
+
+        rules = _language_rule_index(BMDATA[name_mode]['language_rules'])
         all_langs = (
             sum(_LANG_DICT[_] for _ in BMDATA[name_mode]['languages']) - 1
         )
         choices_remaining = all_langs
-        for rule in rules:
-            letters, languages, accept = rule
-            if search(letters, name) is not None:
+        for search, languages, accept in rules:
+            if search(name) is not None:
                 if accept:
                     choices_remaining &= languages
                 else:
                     choices_remaining &= (~languages) % (all_langs + 1)
         if choices_remaining == L_NONE:
             choices_remaining = L_ANY
+
+        if len(self._languages) >= self._languages_size:
+            self._languages.clear()
+        self._languages[(name_mode, name)] = choices_remaining
         return choices_remaining
 
     def _redo_language(
@@ -341,6 +444,7 @@ class BeiderMorse(_Phonetic):
             return result
 
         term_length = len(term)
+        index = _rule_index(rules)
 
         # apply language rules to map to phonetic alphabet
         phonetic = ''
@@ -350,35 +454,31 @@ class BeiderMorse(_Phonetic):
                 skip -= 1
                 continue
             found = False
-            for rule in rules:
-                pattern = rule[_PATTERN_POS]
-                pattern_length = len(pattern)
-                lcontext = rule[_LCONTEXT_POS]
-                rcontext = rule[_RCONTEXT_POS]
-
+            for (
+                pattern,
+                pattern_length,
+                left,
+                right,
+                rule_phonetic,
+            ) in index.get(term[i], ()):
                 # check to see if next sequence in input matches the string in
                 # the rule
-                if (pattern_length > term_length - i) or (
-                    term[i : i + pattern_length] != pattern
-                ):  # no match
+                if not term.startswith(pattern, i):  # no match
                     continue
 
-                right = '^' + rcontext
-                left = lcontext + '$'
-
                 # check that right context is satisfied
-                if rcontext != '':
-                    if not search(right, term[i + pattern_length :]):
+                if right is not None:
+                    if not right(term[i + pattern_length :]):
                         continue
 
                 # check that left context is satisfied
-                if lcontext != '':
-                    if not search(left, term[:i]):
+                if left is not None:
+                    if not left(term, 0, i):
                         continue
 
                 # check for incompatible attributes
                 candidate = self._apply_rule_if_compat(
-                    phonetic, rule[_PHONETIC_POS], language_arg
+                    phonetic, rule_phonetic, language_arg
                 )
                 # The below condition shouldn't ever be false
                 if candidate is not None:  # pragma: no branch
@@ -441,6 +541,8 @@ class BeiderMorse(_Phonetic):
         if not final_rules:
             return phonetic
 
+        index = _rule_index(final_rules)
+
         # expand the result
         phonetic = self._expand_alternates(phonetic)
         phonetic_array = phonetic.split('|')
@@ -465,35 +567,31 @@ class BeiderMorse(_Phonetic):
                         i += 1
                     continue
 
-                for rule in final_rules:
-                    pattern = rule[_PATTERN_POS]
-                    pattern_length = len(pattern)
-                    lcontext = rule[_LCONTEXT_POS]
-                    rcontext = rule[_RCONTEXT_POS]
-
-                    right = '^' + rcontext
-                    left = lcontext + '$'
-
+                for (
+                    pattern,
+                    pattern_length,
+                    left,
+                    right,
+                    rule_phonetic,
+                ) in index.get(phoneticx[i : i + 1], ()):
                     # check to see if next sequence in phonetic matches the
                     # string in the rule
-                    if (pattern_length > len(phoneticx) - i) or phoneticx[
-                        i : i + pattern_length
-                    ] != pattern:
+                    if not phoneticx.startswith(pattern, i):
                         continue
 
                     # check that right context is satisfied
-                    if rcontext != '':
-                        if not search(right, phoneticx[i + pattern_length :]):
+                    if right is not None:
+                        if not right(phoneticx[i + pattern_length :]):
                             continue
 
                     # check that left context is satisfied
-                    if lcontext != '':
-                        if not search(left, phoneticx[:i]):
+                    if left is not None:
+                        if not left(phoneticx, 0, i):
                             continue
 
                     # check for incompatible attributes
                     candidate = self._apply_rule_if_compat(
-                        phonetic2, rule[_PHONETIC_POS], language_arg
+                        phonetic2, rule_phonetic, language_arg
                     )
                     # The below condition shouldn't ever be false
                     if candidate is not None:  # pragma: no branch
@@ -854,6 +952,7 @@ class BeiderMorse(_Phonetic):
         match_mode: str = 'approx',
         concat: bool = False,
         filter_langs: bool = False,
+        cache_size: Optional[int] = 0,
     ) -> None:
         """Initialize BeiderMorse instance.
 
@@ -896,11 +995,18 @@ class BeiderMorse(_Phonetic):
             Concatenation mode
         filter_langs : bool
             Filter out incompatible languages
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(BeiderMorse, self).__init__(cache_size)
         name_mode = name_mode.strip().lower()[:3]
         if name_mode not in {'ash', 'sep', 'gen'}:
             name_mode = 'gen'
@@ -908,37 +1014,78 @@ class BeiderMorse(_Phonetic):
         if match_mode != 'exact':
             match_mode = 'approx'
 
-        # Translate the supplied language_arg value into an integer
-        # representing a set of languages
-        all_langs = (
-            sum(_LANG_DICT[_] for _ in BMDATA[name_mode]['languages']) - 1
-        )
-        lang_choices = 0
-        if isinstance(language_arg, (int, float)):
-            self._lang_choices = int(language_arg)
-        elif language_arg != '' and isinstance(language_arg, str):
-            for lang in language_arg.lower().split(','):
-                if lang in _LANG_DICT and (_LANG_DICT[lang] & all_langs):
-                    lang_choices += _LANG_DICT[lang]
-                elif not filter_langs:
-                    raise ValueError(
-                        "Unknown '" + name_mode + "' language: '" + lang + "'"
-                    )
-
         self._language_arg = language_arg
         self._name_mode = name_mode
         self._match_mode = match_mode
         self._concat = concat
         self._filter_langs = filter_langs
+        self._languages = {}  # type: Dict[Tuple[str, str], int]
+
+        # Translate the supplied language_arg value into an integer
+        # representing a set of languages
+        lang_choices = 0
+        if isinstance(language_arg, (int, float)):
+            self._lang_choices = int(language_arg)
+        elif isinstance(language_arg, str):
+            lang_choices = self._lang_choices_from_names(language_arg)
         self._lang_choices = lang_choices
 
-    def encode(self, word: str) -> str:
+    def _lang_choices_from_names(self, language_arg: str) -> int:
+        """Return the language choices named by a comma-separated string.
+
+        Parameters
+        ----------
+        language_arg : str
+            The names of one or more languages, separated by commas; an empty
+            string names no languages
+
+        Returns
+        -------
+        int
+            The sum of the codes of the named languages, or 0 if none are
+            named
+
+        Raises
+        ------
+        ValueError
+            Unknown language
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if language_arg == '':
+            return 0
+        all_langs = (
+            sum(_LANG_DICT[_] for _ in BMDATA[self._name_mode]['languages'])
+            - 1
+        )
+        lang_choices = 0
+        for lang in language_arg.lower().split(','):
+            if lang in _LANG_DICT and (_LANG_DICT[lang] & all_langs):
+                lang_choices += _LANG_DICT[lang]
+            elif not self._filter_langs:
+                raise ValueError(
+                    "Unknown '"
+                    + self._name_mode
+                    + "' language: '"
+                    + lang
+                    + "'"
+                )
+        return lang_choices
+
+    def encode(self, word: str, language_arg: Optional[str] = None) -> str:
         """Return the Beider-Morse Phonetic Matching encoding(s) of a term.
 
         Parameters
         ----------
         word : str
             The word to transform
+        language_arg : str
+            The language of the term, or several languages separated by
+            commas, in place of the language_arg of the instance. If None (the
+            default), the instance's languages are used; if empty, the
+            language of the term is guessed.
 
         Returns
         -------
@@ -982,24 +1129,35 @@ class BeiderMorse(_Phonetic):
         ... match_mode='exact').encode('Christopher')
         'xriStopher,xriStofer,xristopher,xristofer'
 
+        >>> pe.encode('Christopher', 'English').split(',')
+        ['tzristofir', 'tzrQstofir', 'tzristafir', 'tzrQstafir', 'xristofir',
+        'xrQstofir', 'xristafir', 'xrQstafir']
+
 
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
         .. versionchanged:: 0.6.0
             Made comma-sepated instead of space-separated output
+        .. versionchanged:: 0.6.0
+            Added language_arg parameter
 
         """
         word = normalize('NFC', word.strip().lower())
 
+        if language_arg is None:
+            lang_choices = self._lang_choices
+        else:
+            lang_choices = self._lang_choices_from_names(language_arg)
+
         # Language choices are either all incompatible with the name mode or
         # no choices were given, so try to autodetect
-        if self._lang_choices == 0:
-            language_arg = self._language(word, self._name_mode)
+        if lang_choices == 0:
+            language_code = self._language(word, self._name_mode)
         else:
-            language_arg = self._lang_choices
+            language_code = lang_choices
         language_arg2 = self._language_index_from_code(
-            language_arg, self._name_mode
+            language_code, self._name_mode
         )
 
         rules = BMDATA[self._name_mode]['rules'][language_arg2]
@@ -1012,13 +1170,78 @@ class BeiderMorse(_Phonetic):
             rules,
             final_rules1,
             final_rules2,
-            language_arg,
+            language_code,
             self._concat,
         )
         result = self._phonetic_numbers(result).replace(' ', ',')
 
         return result
 
+    def _encode_pair(self, pair: Tuple[str, Optional[str]]) -> str:
+        """Return the encoding(s) of a term paired with its language.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.encode(pair[0], pair[1])
+
+    def encode_many(
+        self,
+        words: Iterable[str],
+        workers: Optional[int] = 1,
+        chunksize: int = 1000,
+        languages: Optional[Iterable[Optional[str]]] = None,
+    ) -> Iterator[str]:
+        """Yield the encodings of a stream of words.
+
+        The words are read in chunks, each distinct word (and language) of a
+        chunk is processed once, and the encodings are yielded in the order of
+        the words. With multiple workers, the chunks are processed by a pool
+        of processes, to each of which this instance is pickled once.
+
+        Parameters
+        ----------
+        words : iterable of str
+            The words to process
+        workers : int or None
+            The number of worker processes to use (1 by default, which
+            processes all words in the current process). If None, the number of
+            processors on the machine is used.
+        chunksize : int
+            The number of words per chunk
+        languages : iterable of str
+            The language of each word, as for the language_arg parameter of
+            encode. Words whose languages are known are encoded without
+            guessing their languages.
+
+        Yields
+        ------
+        str
+            The encoding of each word
+
+        Examples
+        --------
+        >>> pe = BeiderMorse()
+        >>> list(pe.encode_many(['Schmidt', 'Schmidt', 'Schmidt'],
+        ... languages=['polish', 'german', None]))
+        ['sxmit', 'zmit', 'zmit,stzmit']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if languages is None:
+            return super(BeiderMorse, self).encode_many(
+                words, workers, chunksize
+            )
+        return _map_many(
+            self,
+            '_encode_pair',
+            zip(words, languages),  # type: ignore
+            workers,
+            chunksize,
+        )
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,6 +19,8 @@
 Caverphone phonetic algorithm
 """
 
+from typing import Optional
+
 from ._phonetic import _Phonetic
 
 __all__ = ['Caverphone']
@@ -36,18 +38,27 @@ class Caverphone(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
-    def __init__(self, version: int = 2) -> None:
+    def __init__(
+        self, version: int = 2, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize Caverphone instance.
 
         Parameters
         ----------
         version : int
             The version of Caverphone to employ for encoding (defaults to 2)
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Caverphone, self).__init__(cache_size)
         self._version = version
 
     def encode_alpha(self, word: str) -> str:
@@ -19,14 +19,49 @@
 Daitch-Mokotoff Soundex
 """
 
-from typing import Dict, Tuple, Union, cast
+from typing import Any, Optional, Set, Tuple
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
+from ..util._trie import _trie
 
 __all__ = ['DaitchMokotoff']
 
 
+def _variant_codes(
+    variants: Tuple[Any, Any, Any]
+) -> Tuple[Tuple[str, ...], ...]:
+    """Return the positional variants of a table entry as tuples of strings.
+
+    Parameters
+    ----------
+    variants : tuple
+        The codes of a substring as an initial, before vowels, and
+        elsewhere, each a code or a tuple of alternative codes
+
+    Returns
+    -------
+    tuple
+        The three positional variants, each a tuple of the alternative codes,
+        as strings
+
+    Examples
+    --------
+    >>> _variant_codes(((5, 4), 5, 5))
+    (('5', '4'), ('5',), ('5',))
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return tuple(
+        tuple(str(_) for _ in variant)
+        if isinstance(variant, tuple)
+        else (str(variant),)
+        for variant in variants
+    )
+
+
 class DaitchMokotoff(_Phonetic):
     """Daitch-Mokotoff Soundex.
 
@@ -161,91 +196,10 @@ class DaitchMokotoff(_Phonetic):
         'RS': ((94, 4), (94, 4), (94, 4)),
     }
 
-    _dms_order = {
-        'A': ('AI', 'AJ', 'AU', 'AY', 'A'),
-        'B': ('B',),
-        'C': ('CHS', 'CSZ', 'CZS', 'CH', 'CK', 'CS', 'CZ', 'C'),
-        'D': ('DRS', 'DRZ', 'DSH', 'DSZ', 'DZH', 'DZS', 'DS', 'DT', 'DZ', 'D'),
-        'E': ('EI', 'EJ', 'EU', 'EY', 'E'),
-        'F': ('FB', 'F'),
-        'G': ('G',),
-        'H': ('H',),
-        'I': ('IA', 'IE', 'IO', 'IU', 'I'),
-        'J': ('J',),
-        'K': ('KH', 'KS', 'K'),
-        'L': ('L',),
-        'M': ('MN', 'M'),
-        'N': ('NM', 'N'),
-        'O': ('OI', 'OJ', 'OY', 'O'),
-        'P': ('PF', 'PH', 'P'),
-        'Q': ('Q',),
-        'R': ('RS', 'RZ', 'R'),
-        'S': (
-            'SCHTSCH',
-            'SCHTCH',
-            'SCHTSH',
-            'SHTCH',
-            'SHTSH',
-            'STSCH',
-            'SCHD',
-            'SCHT',
-            'SHCH',
-            'STCH',
-            'STRS',
-            'STRZ',
-            'STSH',
-            'SZCS',
-            'SZCZ',
-            'SCH',
-            'SHD',
-            'SHT',
-            'SZD',
-            'SZT',
-            'SC',
-            'SD',
-            'SH',
-            'ST',
-            'SZ',
-            'S',
-        ),
-        'T': (
-            'TTSCH',
-            'TSCH',
-            'TTCH',
-            'TTSZ',
-            'TCH',
-            'THS',
-            'TRS',
-            'TRZ',
-            'TSH',
-            'TSZ',
-            'TTS',
-            'TTZ',
-            'TZS',
-            'TC',
-            'TH',
-            'TS',
-            'TZ',
-            'T',
-        ),
-        'U': ('UE', 'UI', 'UJ', 'UY', 'U'),
-        'V': ('V',),
-        'W': ('W',),
-        'X': ('X',),
-        'Y': ('Y',),
-        'Z': (
-            'ZHDZH',
-            'ZDZH',
-            'ZSCH',
-            'ZDZ',
-            'ZHD',
-            'ZSH',
-            'ZD',
-            'ZH',
-            'ZS',
-            'Z',
-        ),
-    }  # type: Dict[str, Tuple[str, ...]]
+    _dms_trie = _trie(
+        (sstr, _variant_codes(variants))
+        for sstr, variants in _dms_table.items()
+    )
 
     _uc_v_set = set('AEIJOUY')
 
@@ -254,7 +208,12 @@ class DaitchMokotoff(_Phonetic):
         zip((ord(_) for _ in '0123456789'), ' A TSKNPLR')
     )
 
-    def __init__(self, max_length: int = 6, zero_pad: bool = True) -> None:
+    def __init__(
+        self,
+        max_length: int = 6,
+        zero_pad: bool = True,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize DaitchMokotoff instance.
 
         Parameters
@@ -265,11 +224,18 @@ class DaitchMokotoff(_Phonetic):
         zero_pad : bool
             Pad the end of the return value with 0s to achieve a max_length
             string
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(DaitchMokotoff, self).__init__(cache_size)
         # Require a max_length of at least 6 and not more than 64
         if max_length != -1:
             self._max_length = min(max(6, max_length), 64)
@@ -357,8 +323,6 @@ class DaitchMokotoff(_Phonetic):
             Made return a str only (comma-separated)
 
         """
-        dms = ['']  # initialize empty code list
-
         # uppercase, normalize, decompose, and filter non-A-Z
         word = unicode_normalize('NFKD', word.upper())
         word = ''.join(c for c in word if c in self._uc_set)
@@ -369,73 +333,61 @@ class DaitchMokotoff(_Phonetic):
                 return '0' * self._max_length
             return '0'
 
+        # Each partial code is kept with the last character appended to it,
+        # including _ placeholders, so that doubled digits and placeholders
+        # can be dropped as the code is built. Partial codes that reach
+        # max_length are complete, since later characters would be trimmed.
+        codes = {('', '')}  # type: Set[Tuple[str, str]]
+        complete = set()  # type: Set[str]
         pos = 0
-        while pos < len(word):
-            # Iterate through _dms_order, which specifies the possible
-            # substrings for which codes exist in the Daitch-Mokotoff coding
-            for sstr in self._dms_order[word[pos]]:  # pragma: no branch
-                if word[pos:].startswith(sstr):
-                    # Having determined a valid substring start, retrieve the
-                    # code
-                    dm_tup = cast(
-                        Tuple[
-                            Union[
-                                int,
-                                str,
-                                Tuple[Union[int, str], Union[int, str]],
-                            ],
-                            Union[
-                                int,
-                                str,
-                                Tuple[Union[int, str], Union[int, str]],
-                            ],
-                            Union[
-                                int,
-                                str,
-                                Tuple[Union[int, str], Union[int, str]],
-                            ],
-                        ],
-                        self._dms_table[sstr],
-                    )
-
-                    # Having retried the code (triple), determine the correct
-                    # positional variant (first, pre-vocalic, elsewhere)
-                    if pos == 0:
-                        dm_val = dm_tup[
-                            0
-                        ]  # type: Union[int, str, Tuple[Union[int, str], Union[int, str]]]  # noqa: E501
-                    elif (
-                        pos + len(sstr) < len(word)
-                        and word[pos + len(sstr)] in self._uc_v_set
-                    ):
-                        dm_val = dm_tup[1]
-                    else:
-                        dm_val = dm_tup[2]
-
-                    # Build the code strings
-                    if isinstance(dm_val, tuple):
-                        dms = [_ + str(dm_val[0]) for _ in dms] + [
-                            _ + str(dm_val[1]) for _ in dms
-                        ]
-                    else:
-                        dms = [_ + str(dm_val) for _ in dms]
-                    pos += len(sstr)
+        while pos < len(word) and codes:
+            # Find the longest substring starting at pos for which a code
+            # exists. Every letter has a code, so there is always a match.
+            node = self._dms_trie
+            end = pos
+            for i in range(pos, len(word)):
+                child = node.get(word[i])
+                if child is None:
                     break
+                node = child
+                if '' in node:
+                    variants = node['']
+                    end = i + 1
+
+            # Determine the correct positional variant (first, pre-vocalic,
+            # elsewhere)
+            if pos == 0:
+                alternatives = variants[0]
+            elif end < len(word) and word[end] in self._uc_v_set:
+                alternatives = variants[1]
+            else:
+                alternatives = variants[2]
+
+            extended = set()
+            for code, last in codes:
+                for value in alternatives:
+                    new_code, new_last = code, last
+                    for char in value:
+                        if char != new_last:
+                            if char != '_':
+                                new_code += char
+                            new_last = char
+                    if len(new_code) >= self._max_length:
+                        complete.add(new_code[: self._max_length])
+                    else:
+                        extended.add((new_code, new_last))
+            codes = extended
+            pos = end
 
-        # Filter out double letters and _ placeholders
-        dms = [
-            ''.join(c for c in self._delete_consecutive_repeats(_) if c != '_')
-            for _ in dms
-        ]
+        complete.update(code for code, _ in codes)
 
-        # Trim codes and return set
+        # Pad codes and return set
         if self._zero_pad:
-            dms = [
-                (_ + ('0' * self._max_length))[: self._max_length] for _ in dms
-            ]
-        else:
-            dms = [_[: self._max_length] for _ in dms]
-        return ','.join(sorted(set(dms)))
+            complete = {
+                (_ + ('0' * self._max_length))[: self._max_length]
+                for _ in complete
+            }
+        return ','.join(sorted(complete))
 
 
 if __name__ == '__main__':
@@ -19,6 +19,8 @@
 Davidson's Consonant Code.
 """
 
+from typing import Optional
+
 from ._phonetic import _Phonetic
 
 __all__ = ['Davidson']
@@ -38,7 +40,9 @@ class Davidson(_Phonetic):
 
     _trans = {65: '', 69: '', 73: '', 79: '', 85: '', 72: '', 87: '', 89: ''}
 
-    def __init__(self, omit_fname: bool = False) -> None:
+    def __init__(
+        self, omit_fname: bool = False, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize Davidson instance.
 
         Parameters
@@ -46,11 +50,18 @@ class Davidson(_Phonetic):
         omit_fname : bool
             Set to True to completely omit the first character of the first
             name
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Davidson, self).__init__(cache_size)
         self._omit_fname = omit_fname
 
     def encode(self, lname: str, fname: str = '.') -> str:
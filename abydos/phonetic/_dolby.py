@@ -19,6 +19,7 @@
 Dolby Code
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -40,6 +41,7 @@ class Dolby(_Phonetic):
         max_length: int = -1,
         keep_vowels: bool = False,
         vowel_char: str = '*',
+        cache_size: Optional[int] = 0,
     ) -> None:
         r"""Initialize Dolby instance.
 
@@ -52,11 +54,18 @@ class Dolby(_Phonetic):
             If True, retains all vowel markers
         vowel_char : str
             The vowel marker character (default to \*)
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Dolby, self).__init__(cache_size)
         self._max_length = max_length
         self._keep_vowels = keep_vowels
         self._vowel_char = vowel_char
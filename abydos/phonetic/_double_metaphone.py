@@ -19,7 +19,7 @@
 Double Metaphone
 """
 
-from typing import Set, Tuple
+from typing import Optional, Set, Tuple
 
 from ._phonetic import _Phonetic
 
@@ -35,7 +35,9 @@ class DoubleMetaphone(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
-    def __init__(self, max_length: int = -1) -> None:
+    def __init__(
+        self, max_length: int = -1, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize DoubleMetaphone instance.
 
         Parameters
@@ -43,11 +45,18 @@ class DoubleMetaphone(_Phonetic):
         max_length : int
             Maximum length of the returned Dolby code -- this also activates
             the fixed-length code mode if it is greater than 0
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(DoubleMetaphone, self).__init__(cache_size)
         self._max_length = max_length
 
         # Require a max_length of at least 4
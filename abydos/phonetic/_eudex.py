@@ -19,6 +19,8 @@
 Eudex phonetic hash
 """
 
+from typing import Optional
+
 from ._phonetic import _Phonetic
 
 __all__ = ['Eudex']
@@ -159,18 +161,27 @@ class Eudex(_Phonetic):
         'ÿ': 0b11100101,  # ÿ
     }
 
-    def __init__(self, max_length: int = 8) -> None:
+    def __init__(
+        self, max_length: int = 8, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize Eudex instance.
 
         Parameters
         ----------
         max_length : int
             The length in bits of the code returned (default 8)
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Eudex, self).__init__(cache_size)
         self._max_length = max_length
 
     def encode(self, word: str) -> str:
@@ -20,7 +20,7 @@ Haase Phonetik
 """
 
 from itertools import product
-from typing import List, Set, Tuple, Union, cast
+from typing import cast, List, Optional, Set, Tuple, Union
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -42,18 +42,27 @@ class Haase(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '123456789'), 'PTFKLNRSA'))
 
-    def __init__(self, primary_only: bool = False) -> None:
+    def __init__(
+        self, primary_only: bool = False, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize Haase instance.
 
         Parameters
         ----------
         primary_only : bool
             If True, only the primary code is returned
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Haase, self).__init__(cache_size)
         self._primary_only = primary_only
 
     def encode_alpha(self, word: str) -> str:
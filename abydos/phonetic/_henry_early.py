@@ -19,6 +19,7 @@
 an early version of Henry Code
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -47,18 +48,27 @@ class HenryEarly(_Phonetic):
     }
     _simple = {'W': 'V', 'X': 'S', 'Z': 'S'}
 
-    def __init__(self, max_length: int = 3) -> None:
+    def __init__(
+        self, max_length: int = 3, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize HenryEarly instance.
 
         Parameters
         ----------
         max_length : int
             The length of the code returned (defaults to 3)
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(HenryEarly, self).__init__(cache_size)
         self._max_length = max_length
 
     def encode(self, word: str) -> str:
@@ -19,9 +19,20 @@
 Michigan LEIN (Law Enforcement Information Network) encoding
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
+import numpy as np
+
 from ._phonetic import _Phonetic
+from ..util._array import (
+    _collapse,
+    _compact,
+    _pad,
+    _str_array,
+    _translate,
+    _uc_codepoints,
+)
 
 __all__ = ['LEIN']
 
@@ -43,7 +54,12 @@ class LEIN(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '12345'), 'TNLPK'))
 
-    def __init__(self, max_length: int = 4, zero_pad: bool = True) -> None:
+    def __init__(
+        self,
+        max_length: int = 4,
+        zero_pad: bool = True,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize LEIN instance.
 
         Parameters
@@ -53,11 +69,18 @@ class LEIN(_Phonetic):
         zero_pad : bool
             Pad the end of the return value with 0s to achieve a max_length
             string
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(LEIN, self).__init__(cache_size)
         self._max_length = max_length
         self._zero_pad = zero_pad
 
@@ -138,6 +161,28 @@ class LEIN(_Phonetic):
 
         return code[: self._max_length]
 
+    def _encode_array(self, words: np.ndarray) -> np.ndarray:
+        """Return the LEIN codes of a 1-dimensional array of words.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._max_length < 1:
+            return super(LEIN, self)._encode_array(words)
+
+        codes = _uc_codepoints(words)
+        word = _compact(codes, (codes >= 65) & (codes <= 90))
+
+        code = word[:, :1]  # Rule 1
+        word = word[:, 1:]
+        word = _compact(word, ~np.isin(word, list(self._del_trans)))  # Rule 2
+        word = _collapse(word)  # Rule 3
+        code = np.concatenate(
+            [code, _translate(word, self._trans)], axis=1
+        )  # Rule 4
+        code = _pad(code, self._max_length, self._zero_pad)  # Rule 4
+        return _str_array(code)
+
 
 if __name__ == '__main__':
     import doctest
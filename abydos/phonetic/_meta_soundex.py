@@ -19,6 +19,8 @@
 MetaSoundex
 """
 
+from typing import Optional
+
 from ._metaphone import Metaphone
 from ._phonetic import _Phonetic
 from ._phonetic_spanish import PhoneticSpanish
@@ -44,18 +46,27 @@ class MetaSoundex(_Phonetic):
         )
     )
 
-    def __init__(self, lang: str = 'en') -> None:
+    def __init__(
+        self, lang: str = 'en', cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize MetaSoundex instance.
 
         Parameters
         ----------
         lang : str
             Either ``en`` for English or ``es`` for Spanish
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(MetaSoundex, self).__init__(cache_size)
         self._lang = lang
         if lang == 'en':
             self._sdx = Soundex()  # type: _Phonetic
@@ -19,6 +19,8 @@
 Metaphone
 """
 
+from typing import Optional
+
 from ._phonetic import _Phonetic
 
 __all__ = ['Metaphone']
@@ -38,7 +40,9 @@ class Metaphone(_Phonetic):
     _frontv = {'E', 'I', 'Y'}
     _varson = {'C', 'G', 'P', 'S', 'T'}
 
-    def __init__(self, max_length: int = -1) -> None:
+    def __init__(
+        self, max_length: int = -1, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize AlphaSIS instance.
 
         Parameters
@@ -46,11 +50,18 @@ class Metaphone(_Phonetic):
         max_length : int
             The maximum length of the returned Metaphone code (defaults to 64,
             but in Philips' original implementation this was 4)
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Metaphone, self).__init__(cache_size)
         # Require a max_length of at least 4
         if max_length != -1:
             self._max_length = max(4, max_length)
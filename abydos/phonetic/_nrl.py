@@ -19,14 +19,111 @@
 NRL English-to-phoneme algorithm
 """
 
-from re import match as re_match
-from typing import Dict, Tuple
+from re import escape as re_escape
+from typing import Dict, List, Optional, Tuple
 
 from ._phonetic import _Phonetic
+from ._rewrite_rules import _RewriteRules
 
 __all__ = ['NRL']
 
 
+def _to_regex(pattern: str, left_match: bool = True) -> str:
+    """Convert an NRL context pattern to a regular expression.
+
+    Parameters
+    ----------
+    pattern : str
+        The context pattern
+    left_match : bool
+        True for a left context, which is matched against the word up to the
+        rule, and False for a right context, which is matched against the rest
+        of the word after the rule
+
+    Returns
+    -------
+    str
+        The regular expression
+
+    Examples
+    --------
+    >>> _to_regex('#:')
+    '^.*[AEIOU]+[BCDFGHJKLMNPQRSTVWXYZ]*$'
+    >>> _to_regex('^ ', left_match=False)
+    '^[BCDFGHJKLMNPQRSTVWXYZ]$'
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    new_pattern = ''
+    replacements = {
+        '#': '[AEIOU]+',
+        ':': '[BCDFGHJKLMNPQRSTVWXYZ]*',
+        '^': '[BCDFGHJKLMNPQRSTVWXYZ]',
+        '.': '[BDVGJLMNTWZ]',
+        '%': '(ER|E|ES|ED|ING|ELY)',
+        '+': '[EIY]',
+        ' ': '^',
+    }
+    for char in pattern:
+        new_pattern += replacements[char] if char in replacements else char
+
+    if left_match:
+        new_pattern += '$'
+        if '^' not in pattern:
+            new_pattern = '^.*' + new_pattern
+    else:
+        new_pattern = '^' + new_pattern.replace('^', '$')
+        if '$' not in new_pattern:
+            new_pattern += '.*$'
+
+    return new_pattern
+
+
+def _compile_rules(
+    rules: Dict[str, Tuple[Tuple[str, str, str, str], ...]]
+) -> _RewriteRules:
+    """Compile an NRL rule table into a rewrite table.
+
+    Each rule's match and right context become a regular expression matched
+    at the rule's position (with the right context as a lookahead), and its
+    left context a regular expression matched against the word up to that
+    position.
+
+    Parameters
+    ----------
+    rules : dict
+        The rule table, mapping first letters to tuples of rules, each a
+        tuple of left context, match, right context, and output
+
+    Returns
+    -------
+    _RewriteRules
+        The rewrite table
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    compiled = []  # type: List[Tuple[str, str, Optional[str]]]
+    for letter_rules in rules.values():
+        for left, match, right, out in letter_rules:
+            pattern = re_escape(match)
+            if right:
+                # the right context pattern is anchored at its start by the
+                # lookahead, rather than by ^
+                pattern += '(?=' + _to_regex(right, left_match=False)[1:] + ')'
+            compiled.append(
+                (
+                    pattern,
+                    out,
+                    _to_regex(left, left_match=True) if left else None,
+                )
+            )
+    return _RewriteRules(compiled)
+
+
 class NRL(_Phonetic):
     """Naval Research Laboratory English-to-phoneme encoder.
 
@@ -427,6 +524,8 @@ class NRL(_Phonetic):
         'Z': (('', 'Z', '', 'z'),),
     }  # type: Dict[str, Tuple[Tuple[str, str, str, str], ...]]
 
+    _rewrite = _compile_rules(_rules)
+
     def encode(self, word: str) -> str:
         """Return the Naval Research Laboratory phonetic encoding of a word.
 
@@ -462,61 +561,10 @@ class NRL(_Phonetic):
             Encapsulated in class
 
         """
-
-        def _to_regex(pattern: str, left_match: bool = True) -> str:
-            new_pattern = ''
-            replacements = {
-                '#': '[AEIOU]+',
-                ':': '[BCDFGHJKLMNPQRSTVWXYZ]*',
-                '^': '[BCDFGHJKLMNPQRSTVWXYZ]',
-                '.': '[BDVGJLMNTWZ]',
-                '%': '(ER|E|ES|ED|ING|ELY)',
-                '+': '[EIY]',
-                ' ': '^',
-            }
-            for char in pattern:
-                new_pattern += (
-                    replacements[char] if char in replacements else char
-                )
-
-            if left_match:
-                new_pattern += '$'
-                if '^' not in pattern:
-                    new_pattern = '^.*' + new_pattern
-            else:
-                new_pattern = '^' + new_pattern.replace('^', '$')
-                if '$' not in new_pattern:
-                    new_pattern += '.*$'
-
-            return new_pattern
-
         word = word.upper()
 
-        pron = ''
-        pos = 0
-        while pos < len(word):
-            left_orig = word[:pos]
-            right_orig = word[pos:]
-            first = word[pos] if word[pos] in self._rules else ' '
-            for rule in self._rules[first]:
-                left, match, right, out = rule
-                if right_orig.startswith(match):
-                    if left:
-                        l_pattern = _to_regex(left, left_match=True)
-                    if right:
-                        r_pattern = _to_regex(right, left_match=False)
-                    if (not left or re_match(l_pattern, left_orig)) and (
-                        not right
-                        or re_match(r_pattern, right_orig[len(match) :])
-                    ):
-                        pron += out
-                        pos += len(match)
-                        break
-            else:
-                pron += word[pos]
-                pos += 1
-
-        return pron
+        # characters that fail to match are copied
+        return self._rewrite.rewrite(word, keep_unmatched=True)
 
 
 if __name__ == '__main__':
@@ -20,6 +20,8 @@ New York State Identification and Intelligence System (NYSIIS) phonetic
 encoding
 """
 
+from typing import Optional
+
 from ._phonetic import _Phonetic
 
 __all__ = ['NYSIIS']
@@ -37,7 +39,12 @@ class NYSIIS(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
-    def __init__(self, max_length: int = 6, modified: bool = False) -> None:
+    def __init__(
+        self,
+        max_length: int = 6,
+        modified: bool = False,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize AlphaSIS instance.
 
         Parameters
@@ -46,11 +53,18 @@ class NYSIIS(_Phonetic):
             The maximum length (default 6) of the code to return
         modified : bool
             Indicates whether to use USDA modified NYSIIS
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(NYSIIS, self).__init__(cache_size)
         self._max_length = max_length
         # Require a max_length of at least 6
         if self._max_length > -1:
@@ -19,6 +19,8 @@
 Oxford Name Compression Algorithm (ONCA)
 """
 
+from typing import Optional
+
 from ._nysiis import NYSIIS
 from ._phonetic import _Phonetic
 from ._soundex import Soundex
@@ -39,7 +41,12 @@ class ONCA(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
-    def __init__(self, max_length: int = 4, zero_pad: bool = True) -> None:
+    def __init__(
+        self,
+        max_length: int = 4,
+        zero_pad: bool = True,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize ONCA instance.
 
         Parameters
@@ -49,11 +56,18 @@ class ONCA(_Phonetic):
         zero_pad : bool
             Pad the end of the return value with 0s to achieve a max_length
             string
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(ONCA, self).__init__(cache_size)
         self._nysiis = NYSIIS(max_length=max_length * 3)
         self._soundex = Soundex(max_length=max_length, zero_pad=zero_pad)
 
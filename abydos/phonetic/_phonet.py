@@ -20,7 +20,16 @@ phonet algorithm (a.k.a. Hannoveraner Phonetik), intended chiefly for German
 """
 
 from collections import Counter
-from typing import Counter as TCounter, Optional, Tuple, Union, cast
+from typing import (
+    Any,
+    Counter as TCounter,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -1063,7 +1072,12 @@ class Phonet(_Phonetic):
         )
     )
 
-    def __init__(self, mode: int = 1, lang: str = 'de') -> None:
+    # the hash tables of the rules of each language, built by _hashes
+    _hash_cache = {}  # type: Dict[str, Tuple[Any, ...]]
+
+    def __init__(
+        self, mode: int = 1, lang: str = 'de', cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize AlphaSIS instance.
 
         Parameters
@@ -1072,14 +1086,176 @@ class Phonet(_Phonetic):
             The ponet variant to employ (1 or 2)
         lang : str
             ``de`` (default) for German, ``none`` for no language
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Phonet, self).__init__(cache_size)
         self._mode = mode
         self._lang = lang
 
+    @classmethod
+    def _hashes(
+        cls, lang: str
+    ) -> Tuple[
+        TCounter[str],
+        TCounter[str],
+        TCounter[Tuple[int, int]],
+        TCounter[Tuple[int, int]],
+    ]:
+        """Return the hash tables of the rules for a language.
+
+        The tables are built on first use and shared by all instances.
+
+        Parameters
+        ----------
+        lang : str
+            Language to use for rules
+
+        Returns
+        -------
+        tuple
+            The first-letter hash, the letter positions, and the start & end
+            hashes of the first two letters of the rules
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if lang != 'none':
+            lang = 'de'
+        if lang in cls._hash_cache:
+            return cls._hash_cache[lang]
+
+        phonet_hash = Counter()  # type: TCounter[str]
+        alpha_pos = Counter()  # type: TCounter[str]
+
+        phonet_hash_1 = Counter()  # type: TCounter[Tuple[int, int]]
+        phonet_hash_2 = Counter()  # type: TCounter[Tuple[int, int]]
+
+        if lang == 'none':
+            _phonet_rules = cls._rules_no_lang
+        else:
+            _phonet_rules = cls._rules_german
+
+        phonet_hash[''] = -1
+
+        # German and international umlauts
+        for ch in {
+            'À',
+            'Á',
+            'Â',
+            'Ã',
+            'Ä',
+            'Å',
+            'Æ',
+            'Ç',
+            'È',
+            'É',
+            'Ê',
+            'Ë',
+            'Ì',
+            'Í',
+            'Î',
+            'Ï',
+            'Ð',
+            'Ñ',
+            'Ò',
+            'Ó',
+            'Ô',
+            'Õ',
+            'Ö',
+            'Ø',
+            'Ù',
+            'Ú',
+            'Û',
+            'Ü',
+            'Ý',
+            'Þ',
+            'ß',
+            'Œ',
+            'Š',
+            'Ÿ',
+        }:
+            alpha_pos[ch] = 1
+            phonet_hash[ch] = -1
+
+        # "normal" letters ('A'-'Z')
+        for i, ch in enumerate('ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
+            alpha_pos[ch] = i + 2
+            phonet_hash[ch] = -1
+
+        for i in range(26):
+            for j in range(28):
+                phonet_hash_1[i, j] = -1
+                phonet_hash_2[i, j] = -1
+
+        # for each phonetc rule
+        for i in range(len(_phonet_rules)):
+            rule = _phonet_rules[i]
+
+            if rule and i % 3 == 0:
+                # calculate first hash value
+                ch = cast(str, _phonet_rules[i])[0]
+
+                if phonet_hash[ch] < 0 and (
+                    cast(str, _phonet_rules[i + 1])
+                    or cast(str, _phonet_rules[i + 2])
+                ):
+                    phonet_hash[ch] = i
+
+                # calculate second hash values
+                if ch and alpha_pos[ch] >= 2:
+                    k = alpha_pos[ch]
+
+                    j = k - 2
+                    rule = rule[1:]
+
+                    if not rule:
+                        rule = ' '
+                    elif rule[0] == '(':
+                        rule = rule[1:]
+                    else:
+                        rule = rule[0]
+
+                    while rule and (rule[0] != ')'):
+                        k = alpha_pos[rule[0]]
+
+                        if k > 0:
+                            # add hash value for this letter
+                            if phonet_hash_1[j, k] < 0:
+                                phonet_hash_1[j, k] = i
+                                phonet_hash_2[j, k] = i
+
+                            if phonet_hash_2[j, k] >= (i - 30):
+                                phonet_hash_2[j, k] = i
+                            else:
+                                k = -1
+
+                        if k <= 0:
+                            # add hash value for all letters
+                            if phonet_hash_1[j, 0] < 0:
+                                phonet_hash_1[j, 0] = i
+
+                            phonet_hash_2[j, 0] = i
+
+                        rule = rule[1:]
+
+        cls._hash_cache[lang] = (
+            phonet_hash,
+            alpha_pos,
+            phonet_hash_1,
+            phonet_hash_2,
+        )
+        return cls._hash_cache[lang]
+
     def encode(self, word: str) -> str:
         """Return the phonet code for a word.
 
@@ -1131,130 +1307,9 @@ class Phonet(_Phonetic):
             Encapsulated in class
 
         """
-        phonet_hash = Counter()  # type: TCounter[str]
-        alpha_pos = Counter()  # type: TCounter[str]
-
-        phonet_hash_1 = Counter()  # type: TCounter[Tuple[int, int]]
-        phonet_hash_2 = Counter()  # type: TCounter[Tuple[int, int]]
-
-        def _initialize_phonet(lang: str) -> None:
-            """Initialize phonet variables.
-
-            Parameters
-            ----------
-            lang : str
-                Language to use for rules
-
-            .. versionadded:: 0.1.0
-
-            """
-            if lang == 'none':
-                _phonet_rules = self._rules_no_lang
-            else:
-                _phonet_rules = self._rules_german
-
-            phonet_hash[''] = -1
-
-            # German and international umlauts
-            for ch in {
-                'À',
-                'Á',
-                'Â',
-                'Ã',
-                'Ä',
-                'Å',
-                'Æ',
-                'Ç',
-                'È',
-                'É',
-                'Ê',
-                'Ë',
-                'Ì',
-                'Í',
-                'Î',
-                'Ï',
-                'Ð',
-                'Ñ',
-                'Ò',
-                'Ó',
-                'Ô',
-                'Õ',
-                'Ö',
-                'Ø',
-                'Ù',
-                'Ú',
-                'Û',
-                'Ü',
-                'Ý',
-                'Þ',
-                'ß',
-                'Œ',
-                'Š',
-                'Ÿ',
-            }:
-                alpha_pos[ch] = 1
-                phonet_hash[ch] = -1
-
-            # "normal" letters ('A'-'Z')
-            for i, ch in enumerate('ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
-                alpha_pos[ch] = i + 2
-                phonet_hash[ch] = -1
-
-            for i in range(26):
-                for j in range(28):
-                    phonet_hash_1[i, j] = -1
-                    phonet_hash_2[i, j] = -1
-
-            # for each phonetc rule
-            for i in range(len(_phonet_rules)):
-                rule = _phonet_rules[i]
-
-                if rule and i % 3 == 0:
-                    # calculate first hash value
-                    ch = cast(str, _phonet_rules[i])[0]
-
-                    if phonet_hash[ch] < 0 and (
-                        cast(str, _phonet_rules[i + 1])
-                        or cast(str, _phonet_rules[i + 2])
-                    ):
-                        phonet_hash[ch] = i
-
-                    # calculate second hash values
-                    if ch and alpha_pos[ch] >= 2:
-                        k = alpha_pos[ch]
-
-                        j = k - 2
-                        rule = rule[1:]
-
-                        if not rule:
-                            rule = ' '
-                        elif rule[0] == '(':
-                            rule = rule[1:]
-                        else:
-                            rule = rule[0]
-
-                        while rule and (rule[0] != ')'):
-                            k = alpha_pos[rule[0]]
-
-                            if k > 0:
-                                # add hash value for this letter
-                                if phonet_hash_1[j, k] < 0:
-                                    phonet_hash_1[j, k] = i
-                                    phonet_hash_2[j, k] = i
-
-                                if phonet_hash_2[j, k] >= (i - 30):
-                                    phonet_hash_2[j, k] = i
-                                else:
-                                    k = -1
-
-                            if k <= 0:
-                                # add hash value for all letters
-                                if phonet_hash_1[j, 0] < 0:
-                                    phonet_hash_1[j, 0] = i
-
-                                phonet_hash_2[j, 0] = i
-
-                            rule = rule[1:]
+        phonet_hash, alpha_pos, phonet_hash_1, phonet_hash_2 = self._hashes(
+            self._lang
+        )
 
         def _phonet(term: str, mode: int, lang: str) -> str:
             """Return the phonet coded form of a term.
@@ -1282,13 +1337,12 @@ class Phonet(_Phonetic):
                 _phonet_rules = self._rules_german
 
             char0 = ''
-            dest = term
+            # the output, of which only dest[0:j] is meaningful
+            dest = []  # type: List[str]
 
             if not term:
                 return ''
 
-            term_length = len(term)
-
             # convert input string to upper-case
             src = term.translate(self._upper_trans)
 
@@ -1674,11 +1728,7 @@ class Phonet(_Phonetic):
 
                                 while len(rule) > 1:
                                     if (j == 0) or (dest[j - 1] != rule[0]):
-                                        dest = (
-                                            dest[0:j]
-                                            + rule[0]
-                                            + dest[min(len(dest), j + 1) :]
-                                        )
+                                        dest[j : j + 1] = rule[0]
                                         j += 1
 
                                     rule = rule[1:]
@@ -1696,11 +1746,7 @@ class Phonet(_Phonetic):
                                     in cast(str, _phonet_rules[pos])[1:]
                                 ):
                                     if char:
-                                        dest = (
-                                            dest[0:j]
-                                            + char
-                                            + dest[min(len(dest), j + 1) :]
-                                        )
+                                        dest[j : j + 1] = char
                                         j += 1
 
                                     src = src[i + 1 :]
@@ -1721,19 +1767,13 @@ class Phonet(_Phonetic):
                 if zeta0 == 0:
                     if char and ((j == 0) or (dest[j - 1] != char)):
                         # delete multiple letters only
-                        dest = (
-                            dest[0:j] + char + dest[min(j + 1, term_length) :]
-                        )
+                        dest[j : j + 1] = char
                         j += 1
 
                     i += 1
                     zeta = 0
 
-            dest = dest[0:j]
-
-            return dest
-
-        _initialize_phonet(self._lang)
+            return ''.join(dest[0:j])
 
         word = unicode_normalize('NFKC', word)
         return _phonet(word, self._mode, self._lang)
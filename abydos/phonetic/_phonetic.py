@@ -20,16 +20,24 @@ The phonetic._phonetic module implements abstract class Phonetic.
 """
 
 from itertools import groupby
+from typing import Iterable, Iterator, Optional, cast
+
+import numpy as np
+
+from ..util._cache import _Cached
+from ..util._many import _map_many
 
 __all__ = ['_Phonetic']
 
 
-class _Phonetic:
+class _Phonetic(_Cached):
     """Abstract Phonetic class.
 
     .. versionadded:: 0.3.6
     """
 
+    _cached_method = 'encode'
+
     _uc_set = set('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
     _lc_set = set('abcdefghijklmnopqrstuvwxyz')
     _uc_v_set = set('AEIOU')
@@ -83,6 +91,100 @@ class _Phonetic:
         """
         return word
 
+    def encode_many(
+        self,
+        words: Iterable[str],
+        workers: Optional[int] = 1,
+        chunksize: int = 1000,
+    ) -> Iterator[str]:
+        """Yield the encodings of a stream of words.
+
+        The words are read in chunks, each distinct word of a chunk is
+        processed once, and the encodings are yielded in the order of the
+        words. With multiple workers, the chunks are processed by a pool of
+        processes, to each of which this instance is pickled once.
+
+        Parameters
+        ----------
+        words : iterable of str
+            The words to process
+        workers : int or None
+            The number of worker processes to use (1 by default, which
+            processes all words in the current process). If None, the number of
+            processors on the machine is used.
+        chunksize : int
+            The number of words per chunk
+
+        Yields
+        ------
+        str
+            The encoding of each word
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> list(Soundex().encode_many(['Niall', 'Smith', 'Niall']))
+        ['N400', 'S530', 'N400']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _map_many(self, 'encode', words, workers, chunksize)
+
+    def encode_array(self, words: np.ndarray) -> np.ndarray:
+        """Return the encodings of an array of words.
+
+        Each distinct word of the array is encoded once. Simple letter-mapping
+        algorithms, such as :py:class:`.Soundex`, encode the distinct words
+        together, using vectorized NumPy operations.
+
+        Parameters
+        ----------
+        words : numpy.ndarray
+            An array (or other array-like) of words, of any shape
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of the same shape, containing the encoding of each word
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> Soundex().encode_array(np.array(['Niall', 'Smith', 'Niall']))
+        array(['N400', 'S530', 'N400'], dtype='<U4')
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        words = np.asarray(words, dtype=np.str_)
+        distinct, inverse = np.unique(words, return_inverse=True)
+        return cast(
+            np.ndarray,
+            self._encode_array(distinct)[inverse].reshape(words.shape),
+        )
+
+    def _encode_array(self, words: np.ndarray) -> np.ndarray:
+        """Return the encodings of a 1-dimensional array of distinct words.
+
+        Parameters
+        ----------
+        words : numpy.ndarray
+            A 1-dimensional array of words
+
+        Returns
+        -------
+        numpy.ndarray
+            The encoding of each word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.array([self.encode(word) for word in words], dtype=np.str_)
+
     def encode_alpha(self, word: str) -> str:
         """Encode phonetically using alphabetic characters.
 
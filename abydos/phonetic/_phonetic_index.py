@@ -0,0 +1,357 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.phonetic._phonetic_index.
+
+Phonetic key blocking index
+"""
+
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ._phonetic import _Phonetic
+
+__all__ = ['PhoneticIndex']
+
+
+class PhoneticIndex:
+    """Phonetic key blocking index.
+
+    This index groups terms into blocks by the codes that one or more
+    phonetic algorithms assign to them, so that record linkage need only
+    compare the terms that share a block, rather than every pair of terms.
+
+    Algorithms that return multiple codes, as a comma-separated list, such as
+    :py:class:`.DoubleMetaphone` (primary and secondary codes),
+    :py:class:`.DaitchMokotoff`, and :py:class:`.BeiderMorse`, place a term
+    in the block of each of its codes. Empty codes are ignored. Each code is
+    keyed by the position of its algorithm, so that equal codes from
+    different algorithms do not share a block.
+
+    Results are deterministic: terms are always returned in the order in
+    which they were added to the index.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        encoders: Union[
+            Type[_Phonetic],
+            _Phonetic,
+            Sequence[Union[Type[_Phonetic], _Phonetic]],
+        ],
+        terms: Optional[Iterable[str]] = None,
+        encode_alpha: bool = False,
+    ) -> None:
+        """Initialize PhoneticIndex instance.
+
+        Parameters
+        ----------
+        encoders : _Phonetic or type or list
+            An instance of a subclass of _Phonetic, or a list (or other
+            sequence) of such instances, whose codes are used as keys. Classes
+            are instantiated with their default parameters.
+        terms : iterable of str
+            Terms with which to populate the index
+        encode_alpha : bool
+            Set to true to use the encode_alpha method of the phonetic
+            algorithms
+
+        Raises
+        ------
+        TypeError
+            An encoder is not a phonetic algorithm
+        ValueError
+            No encoders were supplied
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(encoders, Sequence):
+            encoders = list(encoders)
+        else:
+            encoders = [encoders]
+        if not encoders:
+            raise ValueError('At least one encoder is required.')
+
+        self.encoders = []  # type: List[_Phonetic]
+        for encoder in encoders:
+            if isinstance(encoder, type) and issubclass(encoder, _Phonetic):
+                encoder = encoder()
+            if not isinstance(encoder, _Phonetic):
+                raise TypeError(
+                    '{} has unknown type {}'.format(encoder, type(encoder))
+                )
+            self.encoders.append(encoder)
+        self._encode_alpha = encode_alpha
+
+        self._terms = []  # type: List[str]
+        self._index = {}  # type: Dict[Tuple[int, str], List[int]]
+
+        if terms is not None:
+            self.update(terms)
+
+    def __len__(self) -> int:
+        """Return the number of terms in the index.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._terms)
+
+    def _split(self, codes: Iterable[str]) -> Tuple[Tuple[int, str], ...]:
+        """Return the sorted, distinct keys of each encoder's codes.
+
+        .. versionadded:: 0.6.0
+
+        """
+        return tuple(
+            sorted(
+                {
+                    (i, code)
+                    for i, encoded in enumerate(codes)
+                    for code in encoded.split(',')
+                    if code
+                }
+            )
+        )
+
+    def keys(self, term: str) -> List[Tuple[int, str]]:
+        """Return the keys of a term.
+
+        Parameters
+        ----------
+        term : str
+            The term to encode
+
+        Returns
+        -------
+        list of tuples
+            The distinct keys of the term, each the position of an encoder
+            paired with one of its codes, in sorted order
+
+        Examples
+        --------
+        >>> from abydos.phonetic import DoubleMetaphone, Soundex
+        >>> index = PhoneticIndex([DoubleMetaphone(), Soundex()])
+        >>> index.keys('Smith')
+        [(0, 'SM0'), (0, 'XMT'), (1, 'S530')]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._encode_alpha:
+            codes = [encoder.encode_alpha(term) for encoder in self.encoders]
+        else:
+            codes = [encoder.encode(term) for encoder in self.encoders]
+        return list(self._split(codes))
+
+    def _add(self, term: str, keys: Tuple[Tuple[int, str], ...]) -> None:
+        """Add a term to the index under its keys.
+
+        .. versionadded:: 0.6.0
+
+        """
+        rid = len(self._terms)
+        self._terms.append(term)
+        for key in keys:
+            self._index.setdefault(key, []).append(rid)
+
+    def add(self, term: str) -> None:
+        """Add a term to the index.
+
+        Parameters
+        ----------
+        term : str
+            The term to add
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> index = PhoneticIndex(Soundex())
+        >>> index.add('Niall')
+        >>> index.add('Niall')
+        >>> len(index)
+        2
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._add(term, tuple(self.keys(term)))
+
+    def update(self, terms: Iterable[str]) -> None:
+        """Add each of a collection of terms to the index.
+
+        Each encoder processes each distinct term of the collection once.
+
+        Parameters
+        ----------
+        terms : iterable of str
+            The terms to add
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        terms = list(terms)
+        distinct = list(dict.fromkeys(terms))
+        encoded = [
+            [
+                encoder.encode_alpha(term)
+                if self._encode_alpha
+                else encoder.encode(term)
+                for term in distinct
+            ]
+            for encoder in self.encoders
+        ]
+        keys = {
+            term: self._split(codes)
+            for term, codes in zip(distinct, zip(*encoded))
+        }
+        for term in terms:
+            self._add(term, keys[term])
+
+    def block(self, key: Tuple[int, str]) -> List[str]:
+        """Return the indexed terms that have a key.
+
+        Parameters
+        ----------
+        key : tuple
+            The position of an encoder paired with one of its codes
+
+        Returns
+        -------
+        list of str
+            The indexed terms with the key, in the order they were added
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> index = PhoneticIndex(Soundex(), ['Niall', 'Smith', 'Neal'])
+        >>> index.block((0, 'N400'))
+        ['Niall', 'Neal']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return [self._terms[rid] for rid in self._index.get(key, ())]
+
+    def blocks(self) -> Dict[Tuple[int, str], List[str]]:
+        """Return the blocks of the index.
+
+        Returns
+        -------
+        dict
+            Each key, in sorted order, mapped to the indexed terms that have
+            it, in the order they were added
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> index = PhoneticIndex(Soundex(), ['Niall', 'Smith', 'Neal'])
+        >>> index.blocks()
+        {(0, 'N400'): ['Niall', 'Neal'], (0, 'S530'): ['Smith']}
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {key: self.block(key) for key in sorted(self._index)}
+
+    def candidates(self, term: str) -> List[str]:
+        """Return the indexed terms that share a key with a term.
+
+        Parameters
+        ----------
+        term : str
+            The term to search for
+
+        Returns
+        -------
+        list of str
+            The indexed terms in any block of the term, each listed once
+            (per time it was added), in the order they were added
+
+        Examples
+        --------
+        >>> from abydos.phonetic import DoubleMetaphone
+        >>> index = PhoneticIndex(DoubleMetaphone(),
+        ... ['Schmidt', 'Smith', 'Smyth', 'Niall', 'Neil'])
+        >>> index.candidates('Schmitt')
+        ['Schmidt', 'Smith', 'Smyth']
+        >>> index.candidates('Nial')
+        ['Niall', 'Neil']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        rids = set()  # type: Set[int]
+        for key in self.keys(term):
+            rids.update(self._index.get(key, ()))
+        return [self._terms[rid] for rid in sorted(rids)]
+
+    def pairs(self) -> List[Tuple[str, str]]:
+        """Return all pairs of indexed terms that share a key.
+
+        Returns
+        -------
+        list of tuples
+            Each pair of indexed terms in a common block, listed once, with
+            the term added first listed first. Pairs are ordered by the
+            positions at which their terms were added to the index.
+
+        Examples
+        --------
+        >>> from abydos.phonetic import DoubleMetaphone
+        >>> index = PhoneticIndex(DoubleMetaphone(),
+        ... ['Schmidt', 'Niall', 'Smith', 'Neil'])
+        >>> index.pairs()
+        [('Schmidt', 'Smith'), ('Niall', 'Neil')]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        pairs = set()  # type: Set[Tuple[int, int]]
+        for rids in self._index.values():
+            for pos, rid in enumerate(rids):
+                for other in rids[pos + 1 :]:
+                    pairs.add((rid, other))
+        return [
+            (self._terms[rid1], self._terms[rid2])
+            for rid1, rid2 in sorted(pairs)
+        ]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -19,6 +19,7 @@
 Phonetic Spanish
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -43,18 +44,27 @@ class PhoneticSpanish(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '0123456789'), 'PBFTSLNKGR'))
 
-    def __init__(self, max_length: int = -1) -> None:
+    def __init__(
+        self, max_length: int = -1, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize PhoneticSpanish instance.
 
         Parameters
         ----------
         max_length : int
             The length of the code returned (defaults to unlimited)
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(PhoneticSpanish, self).__init__(cache_size)
         self._max_length = max_length
 
     def encode_alpha(self, word: str) -> str:
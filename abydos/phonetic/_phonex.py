@@ -19,6 +19,7 @@
 Phonex
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -36,7 +37,12 @@ class Phonex(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '123456'), 'PSTLNR'))
 
-    def __init__(self, max_length: int = 4, zero_pad: bool = True) -> None:
+    def __init__(
+        self,
+        max_length: int = 4,
+        zero_pad: bool = True,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize Phonex instance.
 
         Parameters
@@ -46,11 +52,18 @@ class Phonex(_Phonetic):
         zero_pad : bool
             Pad the end of the return value with 0s to achieve a max_length
             string
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Phonex, self).__init__(cache_size)
         # Clamp max_length to [4, 64]
         if max_length != -1:
             self._max_length = min(max(4, max_length), 64)
@@ -19,6 +19,8 @@
 Phonic
 """
 
+from typing import Optional
+
 from ._phonetic import _Phonetic
 
 __all__ = ['PHONIC']
@@ -70,6 +72,7 @@ class PHONIC(_Phonetic):
         max_length: int = 5,
         zero_pad: bool = True,
         extended: bool = False,
+        cache_size: Optional[int] = 0,
     ) -> None:
         """Initialize PHONIC instance.
 
@@ -83,11 +86,18 @@ class PHONIC(_Phonetic):
         extended : bool
             If True, this uses Taft's 'Extended PHONIC coding' mode, which
             simply omits the first character of the code.
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(PHONIC, self).__init__(cache_size)
         # Require a max_length of at least 5 and not more than 64
         if max_length != -1:
             self._max_length = min(max(5, max_length), 64)
@@ -49,7 +49,12 @@ class Phonix(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '012345678'), 'APKTLNRFS'))
 
-    def __init__(self, max_length: int = 4, zero_pad: bool = True) -> None:
+    def __init__(
+        self,
+        max_length: int = 4,
+        zero_pad: bool = True,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize Phonix instance.
 
         Parameters
@@ -59,11 +64,18 @@ class Phonix(_Phonetic):
         zero_pad : bool
             Pad the end of the return value with 0s to achieve a max_length
             string
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.3.6
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Phonix, self).__init__(cache_size)
         self._uc_c_set = (
             super(Phonix, self)._uc_set - super(Phonix, self)._uc_v_set
         )
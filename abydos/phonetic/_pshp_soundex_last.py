@@ -19,6 +19,7 @@
 PSHP Soundex/Viewex Coding for last names
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -48,7 +49,12 @@ class PSHPSoundexLast(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '12345'), 'PKTLN'))
 
-    def __init__(self, max_length: int = 4, german: bool = False) -> None:
+    def __init__(
+        self,
+        max_length: int = 4,
+        german: bool = False,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize PSHPSoundexLast instance.
 
         Parameters
@@ -57,11 +63,18 @@ class PSHPSoundexLast(_Phonetic):
             The length of the code returned (defaults to 4)
         german : bool
             Set to True if the name is German (different rules apply)
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(PSHPSoundexLast, self).__init__(cache_size)
         self._max_length = max_length
         self._german = german
 
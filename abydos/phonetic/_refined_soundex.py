@@ -19,9 +19,20 @@
 Refined Soundex
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
+import numpy as np
+
 from ._phonetic import _Phonetic
+from ..util._array import (
+    _collapse,
+    _compact,
+    _pad,
+    _str_array,
+    _translate,
+    _uc_codepoints,
+)
 
 __all__ = ['RefinedSoundex']
 
@@ -49,6 +60,7 @@ class RefinedSoundex(_Phonetic):
         max_length: int = -1,
         zero_pad: bool = False,
         retain_vowels: bool = False,
+        cache_size: Optional[int] = 0,
     ) -> None:
         """Initialize RefinedSoundex instance.
 
@@ -61,11 +73,18 @@ class RefinedSoundex(_Phonetic):
             string
         retain_vowels : bool
             Retain vowels (as 0) in the resulting code
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(RefinedSoundex, self).__init__(cache_size)
         self._max_length = max_length
         self._zero_pad = zero_pad
         self._retain_vowels = retain_vowels
@@ -150,6 +169,27 @@ class RefinedSoundex(_Phonetic):
 
         return sdx
 
+    def _encode_array(self, words: np.ndarray) -> np.ndarray:
+        """Return the Refined Soundex codes of a 1-dimensional array of words.
+
+        .. versionadded:: 0.6.0
+
+        """
+        codes = _uc_codepoints(words)
+        word = _compact(codes, (codes >= 65) & (codes <= 90))
+
+        # apply the Soundex algorithm
+        sdx = _translate(word, self._trans)
+        sdx[:, :1] = word[:, :1]
+        sdx = _collapse(sdx)
+        if not self._retain_vowels:
+            sdx = _compact(sdx, sdx != ord('0'))  # Delete vowels, H, W, Y
+
+        if self._max_length > 0:
+            sdx = _pad(sdx, self._max_length, self._zero_pad)
+
+        return _str_array(sdx)
+
 
 if __name__ == '__main__':
     import doctest
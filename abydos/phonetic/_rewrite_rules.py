@@ -0,0 +1,351 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.phonetic._rewrite_rules.
+
+Compiled tables of ordered rewrite rules, shared by rule-based phonetic
+algorithms
+"""
+
+from re import IGNORECASE, compile as re_compile
+from typing import (
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+__all__ = []  # type: List[str]
+
+# a lookbehind assertion without nested groups
+_LOOKBEHIND = re_compile(r'\(\?<[=!](?:\\.|\[(?:\\.|[^\]\\])*\]|[^()\\\[])*\)')
+# a character class of literal characters, without negation or ranges
+_CLASS = re_compile(r'\[([^\]\\^-][^\]\\-]*)\]')
+_META = set('.^$*+?{}[]\\|()')
+
+_Rule = Tuple[Pattern[str], str, Optional[Pattern[str]]]
+_Segment = Tuple[Pattern[str], Optional[Pattern[str]]]
+
+
+def _first_chars(pattern: str, flags: int = 0) -> Optional[FrozenSet[str]]:
+    """Return the characters that may begin a match of a pattern.
+
+    Leading ^ anchors and lookbehind assertions, which match no characters,
+    are skipped. Patterns that do not begin with a literal character or a
+    class of literal characters, that have top-level alternatives, or that
+    ignore case are not analyzed.
+
+    Parameters
+    ----------
+    pattern : str
+        A regular expression
+    flags : int
+        The flags of the regular expression
+
+    Returns
+    -------
+    frozenset or None
+        The characters that may begin a match, or None if the pattern may
+        begin with any character
+
+    Examples
+    --------
+    >>> sorted(_first_chars('(?<=[aeiou][bcd])e$'))
+    ['e']
+    >>> sorted(_first_chars('^[ae]m(?=[bcd])'))
+    ['a', 'e']
+    >>> sorted(_first_chars(r'\\.'))
+    ['.']
+    >>> _first_chars('a?b') is None
+    True
+    >>> _first_chars('ab|c') is None
+    True
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if flags & IGNORECASE:
+        return None
+
+    # reject top-level alternatives
+    depth = 0
+    pos = 0
+    while pos < len(pattern):
+        char = pattern[pos]
+        if char == '\\':
+            pos += 1
+        elif char == '[':
+            match = _CLASS.match(pattern, pos)
+            if match is None:
+                return None
+            pos = match.end() - 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and not depth:
+            return None
+        pos += 1
+
+    pos = 0
+    while True:
+        if pattern.startswith('^', pos):
+            pos += 1
+            continue
+        match = _LOOKBEHIND.match(pattern, pos)
+        if match is None:
+            break
+        pos = match.end()
+
+    match = _CLASS.match(pattern, pos)
+    if match is not None:
+        chars = frozenset(match.group(1))
+        pos = match.end()
+    elif pattern[pos : pos + 1] == '\\' and not (
+        pattern[pos + 1 : pos + 2].isalnum()
+    ):
+        chars = frozenset(pattern[pos + 1 : pos + 2])
+        pos += 2
+    elif pattern[pos : pos + 1] and pattern[pos] not in _META:
+        chars = frozenset(pattern[pos])
+        pos += 1
+    else:
+        return None
+
+    if not chars or pattern[pos : pos + 1] in {'*', '?', '{'}:
+        return None
+    return chars
+
+
+class _RewriteRules:
+    """Compiled table of ordered rewrite rules.
+
+    Each rule consists of a regular expression, a replacement, and
+    optionally a regular expression for the left context of the rule. At a
+    position in a word, the first rule whose expression matches at that
+    position, and whose left context (if any) matches the word up to that
+    position, applies: its replacement is emitted and the position advances
+    past the characters the expression matched.
+
+    The rules are compiled into a dict, keyed by the characters with which
+    their expressions may begin, so that only the rules that might apply at
+    a position are considered. Consecutive rules without left contexts are
+    combined into a single alternation, which is tried in one step.
+    Expressions must not contain numbered backreferences or named groups.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[
+            Union[
+                Tuple[Union[str, Pattern[str]], str],
+                Tuple[
+                    Union[str, Pattern[str]],
+                    str,
+                    Union[str, Pattern[str], None],
+                ],
+            ]
+        ],
+    ) -> None:
+        """Initialize _RewriteRules instance.
+
+        Parameters
+        ----------
+        rules : sequence of tuples
+            The rules, in order of precedence, each a tuple of a regular
+            expression (str or compiled) matched at a position, its
+            replacement, and optionally a regular expression (or None) that
+            must match the word from its start up to the position
+
+        Raises
+        ------
+        ValueError
+            The rules' expressions must share their flags
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.rules = []  # type: List[_Rule]
+        for rule in rules:
+            pattern = rule[0]
+            left = rule[2] if len(rule) > 2 else None
+            self.rules.append(
+                (
+                    re_compile(pattern),
+                    rule[1],
+                    None if left is None else re_compile(left),
+                )
+            )
+
+        flags = {pattern.flags for pattern, _, _ in self.rules}
+        if len(flags) > 1:
+            raise ValueError(
+                'The expressions of the rules must share their flags'
+            )
+        self._flags = flags.pop() if flags else 0
+
+        first = [
+            _first_chars(pattern.pattern, pattern.flags)
+            for pattern, _, _ in self.rules
+        ]
+        self._buckets = {
+            char: self._segments(
+                [
+                    i
+                    for i, chars in enumerate(first)
+                    if chars is None or char in chars
+                ]
+            )
+            for char in set().union(*(chars for chars in first if chars))
+        }  # type: Dict[str, List[_Segment]]
+        self._default = self._segments(
+            [i for i, chars in enumerate(first) if chars is None]
+        )
+
+    def _segments(self, indices: List[int]) -> List[_Segment]:
+        """Compile rules into segments tried in order.
+
+        Parameters
+        ----------
+        indices : list of int
+            The indices of the rules, in order
+
+        Returns
+        -------
+        list
+            Segments, each a tuple of an alternation of rules, with a group
+            named for the index of each rule, and the left context of the
+            segment's single rule, if it has one
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        segments = []  # type: List[_Segment]
+        run = []  # type: List[str]
+
+        for i in indices:
+            pattern, _, left = self.rules[i]
+            group = '(?P<r{}>{})'.format(i, pattern.pattern)
+            if left is None:
+                run.append(group)
+                continue
+            if run:
+                segments.append((re_compile('|'.join(run), self._flags), None))
+                run = []
+            segments.append((re_compile(group, self._flags), left))
+        if run:
+            segments.append((re_compile('|'.join(run), self._flags), None))
+        return segments
+
+    def match(self, word: str, pos: int) -> Optional[Tuple[str, int]]:
+        """Return the replacement of the rule that applies at a position.
+
+        Parameters
+        ----------
+        word : str
+            The word
+        pos : int
+            The position in the word
+
+        Returns
+        -------
+        tuple or None
+            The replacement of the first rule that applies and the end of
+            the characters it matched, or None if no rule applies
+
+        Examples
+        --------
+        >>> rules = _RewriteRules([('th', 'θ'), ('t', 't'), ('h', '')])
+        >>> rules.match('the', 0)
+        ('θ', 2)
+        >>> rules.match('the', 1)
+        ('', 2)
+        >>> rules.match('the', 2) is None
+        True
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for regex, left in self._buckets.get(word[pos], self._default):
+            match = regex.match(word, pos)
+            if match is not None and (
+                left is None or left.match(word, 0, pos)
+            ):
+                return (
+                    self.rules[int(match.lastgroup[1:])][1],  # type: ignore
+                    match.end(),
+                )
+        return None
+
+    def rewrite(self, word: str, keep_unmatched: bool = False) -> str:
+        """Rewrite a word by applying the rules from left to right.
+
+        Parameters
+        ----------
+        word : str
+            The word
+        keep_unmatched : bool
+            If True, characters at which no rule applies are kept; otherwise
+            they are dropped
+
+        Returns
+        -------
+        str
+            The rewritten word
+
+        Examples
+        --------
+        >>> rules = _RewriteRules([('th', 'θ'), ('t', 't'), ('(?<=a)h', '')])
+        >>> rules.rewrite('hatha')
+        'θ'
+        >>> rules.rewrite('hatha', keep_unmatched=True)
+        'haθa'
+        >>> rules.rewrite('ahtha', keep_unmatched=True)
+        'aθa'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        output = []  # type: List[str]
+        pos = 0
+        while pos < len(word):
+            rule = self.match(word, pos)
+            if rule is None:
+                if keep_unmatched:
+                    output.append(word[pos])
+                pos += 1
+            else:
+                output.append(rule[0])
+                # always advance, even past a rule that matched nothing
+                pos = max(rule[1], pos + 1)
+        return ''.join(output)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
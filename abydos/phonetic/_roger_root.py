@@ -19,6 +19,7 @@
 Roger Root phonetic algorithm
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -131,7 +132,12 @@ class RogerRoot(_Phonetic):
     _alphabetic_initial = dict(zip((ord(_) for _ in '012345'), ' AHJWY'))
     _alphabetic = dict(zip((ord(_) for _ in '0123456789'), 'STNMRLJKFP'))
 
-    def __init__(self, max_length: int = 5, zero_pad: bool = True) -> None:
+    def __init__(
+        self,
+        max_length: int = 5,
+        zero_pad: bool = True,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize RogerRoot instance.
 
         Parameters
@@ -141,11 +147,18 @@ class RogerRoot(_Phonetic):
         zero_pad : bool
             Pad the end of the return value with 0s to achieve a max_length
             string
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(RogerRoot, self).__init__(cache_size)
         self._max_length = max_length
         self._zero_pad = zero_pad
 
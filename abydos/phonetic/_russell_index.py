@@ -21,7 +21,16 @@ Robert C. Russell's Index
 
 from unicodedata import normalize as unicode_normalize
 
+import numpy as np
+
 from ._phonetic import _Phonetic
+from ..util._array import (
+    _collapse,
+    _compact,
+    _str_array,
+    _translate,
+    _uc_codepoints,
+)
 
 __all__ = ['RussellIndex']
 
@@ -136,6 +145,39 @@ class RussellIndex(_Phonetic):
         num = ''.join(c for c in self.encode(word) if c in self._num_set)
         return num.translate(self._num_trans)
 
+    def _encode_array(self, words: np.ndarray) -> np.ndarray:
+        """Return the Russell Indices of a 1-dimensional array of words.
+
+        .. versionadded:: 0.6.0
+
+        """
+        codes = _uc_codepoints(words)
+        keep = codes != 0
+
+        # discard gh (rule 3)
+        gh = (codes[:, :-1] == ord('G')) & (codes[:, 1:] == ord('H'))
+        keep[:, :-1] &= ~gh
+        keep[:, 1:] &= ~gh
+
+        # discard /[sz]$/ (rule 3)
+        pos = np.arange(codes.shape[1])
+        last = np.where(
+            keep & (codes != ord('S')) & (codes != ord('Z')), pos, -1
+        ).max(axis=1)
+        keep &= pos <= last[:, None]
+
+        # translate according to Russell's mapping
+        keep &= np.isin(codes, [ord(_) for _ in self._uc_set])
+        sdx = _translate(_compact(codes, keep), self._trans)
+
+        # remove any 1s after the first occurrence
+        ones = sdx == ord('1')
+        sdx = _compact(sdx, ~ones | (np.cumsum(ones, axis=1) == 1))
+
+        # remove repeating characters
+        sdx = _collapse(sdx)
+        return _str_array(sdx)
+
 
 if __name__ == '__main__':
     import doctest
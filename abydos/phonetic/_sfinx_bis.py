@@ -19,6 +19,7 @@
 SfinxBis
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -144,18 +145,27 @@ class SfinxBis(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '123456789#'), 'PKTLNRFSAŠ'))
 
-    def __init__(self, max_length: int = -1) -> None:
+    def __init__(
+        self, max_length: int = -1, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize SfinxBis instance.
 
         Parameters
         ----------
         max_length : int
             The length of the code returned (defaults to unlimited)
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(SfinxBis, self).__init__(cache_size)
         self._max_length = max_length
 
     def encode_alpha(self, word: str) -> str:
@@ -19,10 +19,20 @@
 American Soundex
 """
 
-from typing import Any
+from typing import Any, Optional
 from unicodedata import normalize as unicode_normalize
 
+import numpy as np
+
 from ._phonetic import _Phonetic
+from ..util._array import (
+    _collapse,
+    _compact,
+    _pad,
+    _str_array,
+    _translate,
+    _uc_codepoints,
+)
 
 __all__ = ['Soundex']
 
@@ -60,6 +70,7 @@ class Soundex(_Phonetic):
         var: str = 'American',
         reverse: bool = False,
         zero_pad: bool = True,
+        cache_size: Optional[int] = 0,
     ) -> None:
         """Initialize Soundex instance.
 
@@ -87,11 +98,18 @@ class Soundex(_Phonetic):
         zero_pad : bool
             Pad the end of the return value with 0s to achieve a max_length
             string
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Soundex, self).__init__(cache_size)
         # Require a max_length of at least 4 and not more than 64
         if max_length != -1:
             self._max_length = min(max(4, max_length), 64)
@@ -236,6 +254,55 @@ class Soundex(_Phonetic):
 
         return sdx[: self._max_length]
 
+    def _encode_array(self, words: np.ndarray) -> np.ndarray:
+        """Return the Soundex codes of a 1-dimensional array of words.
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._var == 'Census':
+            return super(Soundex, self)._encode_array(words)
+
+        codes = _uc_codepoints(words)
+        word = _compact(codes, (codes >= 65) & (codes <= 90))
+        lengths = (word != 0).sum(axis=1)
+
+        # Reverse word if computing Reverse Soundex
+        if self._reverse:
+            pos = lengths[:, None] - 1 - np.arange(word.shape[1])
+            word = np.where(
+                pos >= 0,
+                np.take_along_axis(word, np.maximum(pos, 0), axis=1),
+                0,
+            )
+
+        # apply the Soundex algorithm
+        sdx = _translate(word, self._trans)
+        if self._var == 'special':
+            sdx[sdx == ord('9')] = ord('0')
+        else:
+            sdx = _compact(sdx, sdx != ord('9'))
+        sdx = _collapse(sdx)
+
+        first = word[:, :1]
+        sdx = np.concatenate(
+            [
+                first,
+                np.where(
+                    (first == ord('H')) | (first == ord('W')),
+                    sdx,
+                    np.pad(sdx[:, 1:], ((0, 0), (0, 1))),
+                ),
+            ],
+            axis=1,
+        )
+        sdx = _compact(sdx, sdx != ord('0'))
+        sdx = _pad(sdx, self._max_length, self._zero_pad)
+
+        # words with nothing to convert
+        sdx[lengths == 0, 0] = ord('0')
+        return _str_array(sdx)
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,6 +19,7 @@
 SoundexBR
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -43,7 +44,12 @@ class SoundexBR(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '0123456'), 'APKTLNR'))
 
-    def __init__(self, max_length: int = 4, zero_pad: bool = True) -> None:
+    def __init__(
+        self,
+        max_length: int = 4,
+        zero_pad: bool = True,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize SoundexBR instance.
 
         Parameters
@@ -53,11 +59,18 @@ class SoundexBR(_Phonetic):
         zero_pad : bool
             Pad the end of the return value with 0s to achieve a max_length
             string
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(SoundexBR, self).__init__(cache_size)
         self._max_length = max_length
         self._zero_pad = zero_pad
 
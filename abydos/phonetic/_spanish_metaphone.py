@@ -19,6 +19,7 @@
 Spanish Metaphone
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -39,7 +40,12 @@ class SpanishMetaphone(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
-    def __init__(self, max_length: int = 6, modified: bool = False) -> None:
+    def __init__(
+        self,
+        max_length: int = 6,
+        modified: bool = False,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize AlphaSIS instance.
 
         Parameters
@@ -49,11 +55,18 @@ class SpanishMetaphone(_Phonetic):
         modified : bool
             Set to True to use del Pilar Angeles & Bailón-Miguel's modified
             version of the algorithm
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(SpanishMetaphone, self).__init__(cache_size)
         self._max_length = max_length
         self._modified = modified
 
@@ -19,6 +19,7 @@
 Statistics Canada phonetic encoding
 """
 
+from typing import Optional
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -41,18 +42,27 @@ class StatisticsCanada(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
-    def __init__(self, max_length: int = 4) -> None:
+    def __init__(
+        self, max_length: int = 4, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize StatisticsCanada instance.
 
         Parameters
         ----------
         max_length : int
             The length of the code returned (defaults to 4)
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(StatisticsCanada, self).__init__(cache_size)
         self._max_length = max_length
 
     def encode(self, word: str) -> str:
@@ -36,18 +36,29 @@ class Waahlin(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
-    def __init__(self, encoder: Optional[_Phonetic] = None) -> None:
+    def __init__(
+        self,
+        encoder: Optional[_Phonetic] = None,
+        cache_size: Optional[int] = 0,
+    ) -> None:
         """Initialize Waahlin instance.
 
         Parameters
         ----------
         encoder : _Phonetic
             An initialized phonetic algorithm object
+        cache_size : int or None
+            The number of most recently used encodings to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Waahlin, self).__init__(cache_size)
         self._encoder = encoder
 
     _transforms = {
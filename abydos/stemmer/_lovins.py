@@ -19,14 +19,46 @@
 Lovins stemmer.
 """
 
-from typing import Callable, Dict, Optional, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from unicodedata import normalize
 
 from ._stemmer import _Stemmer
+from ..util._trie import _trie
 
 __all__ = ['Lovins']
 
 
+def _number_by_last(
+    rules: Tuple[Tuple[str, Any], ...]
+) -> Dict[str, Tuple[Tuple[int, str, Any], ...]]:
+    """Return rules, numbered, indexed by the last letter of their endings.
+
+    Parameters
+    ----------
+    rules : tuple
+        A sequence of endings & their replacements
+
+    Returns
+    -------
+    dict
+        A mapping of last letters to tuples of the index, ending, &
+        replacement of each rule, in order
+
+    Examples
+    --------
+    >>> _number_by_last((('ax', 'ac'), ('ud', 'us'), ('ex', 'ec')))
+    {'x': ((0, 'ax', 'ac'), (2, 'ex', 'ec')), 'd': ((1, 'ud', 'us'),)}
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    index = {}  # type: Dict[str, List[Tuple[int, str, Any]]]
+    for i, (ending, replacement) in enumerate(rules):
+        index.setdefault(ending[-1], []).append((i, ending, replacement))
+    return {key: tuple(val) for key, val in index.items()}
+
+
 class Lovins(_Stemmer):
     """Lovins stemmer.
 
@@ -828,348 +860,348 @@ class Lovins(_Stemmer):
             return stem
         return stem[:-1] + 's'
 
-    _suffix = {}  # type: Dict[str, Optional[Callable[[str, int], bool]]]
-    _recode = ()  # type: Tuple[Tuple[str, Union[str, Callable[[str], str]]], ...]  # noqa: E501
-
-    def __init__(self) -> None:
-        """Initialize the stemmer.
-
-        .. versionadded:: 0.3.6
-
-        """
-        self._suffix = {
-            'alistically': self._cond_b,
-            'arizability': None,
-            'izationally': self._cond_b,
-            'antialness': None,
-            'arisations': None,
-            'arizations': None,
-            'entialness': None,
-            'allically': self._cond_c,
-            'antaneous': None,
-            'antiality': None,
-            'arisation': None,
-            'arization': None,
-            'ationally': self._cond_b,
-            'ativeness': None,
-            'eableness': self._cond_e,
-            'entations': None,
-            'entiality': None,
-            'entialize': None,
-            'entiation': None,
-            'ionalness': None,
-            'istically': None,
-            'itousness': None,
-            'izability': None,
-            'izational': None,
-            'ableness': None,
-            'arizable': None,
-            'entation': None,
-            'entially': None,
-            'eousness': None,
-            'ibleness': None,
-            'icalness': None,
-            'ionalism': None,
-            'ionality': None,
-            'ionalize': None,
-            'iousness': None,
-            'izations': None,
-            'lessness': None,
-            'ability': None,
-            'aically': None,
-            'alistic': self._cond_b,
-            'alities': None,
-            'ariness': self._cond_e,
-            'aristic': None,
-            'arizing': None,
-            'ateness': None,
-            'atingly': None,
-            'ational': self._cond_b,
-            'atively': None,
-            'ativism': None,
-            'elihood': self._cond_e,
-            'encible': None,
-            'entally': None,
-            'entials': None,
-            'entiate': None,
-            'entness': None,
-            'fulness': None,
-            'ibility': None,
-            'icalism': None,
-            'icalist': None,
-            'icality': None,
-            'icalize': None,
-            'ication': self._cond_g,
-            'icianry': None,
-            'ination': None,
-            'ingness': None,
-            'ionally': None,
-            'isation': None,
-            'ishness': None,
-            'istical': None,
-            'iteness': None,
-            'iveness': None,
-            'ivistic': None,
-            'ivities': None,
-            'ization': self._cond_f,
-            'izement': None,
-            'oidally': None,
-            'ousness': None,
-            'aceous': None,
-            'acious': self._cond_b,
-            'action': self._cond_g,
-            'alness': None,
-            'ancial': None,
-            'ancies': None,
-            'ancing': self._cond_b,
-            'ariser': None,
-            'arized': None,
-            'arizer': None,
-            'atable': None,
-            'ations': self._cond_b,
-            'atives': None,
-            'eature': self._cond_z,
-            'efully': None,
-            'encies': None,
-            'encing': None,
-            'ential': None,
-            'enting': self._cond_c,
-            'entist': None,
-            'eously': None,
-            'ialist': None,
-            'iality': None,
-            'ialize': None,
-            'ically': None,
-            'icance': None,
-            'icians': None,
-            'icists': None,
-            'ifully': None,
-            'ionals': None,
-            'ionate': self._cond_d,
-            'ioning': None,
-            'ionist': None,
-            'iously': None,
-            'istics': None,
-            'izable': self._cond_e,
-            'lessly': None,
-            'nesses': None,
-            'oidism': None,
-            'acies': None,
-            'acity': None,
-            'aging': self._cond_b,
-            'aical': None,
-            'alist': None,
-            'alism': self._cond_b,
-            'ality': None,
-            'alize': None,
-            'allic': self._cond_bb,
-            'anced': self._cond_b,
-            'ances': self._cond_b,
-            'antic': self._cond_c,
-            'arial': None,
-            'aries': None,
-            'arily': None,
-            'arity': self._cond_b,
-            'arize': None,
-            'aroid': None,
-            'ately': None,
-            'ating': self._cond_i,
-            'ation': self._cond_b,
-            'ative': None,
-            'ators': None,
-            'atory': None,
-            'ature': self._cond_e,
-            'early': self._cond_y,
-            'ehood': None,
-            'eless': None,
-            'elity': None,
-            'ement': None,
-            'enced': None,
-            'ences': None,
-            'eness': self._cond_e,
-            'ening': self._cond_e,
-            'ental': None,
-            'ented': self._cond_c,
-            'ently': None,
-            'fully': None,
-            'ially': None,
-            'icant': None,
-            'ician': None,
-            'icide': None,
-            'icism': None,
-            'icist': None,
-            'icity': None,
-            'idine': self._cond_i,
-            'iedly': None,
-            'ihood': None,
-            'inate': None,
-            'iness': None,
-            'ingly': self._cond_b,
-            'inism': self._cond_j,
-            'inity': self._cond_cc,
-            'ional': None,
-            'ioned': None,
-            'ished': None,
-            'istic': None,
-            'ities': None,
-            'itous': None,
-            'ively': None,
-            'ivity': None,
-            'izers': self._cond_f,
-            'izing': self._cond_f,
-            'oidal': None,
-            'oides': None,
-            'otide': None,
-            'ously': None,
-            'able': None,
-            'ably': None,
-            'ages': self._cond_b,
-            'ally': self._cond_b,
-            'ance': self._cond_b,
-            'ancy': self._cond_b,
-            'ants': self._cond_b,
-            'aric': None,
-            'arly': self._cond_k,
-            'ated': self._cond_i,
-            'ates': None,
-            'atic': self._cond_b,
-            'ator': None,
-            'ealy': self._cond_y,
-            'edly': self._cond_e,
-            'eful': None,
-            'eity': None,
-            'ence': None,
-            'ency': None,
-            'ened': self._cond_e,
-            'enly': self._cond_e,
-            'eous': None,
-            'hood': None,
-            'ials': None,
-            'ians': None,
-            'ible': None,
-            'ibly': None,
-            'ical': None,
-            'ides': self._cond_l,
-            'iers': None,
-            'iful': None,
-            'ines': self._cond_m,
-            'ings': self._cond_n,
-            'ions': self._cond_b,
-            'ious': None,
-            'isms': self._cond_b,
-            'ists': None,
-            'itic': self._cond_h,
-            'ized': self._cond_f,
-            'izer': self._cond_f,
-            'less': None,
-            'lily': None,
-            'ness': None,
-            'ogen': None,
-            'ward': None,
-            'wise': None,
-            'ying': self._cond_b,
-            'yish': None,
-            'acy': None,
-            'age': self._cond_b,
-            'aic': None,
-            'als': self._cond_bb,
-            'ant': self._cond_b,
-            'ars': self._cond_o,
-            'ary': self._cond_f,
-            'ata': None,
-            'ate': None,
-            'eal': self._cond_y,
-            'ear': self._cond_y,
-            'ely': self._cond_e,
-            'ene': self._cond_e,
-            'ent': self._cond_c,
-            'ery': self._cond_e,
-            'ese': None,
-            'ful': None,
-            'ial': None,
-            'ian': None,
-            'ics': None,
-            'ide': self._cond_l,
-            'ied': None,
-            'ier': None,
-            'ies': self._cond_p,
-            'ily': None,
-            'ine': self._cond_m,
-            'ing': self._cond_n,
-            'ion': self._cond_q,
-            'ish': self._cond_c,
-            'ism': self._cond_b,
-            'ist': None,
-            'ite': self._cond_aa,
-            'ity': None,
-            'ium': None,
-            'ive': None,
-            'ize': self._cond_f,
-            'oid': None,
-            'one': self._cond_r,
-            'ous': None,
-            'ae': None,
-            'al': self._cond_bb,
-            'ar': self._cond_x,
-            'as': self._cond_b,
-            'ed': self._cond_e,
-            'en': self._cond_f,
-            'es': self._cond_e,
-            'ia': None,
-            'ic': None,
-            'is': None,
-            'ly': self._cond_b,
-            'on': self._cond_s,
-            'or': self._cond_t,
-            'um': self._cond_u,
-            'us': self._cond_v,
-            'yl': self._cond_r,
-            "'s": None,
-            "s'": None,
-            'a': None,
-            'e': None,
-            'i': None,
-            'o': None,
-            's': self._cond_w,
-            'y': self._cond_b,
-        }
-
-        self._recode = (
-            ('iev', 'ief'),
-            ('uct', 'uc'),
-            ('umpt', 'um'),
-            ('rpt', 'rb'),
-            ('urs', 'ur'),
-            ('istr', 'ister'),
-            ('metr', 'meter'),
-            ('olv', 'olut'),
-            ('ul', self._recode9),
-            ('bex', 'bic'),
-            ('dex', 'dic'),
-            ('pex', 'pic'),
-            ('tex', 'tic'),
-            ('ax', 'ac'),
-            ('ex', 'ec'),
-            ('ix', 'ic'),
-            ('lux', 'luc'),
-            ('uad', 'uas'),
-            ('vad', 'vas'),
-            ('cid', 'cis'),
-            ('lid', 'lis'),
-            ('erid', 'eris'),
-            ('pand', 'pans'),
-            ('end', self._recode24),
-            ('ond', 'ons'),
-            ('lud', 'lus'),
-            ('rud', 'rus'),
-            ('her', self._recode28),
-            ('mit', 'mis'),
-            ('ent', self._recode30),
-            ('ert', 'ers'),
-            ('et', self._recode32),
-            ('yt', 'ys'),
-            ('yz', 'ys'),
-        )
+    _suffix = {
+        'alistically': _cond_b,
+        'arizability': None,
+        'izationally': _cond_b,
+        'antialness': None,
+        'arisations': None,
+        'arizations': None,
+        'entialness': None,
+        'allically': _cond_c,
+        'antaneous': None,
+        'antiality': None,
+        'arisation': None,
+        'arization': None,
+        'ationally': _cond_b,
+        'ativeness': None,
+        'eableness': _cond_e,
+        'entations': None,
+        'entiality': None,
+        'entialize': None,
+        'entiation': None,
+        'ionalness': None,
+        'istically': None,
+        'itousness': None,
+        'izability': None,
+        'izational': None,
+        'ableness': None,
+        'arizable': None,
+        'entation': None,
+        'entially': None,
+        'eousness': None,
+        'ibleness': None,
+        'icalness': None,
+        'ionalism': None,
+        'ionality': None,
+        'ionalize': None,
+        'iousness': None,
+        'izations': None,
+        'lessness': None,
+        'ability': None,
+        'aically': None,
+        'alistic': _cond_b,
+        'alities': None,
+        'ariness': _cond_e,
+        'aristic': None,
+        'arizing': None,
+        'ateness': None,
+        'atingly': None,
+        'ational': _cond_b,
+        'atively': None,
+        'ativism': None,
+        'elihood': _cond_e,
+        'encible': None,
+        'entally': None,
+        'entials': None,
+        'entiate': None,
+        'entness': None,
+        'fulness': None,
+        'ibility': None,
+        'icalism': None,
+        'icalist': None,
+        'icality': None,
+        'icalize': None,
+        'ication': _cond_g,
+        'icianry': None,
+        'ination': None,
+        'ingness': None,
+        'ionally': None,
+        'isation': None,
+        'ishness': None,
+        'istical': None,
+        'iteness': None,
+        'iveness': None,
+        'ivistic': None,
+        'ivities': None,
+        'ization': _cond_f,
+        'izement': None,
+        'oidally': None,
+        'ousness': None,
+        'aceous': None,
+        'acious': _cond_b,
+        'action': _cond_g,
+        'alness': None,
+        'ancial': None,
+        'ancies': None,
+        'ancing': _cond_b,
+        'ariser': None,
+        'arized': None,
+        'arizer': None,
+        'atable': None,
+        'ations': _cond_b,
+        'atives': None,
+        'eature': _cond_z,
+        'efully': None,
+        'encies': None,
+        'encing': None,
+        'ential': None,
+        'enting': _cond_c,
+        'entist': None,
+        'eously': None,
+        'ialist': None,
+        'iality': None,
+        'ialize': None,
+        'ically': None,
+        'icance': None,
+        'icians': None,
+        'icists': None,
+        'ifully': None,
+        'ionals': None,
+        'ionate': _cond_d,
+        'ioning': None,
+        'ionist': None,
+        'iously': None,
+        'istics': None,
+        'izable': _cond_e,
+        'lessly': None,
+        'nesses': None,
+        'oidism': None,
+        'acies': None,
+        'acity': None,
+        'aging': _cond_b,
+        'aical': None,
+        'alist': None,
+        'alism': _cond_b,
+        'ality': None,
+        'alize': None,
+        'allic': _cond_bb,
+        'anced': _cond_b,
+        'ances': _cond_b,
+        'antic': _cond_c,
+        'arial': None,
+        'aries': None,
+        'arily': None,
+        'arity': _cond_b,
+        'arize': None,
+        'aroid': None,
+        'ately': None,
+        'ating': _cond_i,
+        'ation': _cond_b,
+        'ative': None,
+        'ators': None,
+        'atory': None,
+        'ature': _cond_e,
+        'early': _cond_y,
+        'ehood': None,
+        'eless': None,
+        'elity': None,
+        'ement': None,
+        'enced': None,
+        'ences': None,
+        'eness': _cond_e,
+        'ening': _cond_e,
+        'ental': None,
+        'ented': _cond_c,
+        'ently': None,
+        'fully': None,
+        'ially': None,
+        'icant': None,
+        'ician': None,
+        'icide': None,
+        'icism': None,
+        'icist': None,
+        'icity': None,
+        'idine': _cond_i,
+        'iedly': None,
+        'ihood': None,
+        'inate': None,
+        'iness': None,
+        'ingly': _cond_b,
+        'inism': _cond_j,
+        'inity': _cond_cc,
+        'ional': None,
+        'ioned': None,
+        'ished': None,
+        'istic': None,
+        'ities': None,
+        'itous': None,
+        'ively': None,
+        'ivity': None,
+        'izers': _cond_f,
+        'izing': _cond_f,
+        'oidal': None,
+        'oides': None,
+        'otide': None,
+        'ously': None,
+        'able': None,
+        'ably': None,
+        'ages': _cond_b,
+        'ally': _cond_b,
+        'ance': _cond_b,
+        'ancy': _cond_b,
+        'ants': _cond_b,
+        'aric': None,
+        'arly': _cond_k,
+        'ated': _cond_i,
+        'ates': None,
+        'atic': _cond_b,
+        'ator': None,
+        'ealy': _cond_y,
+        'edly': _cond_e,
+        'eful': None,
+        'eity': None,
+        'ence': None,
+        'ency': None,
+        'ened': _cond_e,
+        'enly': _cond_e,
+        'eous': None,
+        'hood': None,
+        'ials': None,
+        'ians': None,
+        'ible': None,
+        'ibly': None,
+        'ical': None,
+        'ides': _cond_l,
+        'iers': None,
+        'iful': None,
+        'ines': _cond_m,
+        'ings': _cond_n,
+        'ions': _cond_b,
+        'ious': None,
+        'isms': _cond_b,
+        'ists': None,
+        'itic': _cond_h,
+        'ized': _cond_f,
+        'izer': _cond_f,
+        'less': None,
+        'lily': None,
+        'ness': None,
+        'ogen': None,
+        'ward': None,
+        'wise': None,
+        'ying': _cond_b,
+        'yish': None,
+        'acy': None,
+        'age': _cond_b,
+        'aic': None,
+        'als': _cond_bb,
+        'ant': _cond_b,
+        'ars': _cond_o,
+        'ary': _cond_f,
+        'ata': None,
+        'ate': None,
+        'eal': _cond_y,
+        'ear': _cond_y,
+        'ely': _cond_e,
+        'ene': _cond_e,
+        'ent': _cond_c,
+        'ery': _cond_e,
+        'ese': None,
+        'ful': None,
+        'ial': None,
+        'ian': None,
+        'ics': None,
+        'ide': _cond_l,
+        'ied': None,
+        'ier': None,
+        'ies': _cond_p,
+        'ily': None,
+        'ine': _cond_m,
+        'ing': _cond_n,
+        'ion': _cond_q,
+        'ish': _cond_c,
+        'ism': _cond_b,
+        'ist': None,
+        'ite': _cond_aa,
+        'ity': None,
+        'ium': None,
+        'ive': None,
+        'ize': _cond_f,
+        'oid': None,
+        'one': _cond_r,
+        'ous': None,
+        'ae': None,
+        'al': _cond_bb,
+        'ar': _cond_x,
+        'as': _cond_b,
+        'ed': _cond_e,
+        'en': _cond_f,
+        'es': _cond_e,
+        'ia': None,
+        'ic': None,
+        'is': None,
+        'ly': _cond_b,
+        'on': _cond_s,
+        'or': _cond_t,
+        'um': _cond_u,
+        'us': _cond_v,
+        'yl': _cond_r,
+        "'s": None,
+        "s'": None,
+        'a': None,
+        'e': None,
+        'i': None,
+        'o': None,
+        's': _cond_w,
+        'y': _cond_b,
+    }  # type: Dict[str, Optional[Callable[[Any, str, int], bool]]]
+
+    _recode = (
+        ('iev', 'ief'),
+        ('uct', 'uc'),
+        ('umpt', 'um'),
+        ('rpt', 'rb'),
+        ('urs', 'ur'),
+        ('istr', 'ister'),
+        ('metr', 'meter'),
+        ('olv', 'olut'),
+        ('ul', _recode9),
+        ('bex', 'bic'),
+        ('dex', 'dic'),
+        ('pex', 'pic'),
+        ('tex', 'tic'),
+        ('ax', 'ac'),
+        ('ex', 'ec'),
+        ('ix', 'ic'),
+        ('lux', 'luc'),
+        ('uad', 'uas'),
+        ('vad', 'vas'),
+        ('cid', 'cis'),
+        ('lid', 'lis'),
+        ('erid', 'eris'),
+        ('pand', 'pans'),
+        ('end', _recode24),
+        ('ond', 'ons'),
+        ('lud', 'lus'),
+        ('rud', 'rus'),
+        ('her', _recode28),
+        ('mit', 'mis'),
+        ('ent', _recode30),
+        ('ert', 'ers'),
+        ('et', _recode32),
+        ('yt', 'ys'),
+        ('yz', 'ys'),
+    )  # type: Tuple[Tuple[str, Union[str, Callable[[Any, str], str]]], ...]  # noqa: E501
+
+    # the suffixes, reversed, in a trie keyed by character, in which the
+    # condition of each suffix is stored under the key ''
+    _suffix_trie = _trie(_suffix.items(), reverse=True)
+
+    # the recoding rules, numbered, by the last letter of their endings
+    _recode_index = _number_by_last(_recode)
+
+    _doubles = {'bb', 'dd', 'gg', 'll', 'mm', 'nn', 'pp', 'rr', 'ss', 'tt'}
 
     def stem(self, word: str) -> str:
         """Return Lovins stem.
@@ -1203,41 +1235,42 @@ class Lovins(_Stemmer):
         # lowercase, normalize, and compose
         word = normalize('NFC', word.lower())
 
-        for suffix_len in range(11, 0, -1):
-            ending = word[-suffix_len:]
-            if (
-                ending in self._suffix
-                and len(word) - suffix_len >= 2
-                and (
-                    self._suffix[ending] is None
-                    or cast(Callable[[str, int], bool], self._suffix[ending])(
-                        word, suffix_len
-                    )
-                )
-            ):
+        # find the suffixes of the word, longest last, leaving a stem of at
+        # least two letters
+        node = self._suffix_trie
+        endings = []
+        for suffix_len in range(1, min(11, len(word) - 2) + 1):
+            child = node.get(word[-suffix_len])
+            if child is None:
+                break
+            node = child
+            if '' in node:
+                endings.append((suffix_len, node['']))
+
+        for suffix_len, condition in reversed(endings):
+            if condition is None or condition(self, word, suffix_len):
                 word = word[:-suffix_len]
                 break
 
-        if word[-2:] in {
-            'bb',
-            'dd',
-            'gg',
-            'll',
-            'mm',
-            'nn',
-            'pp',
-            'rr',
-            'ss',
-            'tt',
-        }:
+        if word[-2:] in self._doubles:
             word = word[:-1]
 
-        for ending, replacement in self._recode:
-            if word.endswith(ending):
-                if callable(replacement):
-                    word = replacement(word)
-                else:
-                    word = word[: -len(ending)] + replacement
+        # apply the recoding rules in order, considering only those whose
+        # endings end with the word's last letter
+        start = 0
+        while True:
+            for index, ending, replacement in self._recode_index.get(
+                word[-1:], ()
+            ):
+                if index >= start and word.endswith(ending):
+                    break
+            else:
+                break
+            if callable(replacement):
+                word = replacement(self, word)
+            else:
+                word = word[: -len(ending)] + replacement
+            start = index + 1
 
         return word
 
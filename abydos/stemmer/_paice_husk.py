@@ -22,6 +22,7 @@ Paice-Husk Stemmer
 from typing import Dict, Optional, Tuple
 
 from ._stemmer import _Stemmer
+from ..util._index_by_last import _index_by_last
 
 __all__ = ['PaiceHusk']
 
@@ -165,6 +166,10 @@ class PaiceHusk(_Stemmer):
         },
     }  # type: Dict[int, Dict[str, Tuple[Tuple[bool, int, Optional[str], bool], ...]]]  # noqa: E501
 
+    # the rule table, indexed by the last letter of each suffix, so that
+    # only the suffix lengths that might match a word need be sliced
+    _rule_index = _index_by_last(_rule_table)
+
     def _has_vowel(self, word: str) -> bool:
         for char in word:
             if char in {'a', 'e', 'i', 'o', 'u', 'y'}:
@@ -236,10 +241,10 @@ class PaiceHusk(_Stemmer):
         terminate = False
         intact = True
         while not terminate:
-            for n in range(6, 0, -1):
-                if word[-n:] in self._rule_table[n]:
+            for n, rule_table in self._rule_index.get(word[-1:], ()):
+                if word[-n:] in rule_table:
                     accept = False
-                    for rule in self._rule_table[n][word[-n:]]:
+                    for rule in rule_table[word[-n:]]:
                         (word, accept, intact, terminate,) = self._apply_rule(
                             word, rule, intact, terminate
                         )
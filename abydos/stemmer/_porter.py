@@ -19,6 +19,7 @@
 Porter stemmer
 """
 
+from typing import Optional
 from unicodedata import normalize
 
 from ._stemmer import _Stemmer
@@ -146,7 +147,9 @@ class Porter(_Stemmer):
             and term[-1] not in tuple('wxY')
         )
 
-    def __init__(self, early_english: bool = False) -> None:
+    def __init__(
+        self, early_english: bool = False, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize Porter instance.
 
         Parameters
@@ -154,11 +157,18 @@ class Porter(_Stemmer):
         early_english : bool
             Set to True in order to remove -eth & -est (2nd & 3rd person
             singular verbal agreement suffixes)
+        cache_size : int or None
+            The number of most recently used stems to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Porter, self).__init__(cache_size)
         self._early_english = early_english
 
     def stem(self, word: str) -> str:
@@ -19,9 +19,10 @@
 Porter2 (Snowball English) stemmer
 """
 
+from typing import Optional
 from unicodedata import normalize
 
-from ._snowball import _Snowball
+from ._snowball import _Snowball, _suffix_trie
 
 __all__ = ['Porter2']
 
@@ -74,7 +75,77 @@ class Porter2(_Snowball):
         'succeed',
     }
 
-    def __init__(self, early_english: bool = False) -> None:
+    _step0_suffixes = _suffix_trie(("'s'", "'s", "'"))
+    _step1a_suffixes = _suffix_trie(('sses', 'ied', 'ies', 'us', 'ss', 's'))
+    _step1b_suffixes = _suffix_trie(
+        ('eedly', 'ingly', 'edly', 'eed', 'ing', 'ed', 'est', 'eth')
+    )
+    # replacements of suffixes in R1
+    _step2_replacements = {
+        'ational': 'ate',
+        'tional': 'tion',
+        'enci': 'ence',
+        'anci': 'ance',
+        'izer': 'ize',
+        'ogi': 'og',
+        'lessli': 'less',
+        'entli': 'ent',
+        'fulli': 'ful',
+        'ousli': 'ous',
+        'abli': 'able',
+        'alli': 'al',
+        'bli': 'ble',
+        'li': '',
+        'ization': 'ize',
+        'ation': 'ate',
+        'ator': 'ate',
+        'fulness': 'ful',
+        'ousness': 'ous',
+        'iveness': 'ive',
+        'alism': 'al',
+        'biliti': 'ble',
+        'aliti': 'al',
+        'iviti': 'ive',
+    }
+    _step2_suffixes = _suffix_trie(_step2_replacements)
+    _step3_replacements = {
+        'ational': 'ate',
+        'tional': 'tion',
+        'alize': 'al',
+        'icate': 'ic',
+        'iciti': 'ic',
+        'ative': '',
+        'ical': 'ic',
+        'ness': '',
+        'ful': '',
+    }
+    _step3_suffixes = _suffix_trie(_step3_replacements)
+    _step4_suffixes = _suffix_trie(
+        (
+            'ement',
+            'ance',
+            'ence',
+            'able',
+            'ible',
+            'ment',
+            'ant',
+            'ent',
+            'ism',
+            'ate',
+            'iti',
+            'ous',
+            'ive',
+            'ize',
+            'ion',
+            'al',
+            'er',
+            'ic',
+        )
+    )
+
+    def __init__(
+        self, early_english: bool = False, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize Porter2 instance.
 
         Parameters
@@ -82,11 +153,18 @@ class Porter2(_Snowball):
         early_english : bool
             Set to True in order to remove -eth & -est (2nd & 3rd person
             singular verbal agreement suffixes)
+        cache_size : int or None
+            The number of most recently used stems to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(Porter2, self).__init__(cache_size)
         self._early_english = early_english
 
     def stem(self, word: str) -> str:
@@ -153,31 +231,26 @@ class Porter2(_Snowball):
             if word[i] == 'y' and word[i - 1] in self._vowels:
                 word = word[:i] + 'Y' + word[i + 1 :]
 
-        r1_start = self._sb_r1(word, self._r1_prefixes)
-        r2_start = self._sb_r2(word, self._r1_prefixes)
+        r1_start, r2_start = self._sb_regions(word, self._r1_prefixes)
 
         # Step 0
-        if word[-3:] == "'s'":
-            word = word[:-3]
-        elif word[-2:] == "'s":
-            word = word[:-2]
-        elif word[-1:] == "'":
-            word = word[:-1]
+        suffix = self._sb_suffix(word, self._step0_suffixes)
+        if suffix:
+            word = word[: -len(suffix)]
         # Return word if stem is shorter than 2
         if len(word) < 3:
             return word
 
         # Step 1a
-        if word[-4:] == 'sses':
+        suffix = self._sb_suffix(word, self._step1a_suffixes)
+        if suffix == 'sses':
             word = word[:-2]
-        elif word[-3:] in {'ied', 'ies'}:
+        elif suffix in {'ied', 'ies'}:
             if len(word) > 4:
                 word = word[:-2]
             else:
                 word = word[:-1]
-        elif word[-2:] in {'us', 'ss'}:
-            pass
-        elif word[-1] == 's':
+        elif suffix == 's':
             if self._sb_has_vowel(word[:-2]):
                 word = word[:-1]
 
@@ -187,37 +260,14 @@ class Porter2(_Snowball):
 
         # Step 1b
         step1b_flag = False
-        if word[-5:] == 'eedly':
-            if len(word[r1_start:]) >= 5:
-                word = word[:-3]
-        elif word[-5:] == 'ingly':
-            if self._sb_has_vowel(word[:-5]):
-                word = word[:-5]
-                step1b_flag = True
-        elif word[-4:] == 'edly':
-            if self._sb_has_vowel(word[:-4]):
-                word = word[:-4]
-                step1b_flag = True
-        elif word[-3:] == 'eed':
-            if len(word[r1_start:]) >= 3:
-                word = word[:-1]
-        elif word[-3:] == 'ing':
-            if self._sb_has_vowel(word[:-3]):
-                word = word[:-3]
-                step1b_flag = True
-        elif word[-2:] == 'ed':
-            if self._sb_has_vowel(word[:-2]):
-                word = word[:-2]
+        suffix = self._sb_suffix(word, self._step1b_suffixes)
+        if suffix in {'eedly', 'eed'}:
+            if len(word) - len(suffix) >= r1_start:
+                word = word[: -len(suffix)] + 'ee'
+        elif suffix and (self._early_english or suffix not in {'est', 'eth'}):
+            if self._sb_has_vowel(word[: -len(suffix)]):
+                word = word[: -len(suffix)]
                 step1b_flag = True
-        elif self._early_english:
-            if word[-3:] == 'est':
-                if self._sb_has_vowel(word[:-3]):
-                    word = word[:-3]
-                    step1b_flag = True
-            elif word[-3:] == 'eth':
-                if self._sb_has_vowel(word[:-3]):
-                    word = word[:-3]
-                    step1b_flag = True
 
         if step1b_flag:
             if word[-2:] in {'at', 'bl', 'iz'}:
@@ -236,135 +286,36 @@ class Porter2(_Snowball):
             word = word[:-1] + 'i'
 
         # Step 2
-        if word[-2] == 'a':
-            if word[-7:] == 'ational':
-                if len(word[r1_start:]) >= 7:
-                    word = word[:-5] + 'e'
-            elif word[-6:] == 'tional':
-                if len(word[r1_start:]) >= 6:
-                    word = word[:-2]
-        elif word[-2] == 'c':
-            if word[-4:] in {'enci', 'anci'}:
-                if len(word[r1_start:]) >= 4:
-                    word = word[:-1] + 'e'
-        elif word[-2] == 'e':
-            if word[-4:] == 'izer':
-                if len(word[r1_start:]) >= 4:
-                    word = word[:-1]
-        elif word[-2] == 'g':
-            if word[-3:] == 'ogi':
-                if (
-                    r1_start >= 1
-                    and len(word[r1_start:]) >= 3
-                    and word[-4] == 'l'
-                ):
-                    word = word[:-1]
-        elif word[-2] == 'l':
-            if word[-6:] == 'lessli':
-                if len(word[r1_start:]) >= 6:
-                    word = word[:-2]
-            elif word[-5:] in {'entli', 'fulli', 'ousli'}:
-                if len(word[r1_start:]) >= 5:
-                    word = word[:-2]
-            elif word[-4:] == 'abli':
-                if len(word[r1_start:]) >= 4:
-                    word = word[:-1] + 'e'
-            elif word[-4:] == 'alli':
-                if len(word[r1_start:]) >= 4:
-                    word = word[:-2]
-            elif word[-3:] == 'bli':
-                if len(word[r1_start:]) >= 3:
-                    word = word[:-1] + 'e'
-            elif word[-2:] == 'li':
-                if (
-                    r1_start >= 1
-                    and len(word[r1_start:]) >= 2
-                    and word[-3] in self._li
-                ):
-                    word = word[:-2]
-        elif word[-2] == 'o':
-            if word[-7:] == 'ization':
-                if len(word[r1_start:]) >= 7:
-                    word = word[:-5] + 'e'
-            elif word[-5:] == 'ation':
-                if len(word[r1_start:]) >= 5:
-                    word = word[:-3] + 'e'
-            elif word[-4:] == 'ator':
-                if len(word[r1_start:]) >= 4:
-                    word = word[:-2] + 'e'
-        elif word[-2] == 's':
-            if word[-7:] in {'fulness', 'ousness', 'iveness'}:
-                if len(word[r1_start:]) >= 7:
-                    word = word[:-4]
-            elif word[-5:] == 'alism':
-                if len(word[r1_start:]) >= 5:
-                    word = word[:-3]
-        elif word[-2] == 't':
-            if word[-6:] == 'biliti':
-                if len(word[r1_start:]) >= 6:
-                    word = word[:-5] + 'le'
-            elif word[-5:] == 'aliti':
-                if len(word[r1_start:]) >= 5:
-                    word = word[:-3]
-            elif word[-5:] == 'iviti':
-                if len(word[r1_start:]) >= 5:
-                    word = word[:-3] + 'e'
+        suffix = self._sb_suffix(word, self._step2_suffixes)
+        if len(word) - len(suffix) < r1_start:
+            pass
+        elif suffix == 'ogi':
+            if word[-4] == 'l':
+                word = word[:-1]
+        elif suffix == 'li':
+            if word[-3] in self._li:
+                word = word[:-2]
+        elif suffix:
+            word = word[: -len(suffix)] + self._step2_replacements[suffix]
 
         # Step 3
-        if word[-7:] == 'ational':
-            if len(word[r1_start:]) >= 7:
-                word = word[:-5] + 'e'
-        elif word[-6:] == 'tional':
-            if len(word[r1_start:]) >= 6:
-                word = word[:-2]
-        elif word[-5:] in {'alize', 'icate', 'iciti'}:
-            if len(word[r1_start:]) >= 5:
-                word = word[:-3]
-        elif word[-5:] == 'ative':
-            if len(word[r2_start:]) >= 5:
-                word = word[:-5]
-        elif word[-4:] == 'ical':
-            if len(word[r1_start:]) >= 4:
-                word = word[:-2]
-        elif word[-4:] == 'ness':
-            if len(word[r1_start:]) >= 4:
-                word = word[:-4]
-        elif word[-3:] == 'ful':
-            if len(word[r1_start:]) >= 3:
-                word = word[:-3]
+        suffix = self._sb_suffix(word, self._step3_suffixes)
+        if len(word) - len(suffix) < (
+            r2_start if suffix == 'ative' else r1_start
+        ):
+            pass
+        elif suffix:
+            word = word[: -len(suffix)] + self._step3_replacements[suffix]
 
         # Step 4
-        for suffix in (
-            'ement',
-            'ance',
-            'ence',
-            'able',
-            'ible',
-            'ment',
-            'ant',
-            'ent',
-            'ism',
-            'ate',
-            'iti',
-            'ous',
-            'ive',
-            'ize',
-            'al',
-            'er',
-            'ic',
-        ):
-            if word[-len(suffix) :] == suffix:
-                if len(word[r2_start:]) >= len(suffix):
-                    word = word[: -len(suffix)]
-                break
-        else:
-            if word[-3:] == 'ion':
-                if (
-                    len(word[r2_start:]) >= 3
-                    and len(word) >= 4
-                    and word[-4] in tuple('st')
-                ):
-                    word = word[:-3]
+        suffix = self._sb_suffix(word, self._step4_suffixes)
+        if len(word) - len(suffix) < r2_start:
+            pass
+        elif suffix == 'ion':
+            if len(word) >= 4 and word[-4] in {'s', 't'}:
+                word = word[:-3]
+        elif suffix:
+            word = word[: -len(suffix)]
 
         # Step 5
         if word[-1] == 'e':
@@ -378,9 +329,7 @@ class Porter2(_Snowball):
                 word = word[:-1]
 
         # Change 'Y' back to 'y' if it survived stemming
-        for i in range(0, len(word)):
-            if word[i] == 'Y':
-                word = word[:i] + 'y' + word[i + 1 :]
+        word = word.replace('Y', 'y')
 
         return word
 
@@ -19,13 +19,43 @@
 Snowball Stemmer base class
 """
 
-from typing import Iterable, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ._stemmer import _Stemmer
+from ..util._trie import _trie
 
 __all__ = ['_Snowball']
 
 
+def _suffix_trie(suffixes: Iterable[str]) -> Dict[str, Any]:
+    """Return a trie of reversed suffixes, for use by _Snowball._sb_suffix.
+
+    Each node of the trie is a dict mapping letters, read from the end of a
+    suffix, to subsequent nodes; the node at which a suffix ends maps the key
+    '' to the suffix itself.
+
+    Parameters
+    ----------
+    suffixes : iterable of str
+        The suffixes
+
+    Returns
+    -------
+    dict
+        The trie
+
+    Examples
+    --------
+    >>> _suffix_trie(['ed', 'd'])
+    {'d': {'e': {'': 'ed'}, '': 'd'}}
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return _trie(((suffix, suffix) for suffix in suffixes), reverse=True)
+
+
 class _Snowball(_Stemmer):
     """Snowball stemmer base class.
 
@@ -58,16 +88,17 @@ class _Snowball(_Stemmer):
             Encapsulated in class
 
         """
-        vowel_found = False
-        if hasattr(r1_prefixes, '__iter__'):
-            for prefix in cast(Iterable[str], r1_prefixes):
-                if term[: len(prefix)] == prefix:
+        if r1_prefixes is not None:
+            for prefix in r1_prefixes:
+                if term.startswith(prefix):
                     return len(prefix)
 
-        for i in range(len(term)):
-            if not vowel_found and term[i] in self._vowels:
+        vowels = self._vowels
+        vowel_found = False
+        for i, char in enumerate(term):
+            if char in vowels:
                 vowel_found = True
-            elif vowel_found and term[i] not in self._vowels:
+            elif vowel_found:
                 return i + 1
         return len(term)
 
@@ -94,8 +125,89 @@ class _Snowball(_Stemmer):
             Encapsulated in class
 
         """
-        r1_start = self._sb_r1(term, r1_prefixes)
-        return r1_start + self._sb_r1(term[r1_start:])
+        return self._sb_regions(term, r1_prefixes)[1]
+
+    def _sb_regions(
+        self, term: str, r1_prefixes: Optional[Iterable[str]] = None
+    ) -> Tuple[int, int]:
+        """Return the R1 and R2 regions, found in a single pass over the term.
+
+        Parameters
+        ----------
+        term : str
+            The term to examine
+        r1_prefixes : iterable
+            Prefixes to consider
+
+        Returns
+        -------
+        tuple
+            Lengths of the R1 and R2 regions, as returned by _sb_r1 and _sb_r2
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        regions = []  # type: List[int]
+        start = 0
+        if r1_prefixes is not None:
+            for prefix in r1_prefixes:
+                if term.startswith(prefix):
+                    start = len(prefix)
+                    regions.append(start)
+                    break
+
+        vowels = self._vowels
+        vowel_found = False
+        for i in range(start, len(term)):
+            if term[i] in vowels:
+                vowel_found = True
+            elif vowel_found:
+                regions.append(i + 1)
+                if len(regions) == 2:
+                    break
+                vowel_found = False
+        else:
+            regions += [len(term)] * (2 - len(regions))
+        return regions[0], regions[1]
+
+    def _sb_suffix(
+        self, term: str, suffixes: Dict[str, Any], start: int = 0
+    ) -> str:
+        """Return the longest of a set of suffixes that ends the term.
+
+        Parameters
+        ----------
+        term : str
+            The term to examine
+        suffixes : dict
+            The suffixes, as a trie built by _suffix_trie
+        start : int
+            The start of the region of the term in which the suffix must lie
+            (e.g. the start of R1)
+
+        Returns
+        -------
+        str
+            The longest suffix of term[start:] among the suffixes, or '' if
+            there is none
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        node = suffixes
+        suffix = ''
+        i = len(term)
+        while i > start:
+            i -= 1
+            child = node.get(term[i])
+            if child is None:
+                break
+            node = child
+            if '' in node:
+                suffix = node['']
+        return suffix
 
     def _sb_ends_in_short_syllable(self, term: str) -> bool:
         """Return True iff term ends in a short syllable.
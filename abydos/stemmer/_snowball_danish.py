@@ -21,7 +21,7 @@ Snowball Danish stemmer
 
 from unicodedata import normalize
 
-from ._snowball import _Snowball
+from ._snowball import _Snowball, _suffix_trie
 
 __all__ = ['SnowballDanish']
 
@@ -58,6 +58,44 @@ class SnowballDanish(_Snowball):
         'z',
         'å',
     }
+    _step1_suffixes = _suffix_trie(
+        (
+            'erendes',
+            'erende',
+            'hedens',
+            'ethed',
+            'erede',
+            'heden',
+            'heder',
+            'endes',
+            'ernes',
+            'erens',
+            'erets',
+            'ered',
+            'ende',
+            'erne',
+            'eren',
+            'erer',
+            'heds',
+            'enes',
+            'eres',
+            'eret',
+            'hed',
+            'ene',
+            'ere',
+            'ens',
+            'ers',
+            'ets',
+            'en',
+            'er',
+            'es',
+            'et',
+            'e',
+            's',
+        )
+    )
+    _step2_suffixes = _suffix_trie(('gd', 'dt', 'gt', 'kt'))
+    _step3_suffixes = _suffix_trie(('elig', 'løst', 'lig', 'els', 'ig'))
 
     def stem(self, word: str) -> str:
         """Return Snowball Danish stem.
@@ -94,73 +132,33 @@ class SnowballDanish(_Snowball):
         r1_start = min(max(3, self._sb_r1(word)), len(word))
 
         # Step 1
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'erendes':
-            word = word[:-7]
-        elif _r1[-6:] in {'erende', 'hedens'}:
-            word = word[:-6]
-        elif _r1[-5:] in {
-            'ethed',
-            'erede',
-            'heden',
-            'heder',
-            'endes',
-            'ernes',
-            'erens',
-            'erets',
-        }:
-            word = word[:-5]
-        elif _r1[-4:] in {
-            'ered',
-            'ende',
-            'erne',
-            'eren',
-            'erer',
-            'heds',
-            'enes',
-            'eres',
-            'eret',
-        }:
-            word = word[:-4]
-        elif _r1[-3:] in {'hed', 'ene', 'ere', 'ens', 'ers', 'ets'}:
-            word = word[:-3]
-        elif _r1[-2:] in {'en', 'er', 'es', 'et'}:
-            word = word[:-2]
-        elif _r1[-1:] == 'e':
-            word = word[:-1]
-        elif _r1[-1:] == 's':
+        suffix = self._sb_suffix(word, self._step1_suffixes, r1_start)
+        if suffix == 's':
             if len(word) > 1 and word[-2] in self._s_endings:
                 word = word[:-1]
+        elif suffix:
+            word = word[: -len(suffix)]
 
         # Step 2
-        if word[r1_start:][-2:] in {'gd', 'dt', 'gt', 'kt'}:
+        if self._sb_suffix(word, self._step2_suffixes, r1_start):
             word = word[:-1]
 
         # Step 3
         if word[-4:] == 'igst':
             word = word[:-2]
 
-        _r1 = word[r1_start:]
-        repeat_step2 = False
-        if _r1[-4:] == 'elig':
-            word = word[:-4]
-            repeat_step2 = True
-        elif _r1[-4:] == 'løst':
+        suffix = self._sb_suffix(word, self._step3_suffixes, r1_start)
+        if suffix == 'løst':
             word = word[:-1]
-        elif _r1[-3:] in {'lig', 'els'}:
-            word = word[:-3]
-            repeat_step2 = True
-        elif _r1[-2:] == 'ig':
-            word = word[:-2]
-            repeat_step2 = True
-
-        if repeat_step2:
-            if word[r1_start:][-2:] in {'gd', 'dt', 'gt', 'kt'}:
+        elif suffix:
+            word = word[: -len(suffix)]
+            # Repeat step 2
+            if self._sb_suffix(word, self._step2_suffixes, r1_start):
                 word = word[:-1]
 
         # Step 4
         if (
-            len(word[r1_start:]) >= 1
+            len(word) > r1_start
             and len(word) >= 2
             and word[-1] == word[-2]
             and word[-1] not in self._vowels
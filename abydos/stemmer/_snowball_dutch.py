@@ -21,7 +21,7 @@ Snowball Dutch stemmer
 
 from unicodedata import normalize
 
-from ._snowball import _Snowball
+from ._snowball import _Snowball, _suffix_trie
 
 __all__ = ['SnowballDutch']
 
@@ -38,6 +38,10 @@ class SnowballDutch(_Snowball):
     _vowels = {'a', 'e', 'i', 'o', 'u', 'y', 'è'}
     _not_s_endings = {'a', 'e', 'i', 'j', 'o', 'u', 'y', 'è'}
     _accented = dict(zip((ord(_) for _ in 'äëïöüáéíóú'), 'aeiouaeiou'))
+    _step1_suffixes = _suffix_trie(('heden', 'ene', 'en', 'se', 's'))
+    _step3b_suffixes = _suffix_trie(
+        ('lijk', 'baar', 'end', 'ing', 'bar', 'ig')
+    )
 
     def _undouble(self, word: str) -> str:
         """Undouble endings -kk, -dd, and -tt.
@@ -113,35 +117,24 @@ class SnowballDutch(_Snowball):
             ):
                 word = word[:i] + 'I' + word[i + 1 :]
 
-        r1_start = max(3, self._sb_r1(word))
-        r2_start = self._sb_r2(word)
+        r1_start, r2_start = self._sb_regions(word)
+        r1_start = max(3, r1_start)
 
         # Step 1
-        if word[-5:] == 'heden':
-            if len(word[r1_start:]) >= 5:
-                word = word[:-3] + 'id'
-        elif word[-3:] == 'ene':
-            if len(word[r1_start:]) >= 3 and (
-                word[-4] not in self._vowels and word[-6:-3] != 'gem'
-            ):
-                word = self._undouble(word[:-3])
-        elif word[-2:] == 'en':
-            if len(word[r1_start:]) >= 2 and (
-                word[-3] not in self._vowels and word[-5:-2] != 'gem'
-            ):
-                word = self._undouble(word[:-2])
-        elif word[-2:] == 'se':
-            if (
-                len(word[r1_start:]) >= 2
-                and word[-3] not in self._not_s_endings
-            ):
-                word = word[:-2]
-        elif word[-1:] == 's':
+        suffix = self._sb_suffix(word, self._step1_suffixes)
+        if len(word) - len(suffix) < r1_start:
+            pass
+        elif suffix == 'heden':
+            word = word[:-3] + 'id'
+        elif suffix in {'ene', 'en'}:
             if (
-                len(word[r1_start:]) >= 1
-                and word[-2] not in self._not_s_endings
+                word[-len(suffix) - 1] not in self._vowels
+                and word[-len(suffix) - 3 : -len(suffix)] != 'gem'
             ):
-                word = word[:-1]
+                word = self._undouble(word[: -len(suffix)])
+        elif suffix:
+            if word[-len(suffix) - 1] not in self._not_s_endings:
+                word = word[: -len(suffix)]
 
         # Step 2
         e_removed = False
@@ -161,35 +154,32 @@ class SnowballDutch(_Snowball):
                         word = self._undouble(word[:-2])
 
         # Step 3b
-        if word[-4:] == 'lijk':
-            if len(word[r2_start:]) >= 4:
-                word = word[:-4]
-                # Repeat step 2
-                if word[-1:] == 'e':
-                    if (
-                        len(word[r1_start:]) >= 1
-                        and word[-2] not in self._vowels
-                    ):
-                        word = self._undouble(word[:-1])
-        elif word[-4:] == 'baar':
-            if len(word[r2_start:]) >= 4:
-                word = word[:-4]
-        elif word[-3:] in ('end', 'ing'):
-            if len(word[r2_start:]) >= 3:
-                word = word[:-3]
-                if (
-                    word[-2:] == 'ig'
-                    and len(word[r2_start:]) >= 2
-                    and word[-3] != 'e'
-                ):
-                    word = word[:-2]
-                else:
-                    word = self._undouble(word)
-        elif word[-3:] == 'bar':
-            if len(word[r2_start:]) >= 3 and e_removed:
+        suffix = self._sb_suffix(word, self._step3b_suffixes)
+        if len(word) - len(suffix) < r2_start:
+            pass
+        elif suffix == 'lijk':
+            word = word[:-4]
+            # Repeat step 2
+            if word[-1:] == 'e':
+                if len(word[r1_start:]) >= 1 and word[-2] not in self._vowels:
+                    word = self._undouble(word[:-1])
+        elif suffix == 'baar':
+            word = word[:-4]
+        elif suffix in {'end', 'ing'}:
+            word = word[:-3]
+            if (
+                word[-2:] == 'ig'
+                and len(word[r2_start:]) >= 2
+                and word[-3] != 'e'
+            ):
+                word = word[:-2]
+            else:
+                word = self._undouble(word)
+        elif suffix == 'bar':
+            if e_removed:
                 word = word[:-3]
-        elif word[-2:] == 'ig':
-            if len(word[r2_start:]) >= 2 and word[-3] != 'e':
+        elif suffix:
+            if word[-3] != 'e':
                 word = word[:-2]
 
         # Step 4
@@ -203,12 +193,8 @@ class SnowballDutch(_Snowball):
         ):
             word = word[:-2] + word[-1]
 
-        # Change 'Y' and 'U' back to lowercase if survived stemming
-        for i in range(0, len(word)):
-            if word[i] == 'Y':
-                word = word[:i] + 'y' + word[i + 1 :]
-            elif word[i] == 'I':
-                word = word[:i] + 'i' + word[i + 1 :]
+        # Change 'Y' and 'I' back to lowercase if survived stemming
+        word = word.replace('Y', 'y').replace('I', 'i')
 
         return word
 
@@ -19,9 +19,10 @@
 Snowball German stemmer
 """
 
+from typing import Optional
 from unicodedata import normalize
 
-from ._snowball import _Snowball
+from ._snowball import _Snowball, _suffix_trie
 
 __all__ = ['SnowballGerman']
 
@@ -38,19 +39,34 @@ class SnowballGerman(_Snowball):
     _vowels = {'a', 'e', 'i', 'o', 'u', 'y', 'ä', 'ö', 'ü'}
     _s_endings = {'b', 'd', 'f', 'g', 'h', 'k', 'l', 'm', 'n', 'r', 't'}
     _st_endings = {'b', 'd', 'f', 'g', 'h', 'k', 'l', 'm', 'n', 't'}
-
-    def __init__(self, alternate_vowels: bool = False) -> None:
+    _umlauts = dict(zip((ord(_) for _ in 'äöü'), 'aou'))
+    _step1_suffixes = _suffix_trie(('ern', 'em', 'er', 'en', 'es', 'e', 's'))
+    _step2_suffixes = _suffix_trie(('est', 'en', 'er', 'st'))
+    _step3_suffixes = _suffix_trie(
+        ('isch', 'lich', 'heit', 'keit', 'end', 'ung', 'ig', 'ik')
+    )
+
+    def __init__(
+        self, alternate_vowels: bool = False, cache_size: Optional[int] = 0
+    ) -> None:
         """Initialize SnowballGerman instance.
 
         Parameters
         ----------
         alternate_vowels : bool
             Composes ae as ä, oe as ö, and ue as ü before running the algorithm
+        cache_size : int or None
+            The number of most recently used stems to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(SnowballGerman, self).__init__(cache_size)
         self._alternate_vowels = alternate_vowels
 
     def stem(self, word: str) -> str:
@@ -101,100 +117,68 @@ class SnowballGerman(_Snowball):
             word = word.replace('ue', 'ü')
             word = word.replace('Q', 'que')
 
-        r1_start = max(3, self._sb_r1(word))
-        r2_start = self._sb_r2(word)
+        r1_start, r2_start = self._sb_regions(word)
+        r1_start = max(3, r1_start)
 
         # Step 1
         niss_flag = False
-        if word[-3:] == 'ern':
-            if len(word[r1_start:]) >= 3:
-                word = word[:-3]
-        elif word[-2:] == 'em':
-            if len(word[r1_start:]) >= 2:
-                word = word[:-2]
-        elif word[-2:] == 'er':
-            if len(word[r1_start:]) >= 2:
-                word = word[:-2]
-        elif word[-2:] == 'en':
-            if len(word[r1_start:]) >= 2:
-                word = word[:-2]
-                niss_flag = True
-        elif word[-2:] == 'es':
-            if len(word[r1_start:]) >= 2:
-                word = word[:-2]
-                niss_flag = True
-        elif word[-1:] == 'e':
-            if len(word[r1_start:]) >= 1:
-                word = word[:-1]
-                niss_flag = True
-        elif word[-1:] == 's':
-            if (
-                len(word[r1_start:]) >= 1
-                and len(word) >= 2
-                and word[-2] in self._s_endings
-            ):
+        suffix = self._sb_suffix(word, self._step1_suffixes)
+        if len(word) - len(suffix) < r1_start:
+            pass
+        elif suffix == 's':
+            if len(word) >= 2 and word[-2] in self._s_endings:
                 word = word[:-1]
+        elif suffix:
+            word = word[: -len(suffix)]
+            niss_flag = suffix in {'en', 'es', 'e'}
 
         if niss_flag and word[-4:] == 'niss':
             word = word[:-1]
 
         # Step 2
-        if word[-3:] == 'est':
-            if len(word[r1_start:]) >= 3:
-                word = word[:-3]
-        elif word[-2:] == 'en':
-            if len(word[r1_start:]) >= 2:
-                word = word[:-2]
-        elif word[-2:] == 'er':
-            if len(word[r1_start:]) >= 2:
-                word = word[:-2]
-        elif word[-2:] == 'st':
-            if (
-                len(word[r1_start:]) >= 2
-                and len(word) >= 6
-                and word[-3] in self._st_endings
-            ):
+        suffix = self._sb_suffix(word, self._step2_suffixes)
+        if len(word) - len(suffix) < r1_start:
+            pass
+        elif suffix == 'st':
+            if len(word) >= 6 and word[-3] in self._st_endings:
                 word = word[:-2]
+        elif suffix:
+            word = word[: -len(suffix)]
 
         # Step 3
-        if word[-4:] == 'isch':
-            if len(word[r2_start:]) >= 4 and word[-5] != 'e':
+        suffix = self._sb_suffix(word, self._step3_suffixes)
+        if len(word) - len(suffix) < r2_start:
+            pass
+        elif suffix == 'isch':
+            if word[-5] != 'e':
                 word = word[:-4]
-        elif word[-4:] in {'lich', 'heit'}:
-            if len(word[r2_start:]) >= 4:
-                word = word[:-4]
-                if word[-2:] in {'er', 'en'} and len(word[r1_start:]) >= 2:
-                    word = word[:-2]
-        elif word[-4:] == 'keit':
-            if len(word[r2_start:]) >= 4:
+        elif suffix in {'lich', 'heit'}:
+            word = word[:-4]
+            if word[-2:] in {'er', 'en'} and len(word[r1_start:]) >= 2:
+                word = word[:-2]
+        elif suffix == 'keit':
+            word = word[:-4]
+            if word[-4:] == 'lich' and len(word[r2_start:]) >= 4:
                 word = word[:-4]
-                if word[-4:] == 'lich' and len(word[r2_start:]) >= 4:
-                    word = word[:-4]
-                elif word[-2:] == 'ig' and len(word[r2_start:]) >= 2:
-                    word = word[:-2]
-        elif word[-3:] in {'end', 'ung'}:
-            if len(word[r2_start:]) >= 3:
-                word = word[:-3]
-                if (
-                    word[-2:] == 'ig'
-                    and len(word[r2_start:]) >= 2
-                    and word[-3] != 'e'
-                ):
-                    word = word[:-2]
-        elif word[-2:] in {'ig', 'ik'}:
-            if len(word[r2_start:]) >= 2 and word[-3] != 'e':
+            elif word[-2:] == 'ig' and len(word[r2_start:]) >= 2:
+                word = word[:-2]
+        elif suffix in {'end', 'ung'}:
+            word = word[:-3]
+            if (
+                word[-2:] == 'ig'
+                and len(word[r2_start:]) >= 2
+                and word[-3] != 'e'
+            ):
+                word = word[:-2]
+        elif suffix:
+            if word[-3] != 'e':
                 word = word[:-2]
 
         # Change 'Y' and 'U' back to lowercase if survived stemming
-        for i in range(0, len(word)):
-            if word[i] == 'Y':
-                word = word[:i] + 'y' + word[i + 1 :]
-            elif word[i] == 'U':
-                word = word[:i] + 'u' + word[i + 1 :]
+        word = word.replace('Y', 'y').replace('U', 'u')
 
         # Remove umlauts
-        _umlauts = dict(zip((ord(_) for _ in 'äöü'), 'aou'))
-        word = word.translate(_umlauts)
+        word = word.translate(self._umlauts)
 
         return word
 
@@ -21,7 +21,7 @@ Snowball Norwegian stemmer
 
 from unicodedata import normalize
 
-from ._snowball import _Snowball
+from ._snowball import _Snowball, _suffix_trie
 
 __all__ = ['SnowballNorwegian']
 
@@ -55,6 +55,55 @@ class SnowballNorwegian(_Snowball):
         'y',
         'z',
     }
+    _step1_suffixes = _suffix_trie(
+        (
+            'hetenes',
+            'hetene',
+            'hetens',
+            'heten',
+            'heter',
+            'endes',
+            'ande',
+            'ende',
+            'edes',
+            'enes',
+            'erte',
+            'ede',
+            'ane',
+            'ene',
+            'ens',
+            'ers',
+            'ets',
+            'het',
+            'ast',
+            'ert',
+            'en',
+            'ar',
+            'er',
+            'as',
+            'es',
+            'et',
+            'a',
+            'e',
+            's',
+        )
+    )
+    _step2_suffixes = _suffix_trie(('dt', 'vt'))
+    _step3_suffixes = _suffix_trie(
+        (
+            'hetslov',
+            'eleg',
+            'elig',
+            'elov',
+            'slov',
+            'leg',
+            'eig',
+            'lig',
+            'els',
+            'lov',
+            'ig',
+        )
+    )
 
     def stem(self, word: str) -> str:
         """Return Snowball Norwegian stem.
@@ -91,59 +140,29 @@ class SnowballNorwegian(_Snowball):
         r1_start = min(max(3, self._sb_r1(word)), len(word))
 
         # Step 1
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'hetenes':
-            word = word[:-7]
-        elif _r1[-6:] in {'hetene', 'hetens'}:
-            word = word[:-6]
-        elif _r1[-5:] in {'heten', 'heter', 'endes'}:
-            word = word[:-5]
-        elif _r1[-4:] in {'ande', 'ende', 'edes', 'enes', 'erte'}:
-            if word[-4:] == 'erte':
-                word = word[:-2]
-            else:
-                word = word[:-4]
-        elif _r1[-3:] in {
-            'ede',
-            'ane',
-            'ene',
-            'ens',
-            'ers',
-            'ets',
-            'het',
-            'ast',
-            'ert',
-        }:
-            if word[-3:] == 'ert':
-                word = word[:-1]
-            else:
-                word = word[:-3]
-        elif _r1[-2:] in {'en', 'ar', 'er', 'as', 'es', 'et'}:
-            word = word[:-2]
-        elif _r1[-1:] in {'a', 'e'}:
-            word = word[:-1]
-        elif _r1[-1:] == 's':
+        suffix = self._sb_suffix(word, self._step1_suffixes, r1_start)
+        if suffix == 's':
             if (len(word) > 1 and word[-2] in self._s_endings) or (
                 len(word) > 2
                 and word[-2] == 'k'
                 and word[-3] not in self._vowels
             ):
                 word = word[:-1]
+        elif suffix == 'erte':
+            word = word[:-2]
+        elif suffix == 'ert':
+            word = word[:-1]
+        elif suffix:
+            word = word[: -len(suffix)]
 
         # Step 2
-        if word[r1_start:][-2:] in {'dt', 'vt'}:
+        if self._sb_suffix(word, self._step2_suffixes, r1_start):
             word = word[:-1]
 
         # Step 3
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'hetslov':
-            word = word[:-7]
-        elif _r1[-4:] in {'eleg', 'elig', 'elov', 'slov'}:
-            word = word[:-4]
-        elif _r1[-3:] in {'leg', 'eig', 'lig', 'els', 'lov'}:
-            word = word[:-3]
-        elif _r1[-2:] == 'ig':
-            word = word[:-2]
+        suffix = self._sb_suffix(word, self._step3_suffixes, r1_start)
+        if suffix:
+            word = word[: -len(suffix)]
 
         return word
 
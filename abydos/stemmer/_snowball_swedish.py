@@ -21,7 +21,7 @@ Snowball Swedish stemmer
 
 from unicodedata import normalize
 
-from ._snowball import _Snowball
+from ._snowball import _Snowball, _suffix_trie
 
 __all__ = ['SnowballSwedish']
 
@@ -55,6 +55,49 @@ class SnowballSwedish(_Snowball):
         'v',
         'y',
     }
+    _step1_suffixes = _suffix_trie(
+        (
+            'heterna',
+            'hetens',
+            'anden',
+            'heten',
+            'heter',
+            'arnas',
+            'ernas',
+            'ornas',
+            'andes',
+            'arens',
+            'andet',
+            'arna',
+            'erna',
+            'orna',
+            'ande',
+            'arne',
+            'aste',
+            'aren',
+            'ades',
+            'erns',
+            'ade',
+            'are',
+            'ern',
+            'ens',
+            'het',
+            'ast',
+            'ad',
+            'en',
+            'ar',
+            'er',
+            'or',
+            'as',
+            'es',
+            'at',
+            'a',
+            'e',
+            's',
+        )
+    )
+    _step2_suffixes = _suffix_trie(('dd', 'gd', 'nn', 'dt', 'gt', 'kt', 'tt'))
+    _step3_suffixes = _suffix_trie(('fullt', 'löst', 'lig', 'els', 'ig'))
 
     def stem(self, word: str) -> str:
         """Return Snowball Swedish stem.
@@ -91,59 +134,23 @@ class SnowballSwedish(_Snowball):
         r1_start = min(max(3, self._sb_r1(word)), len(word))
 
         # Step 1
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'heterna':
-            word = word[:-7]
-        elif _r1[-6:] == 'hetens':
-            word = word[:-6]
-        elif _r1[-5:] in {
-            'anden',
-            'heten',
-            'heter',
-            'arnas',
-            'ernas',
-            'ornas',
-            'andes',
-            'arens',
-            'andet',
-        }:
-            word = word[:-5]
-        elif _r1[-4:] in {
-            'arna',
-            'erna',
-            'orna',
-            'ande',
-            'arne',
-            'aste',
-            'aren',
-            'ades',
-            'erns',
-        }:
-            word = word[:-4]
-        elif _r1[-3:] in {'ade', 'are', 'ern', 'ens', 'het', 'ast'}:
-            word = word[:-3]
-        elif _r1[-2:] in {'ad', 'en', 'ar', 'er', 'or', 'as', 'es', 'at'}:
-            word = word[:-2]
-        elif _r1[-1:] in {'a', 'e'}:
-            word = word[:-1]
-        elif _r1[-1:] == 's':
+        suffix = self._sb_suffix(word, self._step1_suffixes, r1_start)
+        if suffix == 's':
             if len(word) > 1 and word[-2] in self._s_endings:
                 word = word[:-1]
+        elif suffix:
+            word = word[: -len(suffix)]
 
         # Step 2
-        if word[r1_start:][-2:] in {'dd', 'gd', 'nn', 'dt', 'gt', 'kt', 'tt'}:
+        if self._sb_suffix(word, self._step2_suffixes, r1_start):
             word = word[:-1]
 
         # Step 3
-        _r1 = word[r1_start:]
-        if _r1[-5:] == 'fullt':
-            word = word[:-1]
-        elif _r1[-4:] == 'löst':
+        suffix = self._sb_suffix(word, self._step3_suffixes, r1_start)
+        if suffix in {'fullt', 'löst'}:
             word = word[:-1]
-        elif _r1[-3:] in {'lig', 'els'}:
-            word = word[:-3]
-        elif _r1[-2:] == 'ig':
-            word = word[:-2]
+        elif suffix:
+            word = word[: -len(suffix)]
 
         return word
 
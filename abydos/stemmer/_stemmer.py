@@ -19,15 +19,22 @@
 abstract class _Stemmer
 """
 
+from typing import Iterable, Iterator, Optional
+
+from ..util._cache import _Cached
+from ..util._many import _map_many
+
 __all__ = ['_Stemmer']
 
 
-class _Stemmer:
+class _Stemmer(_Cached):
     """Abstract Stemmer class.
 
     .. versionadded:: 0.3.6
     """
 
+    _cached_method = 'stem'
+
     def stem(self, word: str) -> str:
         """Return stem.
 
@@ -47,6 +54,47 @@ class _Stemmer:
         """
         return word
 
+    def stem_many(
+        self,
+        words: Iterable[str],
+        workers: Optional[int] = 1,
+        chunksize: int = 1000,
+    ) -> Iterator[str]:
+        """Yield the stems of a stream of words.
+
+        The words are read in chunks, each distinct word of a chunk is
+        processed once, and the stems are yielded in the order of the
+        words. With multiple workers, the chunks are processed by a pool of
+        processes, to each of which this instance is pickled once.
+
+        Parameters
+        ----------
+        words : iterable of str
+            The words to process
+        workers : int or None
+            The number of worker processes to use (1 by default, which
+            processes all words in the current process). If None, the number of
+            processors on the machine is used.
+        chunksize : int
+            The number of words per chunk
+
+        Yields
+        ------
+        str
+            The stem of each word
+
+        Examples
+        --------
+        >>> from abydos.stemmer import Porter2
+        >>> list(Porter2().stem_many(['running', 'runs', 'running']))
+        ['run', 'run', 'run']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return _map_many(self, 'stem', words, workers, chunksize)
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,10 +19,11 @@
 UEA-Lite stemmer
 """
 
-from re import match as re_match
+from re import compile as re_compile
 from typing import Dict, Optional, Tuple
 
 from ._stemmer import _Stemmer
+from ..util._index_by_last import _index_by_last
 
 __all__ = ['UEALite']
 
@@ -609,11 +610,24 @@ class UEALite(_Stemmer):
         'Perl': _perl_rule_table,
     }  # type: Dict[str, Dict[int, Dict[str, Tuple[float, int, Optional[str]]]]]
 
+    # the rule tables, indexed by the last letter of each suffix, so that
+    # only the suffix lengths that might match a word need be sliced
+    _rule_indexes = {
+        var: _index_by_last(rule_table) for var, rule_table in _rules.items()
+    }  # type: Dict[str, Dict[str, Tuple[Tuple[int, Dict[str, Tuple[float, int, Optional[str]]]], ...]]]  # noqa: E501
+
+    _doubled_end = re_compile(r'.*(\w)\1$')
+    _two_capitals = re_compile(r'^.*[A-Z].*[A-Z].*$')
+    _adams_short = re_compile(r'^[a-z](|[rl])(ing|ed)$')
+    _ing_end = re_compile(r'.*\w\wings?$')
+    _ed_end = re_compile(r'.*\w\weds?$')
+
     def __init__(
         self,
         max_word_length: int = 20,
         max_acro_length: int = 8,
         var: str = 'standard',
+        cache_size: Optional[int] = 0,
     ) -> None:
         """Initialize UEALite instance.
 
@@ -629,11 +643,18 @@ class UEALite(_Stemmer):
                 - ``standard`` to use the original (Java-version) rules
                 - ``Adams`` to use Jason Adams' rules
                 - ``Perl`` to use the original Perl rules
+        cache_size : int or None
+            The number of most recently used stems to cache: 0 (the
+            default) disables caching and None places no limit on the
+            cache
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added cache_size option
 
         """
+        super(UEALite, self).__init__(cache_size)
         self._max_word_length = max_word_length
         self._max_acro_length = max_acro_length
         self._var = var
@@ -713,7 +734,7 @@ class UEALite(_Stemmer):
             if word[-1] == 's':
                 del_len += 1
             stemmed_word = word[:-del_len]
-            if re_match(r'.*(\w)\1$', stemmed_word):
+            if self._doubled_end.match(stemmed_word):
                 stemmed_word = stemmed_word[:-1]
             return stemmed_word
 
@@ -769,20 +790,18 @@ class UEALite(_Stemmer):
                     ):
                         return word, 96
                     return word, 91
-                elif re_match(r'^.*[A-Z].*[A-Z].*$', word):
+                elif self._two_capitals.match(word):
                     return word, 92
                 elif word[0].isupper():
                     return word, 93
-                elif self._var == 'Adams' and re_match(
-                    r'^[a-z](|[rl])(ing|ed)$', word
-                ):
+                elif self._var == 'Adams' and self._adams_short.match(word):
                     return word, 97
 
-            for n in range(7, 1, -1):
-                if word[-n:] in self._rules[self._var][n]:
-                    rule_no, del_len, add_str = self._rules[self._var][n][
-                        word[-n:]
-                    ]
+            for n, rule_table in self._rule_indexes[self._var].get(
+                word[-1], ()
+            ):
+                if word[-n:] in rule_table:
+                    rule_no, del_len, add_str = rule_table[word[-n:]]
                     if del_len:
                         stemmed_word = word[:-del_len]
                     else:
@@ -792,12 +811,12 @@ class UEALite(_Stemmer):
                     break
 
             if not rule_no:
-                if re_match(r'.*\w\wings?$', word):  # rule 58
+                if self._ing_end.match(word):  # rule 58
                     stemmed_word = _stem_with_duplicate_character_check(
                         word, 3
                     )
                     rule_no = 58
-                elif re_match(r'.*\w\weds?$', word):  # rule 62
+                elif self._ed_end.match(word):  # rule 62
                     stemmed_word = _stem_with_duplicate_character_check(
                         word, 2
                     )
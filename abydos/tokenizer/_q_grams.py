@@ -20,7 +20,17 @@ QGrams multi-set class
 """
 
 from collections import Iterable
-from typing import Callable, Iterable as TIterable, Optional, Union, cast
+from typing import (
+    Callable,
+    Iterable as TIterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
 
 from ._tokenizer import _Tokenizer
 
@@ -38,6 +48,9 @@ class QGrams(_Tokenizer):
     .. versionadded:: 0.1.0
     """
 
+    # the base of token codes, one more than the largest code point
+    _code_base = np.uint64(0x110001)
+
     def __init__(
         self,
         qval: Union[int, TIterable[int]] = 2,
@@ -190,6 +203,107 @@ class QGrams(_Tokenizer):
         self._scale_and_counterize()
         return self
 
+    def tokenize_codes(self, string: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the q-grams of a string as packed integer codes.
+
+        Each q-gram is encoded as the number whose digits, in base 0x110001,
+        are its code points plus 1. Every q-gram thus has a distinct code,
+        which fits in 64 bits for q-grams of up to 3 characters, so longer
+        q-grams are not supported. The q-grams are those of the tokenize
+        method, but no token strings are created, and the tokenizer's stored
+        tokens are not changed.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        tuple of numpy.ndarrays
+            The sorted distinct codes of the q-grams, as unsigned 64-bit
+            integers, and the count of each
+
+        Raises
+        ------
+        ValueError
+            Token codes support only the None and 'set' scalers.
+        ValueError
+            Token codes support only q-grams of up to 3 characters.
+
+        Examples
+        --------
+        >>> codes, counts = QGrams(start_stop='').tokenize_codes('AATTATAT')
+        >>> len(codes), counts.tolist()
+        (4, [1, 3, 2, 1])
+        >>> QGrams(qval=1).tokenize_codes('ABBA')[0].tolist()
+        [66, 67]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._scaler not in {None, 'set'}:
+            raise ValueError(
+                'Token codes support only the None and \'set\' scalers.'
+            )
+
+        qvals = (
+            tuple(self.qval)
+            if isinstance(self.qval, Iterable)
+            else (self.qval,)
+        )
+        skips = (
+            tuple(self.skip)
+            if isinstance(self.skip, Iterable)
+            else (self.skip,)
+        )
+        if max(qvals, default=0) > 3:
+            raise ValueError(
+                'Token codes support only q-grams of up to 3 characters.'
+            )
+
+        codes = []  # type: List[np.ndarray]
+        if string:
+            for qval_i in qvals:
+                for skip_i in skips:
+                    if qval_i < 1:
+                        continue
+
+                    if self.start_stop:
+                        padded = (
+                            self.start_stop[0] * (qval_i - 1)
+                            + string
+                            + self.start_stop[-1] * (qval_i - 1)
+                        )
+                    else:
+                        padded = string
+
+                    if qval_i > 1 and len(padded) < qval_i:
+                        continue
+
+                    points = np.frombuffer(
+                        padded.encode('utf-32-le'), dtype=np.uint32
+                    ).astype(np.uint64) + np.uint64(1)
+                    starts = np.arange(len(padded) - (qval_i - 1))
+                    gram = np.zeros(len(starts), dtype=np.uint64)
+                    # q-grams that run past the end of the string with skips
+                    # are truncated, as in tokenize
+                    for pos in range(qval_i):
+                        idx = starts + pos * (skip_i + 1)
+                        valid = idx < len(padded)
+                        gram[valid] = (
+                            gram[valid] * self._code_base + points[idx[valid]]
+                        )
+                    codes.append(gram)
+
+        if not codes:
+            return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64)
+        distinct, counts = np.unique(np.concatenate(codes), return_counts=True)
+        if self._scaler == 'set':
+            counts = np.ones_like(counts)
+        return distinct, counts.astype(np.int64)
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,14 +19,126 @@
 Q-Skipgrams multi-set class
 """
 
-from collections import Iterable
+from collections import Iterable, defaultdict
 from itertools import combinations
-from typing import Callable, Iterable as TIterable, Optional, Union, cast
+from math import exp, log1p, log2
+from typing import (
+    Callable,
+    Dict,
+    Iterable as TIterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from ._tokenizer import _Tokenizer
 
 __all__ = ['QSkipgrams']
 
+# decayed sums are rescaled before they grow beyond this value
+_RESCALE = 1e100
+
+
+def _skipgram_sums(
+    string: str, qval: int, decay: Optional[float] = None
+) -> Tuple[Dict[str, float], Dict[str, Tuple[int, ...]]]:
+    """Return a sum over the occurrences of each distinct q-skipgram.
+
+    The q-skipgrams are counted by dynamic programming over the positions of
+    the string: at each position, every distinct skipgram prefix seen so far
+    is extended by the character at that position. Thus, the work depends on
+    the number of distinct prefixes, rather than on the number of
+    combinations of positions.
+
+    Parameters
+    ----------
+    string : str
+        The string
+    qval : int
+        The q-skipgram length
+    decay : float or None
+        If None, each occurrence counts 1; otherwise each occurrence counts
+        decay raised to the distance between its first & last positions
+
+    Returns
+    -------
+    tuple of dicts
+        Each distinct q-skipgram mapped to its sum, and each distinct
+        q-skipgram (and prefix thereof) mapped to the positions of its first
+        occurrence, in the order of combinations of positions
+
+    Examples
+    --------
+    >>> sums, firsts = _skipgram_sums('ABAB', 2)
+    >>> sums
+    {'AB': 3, 'AA': 1, 'BA': 1, 'BB': 1}
+    >>> firsts['AB'], firsts['AA'], firsts['BA'], firsts['BB']
+    ((0, 1), (0, 2), (1, 2), (1, 3))
+    >>> _skipgram_sums('ABA', 2, 0.5)[0]
+    {'AB': 0.5, 'AA': 0.25, 'BA': 0.5}
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    # the sums of the prefixes of each length, which, when decaying, are
+    # held as decay raised to the distance from their first positions to
+    # the base position; multiplying by scale takes them to the current one
+    prefixes = [{} for _ in range(qval - 1)]  # type: List[Dict[str, float]]
+    sums = {}  # type: Dict[str, float]
+    # a skipgram first occurs where its prefix first occurs, followed by the
+    # next occurrence of its last character
+    firsts = {}  # type: Dict[str, Tuple[int, ...]]
+    base = 0
+    scale = 1  # type: float
+    start = 1  # type: float
+    for pos, char in enumerate(string):
+        if decay is not None:
+            scale = decay ** (pos - base)
+            if scale < 1 / _RESCALE:
+                for level in prefixes:
+                    for prefix in level:
+                        level[prefix] *= scale
+                base = pos
+                scale = 1.0
+            start = 1 / scale
+
+        if prefixes:
+            for prefix, val in prefixes[-1].items():
+                gram = prefix + char
+                if gram in sums:
+                    sums[gram] += val * scale
+                else:
+                    sums[gram] = val * scale
+                    firsts[gram] = firsts[prefix] + (pos,)
+        elif char in sums:
+            sums[char] += 1
+        else:
+            sums[char] = 1
+            firsts[char] = (pos,)
+
+        # extend the longer prefixes first, so that each position is used at
+        # most once in a skipgram
+        for length in range(len(prefixes) - 1, 0, -1):
+            upper = prefixes[length]
+            for prefix, val in prefixes[length - 1].items():
+                gram = prefix + char
+                if gram in upper:
+                    upper[gram] += val
+                else:
+                    upper[gram] = val
+                    firsts[gram] = firsts[prefix] + (pos,)
+        if prefixes:
+            if char in prefixes[0]:
+                prefixes[0][char] += start
+            else:
+                prefixes[0][char] = start
+                firsts[char] = (pos,)
+
+    return sums, firsts
+
 
 class QSkipgrams(_Tokenizer):
     """A q-skipgram class, which functions like a bag/multiset.
@@ -128,14 +240,14 @@ class QSkipgrams(_Tokenizer):
         value ``'SSK'``:
 
         >>> QSkipgrams(scaler='SSK').tokenize('AACTAGAAC')
-        QSkipgrams(, {'$A': 2.8883286990000006, '$C': 1.0047784401000002,
+        QSkipgrams(, {'$A': 2.888328699, '$C': 1.0047784401000002,
         '$T': 0.5904900000000001, '$G': 0.4782969000000001,
-        '$#': 0.31381059609000006, 'AA': 6.170192010000001, 'AC': 4.486377699,
-        'AT': 1.3851, 'AG': 1.931931, 'A#': 2.6526399291000002, 'CT': 0.81,
-        'CA': 1.850931, 'CG': 0.6561, 'CC': 0.4782969000000001,
-        'C#': 1.2404672100000003, 'TA': 2.05659, 'TG': 0.7290000000000001,
-        'TC': 0.531441, 'T#': 0.4782969000000001, 'GA': 1.5390000000000001,
-        'GC': 0.6561, 'G#': 0.5904900000000001})
+        '$#': 0.3138105960900001, 'AA': 6.170192010000001, 'AC': 4.486377699,
+        'AT': 1.3851, 'AG': 1.9319310000000003, 'A#': 2.6526399291000007,
+        'CT': 0.8099999999999999, 'CA': 1.8509309999999999, 'CG': 0.6561,
+        'CC': 0.4782969000000001, 'C#': 1.24046721, 'TA': 2.0565900000000004,
+        'TG': 0.7290000000000001, 'TC': 0.531441, 'T#': 0.47829690000000014,
+        'GA': 1.539, 'GC': 0.6561000000000001, 'G#': 0.5904900000000002})
 
         .. versionadded:: 0.4.0
 
@@ -149,6 +261,7 @@ class QSkipgrams(_Tokenizer):
             self.start_stop = ''
 
         self._string_ss = self._string
+        self._padded = []  # type: List[Tuple[int, str]]
         if isinstance(ssk_lambda, float):
             self._lambda = (ssk_lambda,)  # type: TIterable[float]
         else:
@@ -157,8 +270,14 @@ class QSkipgrams(_Tokenizer):
     def tokenize(self, string: str) -> 'QSkipgrams':
         """Tokenize the term and store it.
 
-        The tokenized term is stored as an ordered list and as a Counter
-        object.
+        The tokenized term is stored as a Counter object, and the ordered
+        list of its q-skipgrams is created when it is first requested.
+
+        The q-skipgrams are counted, and their weights summed, by dynamic
+        programming over the positions of the string, so that only the
+        distinct q-skipgrams, rather than every combination of q positions,
+        are created. The Counter lists the q-skipgrams in the order of their
+        first occurrences.
 
         Parameters
         ----------
@@ -167,15 +286,21 @@ class QSkipgrams(_Tokenizer):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Counts q-skipgrams by dynamic programming
 
         """
         self._string = string
         self._ordered_tokens = []
         self._ordered_weights = []
+        self._padded = []
 
         if not isinstance(self.qval, Iterable):
             self.qval = (self.qval,)
 
+        # the counts, or under the SSK scaler the weights, of the q-skipgrams
+        sums = {}  # type: Dict[str, float]
+
         for qval_i in cast(TIterable[int], self.qval):
             if qval_i < 1:
                 continue
@@ -197,23 +322,84 @@ class QSkipgrams(_Tokenizer):
             if len(string) > len(self._string_ss):
                 self._string_ss = string
 
-            combs = list(combinations(enumerate(string), qval_i))
-            self._ordered_tokens += [''.join(l[1] for l in t) for t in combs]
-
-            if self._scaler == 'SSK':
-                self._ordered_weights += [
-                    sum(
-                        l ** (t[-1][0] - t[0][0] + len(t) - 1)
-                        for l in self._lambda
+            self._padded.append((qval_i, string))
+            # under the SSK scaler, only the weights are needed
+            if self._scaler == 'SSK' and self._lambda:
+                qval_sums = {}  # type: Dict[str, float]
+                for ssk_lambda in self._lambda:
+                    gap = ssk_lambda ** (qval_i - 1)
+                    lambda_sums, firsts = _skipgram_sums(
+                        string, qval_i, ssk_lambda
                     )
-                    for t in combs
-                ]
+                    for gram, val in lambda_sums.items():
+                        qval_sums[gram] = qval_sums.get(gram, 0.0) + val * gap
             else:
-                self._ordered_weights += [1] * len(combs)
-
-        self._scale_and_counterize()
+                qval_sums, firsts = _skipgram_sums(string, qval_i)
+                if self._scaler == 'SSK':
+                    qval_sums = dict.fromkeys(qval_sums, 0.0)
+
+            # list the q-skipgrams in the order of their first occurrences
+            for gram in sorted(qval_sums, key=firsts.__getitem__):
+                if gram in sums:
+                    sums[gram] += qval_sums[gram]
+                else:
+                    sums[gram] = qval_sums[gram]
+
+        if self._scaler == 'SSK':
+            self._tokens = defaultdict(float)
+            self._tokens.update(sums)
+        elif self._scaler in {'length', 'length-log', 'length-exp'}:
+            self._tokens = defaultdict(float)
+            for gram, val in sums.items():
+                weight = len(gram)  # type: float
+                if self._scaler == 'length-log':
+                    weight = log1p(weight)
+                elif self._scaler == 'length-exp':
+                    weight = exp(weight)
+                self._tokens[gram] = weight * val
+        elif self._scaler == 'entropy':
+            total = sum(sums.values())
+            self._tokens = defaultdict(float)
+            self._tokens.update(
+                {
+                    gram: -(val / total) * log2(val / total)
+                    for gram, val in sums.items()
+                }
+            )
+        else:
+            self._tokens = defaultdict(int)
+            self._tokens.update(sums)
         return self
 
+    def get_list(self) -> List[str]:
+        """Return the tokens as an ordered list.
+
+        A string of length n has n choose q q-skipgrams, so the list is only
+        created when it is requested.
+
+        Returns
+        -------
+        list
+            The q-skipgrams in the order of the combinations of their
+            positions
+
+        Examples
+        --------
+        >>> QSkipgrams(start_stop='').tokenize('ABC').get_list()
+        ['AB', 'AC', 'BC']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._ordered_tokens and self._padded:
+            self._ordered_tokens = [
+                ''.join(comb)
+                for qval_i, string in self._padded
+                for comb in combinations(string, qval_i)
+            ]
+        return self._ordered_tokens
+
 
 if __name__ == '__main__':
     import doctest
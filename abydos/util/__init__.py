@@ -20,6 +20,12 @@ The util module defines various utility functions for other modules within
 Abydos, including:
 
     - _prod -- computes the product of a collection of numbers (akin to sum)
+    - _Cached -- a mixin that adds an optional LRU cache to the principal
+      method of phonetic algorithms, stemmers, & fingerprinters
+    - _map_many -- applies a method to a stream of strings in chunks, optionally
+      across a process pool
+    - _trie -- builds a character trie of strings, or of reversed strings
+    - _index_by_last -- indexes a rule table of suffixes by their last letters
 
 These functions are not intended for use by users.
 """
@@ -0,0 +1,245 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._array.
+
+The util._array module defines functions for operating on NumPy arrays of
+strings as 2-dimensional arrays of code points, one row per string, with
+each string's code points followed by zeros.
+"""
+
+from typing import Dict, List, cast
+from unicodedata import normalize as unicode_normalize
+
+import numpy as np
+
+__all__ = []  # type: List[str]
+
+
+def _uc_codepoints(words: np.ndarray) -> np.ndarray:
+    """Return the code points of strings, uppercased and NFKD normalized.
+
+    Parameters
+    ----------
+    words : numpy.ndarray
+        A 1-dimensional array of strings
+
+    Returns
+    -------
+    numpy.ndarray
+        A 2-dimensional array of code points, one row per string
+
+    Examples
+    --------
+    >>> _uc_codepoints(np.array(['Niall', 'Ré'])).tolist()
+    [[78, 73, 65, 76, 76], [82, 69, 769, 0, 0]]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    words = np.ascontiguousarray(words, dtype=np.str_)
+    width = max(words.dtype.itemsize // 4, 1)
+    codes = words.view(np.uint32).reshape(len(words), width).copy()
+
+    # ASCII strings only need to be uppercased
+    codes[(codes >= 97) & (codes <= 122)] -= 32
+    other = (codes >= 128).any(axis=1)
+    if other.any():
+        normalized = [
+            unicode_normalize('NFKD', word.upper()) for word in words[other]
+        ]
+        width = max(width, max(len(word) for word in normalized))
+        if width > codes.shape[1]:
+            codes = np.pad(codes, ((0, 0), (0, width - codes.shape[1])))
+        codes[other] = (
+            np.array(normalized, dtype=(np.str_, width))
+            .view(np.uint32)
+            .reshape(-1, width)
+        )
+    return codes
+
+
+def _compact(codes: np.ndarray, keep: np.ndarray) -> np.ndarray:
+    """Return the code points of each row that are kept, shifted left.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        A 2-dimensional array of code points
+    keep : numpy.ndarray
+        A boolean array of the same shape, marking the code points to keep
+
+    Returns
+    -------
+    numpy.ndarray
+        The kept code points of each row, in order, followed by zeros, in
+        only as many columns as are needed
+
+    Examples
+    --------
+    >>> codes = np.array([[65, 66, 67], [68, 69, 0]])
+    >>> _compact(codes, codes != 66).tolist()
+    [[65, 67], [68, 69]]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    keep = keep & (codes != 0)
+    counts = np.count_nonzero(keep, axis=1)
+    width = int(counts.max()) if len(codes) else 0
+    compacted = np.zeros((len(codes), width), dtype=codes.dtype)
+    # the position of each kept code point in the flattened result
+    cols = np.cumsum(keep, axis=1, dtype=np.intp)[keep] - 1
+    compacted.reshape(-1)[
+        np.repeat(np.arange(len(codes)) * width, counts) + cols
+    ] = codes[keep]
+    return compacted
+
+
+def _collapse(codes: np.ndarray) -> np.ndarray:
+    """Return rows of code points with consecutive repeats deleted.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        A 2-dimensional array of code points
+
+    Returns
+    -------
+    numpy.ndarray
+        The code points, with each run of repeated code points in a row
+        collapsed to a single instance
+
+    Examples
+    --------
+    >>> _collapse(np.array([[65, 65, 66, 65, 65]])).tolist()
+    [[65, 66, 65]]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    keep = np.ones(codes.shape, dtype=bool)
+    keep[:, 1:] = codes[:, 1:] != codes[:, :-1]
+    return _compact(codes, keep)
+
+
+def _translate(codes: np.ndarray, table: Dict[int, str]) -> np.ndarray:
+    """Return code points translated by a table of ASCII characters.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        A 2-dimensional array of ASCII code points
+    table : dict
+        A str.translate table, mapping code points to characters; code
+        points absent from the table are unchanged
+
+    Returns
+    -------
+    numpy.ndarray
+        The translated code points
+
+    Examples
+    --------
+    >>> _translate(np.array([[65, 66]]), {65: '1'}).tolist()
+    [[49, 66]]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    lookup = np.arange(128, dtype=np.uint32)
+    for code, char in table.items():
+        lookup[code] = ord(char)
+    return cast(np.ndarray, lookup[codes])
+
+
+def _pad(
+    codes: np.ndarray, max_length: int, zero_pad: bool = True
+) -> np.ndarray:
+    """Return rows of code points truncated and padded to a length.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        A 2-dimensional array of code points
+    max_length : int
+        The number of columns to return
+    zero_pad : bool
+        Pad the end of each row with the code point of '0'
+
+    Returns
+    -------
+    numpy.ndarray
+        The first max_length code points of each row
+
+    Examples
+    --------
+    >>> _pad(np.array([[65, 66, 67], [68, 0, 0]]), 2).tolist()
+    [[65, 66], [68, 48]]
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if codes.shape[1] < max_length:
+        codes = np.pad(codes, ((0, 0), (0, max_length - codes.shape[1])))
+    codes = codes[:, :max_length].copy()
+    if zero_pad:
+        codes[codes == 0] = ord('0')
+    return codes
+
+
+def _str_array(codes: np.ndarray) -> np.ndarray:
+    """Return the strings whose code points are the rows of an array.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        A 2-dimensional array of code points
+
+    Returns
+    -------
+    numpy.ndarray
+        A 1-dimensional array of strings
+
+    Examples
+    --------
+    >>> _str_array(np.array([[65, 66], [68, 0]])).tolist()
+    ['AB', 'D']
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    width = max(codes.shape[1], 1)
+    if width > codes.shape[1]:
+        codes = np.pad(codes, ((0, 0), (0, width - codes.shape[1])))
+    return cast(
+        np.ndarray,
+        np.ascontiguousarray(codes, dtype=np.uint32)
+        .view((np.str_, width))
+        .reshape(len(codes)),
+    )
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,184 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._cache.
+
+The util._cache module defines _Cached, a mixin for classes whose principal
+method may cache its results.
+"""
+
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+__all__ = []  # type: List[str]
+
+
+_CacheInfo = NamedTuple(
+    '_CacheInfo',
+    [
+        ('hits', int),
+        ('misses', int),
+        ('maxsize', Optional[int]),
+        ('currsize', int),
+    ],
+)
+
+
+def _lru_cached(
+    method: Callable[..., Any], maxsize: Optional[int]
+) -> Callable[..., Any]:
+    """Return a method wrapped in a cache that passes over unhashable calls.
+
+    Parameters
+    ----------
+    method : function
+        The method to cache
+    maxsize : int or None
+        The number of most recently used results to cache, or None for no
+        limit
+
+    Returns
+    -------
+    function
+        The cached method, with the cache_info & cache_clear functions of
+        functools.lru_cache
+
+    Examples
+    --------
+    >>> upper = _lru_cached(lambda word: str(word).upper(), 10)
+    >>> upper('a'), upper(['a'])
+    ('A', "['A']")
+    >>> upper.cache_info().misses
+    1
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    cached = lru_cache(maxsize=maxsize)(method)
+
+    def _call(*args: Any, **kwargs: Any) -> Any:
+        try:
+            hash((args, tuple(kwargs.items())))
+        except TypeError:
+            return method(*args, **kwargs)
+        return cached(*args, **kwargs)
+
+    wrapper = wraps(method)(_call)  # type: Callable[..., Any]
+    wrapper.cache_info = cached.cache_info  # type: ignore
+    wrapper.cache_clear = cached.cache_clear  # type: ignore
+    return wrapper
+
+
+class _Cached:
+    """Mixin for classes with a cached principal method.
+
+    The principal method, named by _cached_method, of an instance constructed
+    with a non-zero cache_size is wrapped in a least-recently-used cache of
+    that size, held by the instance. Since the configuration of an instance
+    is fixed at construction, results are keyed on the method's arguments
+    alone; calls with unhashable arguments, such as lists, bypass the cache.
+    The cache is not pickled or copied with the instance.
+
+    .. versionadded:: 0.6.0
+    """
+
+    _cached_method = ''
+    _cache_size = 0  # type: Optional[int]
+
+    def __init__(self, cache_size: Optional[int] = 0) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        cache_size : int or None
+            The number of most recently used results to cache: 0 (the default)
+            disables caching and None places no limit on the cache
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._cache_size = cache_size
+        self.__dict__.pop(self._cached_method, None)
+        if cache_size != 0:
+            self.__dict__[self._cached_method] = _lru_cached(
+                getattr(self, self._cached_method), cache_size
+            )
+
+    def cache_info(self) -> _CacheInfo:
+        """Return the statistics of the cache.
+
+        Returns
+        -------
+        _CacheInfo
+            A named tuple of the cache's hits, misses, maximum size (None if
+            unbounded), and current size; all are 0 if caching is disabled
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> pe = Soundex(cache_size=100)
+        >>> pe.encode('Niall')
+        'N400'
+        >>> pe.encode('Niall')
+        'N400'
+        >>> pe.cache_info()
+        _CacheInfo(hits=1, misses=1, maxsize=100, currsize=1)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        method = self.__dict__.get(self._cached_method)
+        if method is None:
+            return _CacheInfo(0, 0, 0, 0)
+        return _CacheInfo(*method.cache_info())
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics.
+
+        .. versionadded:: 0.6.0
+
+        """
+        method = self.__dict__.get(self._cached_method)
+        if method is not None:
+            method.cache_clear()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state of the instance, less its cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        state.pop(self._cached_method, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state of the instance, with an empty cache.
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        _Cached.__init__(self, self._cache_size)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,66 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._index_by_last.
+
+The util._index_by_last module defines _index_by_last, which indexes a rule
+table of suffixes, grouped by length, by the last letter of each suffix.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+__all__ = []  # type: List[str]
+
+
+def _index_by_last(
+    rule_table: Dict[int, Dict[str, Any]]
+) -> Dict[str, Tuple[Tuple[int, Dict[str, Any]], ...]]:
+    """Index a rule table by the last letter of its suffixes.
+
+    Parameters
+    ----------
+    rule_table : dict
+        A rule table, mapping suffix lengths to dicts of suffixes and rules
+
+    Returns
+    -------
+    dict
+        A dict mapping each last letter to the suffix lengths of the suffixes
+        ending in that letter, longest first, each paired with a dict of
+        those suffixes and their rules
+
+    Examples
+    --------
+    >>> _index_by_last({2: {'ed': 1, 'es': 2}, 1: {'s': 3}})
+    {'d': ((2, {'ed': 1}),), 's': ((2, {'es': 2}), (1, {'s': 3}))}
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    index = {}  # type: Dict[str, Dict[int, Dict[str, Any]]]
+    for length in sorted(rule_table, reverse=True):
+        for suffix, rules in rule_table[length].items():
+            index.setdefault(suffix[-1], {}).setdefault(length, {})[
+                suffix
+            ] = rules
+    return {last: tuple(lengths.items()) for last, lengths in index.items()}
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
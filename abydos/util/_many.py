@@ -0,0 +1,181 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._many.
+
+The util._many module defines _map_many, which applies a method of an
+instance to each of a stream of strings, in chunks, optionally across a
+process pool.
+"""
+
+import pickle  # noqa: S403
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from os import cpu_count
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+__all__ = []  # type: List[str]
+
+# the pickled instance & method last applied by this worker process, and the
+# method itself, unpickled on first use
+_worker_key = None  # type: Optional[Tuple[bytes, str]]
+_worker_func = None  # type: Optional[Callable[[str], Any]]
+
+
+def _map_chunk(func: Callable[[str], Any], chunk: List[str]) -> List[Any]:
+    """Apply a function to each string of a chunk, once per distinct string.
+
+    Parameters
+    ----------
+    func : function
+        The function to apply
+    chunk : list of str
+        The strings
+
+    Returns
+    -------
+    list
+        The values of the function, in the order of the strings
+
+    Examples
+    --------
+    >>> _map_chunk(str.upper, ['a', 'b', 'a'])
+    ['A', 'B', 'A']
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    values = {word: func(word) for word in dict.fromkeys(chunk)}
+    return [values[word] for word in chunk]
+
+
+def _worker_chunk(payload: bytes, method: str, chunk: List[str]) -> List[Any]:
+    """Apply the method of a pickled instance to a chunk, in a worker process.
+
+    The instance is unpickled only when it differs from that of the previous
+    chunk processed by the worker.
+
+    Parameters
+    ----------
+    payload : bytes
+        The pickled instance
+    method : str
+        The name of the method to apply
+    chunk : list of str
+        The strings
+
+    Returns
+    -------
+    list
+        The values of the method, in the order of the strings
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    global _worker_key, _worker_func
+    if _worker_key != (payload, method):
+        _worker_func = getattr(pickle.loads(payload), method)  # noqa: S301
+        _worker_key = (payload, method)
+    return _map_chunk(_worker_func, chunk)  # type: ignore
+
+
+def _map_many(
+    instance: Any,
+    method: str,
+    words: Iterable[str],
+    workers: Optional[int] = 1,
+    chunksize: int = 1000,
+) -> Iterator[Any]:
+    """Yield the values of a method applied to each of a stream of strings.
+
+    The strings are read in chunks of chunksize, each distinct string of a
+    chunk is processed once, and the values are yielded in the order of the
+    strings. When workers is not 1, chunks are distributed across a process
+    pool, with at most two chunks per worker in progress at a time, so that
+    arbitrarily long streams may be processed in bounded memory.
+
+    Parameters
+    ----------
+    instance : object
+        The instance whose method to apply
+    method : str
+        The name of the method to apply
+    words : iterable of str
+        The strings
+    workers : int or None
+        The number of worker processes to use (1 by default, which processes
+        all strings in the current process). If None, the number of
+        processors on the machine is used.
+    chunksize : int
+        The number of strings per chunk
+
+    Yields
+    ------
+    object
+        The value of the method for each string
+
+    Raises
+    ------
+    ValueError
+        chunksize must be positive
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if chunksize < 1:
+        raise ValueError('chunksize must be positive')
+    words = iter(words)
+    chunks = iter(lambda: list(islice(words, chunksize)), [])
+
+    if workers == 1:
+        func = getattr(instance, method)
+        for chunk in chunks:
+            yield from _map_chunk(func, chunk)
+        return
+
+    # the instance is pickled once & sent with each chunk, since pool
+    # initializers require Python 3.7
+    payload = pickle.dumps(instance)
+    max_pending = 2 * (workers or cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()  # type: Deque[Future[List[Any]]]
+        for chunk in chunks:
+            pending.append(
+                executor.submit(_worker_chunk, payload, method, chunk)
+            )
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
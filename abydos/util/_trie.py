@@ -0,0 +1,72 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._trie.
+
+The util._trie module defines _trie, which builds a character trie of strings
+(or of reversed strings, for suffix matching) as nested dicts.
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+
+__all__ = []  # type: List[str]
+
+
+def _trie(
+    entries: Iterable[Tuple[str, Any]], reverse: bool = False
+) -> Dict[str, Any]:
+    """Return a trie of strings, each mapped to a value.
+
+    Each node of the trie is a dict mapping characters to subsequent nodes;
+    the node at which a string ends maps the key '' to the string's value.
+
+    Parameters
+    ----------
+    entries : iterable of tuples
+        Pairs of strings & their values; of repeated strings, the last value
+        is kept
+    reverse : bool
+        Read each string from its end, as for matching suffixes
+
+    Returns
+    -------
+    dict
+        The trie
+
+    Examples
+    --------
+    >>> _trie([('ch', 1), ('c', 2)])
+    {'c': {'h': {'': 1}, '': 2}}
+    >>> _trie([('ed', 1), ('d', None)], reverse=True)
+    {'d': {'e': {'': 1}, '': None}}
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    trie = {}  # type: Dict[str, Any]
+    for string, value in entries:
+        node = trie
+        for char in reversed(string) if reverse else string:
+            node = node.setdefault(char, {})
+        node[''] = value
+    return trie
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""benchmark_snowball.py.
+
+This helper script stems each of the Snowball vocabularies in tests/corpora
+with the corresponding Snowball stemmer, checks that every stem matches the
+reference stem in the vocabulary, and reports the throughput of each
+stemmer, in words per second, as the best of several runs.
+
+Usage: benchmark_snowball.py [repeat]
+
+It is only used in development and is not included as part of the
+distributed Abydos package itself.
+"""
+
+import os
+import sys
+from timeit import default_timer
+
+from abydos.stemmer import (
+    Porter2,
+    SnowballDanish,
+    SnowballDutch,
+    SnowballGerman,
+    SnowballNorwegian,
+    SnowballSwedish,
+)
+
+CORPORA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'corpora'
+)
+
+STEMMERS = (
+    ('danish', SnowballDanish),
+    ('dutch', SnowballDutch),
+    ('german', SnowballGerman),
+    ('norwegian', SnowballNorwegian),
+    ('swedish', SnowballSwedish),
+    ('porter2', Porter2),
+)
+
+
+def _read_vocabulary(name):
+    with open(
+        os.path.join(CORPORA, 'snowball_' + name + '.csv'), encoding='utf-8'
+    ) as vocabulary:
+        next(vocabulary)
+        return [line.strip().split(',') for line in vocabulary]
+
+
+def _run_script():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    failed = False
+
+    for name, stemmer in STEMMERS:
+        vocabulary = _read_vocabulary(name)
+        words = [word for word, _ in vocabulary]
+        stem = stemmer().stem
+
+        mismatches = [
+            (word, stem(word), expected)
+            for word, expected in vocabulary
+            if stem(word) != expected
+        ]
+        if mismatches:
+            failed = True
+            for word, stemmed, expected in mismatches[:10]:
+                print(
+                    '{}: {} -> {}, expected {}'.format(
+                        name, word, stemmed, expected
+                    )
+                )
+
+        best = float('inf')
+        for _ in range(repeat):
+            start = default_timer()
+            for word in words:
+                stem(word)
+            best = min(best, default_timer() - start)
+
+        print(
+            '{:<10} {:>6} words {:>10.0f} words/s {:>6} mismatches'.format(
+                name, len(words), len(words) / best, len(mismatches)
+            )
+        )
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    _run_script()
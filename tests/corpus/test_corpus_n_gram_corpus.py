@@ -19,6 +19,11 @@
 This module contains unit tests for abydos.corpus._n_gram_corpus
 """
 
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
 import unittest
 from collections import Counter
 
@@ -188,6 +193,31 @@ class NGramCorpusTestCases(unittest.TestCase):
         self.assertEqual(self.simple_corpus.get_count('the'), 20)
         self.assertEqual(self.double_corpus.get_count('the'), 40)
 
+    def test_gng_importer_shards(self):
+        """Test abydos.corpus.NGramCorpus.gng_importer with shards."""
+        corpus = NGramCorpus()
+        shards = tempfile.mkdtemp()
+        for opener, name, ngrams in (
+            (open, 'a', 'googlebooks-ger-all-2gram-20120701-yp'),
+            (gzip.open, 'b.gz', 'googlebooks-ger-all-3gram-20120701-yp'),
+            (lzma.open, 'c.xz', 'simple-ngrams.txt'),
+        ):
+            corpus.gng_importer(_corpus_file(ngrams))
+            with open(_corpus_file(ngrams), 'rb') as gng, opener(
+                os.path.join(shards, name), 'wb'
+            ) as shard:
+                shard.write(gng.read())
+
+        for workers in (1, 2):
+            sharded = NGramCorpus()
+            sharded.gng_importer(shards, workers=workers)
+            self.assertEqual(sharded.ngcorpus, corpus.ngcorpus)
+            self.assertEqual(sharded.get_count('the'), 20)
+            self.assertEqual(
+                sharded.get_count('YP_NOUN -'), corpus.get_count('YP_NOUN -'),
+            )
+        shutil.rmtree(shards)
+
     def test_get_count(self):
         """Test abydos.corpus.NGramCorpus.get_count."""
         # string-style tests
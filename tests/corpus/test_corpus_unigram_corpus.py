@@ -19,15 +19,23 @@
 This module contains unit tests for abydos.corpus._unigram_corpus
 """
 
+import bz2
+import gzip
+import lzma
 import os
+import pickle  # noqa: S403
+import shutil
 import sys
 import tempfile
 import unittest
 from collections import defaultdict
 
+import numpy as np
+
 from abydos.corpus import UnigramCorpus
+from abydos.distance import TFIDF
 from abydos.phonetic import Soundex
-from abydos.tokenizer import QSkipgrams
+from abydos.tokenizer import QSkipgrams, WhitespaceTokenizer
 
 from .. import _corpus_file
 
@@ -151,6 +159,57 @@ class UnigramCorpusTestCases(unittest.TestCase):
         for term, _ in self.pos_corpus.corpus.items():
             self.assertTrue('_' not in term)
 
+    def test_unigram_corpus_gng_importer_shards(self):
+        """Test abydos.corpus.UnigramCorpus.gng_importer with shards."""
+        with open(_corpus_file('simple-ngrams-pos.txt'), 'rb') as gng:
+            lines = gng.readlines()
+
+        shards = tempfile.mkdtemp()
+        for opener, name, start, stop in (
+            (gzip.open, 'a.gz', 0, 2),
+            (bz2.open, 'b.bz2', 2, 4),
+            (lzma.open, 'c.xz', 4, 5),
+            (open, 'd', 5, 6),
+        ):
+            with opener(os.path.join(shards, name), 'wb') as shard:
+                shard.writelines(lines[start:stop])
+        shard = os.path.join(shards, 'e.gz')
+        with gzip.open(shard, 'wb') as gng:
+            gng.writelines(lines[6:])
+        with open(os.path.join(shards, '.hidden'), 'wb') as gng:
+            gng.write(b'not\tcounts\n')
+
+        for kwargs in (
+            {},
+            {'word_transform': Soundex().encode},
+            {'word_tokenizer': QSkipgrams(qval=3, start_stop='')},
+        ):
+            corpus = UnigramCorpus(**kwargs)
+            corpus.gng_importer(_corpus_file('simple-ngrams-pos.txt'))
+            for workers in (1, 2):
+                sharded = UnigramCorpus(**kwargs)
+                sharded.gng_importer(shards, workers=workers)
+                self.assertEqual(
+                    list(sharded.corpus.items()), list(corpus.corpus.items())
+                )
+                self.assertEqual(sharded.doc_count, corpus.doc_count)
+
+        single = UnigramCorpus()
+        single.gng_importer(shard)
+        self.assertEqual(len(single.corpus), len(lines) - 6)
+
+        # importing into a compact corpus converts it back to a defaultdict
+        corpus = UnigramCorpus()
+        corpus.gng_importer(shard)
+        corpus.compact()
+        corpus.gng_importer(shard)
+        self.assertIsInstance(corpus.corpus, defaultdict)
+        for term, counts in single.corpus.items():
+            self.assertEqual(
+                corpus.corpus[term], (2 * counts[0], 2 * counts[1])
+            )
+        shutil.rmtree(shards)
+
     def test_unigram_corpus_save_load_corpus(self):
         """Test abydos.corpus.UnigramCorpus.save_corpus & .load_corpus."""
         handle, path = tempfile.mkstemp('.dat')
@@ -161,6 +220,79 @@ class UnigramCorpusTestCases(unittest.TestCase):
         os.close(handle)
         os.remove(path)
 
+    def test_unigram_corpus_compact(self):
+        """Test abydos.corpus.UnigramCorpus.compact & compact files."""
+        corpus = UnigramCorpus()
+        corpus.gng_importer(_corpus_file('simple-ngrams.txt'))
+        corpus._add_word('naïve', 3, 2)  # noqa: SF01
+        corpus._add_word('naïveté', 1, 1)  # noqa: SF01
+        counts = dict(corpus.corpus)
+
+        compact = UnigramCorpus()
+        compact.gng_importer(_corpus_file('simple-ngrams.txt'))
+        compact._add_word('naïve', 3, 2)  # noqa: SF01
+        compact._add_word('naïveté', 1, 1)  # noqa: SF01
+        compact.compact()
+        self.assertNotIsInstance(compact.corpus, defaultdict)
+        self.assertEqual(dict(compact.corpus.items()), counts)
+        self.assertEqual(
+            list(compact.corpus), sorted(counts, key=lambda _: _.encode())
+        )
+        for term in list(counts) + ['trolley', '', 'naïv', 'naïvetés']:
+            self.assertEqual(compact.idf(term), corpus.idf(term))
+        self.assertNotIn(1, compact.corpus)
+        self.assertRaises(KeyError, compact.corpus.__getitem__, 'trolley')
+
+        # compact files are memory-mapped, whether or not the corpus saved
+        # was compact
+        handle, path = tempfile.mkstemp('.dat')
+        os.close(handle)
+        for saved in (corpus, compact):
+            saved.save_corpus(path, compact=True)
+            loaded = UnigramCorpus()
+            loaded.load_corpus(path)
+            self.assertEqual(dict(loaded.corpus.items()), counts)
+            self.assertEqual(loaded.doc_count, corpus.doc_count)
+            self.assertEqual(loaded.idf('quick'), corpus.idf('quick'))
+
+            # compact corpora, memory-mapped or not, can be pickled, so
+            # measures using them can be run in worker processes
+            for compacted in (compact, loaded):
+                unpickled = pickle.loads(pickle.dumps(compacted))
+                self.assertEqual(dict(unpickled.corpus.items()), counts)
+                self.assertEqual(unpickled.idf('naïve'), corpus.idf('naïve'))
+                tfidf = TFIDF(
+                    tokenizer=WhitespaceTokenizer(), corpus=compacted
+                )
+                srcs = ['the quick fox', 'quick brown fox', 'lazy dog']
+                self.assertTrue(
+                    np.allclose(
+                        tfidf.sim_array(srcs, workers=2, chunksize=1),
+                        tfidf.sim_array(srcs),
+                    )
+                )
+            del loaded, unpickled, tfidf
+        self.assertIsInstance(corpus.corpus, defaultdict)
+
+        # adding to a compact corpus converts it back to a defaultdict
+        compact.add_document('the trolley')
+        self.assertIsInstance(compact.corpus, defaultdict)
+        self.assertEqual(compact.corpus['the'], (counts['the'][0] + 1, 21))
+        self.assertEqual(compact.corpus['trolley'], (1, 1))
+
+        # pickled corpora are still loaded
+        corpus.save_corpus(path)
+        loaded = UnigramCorpus()
+        loaded.load_corpus(path)
+        self.assertEqual(loaded.corpus, corpus.corpus)
+
+        UnigramCorpus().save_corpus(path, compact=True)
+        loaded = UnigramCorpus()
+        loaded.load_corpus(path)
+        self.assertEqual(len(loaded.corpus), 0)
+        self.assertEqual(loaded.idf('the'), float('inf'))
+        os.remove(path)
+
     def test_unigram_corpus_idf(self):
         """Test abydos.corpus.UnigramCorpus.idf."""
         # string-style tests
@@ -21,7 +21,15 @@ This module contains unit tests for abydos.distance._Distance
 
 import unittest
 
-from abydos.distance import Dice, Levenshtein
+import numpy as np
+
+from abydos.distance import (
+    Dice,
+    Gotoh,
+    Levenshtein,
+    NeedlemanWunsch,
+    SmithWaterman,
+)
 
 
 class DistanceTestCases(unittest.TestCase):
@@ -62,6 +70,81 @@ class DistanceTestCases(unittest.TestCase):
             self.dice.dist_abs('Niall', 'Nigel'),
         )
 
+    def test_sim_array(self):
+        """Test abydos.distance._Distance.sim_array."""
+        srcs = ['Niall', 'Neil', 'Nigel', '']
+        tars = ['Neal', 'Njall', 'Nigel']
+        expected = np.array(
+            [[self.lev.sim(src, tar) for tar in tars] for src in srcs]
+        )
+        self.assertTrue(np.allclose(self.lev.sim_array(srcs, tars), expected))
+        self.assertTrue(
+            np.allclose(
+                self.lev.sim_array(srcs, tars, workers=2, chunksize=1),
+                expected,
+            )
+        )
+        self.assertEqual(self.lev.sim_array(srcs).shape, (4, 4))
+        self.assertEqual(self.dice.sim_array([], tars).shape, (0, 3))
+
+    def test_dist_array(self):
+        """Test abydos.distance._Distance.dist_array."""
+        srcs = ['Niall', 'Neil', 'Nigel', '']
+        tars = ['Neal', 'Njall', 'Nigel']
+        expected = np.array(
+            [[self.dice.dist(src, tar) for tar in tars] for src in srcs]
+        )
+        self.assertTrue(
+            np.allclose(self.dice.dist_array(srcs, tars), expected)
+        )
+        self.assertTrue(
+            np.allclose(
+                self.dice.dist_array(srcs, tars, workers=2, chunksize=3),
+                expected,
+            )
+        )
+
+    def test_pdist(self):
+        """Test abydos.distance._Distance.pdist."""
+        collection = ['Niall', 'Neil', 'Nigel', 'Neal', 'Njall', '']
+        expected = np.array(
+            [
+                self.lev.dist(collection[i], collection[j])
+                for i in range(len(collection))
+                for j in range(i + 1, len(collection))
+            ]
+        )
+        self.assertTrue(np.allclose(self.lev.pdist(collection), expected))
+        self.assertTrue(
+            np.allclose(
+                self.lev.pdist(collection, workers=2, chunksize=2), expected
+            )
+        )
+        self.assertEqual(len(self.lev.pdist(['Niall'])), 0)
+
+    def test_alignment_arrays(self):
+        """Test the batch methods of the alignment measures.
+
+        NeedlemanWunsch, Gotoh, & SmithWaterman also have a sim_matrix
+        scoring function, which the batch methods must not shadow.
+        """
+        collection = ['Niall', 'Neil', 'Nigel', 'Neal']
+        for cmp in (NeedlemanWunsch(), Gotoh(), SmithWaterman()):
+            sims = np.array(
+                [
+                    [cmp.sim(src, tar) for tar in collection]
+                    for src in collection
+                ]
+            )
+            self.assertTrue(np.allclose(cmp.sim_array(collection), sims))
+            self.assertTrue(np.allclose(cmp.dist_array(collection), 1 - sims))
+            self.assertTrue(
+                np.allclose(
+                    cmp.pdist(collection), (1 - sims)[np.triu_indices(4, 1)]
+                )
+            )
+            self.assertEqual(cmp.sim_matrix('a', 'a'), 1.0)
+
 
 if __name__ == '__main__':
     unittest.main()
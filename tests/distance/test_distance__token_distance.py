@@ -19,19 +19,32 @@
 This module contains unit tests for abydos.distance._TokenDistance
 """
 
+import pickle
 import unittest
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from math import log1p
 
 from abydos.distance import (
     AverageLinkage,
+    BaulieuXIII,
+    Cosine,
     DamerauLevenshtein,
+    Dice,
+    FuzzyWuzzyTokenSet,
     Jaccard,
     JaroWinkler,
+    KuhnsIII,
+    Overlap,
     SokalMichener,
+    SokalSneathI,
+    Tversky,
 )
+from abydos.distance._token_distance import _encode, _overlaps
 from abydos.stats import ConfusionTable
 from abydos.tokenizer import (
     CharacterTokenizer,
+    QGrams,
     QSkipgrams,
     WhitespaceTokenizer,
 )
@@ -433,6 +446,115 @@ class TokenDistanceTestCases(unittest.TestCase):
             Counter({'#': 0.5, 'e#': -1, 'e': -0.5}),
         )
 
+    def test_token_distance_threads(self):
+        """Test abydos.distance._TokenDistance sharing across threads."""
+        names = [
+            'Niall',
+            'Neal',
+            'Neil',
+            'Njall',
+            'Nigel',
+            'Neel',
+            'Nele',
+            'Nigelle',
+            'Nils',
+            'Colin',
+        ] * 3
+        pairs = [(src, tar) for src in names for tar in reversed(names)]
+        for cmp in (
+            self.cmp_j_crisp,
+            self.cmp_j_soft,
+            self.cmp_j_fuzzy,
+            Tversky(alpha=0.2, beta=0.7, normalizer='proportional'),
+            SokalMichener(normalizer='log'),
+            AverageLinkage(),
+            FuzzyWuzzyTokenSet(),
+            self.cmp_j_linkage,
+        ):
+            expected = [cmp.sim(src, tar) for src, tar in pairs]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                self.assertEqual(
+                    list(executor.map(lambda pair: cmp.sim(*pair), pairs)),
+                    expected,
+                )
+
+        # the per-call state of a comparison is not pickled
+        cmp = self.cmp_j_soft
+        cmp.sim('Niall', 'Neil')
+        copy = pickle.loads(pickle.dumps(cmp))  # noqa: S301
+        self.assertEqual(copy._src_tokens, Counter())  # noqa: SF01
+        self.assertEqual(copy.sim('Niall', 'Neil'), cmp.sim('Niall', 'Neil'))
+
+    def test_token_distance_matrix(self):
+        """Test abydos.distance._TokenDistance contingency tables."""
+        profiles = [
+            self.cmp_j_crisp.prepare(name)
+            for name in ('', 'aaaa', 'aaa', 'abab', 'b')
+        ]
+        features = {}
+        encoded = _encode(profiles, features)
+        self.assertEqual(encoded[1].tolist(), [0, 3, 3, 4, 2])
+        self.assertEqual(
+            _overlaps(encoded[0], encoded[0], (5, 5), len(features)).tolist(),
+            [
+                [sum((src.tokens & tar.tokens).values()) for tar in profiles]
+                for src in profiles
+            ],
+        )
+        self.assertEqual(
+            _overlaps(encoded[2], encoded[2], (5, 5), len(features)).tolist(),
+            [
+                [len(src.tokens & tar.tokens) for tar in profiles]
+                for src in profiles
+            ],
+        )
+
+        names = [
+            'Niall',
+            'Neal',
+            'Neil',
+            'Njall',
+            'Nigel',
+            'Neel',
+            'Nele',
+            'Nigelle',
+            'Nils',
+            'Colin',
+            'aaaaa',
+            'aaa',
+            '',
+        ]
+        for cmp in (
+            self.cmp_j_crisp,
+            self.cmp_j_soft,
+            Jaccard(tokenizer=WhitespaceTokenizer()),
+            Jaccard(tokenizer=QGrams(scaler=log1p)),
+            Jaccard(alphabet=Counter({'aa': 3, 'Ne': 2})),
+            Tversky(alpha=0.2, beta=0.7, normalizer='proportional'),
+            SokalMichener(normalizer='log', alphabet=40),
+            SokalSneathI(alphabet=0),
+            KuhnsIII(),
+            BaulieuXIII(alphabet=30),
+            Dice(),
+            Tversky(alpha=0.2, beta=0.7),
+            Tversky(alpha=0.2, beta=0.7, bias=0.5),
+            Cosine(),
+            Cosine(tokenizer=WhitespaceTokenizer()),
+            Overlap(qval=1),
+        ):
+            self.assertEqual(
+                cmp.sim_array(names).tolist(),
+                [[cmp.sim(src, tar) for tar in names] for src in names],
+            )
+            self.assertEqual(
+                cmp.pdist(names, workers=2, chunksize=3).tolist(),
+                [
+                    cmp.dist(src, tar)
+                    for i, src in enumerate(names)
+                    for tar in names[i + 1 :]
+                ],
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,143 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_bk_tree.
+
+This module contains unit tests for abydos.distance.BKTree
+"""
+
+import pickle
+import random
+import unittest
+
+from abydos.distance import (
+    BKTree,
+    DamerauLevenshtein,
+    Hamming,
+    Indel,
+    Levenshtein,
+)
+
+
+class BKTreeTestCases(unittest.TestCase):
+    """Test BKTree functions.
+
+    abydos.distance.BKTree
+    """
+
+    names = ['Niall', 'Neal', 'Neil', 'Njall', 'Nigel', 'Neel', 'Nele']
+
+    def _random_terms(self, count, seed):
+        rng = random.Random(seed)  # noqa: S311
+        return [
+            ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 7)))
+            for _ in range(count)
+        ]
+
+    def test_bk_tree_container(self):
+        """Test abydos.distance.BKTree container methods."""
+        tree = BKTree()
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(list(tree), [])
+        self.assertNotIn('Niall', tree)
+        self.assertEqual(tree.query('Niall', 2), [])
+        self.assertEqual(tree.nearest('Niall'), [])
+
+        self.assertTrue(tree.add('Niall'))
+        self.assertFalse(tree.add('Niall'))
+        self.assertIn('Niall', tree)
+        self.assertNotIn('Neil', tree)
+        self.assertNotIn(5, tree)
+
+        tree.update(self.names)
+        self.assertEqual(len(tree), len(self.names))
+        self.assertEqual(sorted(tree), sorted(self.names))
+        for name in self.names:
+            self.assertIn(name, tree)
+
+        tree = BKTree(terms=self.names + self.names)
+        self.assertEqual(len(tree), len(self.names))
+        self.assertEqual(tree.nearest('Niall', 0), [])
+
+    def test_bk_tree_query(self):
+        """Test abydos.distance.BKTree.query."""
+        tree = BKTree(terms=self.names)
+        self.assertEqual(tree.query('Niall', 0), [('Niall', 0)])
+        self.assertEqual(tree.query('Nxxxx', 0), [])
+        self.assertEqual(
+            tree.query('Neal', 1), [('Neal', 0), ('Neel', 1), ('Neil', 1)]
+        )
+
+        for metric in (Levenshtein(), DamerauLevenshtein(), Indel()):
+            terms = self._random_terms(300, 0)
+            tree = BKTree(metric, terms)
+            for query in self._random_terms(30, 1):
+                for max_dist in range(4):
+                    expected = sorted(
+                        (metric.dist_abs(query, term), term)
+                        for term in set(terms)
+                        if metric.dist_abs(query, term) <= max_dist
+                    )
+                    self.assertEqual(
+                        tree.query(query, max_dist),
+                        [(term, dist) for dist, term in expected],
+                    )
+
+        metric = Hamming()
+        terms = self._random_terms(300, 2)
+        tree = BKTree(metric, terms)
+        for query in self._random_terms(30, 3):
+            expected = sorted(
+                (metric.dist_abs(query, term), term)
+                for term in set(terms)
+                if metric.dist_abs(query, term) <= 2
+            )
+            self.assertEqual(
+                tree.query(query, 2),
+                [(term, dist) for dist, term in expected],
+            )
+
+    def test_bk_tree_nearest(self):
+        """Test abydos.distance.BKTree.nearest."""
+        tree = BKTree(terms=self.names)
+        self.assertEqual(tree.nearest('Niall'), [('Niall', 0)])
+        self.assertEqual(tree.nearest('Nigl'), [('Nigel', 1)])
+        self.assertEqual(len(tree.nearest('Niall', 100)), len(self.names))
+
+        for metric in (Levenshtein(), DamerauLevenshtein(), Indel()):
+            terms = self._random_terms(300, 4)
+            tree = BKTree(metric, terms)
+            for query in self._random_terms(30, 5):
+                for k in (1, 3, 10):
+                    expected = sorted(
+                        metric.dist_abs(query, term) for term in set(terms)
+                    )[:k]
+                    found = tree.nearest(query, k)
+                    self.assertEqual([dist for _, dist in found], expected)
+                    for term, dist in found:
+                        self.assertEqual(metric.dist_abs(query, term), dist)
+
+    def test_bk_tree_pickle(self):
+        """Test abydos.distance.BKTree pickling."""
+        tree = BKTree(terms=self._random_terms(200, 6))
+        copy = pickle.loads(pickle.dumps(tree))  # noqa: S301
+        self.assertEqual(list(copy), list(tree))
+        for query in self._random_terms(10, 7):
+            self.assertEqual(copy.query(query, 2), tree.query(query, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -104,6 +104,41 @@ class DamerauLevenshteinTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp55105.sim('cab', 'cba'), 2 / 3)
         self.assertRaises(ValueError, self.cmp1010105.sim, 'ab', 'ba')
 
+    def test_damerau_levenshtein_max_distance(self):
+        """Test abydos.distance.DamerauLevenshtein with max_distance."""
+        pairs = (
+            ('', ''),
+            ('', 'abc'),
+            ('abc', ''),
+            ('cat', 'hat'),
+            ('Niall', 'Neil'),
+            ('aluminum', 'Catalan'),
+            ('ATCG', 'TAGC'),
+            ('ACTG', 'TAGC'),
+            ('CA', 'ABC'),
+            ('bcab', 'a'),
+            ('a cat', 'an abct'),
+            ('levenshtein', 'frankenstein'),
+        )
+        for cost in ((1, 1, 1, 1), (5, 7, 10, 10), (3, 1, 1, 2)):
+            full = DamerauLevenshtein(cost=cost)
+            for max_distance in (0, 1, 2, 3, 5, 10):
+                bounded = DamerauLevenshtein(
+                    cost=cost, max_distance=max_distance
+                )
+                for src, tar in pairs:
+                    distance = full.dist_abs(src, tar)
+                    if distance <= max_distance:
+                        self.assertEqual(bounded.dist_abs(src, tar), distance)
+                        self.assertEqual(
+                            bounded.dist(src, tar), full.dist(src, tar)
+                        )
+                    else:
+                        self.assertEqual(
+                            bounded.dist_abs(src, tar), max_distance + 1
+                        )
+                        self.assertEqual(bounded.dist(src, tar), 1.0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,8 @@ This module contains unit tests for abydos.distance.Hamming
 
 import unittest
 
+import numpy as np
+
 from abydos.distance import Hamming
 
 
@@ -105,6 +107,46 @@ class HammingTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.sim('1011101', '1001001'), 5 / 7)
         self.assertAlmostEqual(self.cmp.sim('2173896', '2233796'), 4 / 7)
 
+    def test_hamming_matrix(self):
+        """Test abydos.distance.Hamming.dist_array & .sim_array."""
+        srcs = ['', 'a', 'abc', 'karolin', 'bb']
+        tars = ['', 'cba', 'kathrin', 'cbab']
+        self.assertTrue(
+            np.allclose(
+                self.cmp.dist_array(srcs, tars),
+                [[self.cmp.dist(src, tar) for tar in tars] for src in srcs],
+            )
+        )
+        self.assertTrue(
+            np.allclose(
+                self.cmp.sim_array(srcs, tars),
+                [[self.cmp.sim(src, tar) for tar in tars] for src in srcs],
+            )
+        )
+        self.assertTrue(
+            np.allclose(
+                self.cmp.pdist(srcs),
+                [
+                    self.cmp.dist(srcs[i], srcs[j])
+                    for i in range(len(srcs))
+                    for j in range(i + 1, len(srcs))
+                ],
+            )
+        )
+
+        # NUL characters are handled by the generic implementation
+        self.assertTrue(
+            np.allclose(self.cmp.dist_array(['a\x00b'], ['a\x00']), [[1 / 3]])
+        )
+
+        self.assertTrue(
+            np.allclose(
+                self.cmp_no_diff.dist_array(['abc', 'cba'], ['abc']),
+                [[0.0], [2 / 3]],
+            )
+        )
+        self.assertRaises(ValueError, self.cmp_no_diff.dist_array, ['ab', 'a'])
+
 
 if __name__ == '__main__':
     unittest.main()
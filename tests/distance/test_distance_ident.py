@@ -21,6 +21,8 @@ This module contains unit tests for abydos.distance.Ident
 
 import unittest
 
+import numpy as np
+
 from abydos.distance import Ident
 
 
@@ -52,6 +54,33 @@ class IdentTestCases(unittest.TestCase):
         self.assertEqual(self.cmp.dist('abcd', 'dcba'), 1)
         self.assertEqual(self.cmp.dist('abc', 'cba'), 1)
 
+    def test_ident_matrix(self):
+        """Test abydos.distance.Ident.sim_array & .dist_array."""
+        srcs = ['', 'a', 'abcd', 'abc', 'Niall']
+        tars = ['', 'a', 'dcba', 'abc', 'Neil', 'aluminum']
+        self.assertTrue(
+            np.allclose(
+                self.cmp.sim_array(srcs, tars),
+                [[self.cmp.sim(src, tar) for tar in tars] for src in srcs],
+            )
+        )
+        self.assertTrue(
+            np.allclose(
+                self.cmp.dist_array(srcs, tars),
+                [[self.cmp.dist(src, tar) for tar in tars] for src in srcs],
+            )
+        )
+        self.assertTrue(
+            np.allclose(
+                self.cmp.pdist(tars),
+                [
+                    self.cmp.dist(tars[i], tars[j])
+                    for i in range(len(tars))
+                    for j in range(i + 1, len(tars))
+                ],
+            )
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
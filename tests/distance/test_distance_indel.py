@@ -77,6 +77,20 @@ class IndelTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.dist_abs('Colin', 'Coiln'), 2)
         self.assertAlmostEqual(self.cmp.dist_abs('Coiln', 'Colin'), 2)
 
+    def test_indel_max_distance(self):
+        """Test abydos.distance.Indel with max_distance."""
+        cmp = Indel(max_distance=3)
+        self.assertEqual(cmp.dist_abs('', ''), 0)
+        self.assertEqual(cmp.dist_abs('', 'abc'), 3)
+        self.assertEqual(cmp.dist_abs('', 'abcd'), 4)
+        self.assertEqual(cmp.dist_abs('Niall', 'Neil'), 3)
+        self.assertEqual(cmp.dist_abs('Colin', 'Cuilen'), 4)
+        self.assertEqual(cmp.dist_abs('ATCG', 'TAGC'), 4)
+        self.assertEqual(cmp.dist_abs('aluminum', 'Catalan'), 4)
+        self.assertAlmostEqual(cmp.dist('Niall', 'Neil'), 1 / 3)
+        self.assertEqual(cmp.dist('Colin', 'Cuilen'), 1.0)
+        self.assertEqual(cmp.sim('Colin', 'Cuilen'), 0.0)
+
 
 if __name__ == '__main__':
     unittest.main()
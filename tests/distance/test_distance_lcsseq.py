@@ -143,6 +143,32 @@ class LCSseqTestCases(unittest.TestCase):
         self.assertAlmostEqual(self.cmp.dist('cc', 'bbbbcccccc'), 8 / 10)
         self.assertAlmostEqual(self.cmp.dist('ccc', 'bcbb'), 3 / 4)
 
+    def test_lcsseq_min_similarity(self):
+        """Test abydos.distance.LCSseq with min_similarity."""
+        pairs = (
+            ('', ''),
+            ('', 'abc'),
+            ('cat', 'hat'),
+            ('Niall', 'Neil'),
+            ('aluminum', 'Catalan'),
+            ('ATCG', 'TAGC'),
+            ('abcdefg', 'xabxcdxxefxgx'),
+            ('thisisatest', 'testing123testing'),
+        )
+        for normalizer in (max, lambda x: sum(x) / 2.0):
+            full = LCSseq(normalizer=normalizer)
+            for min_similarity in (0.0, 0.25, 0.5, 0.6, 0.8, 1.0):
+                bounded = LCSseq(
+                    normalizer=normalizer, min_similarity=min_similarity
+                )
+                for src, tar in pairs:
+                    sim = full.sim(src, tar)
+                    if sim >= min_similarity:
+                        self.assertEqual(bounded.sim(src, tar), sim)
+                    else:
+                        self.assertEqual(bounded.sim(src, tar), 0.0)
+                        self.assertEqual(bounded.dist(src, tar), 1.0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,8 @@ This module contains unit tests for abydos.distance.Length
 
 import unittest
 
+import numpy as np
+
 from abydos.distance import Length
 
 
@@ -60,6 +62,33 @@ class LengthTestCases(unittest.TestCase):
         self.assertEqual(self.cmp.dist('ab', 'dcba'), 0.5)
         self.assertEqual(self.cmp.dist('abcd', 'ba'), 0.5)
 
+    def test_length_matrix(self):
+        """Test abydos.distance.Length.sim_array & .dist_array."""
+        srcs = ['', 'a', 'abcd', 'abc', 'Niall']
+        tars = ['', 'a', 'dcba', 'abc', 'Neil', 'aluminum']
+        self.assertTrue(
+            np.allclose(
+                self.cmp.sim_array(srcs, tars),
+                [[self.cmp.sim(src, tar) for tar in tars] for src in srcs],
+            )
+        )
+        self.assertTrue(
+            np.allclose(
+                self.cmp.dist_array(srcs, tars),
+                [[self.cmp.dist(src, tar) for tar in tars] for src in srcs],
+            )
+        )
+        self.assertTrue(
+            np.allclose(
+                self.cmp.pdist(tars),
+                [
+                    self.cmp.dist(tars[i], tars[j])
+                    for i in range(len(tars))
+                    for j in range(i + 1, len(tars))
+                ],
+            )
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -167,6 +167,30 @@ class LevenshteinTestCases(unittest.TestCase):
             7.499999999999999,
         )
 
+        # bit-parallel computation, compared against the full matrix,
+        # including strings longer than a single machine word
+        pairs = (
+            ('ATCG', 'TAGC'),
+            ('ACTG', 'TAGC'),
+            ('levenshtein', 'frankenstein'),
+            ('abcd' * 20, 'bacd' * 19 + 'dcb'),
+            ('the quick brown fox jumps over the lazy dog' * 3, 'fox' * 40),
+        )
+        for cmp in (self.cmp, Levenshtein(mode='osa')):
+            for src, tar in pairs:
+                self.assertEqual(
+                    cmp._bit_parallel(src, tar),  # noqa: SF01
+                    cmp._alignment_matrix(  # noqa: SF01
+                        src, tar, backtrace=False
+                    )[len(src), len(tar)],
+                )
+                self.assertEqual(
+                    cmp.dist_abs(src, tar), cmp.dist_abs(tar, src)
+                )
+        self.assertEqual(
+            Levenshtein(cost=(1, 1, 1, 2), mode='osa').dist_abs('ab', 'ba'), 2
+        )
+
     def test_levenshtein_dist(self):
         """Test abydos.distance.Levenshtein.dist."""
         self.assertEqual(self.cmp.dist('', ''), 0)
@@ -229,6 +253,65 @@ class LevenshteinTestCases(unittest.TestCase):
             (1.0, 'Niall', 'Naill'),
         )
 
+    def test_levenshtein_max_distance(self):
+        """Test abydos.distance.Levenshtein with max_distance."""
+        pairs = (
+            ('', ''),
+            ('', 'abc'),
+            ('abc', ''),
+            ('cat', 'hat'),
+            ('Niall', 'Neil'),
+            ('aluminum', 'Catalan'),
+            ('ATCG', 'TAGC'),
+            ('ACTG', 'TAGC'),
+            ('levenshtein', 'frankenstein'),
+            ('abcdefg', 'xabxcdxxefxgx'),
+        )
+        for params in (
+            {},
+            {'mode': 'osa'},
+            {'taper': True},
+            {'mode': 'osa', 'taper': True},
+            {'cost': (1, 2, 1.5, 0.5), 'mode': 'osa'},
+            {'cost': (2, 1, 3, 1)},
+        ):
+            full = Levenshtein(**params)
+            for max_distance in (0, 1, 2, 3, 5):
+                bounded = Levenshtein(max_distance=max_distance, **params)
+                for src, tar in pairs:
+                    distance = full.dist_abs(src, tar)
+                    if distance <= max_distance:
+                        self.assertEqual(bounded.dist_abs(src, tar), distance)
+                        self.assertEqual(
+                            bounded.dist(src, tar), full.dist(src, tar)
+                        )
+                    else:
+                        self.assertEqual(
+                            bounded.dist_abs(src, tar), max_distance + 1
+                        )
+                        self.assertEqual(bounded.dist(src, tar), 1.0)
+                        self.assertEqual(bounded.sim(src, tar), 0.0)
+
+        # a transposition from the initial row, after a first row exceeding
+        # max_distance
+        self.assertEqual(
+            Levenshtein(mode='osa', cost=(2, 2, 5, 1)).dist_abs('ba', 'ab'), 1
+        )
+        self.assertEqual(
+            Levenshtein(
+                mode='osa', cost=(2, 2, 5, 1), max_distance=1
+            ).dist_abs('ba', 'ab'),
+            1,
+        )
+        self.assertEqual(
+            Levenshtein(
+                mode='osa', cost=(1, 1, 2, 1), taper=True, max_distance=1
+            ).dist_abs('ba', 'ab'),
+            Levenshtein(mode='osa', cost=(1, 1, 2, 1), taper=True).dist_abs(
+                'ba', 'ab'
+            ),
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,150 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_similarity_join.
+
+This module contains unit tests for abydos.distance.SimilarityJoin
+"""
+
+import random
+import unittest
+from itertools import combinations
+from math import log1p
+
+from abydos.distance import (
+    Cosine,
+    Dice,
+    Jaccard,
+    Levenshtein,
+    Overlap,
+    SimilarityJoin,
+    Tversky,
+)
+from abydos.tokenizer import QGrams, WhitespaceTokenizer
+
+
+class SimilarityJoinTestCases(unittest.TestCase):
+    """Test SimilarityJoin functions.
+
+    abydos.distance.SimilarityJoin
+    """
+
+    names = ['Niall', 'Neal', 'Neil', 'Njall', 'Nigel', 'Neel', 'Nele']
+
+    def _random_terms(self, count, seed):
+        rng = random.Random(seed)  # noqa: S311
+        return [
+            ''.join(rng.choice('abcde') for _ in range(rng.randint(0, 9)))
+            for _ in range(count)
+        ]
+
+    def test_similarity_join_init(self):
+        """Test abydos.distance.SimilarityJoin.__init__."""
+        self.assertRaises(ValueError, SimilarityJoin, Jaccard(), 0.0)
+        self.assertRaises(ValueError, SimilarityJoin, Jaccard(), 1.1)
+        self.assertRaises(ValueError, SimilarityJoin, Levenshtein())
+        self.assertRaises(ValueError, SimilarityJoin, Tversky())
+        self.assertRaises(
+            ValueError, SimilarityJoin, Jaccard(intersection_type='soft')
+        )
+        self.assertRaises(
+            ValueError,
+            SimilarityJoin,
+            Jaccard(tokenizer=QGrams(scaler=log1p)),
+            0.5,
+            ['aaaa'],
+        )
+
+        join = SimilarityJoin()
+        self.assertEqual(len(join), 0)
+        self.assertEqual(join.query('Niall'), [])
+        self.assertEqual(join.self_join(), [])
+        join.add('Niall')
+        join.update(['Niall', 'Neil'])
+        self.assertEqual(len(join), 3)
+        self.assertEqual(join.self_join(), [('Niall', 'Niall', 1.0)])
+
+    def test_similarity_join_query(self):
+        """Test abydos.distance.SimilarityJoin.query."""
+        join = SimilarityJoin(threshold=0.5, terms=self.names)
+        self.assertEqual(join.query('Niall'), [('Niall', 1.0), ('Njall', 0.5)])
+        self.assertEqual(join.query('Xavier'), [])
+
+        join = SimilarityJoin(threshold=0.5, terms=['', 'a', ''])
+        self.assertEqual(join.query(''), [('', 1.0), ('', 1.0)])
+        self.assertEqual(join.query('a'), [('a', 1.0)])
+
+        terms = self._random_terms(200, 0)
+        queries = self._random_terms(30, 1)
+        for measure in (
+            Jaccard(),
+            Dice(),
+            Cosine(),
+            Overlap(),
+            Jaccard(qval=3),
+            Dice(qval=1),
+            Cosine(tokenizer=WhitespaceTokenizer()),
+        ):
+            sims = {
+                query: sorted(
+                    (-measure.sim(query, term), term) for term in terms
+                )
+                for query in queries
+            }
+            for threshold in (0.3, 0.6, 0.9, 1.0):
+                join = SimilarityJoin(measure, threshold, terms[:100])
+                join.update(terms[100:])
+                for query in queries:
+                    self.assertEqual(
+                        join.query(query),
+                        [
+                            (term, -sim)
+                            for sim, term in sims[query]
+                            if -sim >= threshold
+                        ],
+                    )
+
+    def test_similarity_join_self_join(self):
+        """Test abydos.distance.SimilarityJoin.self_join."""
+        join = SimilarityJoin(Dice(), 0.6, self.names)
+        self.assertEqual(
+            join.self_join(),
+            [
+                ('Niall', 'Njall', 0.6666666666666666),
+                ('Neal', 'Neil', 0.6),
+                ('Neal', 'Neel', 0.6),
+                ('Neil', 'Neel', 0.6),
+                ('Neel', 'Nele', 0.6),
+            ],
+        )
+
+        terms = self._random_terms(200, 2)
+        for measure in (Jaccard(), Dice(), Cosine(), Overlap()):
+            sims = sorted(
+                (src, tar, measure.sim(src, tar))
+                for src, tar in combinations(terms, 2)
+            )
+            for threshold in (0.3, 0.6, 0.9, 1.0):
+                join = SimilarityJoin(measure, threshold, terms[:100])
+                join.update(terms[100:])
+                self.assertEqual(
+                    sorted(join.self_join()),
+                    [pair for pair in sims if pair[2] >= threshold],
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
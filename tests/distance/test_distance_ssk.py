@@ -22,6 +22,7 @@ This module contains unit tests for abydos.distance.SSK
 import unittest
 
 from abydos.distance import SSK
+from abydos.tokenizer import QSkipgrams, QGrams
 
 import numpy as np
 
@@ -112,6 +113,89 @@ class SSKTestCases(unittest.TestCase):
             0.07841429769736327,
         )
 
+    def test_ssk_kernel(self):
+        """Test abydos.distance.SSK with the kernel engine."""
+        words = [
+            '',
+            'a',
+            'cat',
+            'hat',
+            'Niall',
+            'Neil',
+            'Nigel',
+            'aluminum',
+            'Catalan',
+            'ATCG',
+            'TAGC',
+            'abracadabra',
+        ]
+        for tokenizer, kwargs in (
+            (None, {}),
+            (None, {'qval': 1}),
+            (None, {'qval': 4, 'ssk_lambda': 0.5}),
+            (None, {'ssk_lambda': (0.05, 0.5)}),
+            (None, {'ssk_lambda': np.arange(0.05, 0.5, 0.05)}),
+            (QSkipgrams(qval=(1, 2, 3), start_stop='$#', scaler='SSK'), {}),
+        ):
+            cmp = SSK(tokenizer=tokenizer, **kwargs)
+            cmp_kernel = SSK(tokenizer=tokenizer, engine='kernel', **kwargs)
+            for src in words:
+                for tar in words:
+                    self.assertAlmostEqual(
+                        cmp_kernel.sim_score(src, tar),
+                        cmp.sim_score(src, tar),
+                    )
+                    self.assertAlmostEqual(
+                        cmp_kernel.sim(src, tar), cmp.sim(src, tar)
+                    )
+
+            sims = cmp_kernel.sim_array(words[:4], words)
+            self.assertEqual(sims.shape, (4, len(words)))
+            for i, src in enumerate(words[:4]):
+                for j, tar in enumerate(words):
+                    self.assertAlmostEqual(sims[i, j], cmp.sim(src, tar))
+            self.assertTrue(
+                np.allclose(
+                    cmp_kernel.dist_array(words),
+                    1.0 - cmp_kernel.sim_array(words),
+                )
+            )
+
+        cmp_kernel = SSK(engine='kernel')
+        self.assertAlmostEqual(
+            cmp_kernel.sim('cat', 'hat'), 0.3558718861209964
+        )
+        self.assertAlmostEqual(
+            cmp_kernel.sim_score('cat', 'car'), 0.6561000000000001
+        )
+        self.assertAlmostEqual(
+            cmp_kernel.dist_abs('Niall', 'Neil'), 0.5290992177869401
+        )
+
+        # lambdas given by a generator are used for every comparison
+        cmp = SSK(ssk_lambda=(0.05, 0.5))
+        cmp_kernel = SSK(
+            ssk_lambda=(val for val in (0.05, 0.5)), engine='kernel'
+        )
+        for _ in range(2):
+            self.assertAlmostEqual(
+                cmp_kernel.sim_score('cat', 'hat'), cmp.sim_score('cat', 'hat')
+            )
+
+        # long strings
+        src = '123 Main Street, Springfield, Illinois 62704'
+        tar = '123 Main St., Springfield IL 62704'
+        self.assertAlmostEqual(
+            SSK(qval=3, engine='kernel').sim(src, tar),
+            SSK(qval=3).sim(src, tar),
+        )
+
+        self.assertRaises(ValueError, SSK, engine='dp')
+        self.assertRaises(ValueError, SSK, tokenizer=QGrams(), engine='kernel')
+        self.assertRaises(
+            ValueError, SSK, tokenizer=QSkipgrams(), engine='kernel'
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
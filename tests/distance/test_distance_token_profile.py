@@ -0,0 +1,242 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.distance.test_distance_token_profile.
+
+This module contains unit tests for abydos.distance._token_profile.TokenProfile
+"""
+
+import pickle
+import unittest
+from collections import Counter
+
+import abydos.distance
+from abydos.distance import Dice, Jaccard, _TokenDistance
+from abydos.distance._token_profile import TokenProfile
+from abydos.tokenizer import QGrams, WhitespaceTokenizer
+
+
+class TokenProfileTestCases(unittest.TestCase):
+    """Test TokenProfile functions.
+
+    abydos.distance._token_profile.TokenProfile
+    """
+
+    pairs = (
+        ('Niall', 'Neil'),
+        ('cat', 'hat'),
+        ('aluminum', 'Catalan'),
+        ('ATCG', 'TAGC'),
+        ('Niall', 'Niall'),
+        ('', ''),
+        ('a', ''),
+    )
+
+    def test_token_profile(self):
+        """Test abydos.distance._token_profile.TokenProfile."""
+        profile = TokenProfile('Niall')
+        self.assertEqual(profile, 'Niall')
+        self.assertEqual(profile.tokens, Counter())
+        self.assertIsNone(profile.tokenizer)
+        self.assertEqual(profile.card, 0)
+
+        tokenizer = QGrams()
+        profile = TokenProfile(
+            'Niall', tokenizer.tokenize('Niall').get_counter(), tokenizer
+        )
+        self.assertEqual(profile, 'Niall')
+        self.assertEqual(len(profile), 5)
+        self.assertEqual(hash(profile), hash('Niall'))
+        self.assertEqual(profile.card, 6)
+        self.assertIs(profile.tokenizer, tokenizer)
+
+        copy = pickle.loads(pickle.dumps(profile))
+        self.assertIsInstance(copy, TokenProfile)
+        self.assertEqual(copy, 'Niall')
+        self.assertEqual(copy.tokens, profile.tokens)
+        self.assertEqual(copy.card, 6)
+
+    def test_token_profile_prepare(self):
+        """Test abydos.distance._TokenDistance.prepare."""
+        cmp = Jaccard()
+        profile = cmp.prepare('Niall')
+        self.assertIsInstance(profile, TokenProfile)
+        self.assertIs(profile.tokenizer, cmp.params['tokenizer'])
+        self.assertEqual(
+            profile.tokens,
+            Counter({'$N': 1, 'Ni': 1, 'ia': 1, 'al': 1, 'll': 1, 'l#': 1}),
+        )
+        self.assertIs(cmp.prepare(profile), profile)
+
+        # measures sharing a tokenizer share profiles
+        tokenizer = QGrams(qval=3)
+        jac = Jaccard(tokenizer=tokenizer)
+        dice = Dice(tokenizer=tokenizer)
+        profile = jac.prepare('Niall')
+        self.assertIs(dice.prepare(profile), profile)
+        self.assertEqual(
+            dice.sim(profile, dice.prepare('Neil')), dice.sim('Niall', 'Neil')
+        )
+
+        # profiles from other tokenizers are tokenized again
+        profile = cmp.prepare('Niall')
+        self.assertIsNot(jac.prepare(profile), profile)
+        self.assertEqual(jac.sim(profile, 'Neil'), jac.sim('Niall', 'Neil'))
+        self.assertNotEqual(jac.sim(profile, 'Neil'), cmp.sim(profile, 'Neil'))
+
+    def test_token_profile_measures(self):
+        """Test profiles with all _TokenDistance measures."""
+        for name in abydos.distance.__all__:
+            cls = getattr(abydos.distance, name)
+            if (
+                name.startswith('_')
+                or not issubclass(cls, _TokenDistance)
+                # these measures sample tokens randomly
+                or name in {'ChaoDice', 'ChaoJaccard'}
+            ):
+                continue
+            cmp = cls()
+            for method in (cmp.sim, cmp.dist_abs):
+                for src, tar in self.pairs:
+                    try:
+                        expected = method(src, tar)
+                    except NotImplementedError:
+                        break
+                    self.assertEqual(
+                        method(cmp.prepare(src), cmp.prepare(tar)), expected
+                    )
+                    self.assertEqual(method(src, cmp.prepare(tar)), expected)
+
+        cmp = Jaccard(normalizer='proportional')
+        names = ['Niall', 'Neal', 'Neil', 'Njall', 'Nigel', '']
+        self.assertEqual(
+            cmp.sim_array(names).tolist(),
+            [[cmp.sim(src, tar) for tar in names] for src in names],
+        )
+        self.assertEqual(
+            cmp.pdist(names).tolist(),
+            [
+                cmp.dist(src, tar)
+                for i, src in enumerate(names)
+                for tar in names[i + 1 :]
+            ],
+        )
+
+    def test_token_profile_codes(self):
+        """Test profiles with token codes."""
+        tokenizer = QGrams()
+        profile = TokenProfile(
+            'Niall',
+            tokenizer=tokenizer,
+            codes=tokenizer.tokenize_codes('Niall'),
+        )
+        self.assertEqual(profile.card, 6)
+        self.assertEqual(len(profile.tokens), 6)
+        self.assertTrue(all(isinstance(tok, int) for tok in profile.tokens))
+
+        copy = pickle.loads(pickle.dumps(profile))
+        self.assertEqual(copy.codes[0].tolist(), profile.codes[0].tolist())
+        self.assertEqual(copy.card, 6)
+
+        cmp = Jaccard()
+        profile = cmp.prepare('Niall', codes=True)
+        self.assertIsNotNone(profile.codes)
+        self.assertIs(cmp.prepare(profile), profile)
+        self.assertIs(cmp.prepare(profile, codes=True), profile)
+        self.assertIsNotNone(
+            cmp.prepare(cmp.prepare('Niall'), codes=True).codes
+        )
+        self.assertRaises(
+            TypeError,
+            Jaccard(tokenizer=WhitespaceTokenizer()).prepare,
+            'Niall',
+            codes=True,
+        )
+
+        # profiles with codes are compared with strings, profiles without
+        # codes & Counters by their tokens
+        self.assertEqual(cmp.sim(profile, 'Neil'), cmp.sim('Niall', 'Neil'))
+        self.assertEqual(
+            cmp.sim(profile, cmp.prepare('Neil')), cmp.sim('Niall', 'Neil')
+        )
+        self.assertEqual(
+            cmp.sim(profile, QGrams().tokenize('Neil').get_counter()),
+            cmp.sim('Niall', 'Neil'),
+        )
+        self.assertEqual(
+            Jaccard(intersection_type='soft').sim(profile, 'Neil'),
+            Jaccard(intersection_type='soft').sim('Niall', 'Neil'),
+        )
+
+        for tokenizer in (
+            QGrams(qval=range(1, 4), skip=[0, 1]),
+            QGrams(qval=3, start_stop=''),
+            QGrams(scaler='set'),
+        ):
+            for kwargs in ({'alphabet': None}, {'alphabet': 20}, {}):
+                cmp = Dice(tokenizer=tokenizer, **kwargs)
+                for src, tar in self.pairs:
+                    self.assertEqual(
+                        cmp.sim(
+                            cmp.prepare(src, codes=True),
+                            cmp.prepare(tar, codes=True),
+                        ),
+                        cmp.sim(src, tar),
+                    )
+        self.assertRaises(
+            ValueError,
+            Dice(tokenizer=QGrams(scaler='length')).prepare,
+            'a',
+            True,
+        )
+        self.assertRaises(
+            ValueError, Dice(tokenizer=QGrams(qval=4)).prepare, 'a', True
+        )
+
+    def test_token_profile_codes_measures(self):
+        """Test profiles with token codes with all _TokenDistance measures."""
+        for name in abydos.distance.__all__:
+            cls = getattr(abydos.distance, name)
+            if (
+                name.startswith('_')
+                or not issubclass(cls, _TokenDistance)
+                # these measures sample tokens randomly
+                or name in {'ChaoDice', 'ChaoJaccard'}
+            ):
+                continue
+            cmp = cls()
+            if not isinstance(cmp.params['tokenizer'], QGrams):
+                continue
+            for method in (cmp.sim, cmp.dist_abs):
+                for src, tar in self.pairs:
+                    try:
+                        expected = method(src, tar)
+                    except NotImplementedError:
+                        break
+                    self.assertAlmostEqual(
+                        method(
+                            cmp.prepare(src, codes=True),
+                            cmp.prepare(tar, codes=True),
+                        ),
+                        expected,
+                    )
+                    self.assertAlmostEqual(
+                        method(src, cmp.prepare(tar, codes=True)), expected
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
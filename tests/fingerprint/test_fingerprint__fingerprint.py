@@ -21,6 +21,8 @@ This module contains unit tests for abydos.fingerprint.Count
 
 import unittest
 
+from abydos.fingerprint import Phonetic, String
+
 # noinspection PyProtectedMember
 from abydos.fingerprint._fingerprint import _Fingerprint
 
@@ -39,6 +41,20 @@ class CountFingerprintTestCases(unittest.TestCase):
         self.assertEqual(self.fp.fingerprint(''), '')
         self.assertEqual(self.fp.fingerprint('word'), 'word')
 
+    def test_fingerprint_fingerprint_many(self):
+        """Test abydos.fingerprint._Fingerprint.fingerprint_many."""
+        self.assertEqual(list(self.fp.fingerprint_many([])), [])
+        self.assertEqual(list(self.fp.fingerprint_many(['word'])), ['word'])
+
+        phrases = ['The quick brown fox', 'fox brown', '', 'The quick'] * 5
+        for fp in (String(), Phonetic()):
+            expected = [fp.fingerprint(phrase) for phrase in phrases]
+            self.assertEqual(list(fp.fingerprint_many(phrases)), expected)
+            self.assertEqual(
+                list(fp.fingerprint_many(phrases, workers=2, chunksize=3)),
+                expected,
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,7 +21,20 @@ This module contains unit tests for abydos.phonetic._Phonetic
 
 import unittest
 
-from abydos.phonetic import Davidson
+import numpy as np
+
+from abydos.phonetic import (
+    BeiderMorse,
+    Davidson,
+    DoubleMetaphone,
+    FuzzySoundex,
+    LEIN,
+    PSHPSoundexFirst,
+    Phonet,
+    RefinedSoundex,
+    RussellIndex,
+    Soundex,
+)
 
 # noinspection PyProtectedMember
 from abydos.phonetic._phonetic import _Phonetic
@@ -54,6 +67,84 @@ class PhoneticTestCases(unittest.TestCase):
         self.assertEqual(self.pa.encode(''), '')
         self.assertEqual(self.pa.encode('word'), 'word')
 
+    def test_phonetic_encode_many(self):
+        """Test abydos.phonetic._Phonetic.encode_many."""
+        self.assertEqual(list(self.pa.encode_many([])), [])
+        self.assertRaises(ValueError, list, self.pa.encode_many(['a'], 1, 0))
+
+        words = ['Niall', 'Smith', 'Schmidt', 'Niall', '', 'Christopher'] * 5
+        for pe in (BeiderMorse(), Phonet(), DoubleMetaphone(), self.dav):
+            expected = [pe.encode(word) for word in words]
+            self.assertEqual(list(pe.encode_many(words)), expected)
+            self.assertEqual(
+                list(pe.encode_many(iter(words), chunksize=4)), expected
+            )
+            self.assertEqual(
+                list(pe.encode_many(words, workers=2, chunksize=7)), expected
+            )
+
+        # each distinct word of a chunk is encoded once
+        pe = Davidson(cache_size=100)
+        list(pe.encode_many(words, chunksize=6))
+        self.assertEqual(pe.cache_info().hits, 20)
+        self.assertEqual(pe.cache_info().misses, 5)
+
+    def test_phonetic_encode_array(self):
+        """Test abydos.phonetic._Phonetic.encode_array."""
+        words = [
+            'Niall',
+            'Smith',
+            'Schmidt',
+            'Niall',
+            '',
+            '-',
+            'Christopher',
+            'Ashcroft',
+            'Asicroft',
+            'Hwang',
+            'Whitley',
+            'Vanderbilt',
+            'DeLuca',
+            'Knightsbridge',
+            'Hughes',
+            'GHz',
+            'Sz',
+            "O'Brien",
+            'Müller',
+            'straße',
+            'ﬁsher',
+            'Ållesøe',
+            'Jones ',
+            'x' * 80,
+        ]
+        self.assertEqual(self.pa.encode_array(words).tolist(), words)
+        self.assertEqual(self.pa.encode_array([]).shape, (0,))
+
+        for pe in (
+            Soundex(),
+            Soundex(max_length=-1, zero_pad=False),
+            Soundex(reverse=True),
+            Soundex(var='special'),
+            Soundex(var='Census'),
+            RefinedSoundex(),
+            RefinedSoundex(max_length=4, zero_pad=True, retain_vowels=True),
+            RussellIndex(),
+            LEIN(),
+            LEIN(max_length=8, zero_pad=False),
+            LEIN(max_length=-1),
+            FuzzySoundex(),
+            PSHPSoundexFirst(),
+            self.dav,
+        ):
+            expected = [pe.encode(word) for word in words]
+            self.assertEqual(pe.encode_array(words).tolist(), expected)
+            self.assertEqual(
+                pe.encode_array(np.array(words).reshape(4, 6)).tolist(),
+                np.array(expected).reshape(4, 6).tolist(),
+            )
+            self.assertEqual(pe.encode_array(['']).tolist(), [pe.encode('')])
+            self.assertEqual(pe.encode_array([]).shape, (0,))
+
     def test_phonetic_encode_alpha(self):
         """Test abydos.phonetic._Phonetic.encode_alpha."""
         self.assertEqual(self.pa.encode_alpha(''), '')
@@ -0,0 +1,138 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.phonetic.test_phonetic__rewrite_rules.
+
+This module contains unit tests for abydos.phonetic._RewriteRules
+"""
+
+import re
+import unittest
+
+from abydos.phonetic import Ainsworth, NRL
+
+# noinspection PyProtectedMember
+from abydos.phonetic._rewrite_rules import _RewriteRules, _first_chars
+
+
+class RewriteRulesTestCases(unittest.TestCase):
+    """Test _RewriteRules functions.
+
+    abydos.phonetic._RewriteRules
+    """
+
+    def test_first_chars(self):
+        """Test abydos.phonetic._rewrite_rules._first_chars."""
+        self.assertEqual(_first_chars('a'), {'a'})
+        self.assertEqual(_first_chars('ab+c'), {'a'})
+        self.assertEqual(_first_chars('a+'), {'a'})
+        self.assertEqual(_first_chars('^are'), {'a'})
+        self.assertEqual(_first_chars('[ae]m'), {'a', 'e'})
+        self.assertEqual(_first_chars('(?<=r)u'), {'u'})
+        self.assertEqual(_first_chars('(?<!G)AY$'), {'A'})
+        self.assertEqual(_first_chars('^(?<=[bcd])e(?=d)'), {'e'})
+        self.assertEqual(_first_chars("\\'S"), {"'"})
+        self.assertEqual(_first_chars('a(?=ng(able|ance))'), {'a'})
+        self.assertEqual(_first_chars('a[|]'), {'a'})
+
+        # patterns that may begin with any character
+        self.assertIsNone(_first_chars(''))
+        self.assertIsNone(_first_chars('.'))
+        self.assertIsNone(_first_chars('a*'))
+        self.assertIsNone(_first_chars('a?b'))
+        self.assertIsNone(_first_chars('a{0,1}'))
+        self.assertIsNone(_first_chars('a|b'))
+        self.assertIsNone(_first_chars('(a)'))
+        self.assertIsNone(_first_chars('(?=a)a'))
+        self.assertIsNone(_first_chars('[^a]'))
+        self.assertIsNone(_first_chars('[a-c]'))
+        self.assertIsNone(_first_chars('\\w'))
+        self.assertIsNone(_first_chars('$'))
+        self.assertIsNone(_first_chars('(?<=(a|b))c'))
+        self.assertIsNone(_first_chars('a', re.IGNORECASE))
+
+    def test_rewrite_rules(self):
+        """Test abydos.phonetic._RewriteRules."""
+        rules = _RewriteRules(
+            [
+                ('th', 'θ'),
+                ('(?<=a)h', ''),
+                ('[aeiou]', 'V'),
+                ('.', '*'),
+                ('t', 'never'),
+                ('x', 'ks', '^.*[aeiou]$'),
+                ('x', 'X'),
+            ]
+        )
+        self.assertEqual(len(rules.rules), 7)
+        self.assertEqual(rules.match('the', 0), ('θ', 2))
+        self.assertEqual(rules.match('ah', 1), ('', 2))
+        self.assertEqual(rules.match('h', 0), ('*', 1))
+        self.assertEqual(rules.match('ta', 0), ('*', 1))
+        self.assertEqual(rules.match('e', 0), ('V', 1))
+
+        # rules with a left context
+        self.assertEqual(rules.match('ax', 1), ('*', 2))
+        rules = _RewriteRules(
+            [('x', 'ks', '^.*[aeiou]$'), ('x', 'X'), ('[aeiou]', 'V')]
+        )
+        self.assertEqual(rules.match('ax', 1), ('ks', 2))
+        self.assertEqual(rules.match('bx', 1), ('X', 2))
+        self.assertEqual(rules.match('x', 0), ('X', 1))
+        self.assertIsNone(rules.match('b', 0))
+        self.assertEqual(rules.rewrite('axbxb'), 'VksX')
+        self.assertEqual(rules.rewrite('axbxb', keep_unmatched=True), 'VksbXb')
+        self.assertEqual(rules.rewrite(''), '')
+
+        # compiled expressions, and expressions that match nothing
+        rules = _RewriteRules([(re.compile('a(?=b)'), 'A'), ('(?=c)', 'C')])
+        self.assertEqual(rules.rewrite('abc'), 'AC')
+        self.assertEqual(_RewriteRules([]).rewrite('abc'), '')
+
+        self.assertRaises(
+            ValueError,
+            _RewriteRules,
+            [(re.compile('a'), 'A'), (re.compile('b', re.IGNORECASE), 'B')],
+        )
+
+    def test_rewrite_rules_encoders(self):
+        """Test _RewriteRules against the encoders' rule order."""
+        pe = Ainsworth()
+        for word in ('are', 'a', 'ate', 'thought', 'union', 'clue', 'rue'):
+            pron = []
+            pos = 0
+            while pos < len(word):
+                for rule, repl, matchlen in pe._rules:  # noqa: SF01
+                    if rule.match(word, pos):
+                        pron.append(repl)
+                        pos += matchlen
+                        break
+                else:
+                    pos += 1
+            self.assertEqual(pe.encode(word), ''.join(pron))
+
+        pe = NRL()
+        self.assertEqual(
+            len(pe._rewrite.rules),  # noqa: SF01
+            sum(len(rules) for rules in pe._rules.values()),  # noqa: SF01
+        )
+        self.assertEqual(pe.encode("it's"), 'IHtz')
+        self.assertEqual(pe.encode('a-b'), 'AEb')
+        self.assertEqual(pe.encode('the cat.'), 'THEH kAEt ')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,6 +23,7 @@ import codecs
 import unittest
 
 from abydos.phonetic import BeiderMorse
+from abydos.phonetic._beider_morse import _rule_index
 
 # noinspection PyProtectedMember
 from abydos.phonetic._beider_morse_data import (
@@ -738,6 +739,31 @@ class BeiderMorseTestCases(unittest.TestCase):
             'abcdef[4]',
         )
 
+    def test_beider_morse_rule_index(self):
+        """Test abydos.phonetic._beider_morse._rule_index."""
+        rules = (
+            ('ch', '', '', 'x'),
+            ('c', '', '[ei]', 'ts'),
+            ('a', '^', '', 'A'),
+            ('c', '', '', 'k'),
+        )
+        index = _rule_index(rules)
+        self.assertIs(_rule_index(rules), index)
+        self.assertEqual(sorted(index), ['a', 'c'])
+        self.assertEqual([rule[0] for rule in index['c']], ['ch', 'c', 'c'])
+        pattern, length, left, right, phonetic = index['c'][1]
+        self.assertEqual((pattern, length, phonetic), ('c', 1, 'ts'))
+        self.assertIsNone(left)
+        self.assertTrue(right('e'))
+        self.assertFalse(right('ae'))
+        self.assertTrue(index['a'][0][2]('xa', 0, 0))
+        self.assertFalse(index['a'][0][2]('xa', 0, 1))
+
+        pa = BeiderMorse()
+        self.assertEqual(
+            pa._phonetic('cicha', 'gen', rules, (), ()), 'tsx'  # noqa: SF01
+        )
+
     def test_beider_morse_language(self):
         """Test abydos.phonetic.BeiderMorse._language.
 
@@ -798,6 +824,86 @@ class BeiderMorseTestCases(unittest.TestCase):
         self.assertEqual(self.pa._language('ácz', 'gen'), L_ANY)  # noqa: SF01
         self.assertEqual(self.pa._language('átz', 'gen'), L_ANY)  # noqa: SF01
 
+    def test_beider_morse_language_memo(self):
+        """Test abydos.phonetic.BeiderMorse._language memoization."""
+        pe = BeiderMorse()
+        self.assertEqual(
+            pe._language(' Renault', 'gen'), L_FRENCH
+        )  # noqa: SF01
+        self.assertEqual(
+            pe._languages, {('gen', 'renault'): L_FRENCH}  # noqa: SF01
+        )
+        self.assertEqual(
+            pe._language('renault', 'gen'), L_FRENCH
+        )  # noqa: SF01
+        self.assertEqual(
+            pe._language('renault', 'ash'),  # noqa: SF01
+            self.pa._language('renault', 'ash'),  # noqa: SF01
+        )
+        self.assertEqual(len(pe._languages), 2)  # noqa: SF01
+
+        # a full memo is cleared before adding another term
+        pe._languages_size = 2  # noqa: SF01
+        self.assertEqual(
+            pe._language('Nagy', 'gen'), L_HUNGARIAN
+        )  # noqa: SF01
+        self.assertEqual(
+            pe._languages, {('gen', 'nagy'): L_HUNGARIAN}  # noqa: SF01
+        )
+
+        words = ['Schmidt', 'van der Berg', 'de la Cruz', 'Nagy', 'Schmidt']
+        self.assertEqual(
+            [pe.encode(word) for word in words],
+            [BeiderMorse().encode(word) for word in words],
+        )
+
+    def test_beider_morse_encode_language(self):
+        """Test abydos.phonetic.BeiderMorse.encode with known languages."""
+        words = ['Schmidt', 'Christopher', 'van der Berg', 'Rodham Clinton']
+        for name_mode in ('gen', 'ash', 'sep'):
+            pe = BeiderMorse(name_mode=name_mode)
+            for lang in ('', 'french', 'spanish,hebrew', 'spanish'):
+                expected = [
+                    BeiderMorse(language_arg=lang, name_mode=name_mode).encode(
+                        word
+                    )
+                    for word in words
+                ]
+                self.assertEqual(
+                    [pe.encode(word, lang) for word in words], expected
+                )
+                self.assertEqual(
+                    list(pe.encode_many(words, languages=[lang] * 4)),
+                    expected,
+                )
+
+        pe = BeiderMorse(language_arg='german')
+        self.assertEqual(pe.encode('Schmidt', None), pe.encode('Schmidt'))
+        self.assertEqual(
+            pe.encode('Schmidt', ''), BeiderMorse().encode('Schmidt')
+        )
+        self.assertRaises(ValueError, pe.encode, 'Schmidt', 'klingon')
+        self.assertEqual(
+            BeiderMorse(filter_langs=True).encode('Schmidt', 'klingon'),
+            BeiderMorse().encode('Schmidt'),
+        )
+
+        languages = ['polish', 'german', None, '', 'polish']
+        words = ['Schmidt'] * 5
+        expected = ['sxmit', 'zmit', 'zmit,stzmit', 'zmit,stzmit', 'sxmit']
+        self.assertEqual(
+            list(BeiderMorse().encode_many(words, languages=languages)),
+            expected,
+        )
+        self.assertEqual(
+            list(
+                BeiderMorse(cache_size=10).encode_many(
+                    words, workers=2, chunksize=2, languages=languages
+                )
+            ),
+            expected,
+        )
+
     def test_beider_morse_expand_alternates(self):
         """Test abydos.phonetic.BeiderMorse._expand_alternates."""
         self.assertEqual(self.pa._expand_alternates(''), '')  # noqa: SF01
@@ -123,6 +123,32 @@ class DaitchMokotoffTestCases(unittest.TestCase):
         self.assertEqual(self.pa.encode_alpha('Mannheim'), 'NNKN')
         self.assertEqual(self.pa.encode_alpha('Chernowitz'), 'SRNPS,KRNPS')
 
+    def test_daitch_mokotoff_trie(self):
+        """Test abydos.phonetic.DaitchMokotoff._dms_trie."""
+        trie = self.pa._dms_trie  # noqa: SF01
+        self.assertEqual(
+            trie['S']['Z']['C']['Z'][''], (('2',), ('4',), ('4',))
+        )
+        self.assertEqual(trie['C'][''], (('5', '4'), ('5', '4'), ('5', '4')))
+        self.assertEqual(trie['M']['N'][''], (('6_6',), ('6_6',), ('6_6',)))
+        self.assertNotIn('', trie['S']['Z']['C'])
+
+        # codes that branch at every letter
+        self.assertEqual(
+            self.pa.encode('CKCKCKCKCKCKCKCKCKCKCKCK'),
+            '450000,454500,454545,500000,545000,545450,545454',
+        )
+        self.assertEqual(
+            DaitchMokotoff(max_length=-1, zero_pad=False).encode(
+                'Chrzczonowiczkiewicz'
+            ),
+            '4674574,494674574,54674574,594674574',
+        )
+        self.assertEqual(
+            len(DaitchMokotoff(max_length=-1).encode('CK' * 200).split(',')),
+            65,
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -112,6 +112,24 @@ class PhonetTestCases(unittest.TestCase):
         self.assertEqual(self.pa_2none.encode('Brückmann'), 'BRUECKMAN')
         self.assertEqual(self.pa_2none.encode('Krauße'), 'KRAUSE')
 
+    def test_phonet_hashes(self):
+        """Test abydos.phonetic.Phonet._hashes."""
+        hashes = Phonet._hashes('de')  # noqa: SF01
+        self.assertIs(Phonet._hashes('de'), hashes)  # noqa: SF01
+        self.assertIs(Phonet._hashes('fr'), hashes)  # noqa: SF01
+        self.assertIsNot(Phonet._hashes('none'), hashes)  # noqa: SF01
+        phonet_hash, alpha_pos, phonet_hash_1, phonet_hash_2 = hashes
+        self.assertEqual(alpha_pos['Ä'], 1)
+        self.assertEqual(alpha_pos['A'], 2)
+        self.assertEqual(alpha_pos['Z'], 27)
+        self.assertEqual(phonet_hash[''], -1)
+
+        # encoding does not alter the shared tables
+        copies = [hash_.copy() for hash_ in hashes]
+        Phonet().encode('Schönberg')
+        Phonet(2).encode('Müller-Lüdenscheidt')
+        self.assertEqual(list(hashes), copies)
+
     def test_phonet_nachnamen(self):
         """Test abydos.phonetic.Phonet (Nachnamen set)."""
         if not ALLOW_RANDOM:
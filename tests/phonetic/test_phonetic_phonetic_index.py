@@ -0,0 +1,157 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.phonetic.test_phonetic_phonetic_index.
+
+This module contains unit tests for abydos.phonetic.PhoneticIndex
+"""
+
+import os
+import unittest
+from itertools import combinations
+
+from abydos.phonetic import (
+    BeiderMorse,
+    DaitchMokotoff,
+    DoubleMetaphone,
+    PhoneticIndex,
+    RussellIndex,
+    Soundex,
+)
+from abydos.stemmer import Porter
+
+TESTDIR = os.path.dirname(__file__)
+
+
+class PhoneticIndexTestCases(unittest.TestCase):
+    """Test PhoneticIndex functions.
+
+    abydos.phonetic.PhoneticIndex
+    """
+
+    names = [
+        'Schmidt',
+        'Smith',
+        'Smyth',
+        'Niall',
+        'Neil',
+        'Nigel',
+        'Christopher',
+        'Kristoffer',
+        'Schwarzenegger',
+        'Auerbach',
+        'Ohrbach',
+        'Moskowitz',
+        'Moskovitz',
+        '',
+        'Smith',
+    ]
+
+    def test_phonetic_index_init(self):
+        """Test abydos.phonetic.PhoneticIndex.__init__."""
+        index = PhoneticIndex(Soundex)
+        self.assertIsInstance(index.encoders[0], Soundex)
+        self.assertEqual(len(index), 0)
+
+        index = PhoneticIndex((DoubleMetaphone, Soundex()), self.names)
+        self.assertEqual(len(index.encoders), 2)
+        self.assertEqual(len(index), len(self.names))
+
+        self.assertRaises(ValueError, PhoneticIndex, [])
+        self.assertRaises(TypeError, PhoneticIndex, Porter())
+        self.assertRaises(TypeError, PhoneticIndex, [Soundex(), len])
+
+    def test_phonetic_index_keys(self):
+        """Test abydos.phonetic.PhoneticIndex.keys."""
+        index = PhoneticIndex(DoubleMetaphone())
+        self.assertEqual(index.keys('Niall'), [(0, 'NL')])
+        self.assertEqual(index.keys(''), [])
+
+        index = PhoneticIndex([Soundex(), RussellIndex()])
+        self.assertEqual(index.keys('Niall'), [(0, 'N400'), (1, '715')])
+        index = PhoneticIndex([Soundex(), RussellIndex()], encode_alpha=True)
+        self.assertEqual(index.keys('Niall'), [(0, 'NL'), (1, 'NAL')])
+
+        dm = DaitchMokotoff()
+        index = PhoneticIndex(dm)
+        self.assertEqual(
+            index.keys('Christopher'),
+            [(0, code) for code in dm.encode('Christopher').split(',')],
+        )
+
+        bm = BeiderMorse()
+        index = PhoneticIndex(bm)
+        self.assertEqual(
+            index.keys('Christopher'),
+            sorted((0, code) for code in bm.encode('Christopher').split(',')),
+        )
+
+    def test_phonetic_index_candidates(self):
+        """Test abydos.phonetic.PhoneticIndex.candidates."""
+        index = PhoneticIndex(DoubleMetaphone(), self.names)
+        self.assertEqual(
+            index.candidates('Schmitt'), ['Schmidt', 'Smith', 'Smyth', 'Smith']
+        )
+        self.assertEqual(index.candidates('Nial'), ['Niall', 'Neil'])
+        self.assertEqual(index.candidates('Ashcroft'), [])
+        self.assertEqual(index.candidates(''), [])
+
+        # codes from different encoders do not share a block
+        index = PhoneticIndex(
+            [Soundex(), Soundex(zero_pad=False)], encode_alpha=True
+        )
+        index.add('Niall')
+        self.assertEqual(len(index.blocks()), 2)
+        self.assertEqual(index.block((0, 'NL')), ['Niall'])
+        self.assertEqual(index.block((1, 'NL')), ['Niall'])
+        self.assertEqual(index.block((2, 'NL')), [])
+
+    def test_phonetic_index_corpus(self):
+        """Test abydos.phonetic.PhoneticIndex against brute force search."""
+        with open(
+            os.path.join(TESTDIR, '..', 'corpora', 'nachnamen.csv'),
+            encoding='utf-8',
+        ) as corpus:
+            names = [line.split(',')[0] for line in corpus][:300]
+
+        encoders = [DoubleMetaphone(), DaitchMokotoff()]
+        index = PhoneticIndex(encoders, names)
+        keys = [set(index.keys(name)) for name in names]
+
+        added = PhoneticIndex(encoders)
+        for name in names:
+            added.add(name)
+        self.assertEqual(added.blocks(), index.blocks())
+
+        for name in names[:50]:
+            name_keys = set(index.keys(name))
+            self.assertEqual(
+                index.candidates(name),
+                [names[i] for i in range(len(names)) if keys[i] & name_keys],
+            )
+
+        self.assertEqual(
+            index.pairs(),
+            [
+                (names[i], names[j])
+                for i, j in combinations(range(len(names)), 2)
+                if keys[i] & keys[j]
+            ],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,7 +22,7 @@ This module contains unit tests for abydos.stemmer._Snowball
 import unittest
 
 # noinspection PyProtectedMember
-from abydos.stemmer._snowball import _Snowball
+from abydos.stemmer._snowball import _Snowball, _suffix_trie
 
 
 class SnowballTestCases(unittest.TestCase):
@@ -97,6 +97,94 @@ class SnowballTestCases(unittest.TestCase):
         self.assertEqual(self.stmr._sb_r2('sprinkled'), 9)  # noqa: SF01
         self.assertEqual(self.stmr._sb_r2('eucharist'), 6)  # noqa: SF01
 
+    def test_sb_regions(self):
+        """Test abydos.stemmer._Snowball._sb_regions."""
+        # base case
+        self.assertEqual(self.stmr._sb_regions(''), (0, 0))  # noqa: SF01
+
+        for term in (
+            'beautiful',
+            'beauty',
+            'beau',
+            'animadversion',
+            'sprinkled',
+            'eucharist',
+            'b',
+            'ab',
+            'aba',
+        ):
+            self.assertEqual(
+                self.stmr._sb_regions(term),  # noqa: SF01
+                (
+                    self.stmr._sb_r1(term),  # noqa: SF01
+                    self.stmr._sb_r2(term),  # noqa: SF01
+                ),
+            )
+
+        self.assertEqual(
+            self.stmr._sb_regions(  # noqa: SF01
+                'generous', r1_prefixes=('gener',)
+            ),
+            (5, 8),
+        )
+        self.assertEqual(
+            self.stmr._sb_regions(  # noqa: SF01
+                'generation', r1_prefixes=('gener',)
+            ),
+            (5, 7),
+        )
+        self.assertEqual(
+            self.stmr._sb_regions('ist', r1_prefixes={'ist'}),  # noqa: SF01
+            (3, 3),
+        )
+
+    def test_sb_suffix(self):
+        """Test abydos.stemmer._Snowball._sb_suffix."""
+        trie = _suffix_trie(('ational', 'tional', 'al', 'ness'))
+        self.assertEqual(trie['l']['a'][''], 'al')
+
+        # base case
+        self.assertEqual(self.stmr._sb_suffix('', trie), '')  # noqa: SF01
+
+        self.assertEqual(
+            self.stmr._sb_suffix('relational', trie), 'ational'  # noqa: SF01
+        )
+        self.assertEqual(
+            self.stmr._sb_suffix('conditional', trie), 'tional'  # noqa: SF01
+        )
+        self.assertEqual(
+            self.stmr._sb_suffix('rational', trie), 'ational'  # noqa: SF01
+        )
+        self.assertEqual(
+            self.stmr._sb_suffix('ational', trie), 'ational'  # noqa: SF01
+        )
+        self.assertEqual(
+            self.stmr._sb_suffix('tonal', trie), 'al'  # noqa: SF01
+        )
+        self.assertEqual(
+            self.stmr._sb_suffix('tonality', trie), ''  # noqa: SF01
+        )
+        self.assertEqual(
+            self.stmr._sb_suffix('onal', trie), 'al'  # noqa: SF01
+        )
+
+        # suffixes must lie in the region starting at start
+        self.assertEqual(
+            self.stmr._sb_suffix('rational', trie, 1), 'ational'  # noqa: SF01
+        )
+        self.assertEqual(
+            self.stmr._sb_suffix('rational', trie, 2), 'tional'  # noqa: SF01
+        )
+        self.assertEqual(
+            self.stmr._sb_suffix('rational', trie, 6), 'al'  # noqa: SF01
+        )
+        self.assertEqual(
+            self.stmr._sb_suffix('rational', trie, 7), ''  # noqa: SF01
+        )
+        self.assertEqual(
+            self.stmr._sb_suffix('rational', trie, 20), ''  # noqa: SF01
+        )
+
     def test_sb_ends_in_short_syllable(self):
         """Test abydos.stemmer._Snowball._sb_ends_in_short_syllable."""
         # base case
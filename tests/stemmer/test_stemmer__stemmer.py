@@ -21,6 +21,8 @@ This module contains unit tests for abydos.stemmer._Stemmer
 
 import unittest
 
+from abydos.stemmer import Porter2, UEALite
+
 # noinspection PyProtectedMember
 from abydos.stemmer._stemmer import _Stemmer
 
@@ -39,6 +41,22 @@ class SnowballTestCases(unittest.TestCase):
         self.assertEqual(self.stmr.stem(''), '')
         self.assertEqual(self.stmr.stem('word'), 'word')
 
+    def test__stemmer_stem_many(self):
+        """Test abydos.stemmer._Stemmer.stem_many."""
+        self.assertEqual(list(self.stmr.stem_many([])), [])
+        self.assertEqual(
+            list(self.stmr.stem_many(['word', 'words'])), ['word', 'words']
+        )
+
+        words = ['running', 'runs', 'ran', 'running', '', 'generously'] * 5
+        for stmr in (Porter2(), UEALite()):
+            expected = [stmr.stem(word) for word in words]
+            self.assertEqual(list(stmr.stem_many(words)), expected)
+            self.assertEqual(
+                list(stmr.stem_many(iter(words), workers=2, chunksize=4)),
+                expected,
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -77,6 +77,20 @@ class LovinsTestCases(unittest.TestCase):
         # missed branch test cases
         self.assertEqual(self.stmr.stem('feminism'), 'fem')
 
+        # the longest suffix whose condition is met is removed
+        self.assertEqual(self.stmr.stem('absenting'), 'absens')
+        self.assertEqual(self.stmr.stem('adages'), 'adag')
+        self.assertEqual(self.stmr.stem('adas'), 'ada')
+
+        # the suffix trie & recoding index are shared by all instances
+        self.assertIs(
+            Lovins(cache_size=10)._suffix_trie,  # noqa: SF01
+            self.stmr._suffix_trie,  # noqa: SF01
+        )
+        self.assertIsNone(
+            self.stmr._suffix_trie['s']['e']['d']['i']['o']['']  # noqa: SF01
+        )
+
     def test_lovins_snowball(self):
         """Test abydos.stemmer.Lovins (Snowball testset).
 
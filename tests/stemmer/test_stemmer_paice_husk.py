@@ -54,6 +54,26 @@ class PaiceHuskTestCases(unittest.TestCase):
         self.assertEqual(self.stmr.stem('meant'), 'meant')
         self.assertEqual(self.stmr.stem('cement'), 'cem')
 
+        # the rule index holds each suffix under its last letter
+        index = self.stmr._rule_index  # noqa: SF01
+        table = self.stmr._rule_table  # noqa: SF01
+        self.assertEqual([n for n, _ in index['t']], [6, 5, 4, 3, 2])
+        self.assertEqual(
+            {
+                suffix: rules
+                for lengths in index.values()
+                for _, suffixes in lengths
+                for suffix, rules in suffixes.items()
+            },
+            {
+                suffix: rules
+                for suffixes in table.values()
+                for suffix, rules in suffixes.items()
+            },
+        )
+        self.assertNotIn('x', index)
+        self.assertEqual(self.stmr.stem('x'), 'x')
+
     def test_paice_husk_hopper_set(self):
         """Test abydos.stemmer.PaiceHusk (Hopper262 testset).
 
@@ -182,6 +182,30 @@ class UEALiteTestCases(unittest.TestCase):
         self.assertEqual(self.stmr.stem('abcDefGhij'), 'abcDefGhij')
         self.assertEqual(self.stmr.stem('Tophat'), 'Tophat')
 
+        # words no longer than the suffixes they match
+        self.assertEqual(self.stmr._stem_and_rule('ies'), ('y', 59))
+        self.assertEqual(self.stmr._stem_and_rule('ss'), ('ss', 6))
+        self.assertEqual(self.stmr._stem_and_rule('eds'), ('ed', 68))
+        self.assertEqual(self.stmr._stem_and_rule('ed'), ('ed', 0))
+
+        # the rule indexes hold each suffix under its last letter
+        for var, table in UEALite._rules.items():  # noqa: SF01
+            index = UEALite._rule_indexes[var]  # noqa: SF01
+            self.assertEqual(
+                {
+                    suffix: rule
+                    for lengths in index.values()
+                    for _, suffixes in lengths
+                    for suffix, rule in suffixes.items()
+                },
+                {
+                    suffix: rule
+                    for suffixes in table.values()
+                    for suffix, rule in suffixes.items()
+                },
+            )
+            self.assertEqual([n for n, _ in index['s']], [7, 6, 5, 4, 3, 2])
+
     def test_uealite_wsj_set(self):
         """Test abydos.stemmer.UEALite (WSJ testset)."""
         with open(_corpus_file('uea-lite_wsj.csv')) as wsj_ts:
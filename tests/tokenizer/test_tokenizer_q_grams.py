@@ -378,6 +378,59 @@ class QGramsTestCases(unittest.TestCase):
             ),
         )
 
+    def test_qgrams_codes(self):
+        """Test abydos.tokenizer.QGrams.tokenize_codes."""
+        for tokenizer in (
+            QGrams(),
+            QGrams(qval=1),
+            QGrams(qval=3, start_stop=''),
+            QGrams(start_stop='', skip=[0, 1]),
+            QGrams(qval=range(3), skip=[0, 1]),
+            QGrams(qval=[2, 3], skip=2),
+        ):
+            for word in ('', 'a', 'AACTAGAAC', 'interdisciplinarian', 'Ré'):
+                tokens = tokenizer.tokenize(word).get_counter()
+                codes, counts = tokenizer.tokenize_codes(word)
+                self.assertEqual(len(codes), len(tokens))
+                self.assertEqual(codes.tolist(), sorted(codes.tolist()))
+                self.assertEqual(
+                    sorted(counts.tolist()), sorted(tokens.values())
+                )
+
+        # q-grams of up to 3 characters are encoded exactly
+        codes, counts = QGrams(start_stop='').tokenize_codes('ABAB')
+        self.assertEqual(
+            codes.tolist(), [66 * 0x110001 + 67, 67 * 0x110001 + 66]
+        )
+        self.assertEqual(counts.tolist(), [2, 1])
+        codes, counts = QGrams(qval=[1, 3], start_stop='').tokenize_codes(
+            '\U0010ffff' * 3
+        )
+        self.assertEqual(
+            codes.tolist(),
+            [
+                0x110000,
+                0x110000 * 0x110001 ** 2 + 0x110000 * 0x110001 + 0x110000,
+            ],
+        )
+        self.assertEqual(counts.tolist(), [3, 1])
+
+        codes, counts = QGrams(scaler='set').tokenize_codes('AAAA')
+        self.assertEqual(counts.tolist(), [1, 1, 1])
+        self.assertRaises(
+            ValueError, QGrams(scaler='length').tokenize_codes, 'AAAA'
+        )
+        # longer q-grams would not have exact codes
+        self.assertRaises(ValueError, QGrams(qval=4).tokenize_codes, 'AAAA')
+        self.assertRaises(
+            ValueError, QGrams(qval=range(6)).tokenize_codes, 'AAAA'
+        )
+
+        # tokenize_codes does not alter the stored tokens
+        tokenizer = QGrams().tokenize('Niall')
+        tokenizer.tokenize_codes('Neil')
+        self.assertEqual(tokenizer.get_list()[0], '$N')
+
 
 if __name__ == '__main__':
     unittest.main()
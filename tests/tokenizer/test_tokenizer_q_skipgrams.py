@@ -21,9 +21,13 @@ This module contains unit tests for abydos.tokenizer.QGrams
 
 import unittest
 from collections import Counter
+from itertools import combinations
 
 from abydos.tokenizer import QSkipgrams
 
+# noinspection PyProtectedMember
+from abydos.tokenizer._q_skipgrams import _skipgram_sums
+
 
 class QSkipgramsTestCases(unittest.TestCase):
     """Test abydos.tokenizer.QSkipgrams."""
@@ -616,6 +620,60 @@ class QSkipgramsTestCases(unittest.TestCase):
         for key in gold_counter.keys():
             self.assertAlmostEqual(gold_counter[key], test_counter[key])
 
+    def test_qskipgrams_sums(self):
+        """Test abydos.tokenizer._q_skipgrams._skipgram_sums."""
+        for string in ('', 'a', 'NIALL', 'AACTAGAAC', 'interdisciplinarian'):
+            for qval in (1, 2, 3, 4):
+                combs = list(combinations(enumerate(string), qval))
+                sums, firsts = _skipgram_sums(string, qval)
+                self.assertEqual(
+                    sums, Counter(''.join(c for _, c in t) for t in combs)
+                )
+                gold_firsts = {}
+                for t in combs:
+                    gold_firsts.setdefault(
+                        ''.join(c for _, c in t), tuple(i for i, _ in t)
+                    )
+                for gram in sums:
+                    self.assertEqual(firsts[gram], gold_firsts[gram])
+
+                gold = Counter()
+                for t in combs:
+                    gold[''.join(c for _, c in t)] += 0.5 ** (
+                        t[-1][0] - t[0][0]
+                    )
+                sums = _skipgram_sums(string, qval, 0.5)[0]
+                self.assertEqual(set(sums), set(gold))
+                for gram in gold:
+                    self.assertAlmostEqual(sums[gram], gold[gram])
+
+        # decayed sums are rescaled along long strings
+        sums = _skipgram_sums('ab' + 'c' * 500 + 'ab', 2, 0.01)[0]
+        self.assertAlmostEqual(sums['ab'], 0.02)
+        self.assertAlmostEqual(sums['bb'], 0.0)
+        self.assertAlmostEqual(
+            sums['cc'], sum((500 - d) * 0.01 ** d for d in range(1, 500))
+        )
+
+    def test_qskipgrams_long(self):
+        """Test abydos.tokenizer.QSkipgrams on long strings."""
+        string = '1600 Pennsylvania Avenue NW, Washington, DC 20500'
+        tokenizer = QSkipgrams(qval=3).tokenize(string)
+        self.assertEqual(
+            tokenizer.get_counter(), Counter(tokenizer.get_list())
+        )
+        self.assertEqual(len(tokenizer.get_list()), 23426)
+        self.assertEqual(
+            list(tokenizer.get_counter())[:4], ['$$1', '$$6', '$$0', '$$ ']
+        )
+
+        tokenizer = QSkipgrams(qval=2, start_stop='', scaler='SSK')
+        self.assertAlmostEqual(
+            tokenizer.tokenize('ab' + 'c' * 1000 + 'ab').get_counter()['ba']
+            / 0.9 ** 1002,
+            1.0,
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,103 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_array.
+
+This module contains unit tests for abydos.util._array
+"""
+
+import unittest
+
+import numpy as np
+
+from abydos.util._array import (
+    _collapse,
+    _compact,
+    _pad,
+    _str_array,
+    _translate,
+    _uc_codepoints,
+)
+
+
+class ArrayTestCases(unittest.TestCase):
+    """Test cases for abydos.util._array."""
+
+    def test_uc_codepoints(self):
+        """Test abydos.util._array._uc_codepoints."""
+        self.assertEqual(
+            _uc_codepoints(np.array(['ab', 'c'])).tolist(),
+            [[65, 66], [67, 0]],
+        )
+        self.assertEqual(
+            _uc_codepoints(np.array(['ﬁ', 'ß'])).tolist(),
+            [[70, 73], [83, 83]],
+        )
+        self.assertEqual(_uc_codepoints(np.array([''])).tolist(), [[0]])
+        self.assertEqual(
+            _uc_codepoints(np.array([], dtype=np.str_)).shape, (0, 1)
+        )
+
+    def test_compact(self):
+        """Test abydos.util._array._compact."""
+        codes = np.array([[65, 66, 67, 66], [66, 0, 0, 0], [0, 0, 0, 0]])
+        self.assertEqual(
+            _compact(codes, codes != 66).tolist(), [[65, 67], [0, 0], [0, 0]]
+        )
+        self.assertEqual(
+            _compact(codes, codes == 66).tolist(), [[66, 66], [66, 0], [0, 0]]
+        )
+        self.assertEqual(_compact(codes, codes < 0).shape, (3, 0))
+        empty = np.zeros((0, 3), dtype=np.uint32)
+        self.assertEqual(_compact(empty, empty == 0).shape, (0, 0))
+
+    def test_collapse(self):
+        """Test abydos.util._array._collapse."""
+        self.assertEqual(
+            _collapse(
+                np.array([[65, 65, 66, 66, 65], [67, 67, 0, 0, 0]])
+            ).tolist(),
+            [[65, 66, 65], [67, 0, 0]],
+        )
+
+    def test_translate(self):
+        """Test abydos.util._array._translate."""
+        self.assertEqual(
+            _translate(np.array([[65, 66, 0]]), {65: '1', 66: '2'}).tolist(),
+            [[49, 50, 0]],
+        )
+
+    def test_pad(self):
+        """Test abydos.util._array._pad."""
+        codes = np.array([[65, 66, 67], [68, 0, 0]])
+        self.assertEqual(
+            _pad(codes, 4).tolist(), [[65, 66, 67, 48]] + [[68, 48, 48, 48]]
+        )
+        self.assertEqual(_pad(codes, 2, False).tolist(), [[65, 66], [68, 0]])
+
+    def test_str_array(self):
+        """Test abydos.util._array._str_array."""
+        self.assertEqual(
+            _str_array(np.array([[65, 66], [68, 0], [0, 0]])).tolist(),
+            ['AB', 'D', ''],
+        )
+        self.assertEqual(
+            _str_array(np.zeros((2, 0), dtype=np.uint32)).tolist(), ['', '']
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# Copyright 2014-2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_cache.
+
+This module contains unit tests for abydos.util._cache
+"""
+
+import copy
+import pickle
+import unittest
+
+from abydos.fingerprint import Phonetic, String
+from abydos.phonetic import SPFC, Soundex
+from abydos.stemmer import Porter2
+
+
+class CacheTestCases(unittest.TestCase):
+    """Test cases for abydos.util._cache."""
+
+    def test_cache(self):
+        """Test abydos.util._cache._Cached."""
+        pe = Soundex()
+        self.assertEqual(pe.encode('Niall'), 'N400')
+        self.assertEqual(tuple(pe.cache_info()), (0, 0, 0, 0))
+        pe.cache_clear()
+
+        pe = Soundex(max_length=6, cache_size=2)
+        for word in ('Niall', 'Neil', 'Niall', 'Smith', 'Neil', 'Niall'):
+            self.assertEqual(
+                pe.encode(word), Soundex(max_length=6).encode(word)
+            )
+        info = pe.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 5)
+        self.assertEqual(info.maxsize, 2)
+        self.assertEqual(info.currsize, 2)
+        self.assertEqual(pe.encode('Niall', recurse=True), 'N40000')
+        pe.cache_clear()
+        self.assertEqual(tuple(pe.cache_info()), (0, 0, 2, 0))
+
+        stmr = Porter2(cache_size=None)
+        for _ in range(3):
+            self.assertEqual(stmr.stem('running'), 'run')
+        self.assertEqual(tuple(stmr.cache_info()), (2, 1, None, 1))
+
+        fp = Phonetic(cache_size=10)
+        self.assertEqual(fp.fingerprint('John Smith'), 'jn sm0')
+        self.assertEqual(fp.fingerprint('John Smith'), 'jn sm0')
+        self.assertEqual(fp.cache_info().hits, 1)
+        self.assertEqual(String(cache_size=10).fingerprint('b a'), 'a b')
+
+        # unhashable arguments bypass the cache
+        spfc = SPFC(cache_size=10)
+        self.assertEqual(
+            spfc.encode(['Niall', 'Smith']), SPFC().encode(['Niall', 'Smith'])
+        )
+        self.assertEqual(
+            spfc.encode(('Niall', 'Smith')), SPFC().encode(('Niall', 'Smith'))
+        )
+        self.assertEqual(
+            spfc.encode(['Niall', 'Smith']), spfc.encode('Niall Smith')
+        )
+        self.assertEqual(tuple(spfc.cache_info()), (0, 2, 10, 2))
+
+        # the cache is neither pickled nor copied
+        for clone in (pickle.loads(pickle.dumps(pe)), copy.copy(pe)):
+            self.assertEqual(tuple(clone.cache_info()), (0, 0, 2, 0))
+            self.assertEqual(clone.encode('Neil'), 'N40000')
+            self.assertEqual(tuple(clone.cache_info()), (0, 1, 2, 1))
+            self.assertEqual(tuple(pe.cache_info()), (0, 0, 2, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
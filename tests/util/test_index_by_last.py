@@ -0,0 +1,46 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_index_by_last.
+
+This module contains unit tests for abydos.util._index_by_last
+"""
+
+import unittest
+
+from abydos.util._index_by_last import _index_by_last
+
+
+class IndexByLastTestCases(unittest.TestCase):
+    """Test cases for abydos.util._index_by_last."""
+
+    def test_index_by_last(self):
+        """Test abydos.util._index_by_last."""
+        self.assertEqual(_index_by_last({}), {})
+        self.assertEqual(
+            _index_by_last({3: {'ies': 1, 'ied': 2}, 2: {'es': 3}}),
+            {'s': ((3, {'ies': 1}), (2, {'es': 3})), 'd': ((3, {'ied': 2}),)},
+        )
+
+        # suffix lengths are ordered longest first, whatever the table order
+        self.assertEqual(
+            _index_by_last({1: {'s': 1}, 4: {'ness': 2}, 2: {'es': 3}}),
+            {'s': ((4, {'ness': 2}), (2, {'es': 3}), (1, {'s': 1}))},
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
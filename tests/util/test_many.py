@@ -0,0 +1,66 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_many.
+
+This module contains unit tests for abydos.util._many
+"""
+
+import unittest
+
+from abydos.phonetic import Soundex
+from abydos.stemmer import Porter
+from abydos.util._many import _map_many
+
+
+class MapManyTestCases(unittest.TestCase):
+    """Test cases for abydos.util._many."""
+
+    words = ['Niall', 'Neil', 'Nigel', 'Niall', 'Nils', 'Neal'] * 5
+
+    def test_map_many(self):
+        """Test abydos.util._many._map_many."""
+        self.assertEqual(list(_map_many(Soundex(), 'encode', [])), [])
+        self.assertRaises(
+            ValueError, list, _map_many(Soundex(), 'encode', ['a'], 1, 0)
+        )
+
+        for instance, method in (
+            (Soundex(), 'encode'),
+            (Soundex(max_length=6), 'encode'),
+            (Porter(), 'stem'),
+        ):
+            expected = [getattr(instance, method)(word) for word in self.words]
+            self.assertEqual(
+                list(_map_many(instance, method, self.words, chunksize=4)),
+                expected,
+            )
+            # more chunks than may be pending at once, across two workers
+            self.assertEqual(
+                list(
+                    _map_many(
+                        instance, method, iter(self.words), 2, chunksize=2
+                    )
+                ),
+                expected,
+            )
+            self.assertEqual(
+                list(_map_many(instance, method, self.words, None)), expected
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
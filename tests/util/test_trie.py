@@ -0,0 +1,52 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_trie.
+
+This module contains unit tests for abydos.util._trie
+"""
+
+import unittest
+
+from abydos.util._trie import _trie
+
+
+class TrieTestCases(unittest.TestCase):
+    """Test cases for abydos.util._trie."""
+
+    def test_trie(self):
+        """Test abydos.util._trie."""
+        self.assertEqual(_trie([]), {})
+        self.assertEqual(_trie([('', 0)]), {'': 0})
+        self.assertEqual(
+            _trie([('ab', 1), ('ac', 2), ('a', 3)]),
+            {'a': {'b': {'': 1}, 'c': {'': 2}, '': 3}},
+        )
+        self.assertEqual(
+            _trie([('ab', 1), ('cb', 2)], reverse=True),
+            {'b': {'a': {'': 1}, 'c': {'': 2}}},
+        )
+
+        # the last value of a repeated string is kept
+        self.assertEqual(_trie([('a', 1), ('a', 2)]), {'a': {'': 2}})
+        self.assertEqual(
+            _trie(iter([('ed', 'ed'), ('d', 'd')]), reverse=True),
+            {'d': {'e': {'': 'ed'}, '': 'd'}},
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()